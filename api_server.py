@@ -17,10 +17,12 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 import config
 import logger
 import data_handler
+import data_providers
 import feature_engineer
 from news_sentiment_analyzer import get_news_sentiment_for_date, fetch_financial_news
 import ml_model
 import strategy_executor
+import inference_pipeline
 import main
 
 # Flask uygulamasını oluştur
@@ -134,7 +136,19 @@ def get_portfolio():
                 },
             ],
         }
-        
+
+        # Pozisyonları güncel fiyatlarla değerle (sembol başına tek önbellek sorgusu)
+        quotes = data_handler.get_latest_prices([p['symbol'] for p in portfolio_data['positions']])
+        for position in portfolio_data['positions']:
+            quote = quotes.get(position['symbol'])
+            if quote is None:
+                continue
+            cost = position['shares'] * position['avg_price']
+            position['current_price'] = round(quote['price'], 2)
+            position['total_value'] = round(position['shares'] * quote['price'], 2)
+            position['unrealized_pnl'] = round(position['total_value'] - cost, 2)
+            position['unrealized_pnl_percent'] = round(position['unrealized_pnl'] / cost * 100, 2) if cost else 0.0
+
         return jsonify(portfolio_data)
     except Exception as e:
         logger.log_error(f"Portföy API hatası: {e}")
@@ -146,14 +160,18 @@ def get_stock_data(symbol):
     try:
         days = request.args.get('days', 30, type=int)
         
-        # DataHandler ile veri çek
+        # Veri sağlayıcısından veri çek
         end_date = datetime.now().strftime('%Y-%m-%d')
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
         try:
-            stock_data = data_handler.get_stock_data(symbol, start_date, end_date)
-        except:
+            # Veri kaynağı config.DATA_PROVIDER ile seçilir (yfinance, local, synthetic)
+            stock_data = data_providers.get_data_provider().get_history(symbol, start_date, end_date)
+            if stock_data.empty:
+                raise ValueError(f"{symbol} için veri bulunamadı")
+        except Exception as e:
             # Hata durumunda mock veri döndür
+            logger.log_warning(f"Hisse verisi alınamadı ({symbol}), örnek veri kullanılıyor: {e}")
             stock_data = _generate_mock_stock_data(symbol, days)
         
         # JSON formatına çevir
@@ -242,6 +260,21 @@ def get_trading_signals():
         # Mock trading sinyalleri
         signals = []
         for i, symbol in enumerate(config.SYMBOLS[:limit]):
+            # Kayıtlı modeli olan semboller için sinyal tahmin hattından üretilir
+            prediction = inference_pipeline.predict_signal(symbol)
+            if prediction is not None:
+                features = prediction['features']
+                signals.append({
+                    'symbol': symbol,
+                    'date': datetime.now().isoformat(),
+                    'signal': prediction['signal'],
+                    'confidence': max(prediction['probability'], 1 - prediction['probability']),
+                    'price': prediction['price'],
+                    'reason': f"ML modeli {prediction['signal']} sinyali üretti",
+                    'indicators': {name: features[name] for name in ('RSI', 'MACD_Hist', 'SMA_20') if name in features}
+                })
+                continue
+            
             import random
             signal_types = ['BUY', 'SELL', 'HOLD']
             signal = random.choice(signal_types)
@@ -10,10 +10,11 @@ import numpy as np
 from datetime import datetime, timedelta
 import config
 import logger
+import feature_engineer
 
 
 def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=None, 
-                initial_capital=None, start_date=None, end_date=None):
+                initial_capital=None, start_date=None, end_date=None, snapshot_id=None, pipeline=None):
     """
     Geçmiş veri üzerinde strateji backtesti yapar. Her adımda ML modelinden 
     sinyal alır, haber duygu skorunu alır ve strategy_executor ile kararları uygular.
@@ -25,6 +26,9 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
         initial_capital (float): Başlangıç sermayesi
         start_date (str): Backtest başlangıç tarihi
         end_date (str): Backtest bitiş tarihi
+        snapshot_id (str): Girdi verisinin snapshot kimliği (sonuca kaydedilir)
+        pipeline (inference_pipeline.InferencePipeline): Verilirse model girdileri bu hattan,
+            modelin sütun sırasında üretilir (None ise verideki özellik sütunları kullanılır)
     
     Returns:
         dict: {
@@ -32,7 +36,8 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
             'portfolio_history': pandas.DataFrame,
             'final_portfolio_value': float,
             'total_return': float,
-            'total_trades': int
+            'total_trades': int,
+            'snapshot_id': str
         }
         None: Hata durumunda
         
@@ -48,8 +53,11 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
         
         logger.log_info(f"Backtest başlıyor: Sermaye=${initial_capital:,.0f}, Komisyon=%{commission_rate*100:.1f}")
         
-        # Veriyi temizle ve tarih aralığını filtrele
-        data = data_dataframe.copy().dropna()
+        # Veriyi temizle ve tarih aralığını filtrele (tamamen boş sütunlar, ör. sektöründe tek
+        # sembol kalan CS_Momentum_Sector, modelde de kullanılmaz; satır filtresine girmez).
+        # Geleceği bilinmeyen son satırların Target'ı NaN'dır; işlem günü oldukları için tutulur
+        data = data_dataframe.dropna(axis=1, how='all')
+        data = data.dropna(subset=[column for column in data.columns if column != 'Target'])
         
         if start_date:
             data = data[data.index >= start_date]
@@ -70,10 +78,16 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
         portfolio_history = []
         
         # ML özelliklerini hazırla
-        ml_features = config.ML_FEATURES.copy()
-        scaled_features = [f"{feature}_scaled" for feature in ml_features]
-        all_features = ml_features + scaled_features
-        available_features = [f for f in all_features if f in data.columns]
+        feature_matrix = None
+        if pipeline is not None:
+            # Göstergeler filtrelenmemiş veriden (tam ısınma ile) bir kez hesaplanır; satırlar eşlenir
+            available_features = pipeline.feature_names
+            feature_matrix = pipeline.transform_frame(data_dataframe)[data_dataframe.index.get_indexer(data.index)]
+        else:
+            ml_features = feature_engineer.model_features()  # prepare_data_for_ml ile aynı sütunlar ve sıra
+            scaled_features = [f"{feature}_scaled" for feature in ml_features]
+            all_features = ml_features + scaled_features
+            available_features = [f for f in all_features if f in data.columns]
         
         if not available_features:
             logger.log_error("ML özellikleri bulunamadı")
@@ -81,7 +95,7 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
             
         # Her gün için simülasyon
         for i, (date, row) in enumerate(data.iterrows()):
-            current_price = row['Close']
+            current_price = float(row['Close'])  # nakit ve P&L kompakt modda da float64 hesaplanır
             
             # İlk birkaç günde yeterli veri olmayabilir
             if i < max(20, len(available_features)):
@@ -89,7 +103,10 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
                 
             try:
                 # ML tahmini yap
-                feature_vector = row[available_features].values.reshape(1, -1)
+                if feature_matrix is not None:
+                    feature_vector = feature_matrix[i:i + 1]
+                else:
+                    feature_vector = row[available_features].values.reshape(1, -1)
                 
                 # NaN kontrolü
                 if np.isnan(feature_vector).any():
@@ -235,7 +252,7 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
                 
         # Tüm pozisyonları kapat (backtest sonu)
         final_date = data.index[-1]
-        final_price = data['Close'].iloc[-1]
+        final_price = float(data['Close'].iloc[-1])
         
         for symbol, position in positions.items():
             shares = position['shares']
@@ -278,7 +295,8 @@ def run_backtest(data_dataframe, ml_model_instance, sentiment_analyzer_instance=
             'final_portfolio_value': final_portfolio_value,
             'total_return': total_return,
             'total_trades': len(trade_log_df),
-            'initial_capital': initial_capital
+            'initial_capital': initial_capital,
+            'snapshot_id': snapshot_id
         }
         
         logger.log_info(f"Backtest tamamlandı: Final değer=${final_portfolio_value:,.0f}, Toplam getiri={total_return:.1f}%, İşlem sayısı={len(trade_log_df)}")
@@ -0,0 +1,447 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Bar Aggregator Module
+
+Bu modül, 1 dakikalık barları veya tick'leri (ör. yerel bir replay dosyasından)
+artımlı olarak daha büyük zaman dilimlerine (5m, 15m, 1h, 1d) birleştirir.
+Böylece canlı modda her zaman dilimi için yfinance'e ayrı istek atılmaz.
+
+Kurallar:
+- Gün içi barlar seans açılışına hizalanır (NYSE'de 1h barlar 09:30, 10:30, ...)
+- Hiçbir bar seans sınırını aşmaz; son bar seans kapanışında kesilir (15:30-16:00),
+  yarım günlerde işlem takvimindeki erken kapanış kullanılır
+- Seans öncesi/sonrası veriler sadece prepost açıkken gün içi barlara dahil edilir
+- Günlük bar sadece normal seans verisinden oluşur ve seans kapanışında tamamlanır
+- Sadece tamamlanmış barlar yayınlanır; yarım bar zaman ilerleyince veya flush ile çıkar
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import trading_calendar
+
+
+_NS_PER_DAY = 86_400 * 10 ** 9
+
+
+def parse_timeframe(timeframe):
+    """
+    Zaman dilimi ifadesini çözer.
+
+    Args:
+        timeframe (str): '5m', '15m', '1h', '1d' gibi ifade
+
+    Returns:
+        pandas.Timedelta: Gün içi zaman dilimleri için bar süresi, '1d' için None
+
+    Raises:
+        ValueError: Desteklenmeyen zaman diliminde
+    """
+    if timeframe == '1d':
+        return None
+    units = {'m': 'min', 'h': 'h'}
+    if timeframe and timeframe[-1] in units and timeframe[:-1].isdigit() and int(timeframe[:-1]) > 0:
+        return pd.Timedelta(int(timeframe[:-1]), unit=units[timeframe[-1]])
+    raise ValueError(f"Desteklenmeyen zaman dilimi: {timeframe}")
+
+
+class BarAggregator:
+    """
+    Akan 1 dakikalık barları/tick'leri birden fazla zaman dilimine artımlı birleştirir.
+
+    Her güncelleme sembol ve zaman dilimi başına O(1) iş yapar; tamamlanan barlar
+    güncelleme çağrısının dönüş değeri olarak yayınlanır.
+
+    Kullanım:
+        aggregator = BarAggregator(['5m', '1h', '1d'])
+        for ts, row in minute_bars.iterrows():
+            for bar in aggregator.update_bar('AAPL', ts, *row[OHLCV]):
+                ...  # bar['timeframe'], bar['timestamp'], bar['Close'], ...
+    """
+
+    def __init__(self, timeframes=None, prepost=None, bar_interval='1min'):
+        """
+        Args:
+            timeframes (list): Üretilecek zaman dilimleri (None ise config.AGGREGATION_TIMEFRAMES)
+            prepost (bool): Seans öncesi/sonrası veriler dahil edilsin mi (None ise config.INCLUDE_PREPOST)
+            bar_interval (str): Girdi barlarının süresi (bar zaman damgası başlangıcı gösterir)
+        """
+        self.timeframes = list(timeframes if timeframes is not None else config.AGGREGATION_TIMEFRAMES)
+        self.prepost = config.INCLUDE_PREPOST if prepost is None else prepost
+        self.bar_interval = pd.Timedelta(bar_interval)
+        self._frequencies = {tf: parse_timeframe(tf) for tf in self.timeframes}
+        self._open_bars = {}    # (symbol, timeframe) -> [start, end, open, high, low, close, volume]
+        self._symbol_info = {}  # symbol -> (TradingCalendar, tz_aware)
+        self._day_sessions = {}  # symbol -> (gün, açılış, kapanış) - son işlenen günün seans saatleri
+        self._last_seen = {}    # symbol -> son yerel zaman damgası (sıra kontrolü için)
+
+    def update_bar(self, symbol, timestamp, open_price, high, low, close, volume):
+        """
+        Bir girdi barı (ör. 1 dakikalık) ekler.
+
+        Args:
+            symbol (str): İşlem sembolü
+            timestamp: Bar başlangıç zamanı (saat dilimli veya borsa yerel saati)
+            open_price, high, low, close (float): Bar fiyatları
+            volume (float): Bar hacmi
+
+        Returns:
+            list: Bu güncellemeyle tamamlanan barlar (dict)
+        """
+        local_ts = self._to_local(symbol, timestamp)
+        return self._update(symbol, local_ts, local_ts + self.bar_interval,
+                            open_price, high, low, close, volume)
+
+    def update_tick(self, symbol, timestamp, price, size=0):
+        """
+        Bir işlem (tick) ekler. Tick'in kapsadığı süre olmadığından barlar ancak
+        sonraki bir tick veya advance_time ile zaman ilerleyince tamamlanır.
+
+        Args:
+            symbol (str): İşlem sembolü
+            timestamp: İşlem zamanı
+            price (float): İşlem fiyatı
+            size (float): İşlem miktarı
+
+        Returns:
+            list: Bu güncellemeyle tamamlanan barlar (dict)
+        """
+        local_ts = self._to_local(symbol, timestamp)
+        return self._update(symbol, local_ts, local_ts, price, price, price, price, size)
+
+    def advance_time(self, now, symbol=None):
+        """
+        Saati ilerletir ve bitiş zamanı geçmiş barları yayınlar (ör. seans kapanışında
+        veya zamanlayıcıdan). Veri gelmeyen sessiz dönemlerde barların takılı kalmasını önler.
+
+        Args:
+            now: Şu anki zaman
+            symbol (str): Sadece bu sembol (None ise tüm semboller)
+
+        Returns:
+            list: Tamamlanan barlar (dict)
+        """
+        finished = []
+        symbols = [symbol] if symbol is not None else list(self._symbol_info)
+        for sym in symbols:
+            if sym not in self._symbol_info:
+                continue
+            local_now = self._to_local(sym, now, remember=False)
+            for timeframe in self.timeframes:
+                bar = self._open_bars.get((sym, timeframe))
+                if bar is not None and bar[1] <= local_now:
+                    finished.append(self._emit(sym, timeframe))
+        return finished
+
+    def flush(self, symbol=None):
+        """
+        Açık kalan tüm barları (tamamlanmamış olsalar bile) yayınlar; akışın sonunda kullanılır.
+
+        Args:
+            symbol (str): Sadece bu sembol (None ise tüm semboller)
+
+        Returns:
+            list: Yayınlanan barlar (dict)
+        """
+        keys = [key for key in self._open_bars if symbol is None or key[0] == symbol]
+        return [self._emit(sym, timeframe) for sym, timeframe in keys]
+
+    def _update(self, symbol, local_ts, covered_end, open_price, high, low, close, volume):
+        last_seen = self._last_seen.get(symbol)
+        if last_seen is not None and local_ts < last_seen:
+            logger.log_warning(f"{symbol}: Sıra dışı veri atlandı ({local_ts} < {last_seen})")
+            return []
+        self._last_seen[symbol] = local_ts
+
+        session_open, session_close = self._session_times(symbol, local_ts)
+        finished = []
+        for timeframe in self.timeframes:
+            key = (symbol, timeframe)
+            bucket = _bucket_bounds(local_ts, self._frequencies[timeframe], session_open, session_close, self.prepost)
+            current = self._open_bars.get(key)
+
+            if current is not None and (bucket is None or current[0] != bucket[0]):
+                finished.append(self._emit(symbol, timeframe))
+                current = None
+            if bucket is None:
+                continue
+
+            if current is None:
+                self._open_bars[key] = [bucket[0], bucket[1], open_price, high, low, close, volume]
+            else:
+                current[3] = max(current[3], high)
+                current[4] = min(current[4], low)
+                current[5] = close
+                current[6] += volume
+
+            if covered_end >= bucket[1]:
+                finished.append(self._emit(symbol, timeframe))
+        return finished
+
+    def _session_times(self, symbol, local_ts):
+        """Zaman damgasının gününe ait seans açılış/kapanış saatlerini döndürür (gün başına bir arama)"""
+        day = local_ts.normalize()
+        cached = self._day_sessions.get(symbol)
+        if cached is None or cached[0] != day:
+            calendar = self._symbol_info[symbol][0]
+            close = calendar.session_close_offsets(np.array([day.value // _NS_PER_DAY]))[0]
+            cached = (day, pd.Timedelta(calendar.open_offset), pd.Timedelta(int(close)))
+            self._day_sessions[symbol] = cached
+        return cached[1], cached[2]
+
+    def _emit(self, symbol, timeframe):
+        start, _, open_price, high, low, close, volume = self._open_bars.pop((symbol, timeframe))
+        calendar, tz_aware = self._symbol_info[symbol]
+        timezone = calendar.timezone
+        return {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'timestamp': start.tz_localize(timezone) if tz_aware else start,
+            'Open': open_price,
+            'High': high,
+            'Low': low,
+            'Close': close,
+            'Volume': volume
+        }
+
+    def _to_local(self, symbol, timestamp, remember=True):
+        """Zaman damgasını borsanın saat dilimine (saat dilimsiz) çevirir"""
+        ts = pd.Timestamp(timestamp)
+        if symbol not in self._symbol_info:
+            if not remember:
+                return ts
+            calendar = trading_calendar.get_symbol_calendar(symbol)
+            self._symbol_info[symbol] = (calendar, ts.tzinfo is not None)
+        timezone = self._symbol_info[symbol][0].timezone
+        if ts.tzinfo is not None:
+            return ts.tz_convert(timezone).tz_localize(None)
+        return ts
+
+
+def _bucket_bounds(local_ts, frequency, session_open, session_close, prepost):
+    """
+    Yerel zaman damgasının düştüğü barın [başlangıç, bitiş) aralığını döndürür.
+
+    Returns:
+        tuple: (start, end) veya veri bu zaman diliminde kullanılmayacaksa None
+    """
+    day = local_ts.normalize()
+    time_of_day = local_ts - day
+
+    if frequency is None:  # günlük bar: sadece normal seans
+        if session_open <= time_of_day < session_close:
+            return day, day + session_close
+        return None
+
+    if session_open <= time_of_day < session_close:
+        start = day + session_open + ((time_of_day - session_open) // frequency) * frequency
+        return start, min(start + frequency, day + session_close)
+    if not prepost:
+        return None
+    if time_of_day < session_open:
+        start = max(day, day + session_open + ((time_of_day - session_open) // frequency) * frequency)
+        return start, min(start + frequency, day + session_open)
+    start = day + session_close + ((time_of_day - session_close) // frequency) * frequency
+    return start, min(start + frequency, day + pd.Timedelta(days=1))
+
+
+def aggregate_bars(dataframe, timeframe, symbol=None, prepost=None, bar_interval=None, include_partial=False):
+    """
+    Tarihsel 1 dakikalık barları (veya tick'leri) vektörel olarak büyük zaman dilimine
+    birleştirir. BarAggregator ile aynı seans kurallarını uygular ve aynı barları üretir.
+
+    Args:
+        dataframe (pandas.DataFrame): OHLCV barları veya 'Price'/'Size' kolonlu tick verisi
+        timeframe (str): Hedef zaman dilimi ('5m', '15m', '1h', '1d')
+        symbol (str): Sembol (borsa seansını belirlemek için)
+        prepost (bool): Seans öncesi/sonrası veriler dahil edilsin mi (None ise config)
+        bar_interval (str): Girdi bar süresi (None ise barlar için en küçük aralık, tick'ler için 0)
+        include_partial (bool): Son, tamamlanmamış bar da döndürülsün mü
+
+    Returns:
+        pandas.DataFrame: Birleştirilmiş OHLCV barları (bar başlangıcı indeksli, BarAggregator
+            çıktısıyla aynı datetime64[ns] çözünürlüğünde)
+        None: Hata durumunda
+    """
+    try:
+        if prepost is None:
+            prepost = config.INCLUDE_PREPOST
+        frequency = parse_timeframe(timeframe)
+        calendar = trading_calendar.get_symbol_calendar(symbol)
+        timezone = calendar.timezone
+
+        bars = _as_ohlcv(dataframe)
+        if bars.empty:
+            return bars
+        if bar_interval is None:
+            bar_interval = pd.Timedelta(0) if 'Price' in dataframe.columns else _infer_interval(bars.index)
+        bar_interval = pd.Timedelta(bar_interval)
+
+        index = bars.index
+        tz_aware = index.tz is not None
+        if tz_aware:
+            index = index.tz_convert(timezone).tz_localize(None)
+        local = np.asarray(index.values, dtype='datetime64[ns]').view('int64')
+
+        day = (local // _NS_PER_DAY) * _NS_PER_DAY
+        time_of_day = local - day
+        open_ns = calendar.open_offset
+        close_ns = calendar.session_close_offsets(day // _NS_PER_DAY)  # yarım günlerde erken kapanış
+        regular = (time_of_day >= open_ns) & (time_of_day < close_ns)
+
+        if frequency is None:
+            keep = regular
+            start = day
+            end = day + close_ns
+        else:
+            freq_ns = frequency.value
+            pre = time_of_day < open_ns
+            anchor = np.where(time_of_day >= close_ns, close_ns, open_ns)
+            start = day + anchor + ((time_of_day - anchor) // freq_ns) * freq_ns
+            start = np.maximum(start, day)
+            limit = np.where(regular, day + close_ns, np.where(pre, day + open_ns, day + _NS_PER_DAY))
+            end = np.minimum(start + freq_ns, limit)
+            keep = regular | prepost
+
+        if not keep.any():
+            return _as_ohlcv(dataframe.iloc[:0])
+
+        values = bars[['Open', 'High', 'Low', 'Close', 'Volume']].to_numpy(dtype=np.float64)[keep]
+        start, end, covered = start[keep], end[keep], local[keep] + bar_interval.value
+
+        # Zaman sıralı girdide aynı başlangıçlı satırlar ardışıktır: grup sınırları tek geçişte bulunur
+        boundaries = np.flatnonzero(np.diff(start)) + 1
+        first = np.concatenate([[0], boundaries])
+        last = np.concatenate([boundaries, [len(start)]]) - 1
+
+        result = pd.DataFrame({
+            'Open': values[first, 0],
+            'High': np.maximum.reduceat(values[:, 1], first),
+            'Low': np.minimum.reduceat(values[:, 2], first),
+            'Close': values[last, 3],
+            'Volume': np.add.reduceat(values[:, 4], first)
+        }, index=pd.DatetimeIndex(start[first].astype('datetime64[ns]')))
+
+        if not include_partial and covered[-1] < end[-1]:
+            result = result.iloc[:-1]
+        if tz_aware:
+            result.index = result.index.tz_localize(timezone)
+        if pd.api.types.is_integer_dtype(bars['Volume'].dtype):
+            result['Volume'] = result['Volume'].astype(np.int64)  # toplam hacim 32 biti aşabilir
+        return result
+
+    except Exception as e:
+        logger.log_error(f"Bar birleştirme hatası ({symbol}, {timeframe}): {e}", exc_info=True)
+        return None
+
+
+def _as_ohlcv(dataframe):
+    """Tick verisini ('Price', 'Size') tek işlemlik OHLCV barlarına çevirir; sıralı döndürür"""
+    if 'Price' in dataframe.columns:
+        price = dataframe['Price']
+        size = dataframe['Size'] if 'Size' in dataframe.columns else pd.Series(0, index=dataframe.index)
+        dataframe = pd.DataFrame({'Open': price, 'High': price, 'Low': price, 'Close': price, 'Volume': size})
+    if not dataframe.index.is_monotonic_increasing:
+        dataframe = dataframe.sort_index(kind='stable')
+    return dataframe
+
+
+def _infer_interval(index):
+    """Bar indeksindeki en küçük pozitif aralığı döndürür"""
+    if len(index) < 2:
+        return pd.Timedelta(minutes=1)
+    diffs = np.diff(np.asarray(index.values, dtype='datetime64[ns]').view('int64'))
+    positive = diffs[diffs > 0]
+    return pd.Timedelta(int(positive.min())) if len(positive) else pd.Timedelta(minutes=1)
+
+
+def bars_to_frame(bars):
+    """
+    Yayınlanan bar kayıtlarını zaman dilimi başına DataFrame'e çevirir.
+
+    Args:
+        bars (list): BarAggregator'ın döndürdüğü bar kayıtları
+
+    Returns:
+        dict: {timeframe: pandas.DataFrame} (sembol kolonlu, bar başlangıcı indeksli)
+    """
+    frames = {}
+    if not bars:
+        return frames
+    records = pd.DataFrame(bars)
+    for timeframe, group in records.groupby('timeframe', sort=False):
+        frames[timeframe] = group.drop(columns='timeframe').set_index('timestamp').rename_axis(None)
+    return frames
+
+
+def replay_file(file_path, symbol, timeframes=None, prepost=None):
+    """
+    Yerel bir replay dosyasındaki 1 dakikalık barları veya tick'leri akış olarak
+    BarAggregator'dan geçirir (canlı modun çevrimdışı provası).
+
+    Dosya CSV veya Parquet olabilir; 'Price'/'Size' kolonları varsa tick, aksi halde
+    OHLCV bar verisi olarak okunur. İlk kolon (CSV) zaman damgasıdır.
+
+    Args:
+        file_path (str): Replay dosyası yolu
+        symbol (str): İşlem sembolü
+        timeframes (list): Üretilecek zaman dilimleri (None ise config)
+        prepost (bool): Seans öncesi/sonrası veriler dahil edilsin mi
+
+    Returns:
+        dict: {timeframe: pandas.DataFrame} - sadece tamamlanmış barlar
+        None: Hata durumunda
+    """
+    try:
+        if file_path.endswith('.parquet'):
+            data = pd.read_parquet(file_path)
+        else:
+            data = pd.read_csv(file_path, index_col=0)
+            data.index = pd.to_datetime(data.index, utc=any(c in str(data.index[0])[10:] for c in '+Z'))
+        data = data.sort_index(kind='stable')
+
+        aggregator = BarAggregator(timeframes, prepost=prepost)
+        finished = []
+        if 'Price' in data.columns:
+            sizes = data['Size'].to_numpy() if 'Size' in data.columns else np.zeros(len(data))
+            for timestamp, price, size in zip(data.index, data['Price'].to_numpy(), sizes):
+                finished.extend(aggregator.update_tick(symbol, timestamp, price, size))
+        else:
+            aggregator.bar_interval = _infer_interval(data.index)
+            columns = [data[c].to_numpy() for c in ['Open', 'High', 'Low', 'Close', 'Volume']]
+            for timestamp, *row in zip(data.index, *columns):
+                finished.extend(aggregator.update_bar(symbol, timestamp, *row))
+
+        logger.log_info(f"Replay tamamlandı: {os.path.basename(file_path)}, {len(data)} kayıt, "
+                        f"{len(finished)} tamamlanmış bar")
+        return bars_to_frame(finished)
+
+    except Exception as e:
+        logger.log_error(f"Replay dosyası işlenirken hata ({file_path}): {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Bar Aggregator modülü test kodu
+    """
+    print("=== AI-FTB Bar Aggregator Test ===")
+
+    import data_providers
+
+    minute_bars = data_providers.get_data_provider('synthetic').get_history('AAPL', '2023-03-06', '2023-03-08', '1m')
+    print(f"✅ 1 dakikalık bar: {len(minute_bars)}")
+
+    aggregator = BarAggregator(['5m', '1h', '1d'])
+    emitted = []
+    for ts, row in minute_bars.iterrows():
+        emitted.extend(aggregator.update_bar('AAPL', ts, row['Open'], row['High'], row['Low'], row['Close'], row['Volume']))
+
+    for timeframe, frame in bars_to_frame(emitted).items():
+        print(f"📊 {timeframe}: {len(frame)} bar, ilk {frame.index[0]}, son {frame.index[-1]}")
+
+    print(aggregate_bars(minute_bars, '1h', 'AAPL').head(8))
+    print("\nBar Aggregator test tamamlandı!")
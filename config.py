@@ -34,6 +34,43 @@ HISTORICAL_DATA_START_DATE = '2020-01-01'  # Geçmiş veri başlangıç tarihi
 HISTORICAL_DATA_END_DATE = '2024-12-31'    # Geçmiş veri bitiş tarihi
 PRICE_TIMEFRAME = '1d'  # Fiyat verisi zaman dilimi (1d=günlük, 1h=saatlik)
 
+# Piyasa Verisi Sağlayıcısı
+DATA_PROVIDER = 'yfinance'          # 'yfinance', 'local' (yerel dosyalar), 'synthetic' (deterministik test verisi)
+LOCAL_DATA_PATH = './data/local/'   # 'local' sağlayıcısının okuduğu dizin (NumPy deposu, CSV veya Parquet)
+LOCAL_DATA_DATASET = 'bars'         # 'local' sağlayıcısında NumPy deposu veri seti adı
+SYNTHETIC_DATA_SEED = 42            # 'synthetic' sağlayıcısının rastgelelik tohumu
+
+# Yerel Bar Önbelleği
+DATA_CACHE_ENABLED = True   # Sadece önbellekte olmayan tarih aralıkları indirilir
+DATA_OFFLINE_MODE = False   # True ise hiç indirme yapılmaz, sadece yerel önbellek kullanılır (replay)
+
+# Seans ve Bar Birleştirme Ayarları
+MARKET_SESSIONS = {
+    'NYSE': {'timezone': 'America/New_York', 'open': '09:30', 'close': '16:00', 'half_day_close': '13:00'},  # ABD hisseleri
+    'BIST': {'timezone': 'Europe/Istanbul', 'open': '10:00', 'close': '18:00', 'half_day_close': '12:30'}    # Borsa İstanbul (.IS)
+}
+CALENDAR_START_DATE = '2000-01-01'   # İşlem takviminin hesaplandığı ilk tarih
+CALENDAR_END_DATE = '2030-12-31'     # İşlem takviminin hesaplandığı son tarih
+CALENDAR_EXTRA_HOLIDAYS = {'NYSE': [], 'BIST': []}  # Takvime eklenecek olağanüstü tatiller ('YYYY-MM-DD')
+INCLUDE_PREPOST = False                          # True ise seans öncesi/sonrası barlar gün içi zaman dilimlerine dahil edilir
+AGGREGATION_TIMEFRAMES = ['5m', '15m', '1h', '1d']  # 1 dakikalık barlardan/tick'lerden üretilecek zaman dilimleri
+
+# Toplu Veri Çekme Ayarları
+DATA_FETCH_MAX_WORKERS = 8       # Eşzamanlı indirme sayısı üst sınırı
+DATA_FETCH_MAX_RETRIES = 3       # Sembol başına yeniden deneme sayısı
+DATA_FETCH_RETRY_BACKOFF = 1.0   # İlk yeniden deneme beklemesi (saniye), her denemede iki katına çıkar
+
+# Güncel Fiyat Önbelleği Ayarları
+QUOTE_CACHE_TTL_SECONDS = 15.0        # Güncel fiyatların yeniden çekilmeden kullanıldığı süre (saniye)
+QUOTE_BACKGROUND_REFRESH = False      # True ise sorgulanan semboller arka planda periyodik olarak yenilenir
+QUOTE_REFRESH_INTERVAL_SECONDS = 10.0 # Arka plan yenileme aralığı (saniye)
+
+# Veri Kalitesi Tarama Ayarları
+QUALITY_SCAN_ENABLED = True     # Eğitim öncesi tüm semboller için toplu kalite taraması yapılır
+QUALITY_STALE_RUN = 5           # Kapanış fiyatı bu kadar ardışık bar aynı kalırsa bayat veri sayılır
+QUALITY_RETURN_ZSCORE = 8.0     # Getirisi bu z-skorunu aşan barlar aykırı değer sayılır
+QUALITY_MIN_SCORE = 90.0        # Bu skorun altındaki semboller raporda sorunlu işaretlenir
+
 # Makine Öğrenimi Özellikleri
 ML_FEATURES = [
     'RSI',           # Relative Strength Index
@@ -88,6 +125,21 @@ LOG_LEVEL = 'INFO'  # DEBUG, INFO, WARNING, ERROR, CRITICAL
 # Veri Kaydetme Ayarları
 DATA_SAVE_PATH = './data/'
 MODEL_SAVE_PATH = './models/'
+DATA_STORE_FORMAT = 'npy'            # 'npy' (kolon bazlı NumPy deposu) veya 'csv' (eski format)
+DATA_STORE_PATH = './data/store/'    # Kolon bazlı deponun kök dizini
+SHARED_DATA_PATH = None              # Paralel işçiler için paylaşımlı veri dizini (None ise /dev/shm veya geçici dizin)
+
+# Veri Snapshot Ayarları
+SNAPSHOTS_ENABLED = True             # True ise eğitim/backtest girdileri içerik özetli değiştirilemez snapshot'a dondurulur
+SNAPSHOT_PATH = './data/snapshots/'  # Snapshot'ların ve aşama çıktısı önbelleğinin kök dizini
+SNAPSHOT_OUTPUT_CACHE = True         # Aynı snapshot ve parametrelerle üretilmiş özellik/model/backtest çıktıları yeniden kullanılır
+PRICE_ADJUSTMENT_MODE = 'adjusted'   # 'adjusted' (bölünme + temettü), 'split' (sadece bölünme), 'raw' (ayarsız); snapshot anahtarına girer
+LOCAL_PRICE_ADJUSTMENT = False       # True ise barlar ham saklanır, ayarlama kurumsal işlem tablosuyla okuma sırasında yerelde yapılır
+CORPORATE_ACTIONS_REFRESH_HOURS = 24 # Kurumsal işlem tablosunun sağlayıcıdan yenilenme aralığı (saat)
+
+# Bellek Ayarları
+COMPACT_DTYPES = False               # True ise fiyat/özellikler float32, hacim uint32/int32, semboller kategorik tutulur
+MEMORY_REPORT_ENABLED = False        # True ise eğitim sürecinde aşama bazlı bellek raporu loglanır
 
 # Teknik Gösterge Parametreleri
 TECHNICAL_INDICATORS = {
@@ -101,6 +153,27 @@ TECHNICAL_INDICATORS = {
     'BB_STD': 2,             # Bollinger Bands standart sapma çarpanı
     'VOLATILITY_PERIOD': 14  # Volatilite hesaplama periyodu
 }
+PANEL_INDICATORS_ENABLED = True      # True ise eğitimde tüm sembollerin göstergeleri tek panel hesabıyla üretilir
+MULTI_TIMEFRAME_FEATURES = {         # Üst zaman dilimi göstergeleri (yalnızca kapanmış barlardan, '{gösterge}_{periyot}')
+    'W': ['RSI', 'MACD_Hist', 'Price_Change', 'Volatility'],  # Haftalık
+    'M': ['RSI', 'Price_Change'],                             # Aylık
+}
+CROSS_SECTIONAL_FEATURES_ENABLED = False # True ise eğitimde sembol evrenine göre sıra/z-skor/sektör özellikleri eklenir
+                                         # (canlı döngü ve API tek sembol verisinden CS_* üretemez; bu modellerin
+                                         # tahmin hattı yalnızca CS_* sütunları hazır verildiğinde, ör. backtestte çalışır)
+CROSS_SECTIONAL_MIN_SYMBOLS = 3          # Bir tarihte kesitsel özellik için gereken en az sembol sayısı
+SYMBOL_SECTORS = {                       # Sektöre göre momentum için sembol sektörleri (eksikler 'Other')
+    'AAPL': 'Technology', 'MSFT': 'Technology', 'GOOGL': 'Communication',
+    'TSLA': 'Consumer', 'AMZN': 'Consumer',
+    'THYAO.IS': 'Industrials', 'BIMAS.IS': 'Consumer', 'AKBNK.IS': 'Financials',
+    'GARAN.IS': 'Financials', 'SAHOL.IS': 'Financials',
+}
+
+# Özellik Önbelleği Ayarları
+FEATURE_CACHE_ENABLED = True         # True ise özellikler veri özeti + gösterge parametrelerine göre önbelleğe alınır
+FEATURE_CACHE_PATH = './data/feature_cache/'  # Disk önbelleği dizini
+FEATURE_CACHE_MAX_ENTRIES = 64       # Bellekte (LRU) tutulan en fazla sembol/parametre girdisi
+FEATURE_CACHE_EMA_TOLERANCE = 1e-12  # Yeni bar eklenirken EMA ısınma penceresinin kabul ettiği göreli hata
 
 # Backtest Ayarları
 BACKTEST_INITIAL_CAPITAL = 100000  # Başlangıç sermayesi ($100,000)
@@ -118,6 +191,25 @@ NEWS_SEARCH_KEYWORDS = {
 # Feature Engineering Ayarları
 FEATURE_SCALING_METHOD = 'StandardScaler'  # 'MinMaxScaler', 'StandardScaler'
 TARGET_LOOKAHEAD_DAYS = 1  # Kaç gün sonrasının fiyat yönü tahmin edilecek
+LABEL_HORIZONS = [1, 5, 10, 20]  # labeling.add_labels'ın ürettiği yön etiketi ufukları ('Target_{h}')
+TRIPLE_BARRIER_HORIZON = 10      # Üçlü bariyer etiketinde dikey bariyer (bar sayısı)
+
+# Walk-Forward Ayarları
+WALK_FORWARD_WINDOW = 'expanding'    # 'expanding' (başlangıçtan itibaren) veya 'rolling' (son N bar)
+WALK_FORWARD_TRAIN_BARS = 756        # 'rolling' pencerede eğitim satırı sayısı (~3 yıl)
+WALK_FORWARD_MIN_TRAIN_BARS = 252    # İlk modelin eğitimi için gereken en az satır (~1 yıl)
+WALK_FORWARD_RETRAIN = 'M'           # Yeniden eğitim sıklığı: pandas periyot kodu ('W', 'M', 'Q') veya bar sayısı
+WALK_FORWARD_MAX_WORKERS = None      # Paralel eğitim süreci sayısı (None ise CPU sayısı)
+WALK_FORWARD_SAVE_MODELS = True      # Pencere modelleri ve metrikleri MODEL_SAVE_PATH/walk_forward/ altına kaydedilir
+
+# Çapraz Doğrulama Ayarları (örtüşen etiketler için purge + ambargo)
+CV_METHOD = 'purged'                 # 'purged' (PurgedKFold) veya 'combinatorial' (CPCV)
+CV_N_SPLITS = 5                      # Kat / grup sayısı
+CV_N_TEST_SPLITS = 2                 # CPCV'de her katta test edilen grup sayısı
+CV_EMBARGO_PCT = 0.01                # Test bloğundan sonra eğitimden çıkarılan örnek oranı
+FEATURE_ANALYSIS_ENABLED = True          # True ise eğitimde özellik önemi ve fazlalık analizi loglanır
+FEATURE_COLLINEARITY_THRESHOLD = 0.95    # |korelasyon| bu eşiği aşan özellik çiftleri fazlalık sayılır
+FEATURE_ANALYSIS_N_JOBS = -1             # Karşılıklı bilgi hesabı için paralel iş sayısı (-1: tüm çekirdekler)
 
 if __name__ == "__main__":
     """
@@ -0,0 +1,305 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Corporate Actions Module
+
+Bu modül, ham (ayarlanmamış) barlar üzerinde bölünme ve temettü ayarlamalarını
+okuma sırasında yerelde uygular. Barlar diske ham olarak yazılır; kurumsal işlemler
+sembol başına küçük bir tabloda tutulur. Yeni bir bölünme veya temettü geçmiş
+fiyatları değiştirdiğinde tüm geçmişi yeniden indirmek yerine sadece bu tablo
+güncellenir.
+
+Ayarlama faktörleri tek bir vektörel geçişte hesaplanır: her kurumsal işlemin
+çarpanı ex-tarihinden önceki son bara yazılır ve dizinin sonundan başa doğru
+kümülatif çarpım (cumprod) alınır.
+
+Ayarlama modları:
+    'raw'      - ayarlama yapılmaz
+    'split'    - sadece bölünmeler (fiyat ve hacim)
+    'adjusted' - bölünme ve temettüler (yfinance auto_adjust=True ile aynı)
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import data_store
+import data_providers
+
+
+ACTION_COLUMNS = ['Dividends', 'Stock Splits']
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+ADJUSTMENT_MODES = ('raw', 'split', 'adjusted')
+
+# Kurumsal işlem tablosunun depodaki veri seti ve bölüm adı
+ACTIONS_DATASET = 'corporate_actions'
+ACTIONS_TIMEFRAME = 'actions'
+
+
+def empty_actions():
+    """Boş kurumsal işlem tablosunu döndürür"""
+    return pd.DataFrame({c: pd.Series(dtype=np.float64) for c in ACTION_COLUMNS},
+                        index=pd.DatetimeIndex([], name='Date'))
+
+
+def normalize_actions(actions):
+    """
+    Kurumsal işlem tablosunu ortak biçime getirir: saat dilimsiz gün indeksi,
+    'Dividends' (hisse başı nakit) ve 'Stock Splits' (oran, 0 = bölünme yok) sütunları.
+
+    Args:
+        actions (pandas.DataFrame): yfinance 'actions' biçiminde tablo
+
+    Returns:
+        pandas.DataFrame: Sıralı ve aynı günü birleştirilmiş tablo
+    """
+    if actions is None or len(actions) == 0:
+        return empty_actions()
+
+    table = actions.reindex(columns=ACTION_COLUMNS).astype(np.float64).fillna(0.0)
+    index = pd.DatetimeIndex(table.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    table.index = index.normalize().rename('Date')
+    table = table[(table['Dividends'] != 0) | (table['Stock Splits'] != 0)]
+    # Aynı gündeki kayıtlar tek satırda birleşir (son kayıt geçerlidir)
+    return table[~table.index.duplicated(keep='last')].sort_index()
+
+
+def adjustment_factors(index, close, actions, mode=None):
+    """
+    Her bar için fiyat ve hacim ayarlama faktörlerini hesaplar.
+
+    Ex-tarihi e olan bir işlem, e'den önceki tüm barları etkiler. İşlemin çarpanı
+    e'den önceki son bara yazılır, ardından sondan başa kümülatif çarpım alınır.
+
+    Args:
+        index (pandas.DatetimeIndex): Sıralı bar zaman damgaları
+        close (numpy.ndarray): Ham kapanış fiyatları (temettü oranı için)
+        actions (pandas.DataFrame): normalize_actions biçiminde tablo
+        mode (str): 'raw', 'split' veya 'adjusted' (None ise config.PRICE_ADJUSTMENT_MODE)
+
+    Returns:
+        tuple: (price_factor, volume_factor) - numpy.ndarray, bar sayısı uzunluğunda
+
+    Raises:
+        ValueError: Bilinmeyen ayarlama modunda
+    """
+    if mode is None:
+        mode = config.PRICE_ADJUSTMENT_MODE
+    if mode not in ADJUSTMENT_MODES:
+        raise ValueError(f"Bilinmeyen ayarlama modu: {mode} (geçerli: {list(ADJUSTMENT_MODES)})")
+
+    n = len(index)
+    price_events = np.ones(n, dtype=np.float64)
+    volume_events = np.ones(n, dtype=np.float64)
+    if mode == 'raw' or n == 0 or actions is None or len(actions) == 0:
+        return price_events, volume_events
+
+    if index.tz is not None:
+        index = index.tz_localize(None)  # borsa yerel günü
+    bar_days = np.asarray(index.values, dtype='datetime64[ns]').astype('datetime64[D]')
+    ex_days = np.asarray(actions.index.values, dtype='datetime64[ns]').astype('datetime64[D]')
+
+    # Ex-tarihinden önceki son barın konumu (ilk bardan önceki işlemler etkisizdir)
+    positions = np.searchsorted(bar_days, ex_days, side='left') - 1
+    valid = positions >= 0
+    positions = positions[valid]
+
+    splits = actions['Stock Splits'].to_numpy(dtype=np.float64)[valid]
+    split_ratio = np.where(splits > 0, splits, 1.0)
+    np.multiply.at(price_events, positions, 1.0 / split_ratio)
+    np.multiply.at(volume_events, positions, split_ratio)
+
+    if mode == 'adjusted':
+        dividends = actions['Dividends'].to_numpy(dtype=np.float64)[valid]
+        previous_close = np.asarray(close, dtype=np.float64)[positions]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            dividend_factor = 1.0 - dividends / previous_close
+        dividend_factor = np.where((dividends > 0) & (dividend_factor > 0), dividend_factor, 1.0)
+        np.multiply.at(price_events, positions, dividend_factor)
+
+    # f[t] = t'den sonraki tüm işlemlerin çarpımı: ters kümülatif çarpım
+    price_factor = np.cumprod(price_events[::-1])[::-1]
+    volume_factor = np.cumprod(volume_events[::-1])[::-1]
+    return price_factor, volume_factor
+
+
+def apply_adjustments(data, actions, mode=None):
+    """
+    Ham OHLCV verisine bölünme/temettü ayarlamalarını uygular.
+
+    Args:
+        data (pandas.DataFrame): Ham OHLCV verisi (sıralı DatetimeIndex)
+        actions (pandas.DataFrame): Kurumsal işlem tablosu
+        mode (str): 'raw', 'split' veya 'adjusted' (None ise config.PRICE_ADJUSTMENT_MODE)
+
+    Returns:
+        pandas.DataFrame: Ayarlanmış veri (girdi değiştirilmez)
+    """
+    if data is None or data.empty:
+        return data
+    actions = normalize_actions(actions)
+    price_factor, volume_factor = adjustment_factors(data.index, data['Close'].to_numpy(), actions, mode)
+
+    adjusted = data.copy()
+    if (price_factor == 1.0).all() and (volume_factor == 1.0).all():
+        return adjusted
+
+    price_columns = [c for c in PRICE_COLUMNS if c in adjusted.columns]
+    adjusted[price_columns] = adjusted[price_columns].to_numpy(dtype=np.float64) * price_factor[:, None]
+    if 'Volume' in adjusted.columns:
+        volume = adjusted['Volume'].to_numpy(dtype=np.float64) * volume_factor
+        if pd.api.types.is_integer_dtype(adjusted['Volume'].dtype):
+            volume = np.round(volume).astype(np.int64)
+        adjusted['Volume'] = volume
+    return adjusted
+
+
+def remove_split_adjustment(data, splits):
+    """
+    Sağlayıcının bölünmeye göre ayarlayarak döndürdüğü barları ham hale getirir
+    (Yahoo 'Close' değerleri bölünme ayarlıdır). Bölünme faktörlerinin tersi uygulanır.
+
+    Args:
+        data (pandas.DataFrame): Bölünme ayarlı OHLCV verisi
+        splits (pandas.Series): Ex-tarihi indeksli bölünme oranları (tüm geçmiş)
+
+    Returns:
+        pandas.DataFrame: Ham veri
+    """
+    if data is None or data.empty or splits is None or len(splits) == 0:
+        return data
+    actions = normalize_actions(pd.DataFrame({'Dividends': 0.0, 'Stock Splits': splits}))
+    price_factor, volume_factor = adjustment_factors(data.index, data['Close'].to_numpy(), actions, 'split')
+
+    raw = data.copy()
+    price_columns = [c for c in PRICE_COLUMNS if c in raw.columns]
+    raw[price_columns] = raw[price_columns].to_numpy(dtype=np.float64) / price_factor[:, None]
+    if 'Volume' in raw.columns:
+        volume = raw['Volume'].to_numpy(dtype=np.float64) / volume_factor
+        if pd.api.types.is_integer_dtype(raw['Volume'].dtype):
+            volume = np.round(volume).astype(np.int64)
+        raw['Volume'] = volume
+    return raw
+
+
+def load_actions(symbol, base_path=None):
+    """
+    Sembolün kayıtlı kurumsal işlem tablosunu okur.
+
+    Args:
+        symbol (str): İşlem sembolü
+        base_path (str): Depo kök dizini
+
+    Returns:
+        pandas.DataFrame: Kurumsal işlem tablosu (kayıt yoksa boş)
+    """
+    actions = data_store.read_frame(ACTIONS_DATASET, symbol, ACTIONS_TIMEFRAME, base_path=base_path)
+    return normalize_actions(actions)
+
+
+def save_actions(symbol, actions, base_path=None):
+    """
+    Sembolün kurumsal işlem tablosunu yazar (ham barlara dokunulmaz).
+
+    Args:
+        symbol (str): İşlem sembolü
+        actions (pandas.DataFrame): Kurumsal işlem tablosu
+        base_path (str): Depo kök dizini
+
+    Returns:
+        bool: Başarı durumu
+    """
+    return data_store.write_frame(normalize_actions(actions), ACTIONS_DATASET, symbol, ACTIONS_TIMEFRAME,
+                                  extra_meta={'updated_at': datetime.now().isoformat()}, base_path=base_path)
+
+
+def record_action(symbol, ex_date, split_ratio=None, dividend=None, base_path=None):
+    """
+    Tek bir bölünme veya temettüyü tabloya ekler. Sonraki okumalar bu işlemi
+    yeniden indirme yapmadan yansıtır.
+
+    Args:
+        symbol (str): İşlem sembolü
+        ex_date (str): Ex-tarihi ('YYYY-MM-DD')
+        split_ratio (float): Bölünme oranı (ör. 4:1 bölünme için 4.0)
+        dividend (float): Hisse başına nakit temettü
+        base_path (str): Depo kök dizini
+
+    Returns:
+        bool: Başarı durumu
+    """
+    try:
+        row = pd.DataFrame({'Dividends': [float(dividend or 0.0)], 'Stock Splits': [float(split_ratio or 0.0)]},
+                           index=pd.DatetimeIndex([pd.Timestamp(ex_date)]))
+        actions = pd.concat([load_actions(symbol, base_path), row])
+        logger.log_info(f"{symbol}: Kurumsal işlem kaydedildi ({ex_date}, bölünme={split_ratio}, temettü={dividend})")
+        return save_actions(symbol, actions, base_path)
+    except Exception as e:
+        logger.log_error(f"Kurumsal işlem kaydedilirken hata ({symbol}): {e}")
+        return False
+
+
+def get_actions(symbol, refresh=None, base_path=None):
+    """
+    Sembolün kurumsal işlem tablosunu döndürür. Tablo yoksa veya
+    config.CORPORATE_ACTIONS_REFRESH_HOURS'tan eskiyse ağ sağlayıcısından yenilenir.
+    Elle kaydedilmiş işlemler korunur.
+
+    Args:
+        symbol (str): İşlem sembolü
+        refresh (bool): Yenileme zorla/engelle (None ise yaşa göre karar verilir)
+        base_path (str): Depo kök dizini
+
+    Returns:
+        pandas.DataFrame: Kurumsal işlem tablosu
+    """
+    meta = data_store.read_meta(ACTIONS_DATASET, symbol, ACTIONS_TIMEFRAME, base_path=base_path)
+    stored = load_actions(symbol, base_path) if meta else empty_actions()
+
+    if refresh is None:
+        provider = data_providers.get_data_provider()
+        stale = True
+        if meta and meta.get('updated_at'):
+            age_hours = (datetime.now() - datetime.fromisoformat(meta['updated_at'])).total_seconds() / 3600
+            stale = age_hours > config.CORPORATE_ACTIONS_REFRESH_HOURS
+        refresh = provider.is_remote and stale and not config.DATA_OFFLINE_MODE
+    if not refresh:
+        return stored
+
+    try:
+        fetched = normalize_actions(data_providers.get_data_provider().get_actions(symbol))
+        merged = normalize_actions(pd.concat([stored, fetched]))
+        save_actions(symbol, merged, base_path)
+        logger.log_debug(f"{symbol}: Kurumsal işlem tablosu yenilendi ({len(merged)} kayıt)")
+        return merged
+    except Exception as e:
+        logger.log_warning(f"{symbol}: Kurumsal işlemler yenilenemedi, kayıtlı tablo kullanılıyor: {e}")
+        return stored
+
+
+if __name__ == "__main__":
+    """
+    Corporate Actions modülü test kodu
+    """
+    print("=== AI-FTB Corporate Actions Test ===")
+
+    import time
+
+    dates = pd.bdate_range('2020-01-01', '2024-01-01')
+    raw = pd.DataFrame({'Open': 100.0, 'High': 101.0, 'Low': 99.0, 'Close': 100.0, 'Volume': 1000}, index=dates)
+    raw.loc[raw.index >= '2022-06-06', ['Open', 'High', 'Low', 'Close']] /= 20  # 20:1 bölünme
+    actions = pd.DataFrame({'Dividends': [0.0, 0.25], 'Stock Splits': [20.0, 0.0]},
+                           index=pd.DatetimeIndex(['2022-06-06', '2023-02-10']))
+
+    started = time.perf_counter()
+    adjusted = apply_adjustments(raw, actions, 'adjusted')
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ {len(raw)} bar {elapsed * 1000:.2f} ms içinde ayarlandı")
+    print(f"📊 İlk kapanış: ham={raw['Close'].iloc[0]:.2f}, ayarlı={adjusted['Close'].iloc[0]:.4f}")
+    print(f"📊 İlk hacim: ham={raw['Volume'].iloc[0]}, ayarlı={adjusted['Volume'].iloc[0]}")
+
+    print("\nCorporate Actions test tamamlandı!")
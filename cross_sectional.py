@@ -0,0 +1,192 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Cross-Sectional Features Module
+
+Bu modül, her tarih için tüm semboller arasında (evrene göre) özellikler üretir.
+Sembol göstergeleri tarih hizalı (zaman × sembol) bir panele yerleştirilir ve her
+özellik tek bir vektörel işlemle hesaplanır (tarih başına bir sıralama); sembol
+tablolarının birbiriyle birleştirilmesi gerekmez.
+
+- CS_Return_Rank: günlük getirinin o tarihteki yüzdelik sırası (0-1]
+- CS_Return_ZScore: günlük getirinin evren ortalamasına göre z-skoru
+- CS_Momentum_Sector: 10 günlük momentumun sektör ortalamasından farkı
+- CS_RSI_Percentile: RSI'ın o tarihteki yüzdelik sırası (0-1]
+
+O tarihte işlem görmeyen semboller hesaba katılmaz.
+"""
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import panel_indicators
+import feature_graph
+
+
+# Kesitsel özellik -> kaynak gösterge
+CROSS_SECTIONAL_SOURCES = {
+    'CS_Return_Rank': 'Price_Change',
+    'CS_Return_ZScore': 'Price_Change',
+    'CS_Momentum_Sector': 'Momentum_10',
+    'CS_RSI_Percentile': 'RSI',
+}
+
+
+def percentile_rank(values, min_symbols=None):
+    """
+    Her satırda (tarih) yüzdelik sıra; eşitlerde ortalama sıra kullanılır.
+
+    Args:
+        values (numpy.ndarray): (zaman × sembol) değerler
+        min_symbols (int): Geçerli sembol sayısı bundan azsa satır NaN (None ise config)
+
+    Returns:
+        numpy.ndarray: (zaman × sembol) sıralar (0-1]; NaN girdiler NaN kalır
+    """
+    min_symbols = config.CROSS_SECTIONAL_MIN_SYMBOLS if min_symbols is None else min_symbols
+    ranks = pd.DataFrame(values).rank(axis=1, method='average', pct=True).to_numpy(dtype=np.float64, copy=True)
+    ranks[(~np.isnan(values)).sum(axis=1) < min_symbols] = np.nan
+    return ranks
+
+
+def zscore(values, min_symbols=None):
+    """
+    Her satırda evren ortalaması ve standart sapmasına (ddof=0) göre z-skoru.
+    Tüm değerleri aynı olan satırlar NaN olur.
+
+    Args:
+        values (numpy.ndarray): (zaman × sembol) değerler
+        min_symbols (int): Geçerli sembol sayısı bundan azsa satır NaN (None ise config)
+
+    Returns:
+        numpy.ndarray: (zaman × sembol) z-skorları
+    """
+    min_symbols = config.CROSS_SECTIONAL_MIN_SYMBOLS if min_symbols is None else min_symbols
+    present = ~np.isnan(values)
+    count = present.sum(axis=1, keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean = np.where(present, values, 0.0).sum(axis=1, keepdims=True) / count
+        deviation = np.where(present, values - mean, 0.0)
+        std = np.sqrt((deviation ** 2).sum(axis=1, keepdims=True) / count)
+        scores = (values - mean) / std
+    scores[((count < min_symbols) | (std == 0))[:, 0]] = np.nan
+    return scores
+
+
+def group_demean(values, groups):
+    """
+    Her satırda değerin kendi grubunun (sektör) ortalamasından farkı. Grup ortalamaları
+    sembol × grup göstergesi matrisiyle tek çarpımda alınır; o tarihte grubunda tek
+    geçerli sembol kalan değerler NaN olur.
+
+    Args:
+        values (numpy.ndarray): (zaman × sembol) değerler
+        groups (list): Sembol başına grup adı
+
+    Returns:
+        numpy.ndarray: (zaman × sembol) grup ortalamasından farklar
+    """
+    labels, codes = np.unique(np.asarray(groups, dtype=str), return_inverse=True)
+    membership = np.zeros((len(codes), len(labels)))
+    membership[np.arange(len(codes)), codes] = 1.0
+
+    present = ~np.isnan(values)
+    sums = np.where(present, values, 0.0) @ membership
+    counts = present.astype(np.float64) @ membership
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / counts
+    demeaned = values - means[:, codes]
+    demeaned[counts[:, codes] < 2] = np.nan
+    return demeaned
+
+
+def compute_cross_sectional(sources, sectors, min_symbols=None):
+    """
+    Kaynak gösterge panellerinden kesitsel özellikleri hesaplar.
+
+    Args:
+        sources (dict): {'Price_Change'|'Momentum_10'|'RSI': (zaman × sembol) dizi}
+        sectors (list): Sembol başına sektör adı
+        min_symbols (int): Bir tarihte gereken en az geçerli sembol sayısı
+
+    Returns:
+        dict: {kesitsel özellik: (zaman × sembol) dizi}
+    """
+    returns = sources['Price_Change']
+    return {
+        'CS_Return_Rank': percentile_rank(returns, min_symbols),
+        'CS_Return_ZScore': zscore(returns, min_symbols),
+        'CS_Momentum_Sector': group_demean(sources['Momentum_10'], sectors),
+        'CS_RSI_Percentile': percentile_rank(sources['RSI'], min_symbols),
+    }
+
+
+def add_cross_sectional_features(frames, sectors=None, min_symbols=None):
+    """
+    Sembol DataFrame'lerine kesitsel özellikleri ekler. Kaynak göstergeler (RSI,
+    Price_Change, Momentum_10) yoksa sembol bazında hesaplanır.
+
+    Args:
+        frames (dict): {sembol: OHLCV veya göstergeli DataFrame}
+        sectors (dict): {sembol: sektör} (None ise config.SYMBOL_SECTORS; eksikler 'Other')
+        min_symbols (int): Bir tarihte gereken en az geçerli sembol sayısı
+
+    Returns:
+        dict: {sembol: kesitsel sütunlar eklenmiş DataFrame}
+        None: Hata durumunda
+    """
+    try:
+        sectors = config.SYMBOL_SECTORS if sectors is None else sectors
+        source_columns = list(dict.fromkeys(CROSS_SECTIONAL_SOURCES.values()))
+
+        frames = {s: f for s, f in frames.items() if f is not None and len(f) > 0}
+        for symbol, frame in frames.items():
+            missing = [c for c in source_columns if c not in frame.columns]
+            if missing:
+                frames[symbol] = feature_graph.FeatureGraph().compute(frame, missing)
+
+        # Tarih hizalı panel: satırlar tüm tarihlerin birleşimi, sembolün işlem görmediği tarihler NaN
+        panel = panel_indicators.build_panel(frames, align='date')
+        symbols, rows = panel['symbols'], panel['rows']
+        sources = {}
+        for column in source_columns:
+            values = np.full((len(panel['index']), len(symbols)), np.nan)
+            for position, symbol in enumerate(symbols):
+                values[rows[symbol], position] = frames[symbol][column].to_numpy(dtype=np.float64)
+            sources[column] = values
+
+        features = compute_cross_sectional(sources, [sectors.get(s, 'Other') for s in symbols], min_symbols)
+
+        results = {}
+        for position, symbol in enumerate(symbols):
+            data = frames[symbol].copy()
+            for name, values in features.items():
+                data[name] = values[rows[symbol], position]
+            results[symbol] = data
+        logger.log_info(f"Kesitsel özellikler eklendi: {len(symbols)} sembol, {len(panel['index'])} tarih")
+        return results
+
+    except Exception as e:
+        logger.log_error(f"Kesitsel özellikler hesaplanırken hata: {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Cross-Sectional Features modülü test kodu
+    """
+    print("=== AI-FTB Cross-Sectional Features Test ===")
+
+    import time
+    import data_providers
+
+    provider = data_providers.get_data_provider('synthetic')
+    frames = {s: provider.get_history(s, '2020-01-01', '2024-01-01') for s in config.SYMBOLS + config.TURKISH_SYMBOLS}
+    frames = panel_indicators.add_panel_indicators(frames)
+
+    started = time.perf_counter()
+    enhanced = add_cross_sectional_features(frames)
+    print(f"✅ {len(enhanced)} sembol: {(time.perf_counter() - started) * 1000:.1f} ms")
+    print(enhanced['AAPL'][list(CROSS_SECTIONAL_SOURCES)].dropna().tail(3))
+
+    print("\nCross-Sectional Features test tamamlandı!")
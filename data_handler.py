@@ -2,28 +2,54 @@
 AI-FTB (AI-Powered Financial Trading Bot) Data Handler Module
 
 Bu modül, finansal piyasalardan geçmiş fiyat ve hacim verilerini güvenilir bir şekilde 
-çeker ve temel ön işlemeden geçirir. yfinance kütüphanesini kullanarak 
-tarihsel OHLCV verilerini alır.
+çeker ve temel ön işlemeden geçirir. Tarihsel OHLCV verileri config.DATA_PROVIDER ile 
+seçilen veri sağlayıcısından (yfinance, yerel dosyalar veya sentetik veri) alınır.
 """
 
 import pandas as pd
-import yfinance as yf
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 import config
 import logger
+import data_store
+import data_providers
+import memory_utils
+import bar_aggregator
+import trading_calendar
+import quote_cache
+import corporate_actions
+import data_quality
 
 
-def fetch_historical_data(symbol, start_date=None, end_date=None, timeframe=None):
+# Yerel bar önbelleğinin depodaki veri seti adı (sağlayıcı adı sonek olarak eklenir)
+BAR_CACHE_DATASET = 'bar_cache'
+
+# Boş dönen bu uzunluktan kısa aralıklar (hafta sonu, tatil) indirilmiş sayılır
+_EMPTY_RANGE_TOLERANCE_DAYS = 7
+
+
+def fetch_historical_data(symbol, start_date=None, end_date=None, timeframe=None, use_cache=None, offline=None):
     """
     Belirli bir sembol için tarihsel OHLCV (Açılış, En Yüksek, En Düşük, Kapanış, Hacim) 
-    verilerini yfinance kullanarak çeker.
+    verilerini config.DATA_PROVIDER ile seçilen veri sağlayıcısından (bkz. data_providers)
+    çeker.
+
+    Önbellek etkinse sembolün yerel geçmişi korunur, istenen aralıktan sadece daha önce
+    indirilmemiş tarih aralıkları indirilip mevcut verilerle birleştirilir. Offline modda
+    hiç indirme yapılmaz, sadece yerel önbellek kullanılır.
+    
+    config.LOCAL_PRICE_ADJUSTMENT açıksa barlar ham saklanır ve bölünme/temettü
+    ayarlaması kurumsal işlem tablosuyla okuma sırasında uygulanır (bkz. corporate_actions).
     
     Args:
         symbol (str): İşlem sembolü (örn. 'AAPL', 'MSFT')
         start_date (str): Başlangıç tarihi ('YYYY-MM-DD' formatında)
         end_date (str): Bitiş tarihi ('YYYY-MM-DD' formatında)
         timeframe (str): Veri zaman dilimi ('1d', '1h', '1m' vb.)
+        use_cache (bool): Yerel bar önbelleği kullanılsın mı (None ise config'ten alınır)
+        offline (bool): Sadece yerel önbellekten oku (None ise config'ten alınır)
     
     Returns:
         pandas.DataFrame: Temizlenmiş, datetime indeksli OHLCV verisi
@@ -33,81 +59,448 @@ def fetch_historical_data(symbol, start_date=None, end_date=None, timeframe=None
         Exception: API çağrısı veya veri işleme hatalarında
     """
     try:
-        # Parametreleri config'ten al eğer verilmemişse
-        if start_date is None:
-            start_date = config.HISTORICAL_DATA_START_DATE
-        if end_date is None:
-            end_date = config.HISTORICAL_DATA_END_DATE
-        if timeframe is None:
-            timeframe = config.PRICE_TIMEFRAME
-            
-        logger.log_info(f"Veri çekiliyor: {symbol} ({start_date} - {end_date}, {timeframe})")
-        
-        # yfinance ile veri çek
-        ticker = yf.Ticker(symbol)
-        data = ticker.history(
-            start=start_date,
-            end=end_date,
-            interval=timeframe,
-            auto_adjust=True,  # Bölünme ve temettü ayarlamaları otomatik yapılır
-            prepost=True       # Piyasa öncesi ve sonrası veriler dahil edilir
-        )
+        return _fetch_symbol(symbol, start_date, end_date, timeframe, use_cache, offline)
         
-        # Veri kontrolü
-        if data.empty:
-            logger.log_warning(f"Sembol {symbol} için veri bulunamadı")
-            return None
+    except Exception as e:
+        logger.log_error(f"Veri çekerken hata ({symbol}): {e}", exc_info=True)
+        return None
+
+
+def _fetch_symbol(symbol, start_date=None, end_date=None, timeframe=None, use_cache=None, offline=None,
+                  raw_bars=None):
+    """
+    fetch_historical_data'nın hata yakalamayan çekirdeği. İndirme hataları
+    çağırana iletilir (toplu çekmede yeniden deneme için).
+    
+    Args:
+        raw_bars (dict): Verilirse temizlenmemiş barlar {symbol: DataFrame} olarak eklenir
+            (kalite taraması eksik/sıfır değerleri doldurulmadan görsün diye)
+    
+    Returns:
+        pandas.DataFrame: Temizlenmiş OHLCV verisi
+        None: Veri bulunamazsa veya yetersizse
+    """
+    # Parametreleri config'ten al eğer verilmemişse
+    if start_date is None:
+        start_date = config.HISTORICAL_DATA_START_DATE
+    if end_date is None:
+        end_date = config.HISTORICAL_DATA_END_DATE
+    if timeframe is None:
+        timeframe = config.PRICE_TIMEFRAME
+    if use_cache is None:
+        use_cache = config.DATA_CACHE_ENABLED
+    if offline is None:
+        offline = config.DATA_OFFLINE_MODE
+        
+    logger.log_info(f"Veri çekiliyor: {symbol} ({start_date} - {end_date}, {timeframe})")
+    
+    # Önbellek sadece ağdan veri getiren sağlayıcılar için kullanılır
+    # (yerel ve sentetik sağlayıcılar zaten disk/bellek hızında)
+    if (use_cache or offline) and data_providers.get_data_provider().is_remote:
+        data = _fetch_with_cache(symbol, start_date, end_date, timeframe, offline)
+    else:
+        data = _download_bars(symbol, start_date, end_date, timeframe)
+    
+    # Veri kontrolü
+    if data is None or data.empty:
+        logger.log_warning(f"Sembol {symbol} için veri bulunamadı")
+        return None
+        
+    # Ham barlara bölünme/temettü ayarlamasını yerelde uygula
+    if config.LOCAL_PRICE_ADJUSTMENT:
+        data = corporate_actions.apply_adjustments(data, corporate_actions.get_actions(symbol),
+                                                   config.PRICE_ADJUSTMENT_MODE)
+        
+    data = _check_calendar_gaps(data, symbol, timeframe)
+    if raw_bars is not None:
+        raw_bars[symbol] = data
+    return memory_utils.maybe_compact(_clean_historical_data(data, symbol))
+
+
+def fetch_historical_data_many(symbols, start_date=None, end_date=None, timeframe=None,
+                               max_workers=None, max_retries=None, retry_backoff=None, quality_scan=None):
+    """
+    Birden fazla sembolün tarihsel verisini sınırlı bir iş parçacığı havuzu ile
+    eşzamanlı çeker. Her sembol hata durumunda üstel bekleme ile yeniden denenir.
+    
+    Kalite taraması açıksa tüm sembollerin temizlenmemiş barları tek geçişte taranır
+    (bkz. data_quality); temizlik sonrası doldurulan değerler sorun olarak görünmez.
+    
+    Args:
+        symbols (list): Sembol listesi
+        start_date (str): Başlangıç tarihi ('YYYY-MM-DD' formatında)
+        end_date (str): Bitiş tarihi ('YYYY-MM-DD' formatında)
+        timeframe (str): Veri zaman dilimi
+        max_workers (int): Eşzamanlı indirme sayısı üst sınırı
+        max_retries (int): Sembol başına en fazla yeniden deneme sayısı
+        retry_backoff (float): İlk yeniden deneme öncesi bekleme (saniye), her denemede iki katına çıkar
+        quality_scan (bool): Ham barlar kalite taramasından geçirilsin mi (None ise config.QUALITY_SCAN_ENABLED)
+    
+    Returns:
+        tuple: (data, failures)
+            data (dict): {symbol: pandas.DataFrame} - başarıyla çekilen semboller
+            failures (dict): {symbol: str} - başarısız semboller ve hata nedeni
+    """
+    if max_workers is None:
+        max_workers = config.DATA_FETCH_MAX_WORKERS
+    if max_retries is None:
+        max_retries = config.DATA_FETCH_MAX_RETRIES
+    if retry_backoff is None:
+        retry_backoff = config.DATA_FETCH_RETRY_BACKOFF
+    if quality_scan is None:
+        quality_scan = config.QUALITY_SCAN_ENABLED
+        
+    symbols = list(dict.fromkeys(symbols))  # Sırayı koruyarak tekrarları kaldır
+    data = {}
+    failures = {}
+    raw_bars = {} if quality_scan else None
+    
+    if not symbols:
+        return data, failures
+        
+    logger.log_info(f"{len(symbols)} sembol için toplu veri çekiliyor (en fazla {max_workers} eşzamanlı)")
+    started = time.perf_counter()
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+        futures = {
+            executor.submit(_fetch_symbol_with_retry, symbol, start_date, end_date, timeframe,
+                            max_retries, retry_backoff, raw_bars): symbol
+            for symbol in symbols
+        }
+        for future in as_completed(futures):
+            symbol = futures[future]
+            try:
+                frame = future.result()
+                if frame is None:
+                    failures[symbol] = 'Veri bulunamadı veya yetersiz'
+                else:
+                    data[symbol] = frame
+            except Exception as e:
+                failures[symbol] = str(e)
+                logger.log_error(f"{symbol}: Toplu veri çekme başarısız: {e}")
+                
+    # Sonuçları giriş sırasına göre döndür
+    data = {symbol: data[symbol] for symbol in symbols if symbol in data}
+    
+    elapsed = time.perf_counter() - started
+    logger.log_info(
+        f"Toplu veri çekme tamamlandı: {len(data)}/{len(symbols)} başarılı, "
+        f"{elapsed:.2f} sn ({len(symbols) / elapsed if elapsed > 0 else 0:.1f} sembol/sn)"
+    )
+    if failures:
+        logger.log_warning(f"Başarısız semboller: {failures}")
+        
+    # Tüm semboller için temizlenmemiş barlarla tek geçişte veri kalitesi taraması
+    if raw_bars:
+        data_quality.scan_frames({symbol: raw_bars[symbol] for symbol in symbols if symbol in raw_bars})
+        
+    return data, failures
+
+
+def fetch_historical_timeframes(symbol, timeframes=None, start_date=None, end_date=None, base_timeframe='1m'):
+    """
+    Sembolün verisini temel zaman diliminde (ör. 1 dakika) bir kez çeker ve istenen
+    büyük zaman dilimlerini yerelde birleştirir. Her zaman dilimi için ayrı indirme yapılmaz.
+    
+    Args:
+        symbol (str): İşlem sembolü
+        timeframes (list): Üretilecek zaman dilimleri (None ise config.AGGREGATION_TIMEFRAMES)
+        start_date (str): Başlangıç tarihi ('YYYY-MM-DD' formatında)
+        end_date (str): Bitiş tarihi ('YYYY-MM-DD' formatında)
+        base_timeframe (str): İndirilecek temel zaman dilimi
+    
+    Returns:
+        dict: {timeframe: pandas.DataFrame} - sadece tamamlanmış barlar
+        None: Temel veri çekilemezse
+    """
+    if timeframes is None:
+        timeframes = config.AGGREGATION_TIMEFRAMES
+        
+    base = fetch_historical_data(symbol, start_date, end_date, base_timeframe)
+    if base is None:
+        return None
+        
+    frames = {}
+    for timeframe in timeframes:
+        if timeframe == base_timeframe:
+            frames[timeframe] = base
+            continue
+        aggregated = bar_aggregator.aggregate_bars(base, timeframe, symbol)
+        if aggregated is not None:
+            frames[timeframe] = aggregated
             
-        # Sütun adlarını standartlaştır (yfinance bazen farklı isimler kullanır)
-        data.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+    logger.log_info(f"{symbol}: {base_timeframe} verisinden {list(frames)} zaman dilimleri üretildi")
+    return frames
+
+
+def _fetch_symbol_with_retry(symbol, start_date, end_date, timeframe, max_retries, retry_backoff, raw_bars=None):
+    """
+    Tek bir sembolü hata durumunda üstel bekleme ile yeniden deneyerek çeker.
+    
+    Returns:
+        pandas.DataFrame: Temizlenmiş OHLCV verisi
+        None: Veri bulunamazsa veya yetersizse
         
-        # Index'in datetime formatında olduğundan emin ol
-        if not isinstance(data.index, pd.DatetimeIndex):
-            data.index = pd.to_datetime(data.index)
+    Raises:
+        Exception: Tüm denemeler başarısız olursa son hata
+    """
+    attempt = 0
+    while True:
+        try:
+            return _fetch_symbol(symbol, start_date, end_date, timeframe, raw_bars=raw_bars)
+        except Exception as e:
+            if attempt >= max_retries:
+                raise
+            delay = retry_backoff * (2 ** attempt)
+            attempt += 1
+            logger.log_warning(f"{symbol}: Veri çekme hatası ({e}), {delay:.1f} sn sonra tekrar denenecek "
+                               f"({attempt}/{max_retries})")
+            time.sleep(delay)
+
+
+def _download_bars(symbol, start_date, end_date, timeframe):
+    """
+    Seçili veri sağlayıcısından (config.DATA_PROVIDER) ham OHLCV barlarını alır.
+    
+    Args:
+        symbol (str): İşlem sembolü
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+        timeframe (str): Veri zaman dilimi
+    
+    Returns:
+        pandas.DataFrame: OHLCV verisi (veri yoksa boş DataFrame)
+        
+    Raises:
+        Exception: Veri kaynağı hatalarında
+    """
+    return data_providers.get_data_provider().get_history(symbol, start_date, end_date, timeframe)
+
+
+def _check_calendar_gaps(data, symbol, timeframe):
+    """
+    Veriyi sembolün borsa takvimiyle karşılaştırır. Eksik seansları raporlar; günlük
+    veride tatil/hafta sonuna düşen boş satırları (fiyatsız veya sıfır hacimli) atar.
+    
+    Args:
+        data (pandas.DataFrame): Ham OHLCV verisi
+        symbol (str): Sembol adı
+        timeframe (str): Veri zaman dilimi
+    
+    Returns:
+        pandas.DataFrame: Seans dışı boş satırları atılmış veri
+    """
+    calendar = trading_calendar.get_symbol_calendar(symbol)
+    
+    if timeframe == '1d':
+        prices = data.reindex(columns=['Open', 'High', 'Low', 'Close'])
+        empty_rows = prices.isnull().all(axis=1).to_numpy()
+        if 'Volume' in data.columns:
+            empty_rows = empty_rows | (data['Volume'] == 0).to_numpy()
+        drop = empty_rows & ~calendar.is_session(data.index)
+        if drop.any():
+            logger.log_info(f"{symbol}: İşlem günü olmayan {int(drop.sum())} boş satır atıldı")
+            data = data[~drop]
             
-        # Eksik verileri önceki geçerli değerle doldur (forward fill)
-        data_before_fill = data.isnull().sum().sum()
-        data = data.ffill()
-        data_after_fill = data.isnull().sum().sum()
+    missing = calendar.missing_sessions(data.index)
+    if len(missing) > 0:
+        logger.log_warning(f"{symbol}: {calendar.exchange} takvimine göre {len(missing)} eksik seans "
+                           f"(ilk: {missing[0]}, son: {missing[-1]})")
+    return data
+
+
+def _clean_historical_data(data, symbol):
+    """
+    Ham OHLCV verisindeki eksik ve geçersiz değerleri temizler ve yeterliliğini kontrol eder.
+    
+    Args:
+        data (pandas.DataFrame): Ham OHLCV verisi
+        symbol (str): Sembol adı (loglama için)
+    
+    Returns:
+        pandas.DataFrame: Temizlenmiş veri
+        None: Veri yetersizse
+    """
+    # Eksik verileri önceki geçerli değerle doldur (forward fill)
+    data_before_fill = data.isnull().sum().sum()
+    data = data.ffill()
+    data_after_fill = data.isnull().sum().sum()
+    
+    if data_before_fill > 0:
+        logger.log_info(f"{symbol}: {data_before_fill} eksik veri forward fill ile dolduruldu")
         
-        if data_before_fill > 0:
-            logger.log_info(f"{symbol}: {data_before_fill} eksik veri forward fill ile dolduruldu")
+    # Hala eksik veriler varsa (ilk satırlar), backward fill kullan
+    if data_after_fill > 0:
+        data = data.bfill()
+        final_missing = data.isnull().sum().sum()
+        if final_missing > 0:
+            logger.log_warning(f"{symbol}: {final_missing} veri hala eksik")
             
-        # Hala eksik veriler varsa (ilk satırlar), backward fill kullan
-        if data_after_fill > 0:
-            data = data.bfill()
-            final_missing = data.isnull().sum().sum()
-            if final_missing > 0:
-                logger.log_warning(f"{symbol}: {final_missing} veri hala eksik")
-                
-        # Verinin geçerliliğini kontrol et
-        if len(data) < 50:  # En az 50 günlük veri gerekli
-            logger.log_warning(f"{symbol}: Yetersiz veri ({len(data)} gün)")
-            return None
+    # Verinin geçerliliğini kontrol et
+    if len(data) < 50:  # En az 50 günlük veri gerekli
+        logger.log_warning(f"{symbol}: Yetersiz veri ({len(data)} gün)")
+        return None
+        
+    # Negatif fiyatları kontrol et
+    if (data[['Open', 'High', 'Low', 'Close']] <= 0).any().any():
+        logger.log_warning(f"{symbol}: Negatif veya sıfır fiyat değerleri tespit edildi")
+        # Negatif değerleri bir önceki geçerli değerle değiştir
+        data = data.mask(data <= 0).ffill()
+        
+    logger.log_info(f"{symbol}: {len(data)} günlük veri başarıyla çekildi")
+    return data
+
+
+def _fetch_with_cache(symbol, start_date, end_date, timeframe, offline=False):
+    """
+    İstenen aralığı yerel bar önbelleğinden karşılar; eksik tarih aralıklarını
+    indirip önbelleğe ekler.
+    
+    Args:
+        symbol (str): İşlem sembolü
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+        timeframe (str): Veri zaman dilimi
+        offline (bool): True ise indirme yapılmaz
+    
+    Returns:
+        pandas.DataFrame: İstenen aralıktaki ham OHLCV verisi (boş olabilir)
+    """
+    dataset = f"{BAR_CACHE_DATASET}_{config.DATA_PROVIDER}"
+    if config.LOCAL_PRICE_ADJUSTMENT:
+        dataset = f"{dataset}_raw"  # ham ve ayarlı barlar aynı önbellekte karışmaz
+    meta = data_store.read_meta(dataset, symbol, timeframe)
+    coverage = meta.get('coverage', []) if meta else []
+    cached = data_store.read_frame(dataset, symbol, timeframe) if meta else None
+    
+    missing_ranges = _find_missing_ranges(coverage, start_date, end_date)
+    
+    if offline:
+        if missing_ranges:
+            logger.log_warning(f"{symbol}: Offline mod, önbellekte eksik aralıklar: {missing_ranges}")
+        if cached is None:
+            return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
+        return _slice_by_date(cached, start_date, end_date)
+        
+    if not missing_ranges:
+        logger.log_info(f"{symbol}: Tüm aralık önbellekten okundu")
+        return _slice_by_date(cached, start_date, end_date)
+        
+    # Bugünün barı henüz tamamlanmamış olabilir, kapsama bugünden öncesine kadar yazılır
+    today = pd.Timestamp.now().normalize()
+    
+    downloaded = []
+    for range_start, range_end in missing_ranges:
+        logger.log_info(f"{symbol}: Eksik aralık indiriliyor ({range_start} - {range_end})")
+        bars = _download_bars(symbol, range_start, range_end, timeframe)
+        
+        covered_end = min(pd.Timestamp(range_end), today)
+        if bars.empty and (covered_end - pd.Timestamp(range_start)).days > _EMPTY_RANGE_TOLERANCE_DAYS:
+            # Uzun bir aralığın boş gelmesi geçici bir API hatası olabilir, kapsama yazılmaz
+            logger.log_warning(f"{symbol}: {range_start} - {range_end} aralığı boş döndü")
+            continue
             
-        # Negatif fiyatları kontrol et
-        if (data[['Open', 'High', 'Low', 'Close']] <= 0).any().any():
-            logger.log_warning(f"{symbol}: Negatif veya sıfır fiyat değerleri tespit edildi")
-            # Negatif değerleri bir önceki geçerli değerle değiştir
-            data[data <= 0] = None
-            data = data.ffill()
+        if not bars.empty:
+            downloaded.append(bars)
+        if covered_end > pd.Timestamp(range_start):
+            coverage.append([range_start, covered_end.strftime('%Y-%m-%d')])
             
-        logger.log_info(f"{symbol}: {len(data)} günlük veri başarıyla çekildi")
-        return data
+    frames = [f for f in [cached] + downloaded if f is not None and not f.empty]
+    if not frames:
+        return pd.DataFrame(columns=['Open', 'High', 'Low', 'Close', 'Volume'])
         
-    except Exception as e:
-        logger.log_error(f"Veri çekerken hata ({symbol}): {e}", exc_info=True)
-        return None
+    merged = pd.concat(frames) if len(frames) > 1 else frames[0]
+    merged = merged[~merged.index.duplicated(keep='last')].sort_index()
+    
+    data_store.write_frame(merged, dataset, symbol, timeframe,
+                           extra_meta={'coverage': _merge_ranges(coverage)})
+    
+    return _slice_by_date(merged, start_date, end_date)
+
+
+def _merge_ranges(ranges):
+    """
+    Çakışan veya bitişik [başlangıç, bitiş) tarih aralıklarını birleştirir.
+    
+    Args:
+        ranges (list): [['YYYY-MM-DD', 'YYYY-MM-DD'], ...] aralık listesi
+    
+    Returns:
+        list: Sıralı ve birleştirilmiş aralık listesi
+    """
+    merged = []
+    for range_start, range_end in sorted(ranges):
+        if merged and range_start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], range_end)
+        else:
+            merged.append([range_start, range_end])
+    return merged
+
+
+def _find_missing_ranges(coverage, start_date, end_date):
+    """
+    İstenen [start_date, end_date) aralığının önbellek kapsamında olmayan kısımlarını bulur.
+    
+    Args:
+        coverage (list): Önbellekte indirilmiş aralıklar
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+    
+    Returns:
+        list: [(başlangıç, bitiş), ...] eksik aralıklar ('YYYY-MM-DD' formatında)
+    """
+    start = pd.Timestamp(start_date).strftime('%Y-%m-%d')
+    end = pd.Timestamp(end_date).strftime('%Y-%m-%d')
+    
+    missing = []
+    cursor = start
+    for covered_start, covered_end in _merge_ranges(coverage):
+        if covered_end <= cursor:
+            continue
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            missing.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+        if cursor >= end:
+            break
+            
+    if cursor < end:
+        missing.append((cursor, end))
+    return missing
 
 
-def save_data(dataframe, filename, symbol=None):
+def _slice_by_date(data, start_date, end_date):
     """
-    DataFrame'i belirtilen dosyaya CSV formatında kaydeder.
+    Datetime indeksli veriyi [start_date, end_date) aralığına göre filtreler.
+    Zaman dilimli indekslerde sınırlar indeksin zaman dilimine çevrilir.
+    
+    Args:
+        data (pandas.DataFrame): Filtrelenecek veri
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+    
+    Returns:
+        pandas.DataFrame: Filtrelenmiş veri
+    """
+    start = pd.Timestamp(start_date)
+    end = pd.Timestamp(end_date)
+    if data.index.tz is not None:
+        start = start.tz_localize(data.index.tz) if start.tzinfo is None else start
+        end = end.tz_localize(data.index.tz) if end.tzinfo is None else end
+    return data[(data.index >= start) & (data.index < end)]
+
+
+def save_data(dataframe, filename, symbol=None, timeframe=None):
+    """
+    DataFrame'i kaydeder. config.DATA_STORE_FORMAT 'npy' ise kolon bazlı depoya
+    (sembol ve zaman dilimine göre bölümlenmiş), 'csv' ise CSV dosyasına yazar.
     
     Args:
         dataframe (pandas.DataFrame): Kaydedilecek veri
-        filename (str): Dosya adı (uzantı olmadan)
+        filename (str): Dosya adı (uzantı olmadan); depoda veri seti adı olarak kullanılır
         symbol (str): Sembol adı (dosya adına eklenir)
+        timeframe (str): Zaman dilimi (depo bölümü için, None ise config'ten alınır)
     
     Returns:
         bool: Başarı durumu
@@ -116,6 +509,12 @@ def save_data(dataframe, filename, symbol=None):
         Exception: Dosya yazma hatalarında
     """
     try:
+        if config.DATA_STORE_FORMAT == 'npy':
+            success = data_store.write_frame(dataframe, filename, symbol, timeframe)
+            if success:
+                logger.log_info(f"Veri depoya kaydedildi: {filename}/{symbol or data_store.DEFAULT_PARTITION}")
+            return success
+            
         # Dosya yolunu oluştur
         if symbol:
             filename = f"{symbol}_{filename}"
@@ -134,13 +533,18 @@ def save_data(dataframe, filename, symbol=None):
         return False
 
 
-def load_data(filename, symbol=None):
+def load_data(filename, symbol=None, columns=None, start_date=None, end_date=None, timeframe=None):
     """
-    Belirtilen dosyadan veriyi CSV formatında yükler.
+    Kaydedilmiş veriyi yükler. Kolon bazlı depoda sadece istenen kolonlar ve
+    tarih aralığı okunur; depoda bulunmayan veri için eski CSV dosyasına bakılır.
     
     Args:
         filename (str): Dosya adı (uzantı olmadan)
         symbol (str): Sembol adı (dosya adından çıkarılır)
+        columns (list): Yüklenecek kolonlar (None ise tümü)
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+        timeframe (str): Zaman dilimi (None ise config'ten alınır)
     
     Returns:
         pandas.DataFrame: Yüklenen veri
@@ -150,6 +554,12 @@ def load_data(filename, symbol=None):
         Exception: Dosya okuma hatalarında
     """
     try:
+        if config.DATA_STORE_FORMAT == 'npy' and data_store.has_frame(filename, symbol, timeframe):
+            data = data_store.read_frame(filename, symbol, timeframe, columns, start_date, end_date)
+            if data is not None:
+                logger.log_info(f"Veri depodan yüklendi: {filename}/{symbol or data_store.DEFAULT_PARTITION} ({len(data)} satır)")
+            return data
+            
         # Dosya yolunu oluştur
         if symbol:
             filename = f"{symbol}_{filename}"
@@ -161,6 +571,15 @@ def load_data(filename, symbol=None):
             
         # Veriyi yükle
         data = pd.read_csv(file_path, index_col=0, parse_dates=True)
+        
+        # CSV için projeksiyon ve tarih filtresi okuma sonrası uygulanır
+        if columns is not None:
+            data = data[[c for c in columns if c in data.columns]]
+        if start_date is not None:
+            data = data[data.index >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            data = data[data.index < pd.Timestamp(end_date)]
+            
         logger.log_info(f"Veri yüklendi: {file_path} ({len(data)} satır)")
         return data
         
@@ -172,6 +591,7 @@ def load_data(filename, symbol=None):
 def get_latest_price(symbol):
     """
     Belirli bir sembol için en güncel fiyat bilgisini alır.
+    Fiyatlar süreç genelindeki TTL önbelleğinden okunur (bkz. quote_cache).
     
     Args:
         symbol (str): İşlem sembolü
@@ -181,30 +601,33 @@ def get_latest_price(symbol):
         None: Hata durumunda
     """
     try:
-        ticker = yf.Ticker(symbol)
-        
-        # Son 5 günlük veriyi al (güncel fiyat için)
-        data = ticker.history(period="5d")
-        if data.empty:
-            return None
-            
-        current_price = data['Close'].iloc[-1]
-        previous_price = data['Close'].iloc[-2] if len(data) > 1 else current_price
-        
-        change = current_price - previous_price
-        change_percent = (change / previous_price) * 100 if previous_price != 0 else 0
-        
-        return {
-            'price': float(current_price),
-            'change': float(change),
-            'change_percent': float(change_percent)
-        }
+        return quote_cache.get_quote_cache().get(symbol)
         
     except Exception as e:
         logger.log_error(f"Güncel fiyat alırken hata ({symbol}): {e}")
         return None
 
 
+def get_latest_prices(symbols):
+    """
+    Birden fazla sembol için güncel fiyat bilgilerini tek seferde alır.
+    Önbellekte taze olanlar doğrudan döner, eksikler paralel olarak çekilir.
+    
+    Args:
+        symbols (list): Sembol listesi
+    
+    Returns:
+        dict: {symbol: {'price': float, 'change': float, 'change_percent': float}}
+              Fiyatı alınamayan semboller dahil edilmez
+    """
+    try:
+        return quote_cache.get_quote_cache().get_many(symbols)
+        
+    except Exception as e:
+        logger.log_error(f"Toplu güncel fiyat alırken hata: {e}")
+        return {}
+
+
 def validate_data_quality(dataframe, symbol):
     """
     Veri kalitesini kontrol eder ve raporlar.
@@ -0,0 +1,378 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Data Providers Module
+
+Bu modül, piyasa verisi kaynaklarını ortak bir arayüz arkasında toplar. Böylece
+data_handler ve API sunucuları kullanılacak kaynağı config.DATA_PROVIDER ile seçer:
+
+    'yfinance'  - Yahoo Finance üzerinden canlı veri (ağ gerektirir)
+    'local'     - Yerel dizindeki NumPy deposu / CSV / Parquet dosyaları
+    'synthetic' - Sembol ve tarihe göre deterministik üretilen sentetik veri
+
+Tüm sağlayıcılar 'Open', 'High', 'Low', 'Close', 'Volume' sütunlu ve
+DatetimeIndex'li DataFrame döndürür.
+"""
+
+import os
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import data_store
+
+
+OHLCV_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Sağlayıcı örnekleri (isim -> örnek), her sağlayıcı süreç başına bir kez oluşturulur
+_provider_instances = {}
+
+
+def _empty_frame():
+    """Boş OHLCV DataFrame'i döndürür"""
+    return pd.DataFrame(columns=OHLCV_COLUMNS, index=pd.DatetimeIndex([]))
+
+
+def _resolve_period(period, end_date=None):
+    """
+    yfinance tarzı periyodu ('5d', '1mo', '1y') başlangıç ve bitiş tarihine çevirir.
+
+    Args:
+        period (str): Periyot ifadesi
+        end_date (str): Bitiş tarihi (None ise yarın, böylece bugün dahil olur)
+
+    Returns:
+        tuple: (start_date, end_date) - pandas.Timestamp
+    """
+    end = pd.Timestamp(end_date) if end_date is not None else pd.Timestamp.now().normalize() + pd.Timedelta(days=1)
+    units = {'d': 'days', 'wk': 'weeks', 'mo': 'months', 'y': 'years'}
+    for suffix, unit in units.items():
+        if period.endswith(suffix) and period[:-len(suffix)].isdigit():
+            return end - pd.DateOffset(**{unit: int(period[:-len(suffix)])}), end
+    raise ValueError(f"Geçersiz periyot: {period}")
+
+
+class BaseDataProvider:
+    """
+    Piyasa verisi sağlayıcıları için temel sınıf.
+
+    Alt sınıflar _history metodunu uygular; tarih/periyot çözümü ve sütun
+    standardizasyonu burada ortak yapılır.
+    """
+
+    name = 'base'
+    is_remote = False  # True ise veri ağdan gelir ve yerel bar önbelleği kullanılır
+
+    def get_history(self, symbol, start_date=None, end_date=None, interval='1d', period=None):
+        """
+        Bir sembol için OHLCV geçmişini döndürür.
+
+        Args:
+            symbol (str): İşlem sembolü
+            start_date (str): Başlangıç tarihi (dahil)
+            end_date (str): Bitiş tarihi (hariç)
+            interval (str): Zaman dilimi ('1d', '1h', '1m' vb.)
+            period (str): start_date yerine göreli periyot ('5d', '1mo', '1y')
+
+        Returns:
+            pandas.DataFrame: OHLCV verisi (veri yoksa boş DataFrame)
+
+        Raises:
+            Exception: Veri kaynağı hatalarında
+        """
+        if period is not None:
+            start_date, end_date = _resolve_period(period, end_date)
+
+        data = self._history(symbol, start_date, end_date, interval)
+        if data is None or data.empty:
+            return _empty_frame()
+
+        data = data[OHLCV_COLUMNS]
+        if not isinstance(data.index, pd.DatetimeIndex):
+            data.index = pd.to_datetime(data.index)
+        return data
+
+    def get_actions(self, symbol):
+        """
+        Sembolün bölünme ve temettü geçmişini döndürür.
+
+        Args:
+            symbol (str): İşlem sembolü
+
+        Returns:
+            pandas.DataFrame: 'Dividends' ve 'Stock Splits' sütunlu, ex-tarihi indeksli tablo
+        """
+        actions = self._actions(symbol)
+        if actions is None:
+            return pd.DataFrame(columns=['Dividends', 'Stock Splits'], index=pd.DatetimeIndex([]))
+        return actions
+
+    def _history(self, symbol, start_date, end_date, interval):
+        raise NotImplementedError
+
+    def _actions(self, symbol):
+        return None
+
+
+class YFinanceDataProvider(BaseDataProvider):
+    """Yahoo Finance (yfinance) veri sağlayıcısı"""
+
+    name = 'yfinance'
+    is_remote = True
+
+    def _history(self, symbol, start_date, end_date, interval):
+        import yfinance as yf
+
+        ticker = yf.Ticker(symbol)
+        local_adjustment = config.LOCAL_PRICE_ADJUSTMENT
+        data = ticker.history(
+            start=start_date,
+            end=end_date,
+            interval=interval,
+            auto_adjust=not local_adjustment,  # Yerel ayarlamada ham barlar alınır
+            prepost=True       # Piyasa öncesi ve sonrası veriler dahil edilir
+        )
+        if local_adjustment:
+            # Yahoo kapanışları ham modda da bölünme ayarlıdır; gerçek ham fiyatlara geri çevrilir
+            import corporate_actions
+            data = corporate_actions.remove_split_adjustment(data, ticker.splits)
+        return data
+
+    def _actions(self, symbol):
+        import yfinance as yf
+
+        return yf.Ticker(symbol).actions
+
+
+class LocalFileDataProvider(BaseDataProvider):
+    """
+    Yerel dosya veri sağlayıcısı. Sırasıyla şu kaynaklara bakar:
+        1. {LOCAL_DATA_PATH}/{dataset}/{interval}/{symbol}/ (kolon bazlı NumPy deposu)
+        2. {LOCAL_DATA_PATH}/{symbol}_{interval}.parquet veya {symbol}.parquet
+        3. {LOCAL_DATA_PATH}/{symbol}_{interval}.csv veya {symbol}.csv
+    """
+
+    name = 'local'
+
+    def __init__(self, base_path=None, dataset=None):
+        self.base_path = base_path if base_path is not None else config.LOCAL_DATA_PATH
+        self.dataset = dataset if dataset is not None else config.LOCAL_DATA_DATASET
+
+    def _history(self, symbol, start_date, end_date, interval):
+        if data_store.has_frame(self.dataset, symbol, interval, base_path=self.base_path):
+            return data_store.read_frame(self.dataset, symbol, interval, OHLCV_COLUMNS,
+                                         start_date, end_date, base_path=self.base_path)
+
+        data = self._read_file(symbol, interval)
+        if data is None:
+            logger.log_warning(f"Yerel veri bulunamadı: {symbol} ({interval}, {self.base_path})")
+            return None
+
+        data = data.sort_index()
+        if start_date is not None:
+            data = data[data.index >= _localize(start_date, data.index)]
+        if end_date is not None:
+            data = data[data.index < _localize(end_date, data.index)]
+        return data
+
+    def _read_file(self, symbol, interval):
+        for name in [f"{symbol}_{interval}", symbol]:
+            parquet_path = os.path.join(self.base_path, f"{name}.parquet")
+            if os.path.exists(parquet_path):
+                return pd.read_parquet(parquet_path)
+            csv_path = os.path.join(self.base_path, f"{name}.csv")
+            if os.path.exists(csv_path):
+                data = pd.read_csv(csv_path, index_col=0)
+                data.index = pd.to_datetime(data.index, utc=_has_offset(data.index))
+                return data
+        return None
+
+
+class SyntheticDataProvider(BaseDataProvider):
+    """
+    Deterministik sentetik veri sağlayıcısı. Aynı sembol ve tarih için her zaman aynı
+    barı üretir; ağ ve disk gerektirmeden tüm hattı çalıştırmak ve ölçmek için kullanılır.
+    """
+
+    name = 'synthetic'
+
+    # Fiyat yolunun başladığı sabit tarih (istenen aralıktan bağımsız deterministik yol için)
+    ORIGIN = pd.Timestamp('2000-01-03')
+
+    def __init__(self, seed=None):
+        self.seed = seed if seed is not None else config.SYNTHETIC_DATA_SEED
+
+    def _symbol_rng(self, symbol, salt=0):
+        return np.random.default_rng([self.seed, zlib.crc32(symbol.encode('utf-8')), salt])
+
+    def _daily_path(self, symbol, end):
+        """ORIGIN'den end'e kadar iş günü kapanış yolu ve hacimleri"""
+        dates = pd.bdate_range(self.ORIGIN, end)
+        rng = self._symbol_rng(symbol)
+        base_price = 20 + rng.random() * 280
+        # Satır satır üretilen şoklar: i. günün değerleri istenen bitiş tarihinden bağımsızdır
+        shocks = rng.standard_normal((len(dates), 5))
+        close = base_price * np.exp(np.cumsum(0.0003 + 0.018 * shocks[:, 0]))
+        open_ = close * np.exp(0.004 * shocks[:, 1])
+        high = np.maximum(open_, close) * (1 + np.abs(0.008 * shocks[:, 2]))
+        low = np.minimum(open_, close) * (1 - np.abs(0.008 * shocks[:, 3]))
+        volume = np.exp(15 + 0.4 * shocks[:, 4]).astype(np.int64)
+        return pd.DataFrame({'Open': open_, 'High': high, 'Low': low, 'Close': close, 'Volume': volume},
+                            index=dates)
+
+    def _history(self, symbol, start_date, end_date, interval):
+        start = pd.Timestamp(start_date) if start_date is not None else pd.Timestamp(config.HISTORICAL_DATA_START_DATE)
+        end = pd.Timestamp(end_date) if end_date is not None else pd.Timestamp(config.HISTORICAL_DATA_END_DATE)
+        if end <= start or end <= self.ORIGIN:
+            return None
+
+        daily = self._daily_path(symbol, end)
+        if interval == '1d':
+            return daily[(daily.index >= start) & (daily.index < end)]
+        if interval.endswith('m') or interval.endswith('h'):
+            return self._intraday(symbol, daily, start, end, interval)
+        raise ValueError(f"Sentetik sağlayıcı bu zaman dilimini desteklemiyor: {interval}")
+
+    def _intraday(self, symbol, daily, start, end, interval):
+        """Her gün için günlük açılış-kapanış arasında deterministik bir köprü üretir"""
+        freq = pd.Timedelta(interval.replace('m', 'min') if interval.endswith('m') else interval)
+        session_minutes = 390  # 09:30-16:00
+        steps = max(1, int(pd.Timedelta(minutes=session_minutes) / freq))
+
+        frames = []
+        for day, row in daily[(daily.index >= start.normalize()) & (daily.index < end)].iterrows():
+            rng = self._symbol_rng(symbol, salt=day.toordinal())
+            noise = np.cumsum(rng.normal(0, 0.001, steps))
+            noise -= np.linspace(0, noise[-1], steps)  # köprü: uçlar açılış ve kapanışa oturur
+            path = row['Open'] * np.exp(np.linspace(0, np.log(row['Close'] / row['Open']), steps) + noise)
+            open_ = np.concatenate([[row['Open']], path[:-1]])
+            index = day + pd.Timedelta(hours=9, minutes=30) + freq * np.arange(steps)
+            frames.append(pd.DataFrame({
+                'Open': open_,
+                'High': np.maximum(open_, path) * (1 + np.abs(rng.normal(0, 0.0005, steps))),
+                'Low': np.minimum(open_, path) * (1 - np.abs(rng.normal(0, 0.0005, steps))),
+                'Close': path,
+                'Volume': np.maximum(1, rng.multinomial(int(row['Volume']), np.full(steps, 1 / steps)))
+            }, index=index))
+
+        if not frames:
+            return None
+        data = pd.concat(frames)
+        return data[(data.index >= start) & (data.index < end)]
+
+
+PROVIDERS = {
+    YFinanceDataProvider.name: YFinanceDataProvider,
+    LocalFileDataProvider.name: LocalFileDataProvider,
+    SyntheticDataProvider.name: SyntheticDataProvider,
+}
+
+
+def _has_offset(index):
+    """CSV'den okunan tarih metinlerinde UTC ofseti var mı"""
+    sample = str(index[0]) if len(index) else ''
+    return '+' in sample[10:] or sample.endswith('Z')
+
+
+def _localize(value, index):
+    """Tarih sınırını indeksin zaman dilimine uyarlar"""
+    ts = pd.Timestamp(value)
+    if index.tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(index.tz)
+    if index.tz is None and ts.tzinfo is not None:
+        return ts.tz_localize(None)
+    return ts
+
+
+def get_data_provider(name=None):
+    """
+    İsmi verilen (veya config.DATA_PROVIDER ile seçilen) veri sağlayıcısını döndürür.
+
+    Args:
+        name (str): 'yfinance', 'local' veya 'synthetic'
+
+    Returns:
+        BaseDataProvider: Sağlayıcı örneği
+
+    Raises:
+        ValueError: Bilinmeyen sağlayıcı adında
+    """
+    if name is None:
+        name = config.DATA_PROVIDER
+    if name not in PROVIDERS:
+        raise ValueError(f"Bilinmeyen veri sağlayıcısı: {name} (geçerli: {list(PROVIDERS)})")
+    if name not in _provider_instances:
+        _provider_instances[name] = PROVIDERS[name]()
+        logger.log_info(f"Veri sağlayıcısı oluşturuldu: {name}")
+    return _provider_instances[name]
+
+
+def reset_providers():
+    """Önbelleğe alınmış sağlayıcı örneklerini temizler (config değişikliği sonrası)"""
+    _provider_instances.clear()
+
+
+def benchmark_providers(symbols, start_date, end_date, interval='1d', provider_names=None, repeats=1):
+    """
+    Sağlayıcıların aynı istekler için gecikmesini ölçer.
+
+    Args:
+        symbols (list): Ölçümde kullanılacak semboller
+        start_date (str): Başlangıç tarihi
+        end_date (str): Bitiş tarihi
+        interval (str): Zaman dilimi
+        provider_names (list): Karşılaştırılacak sağlayıcılar (None ise tümü)
+        repeats (int): Her sembol için tekrar sayısı
+
+    Returns:
+        pandas.DataFrame: Sağlayıcı başına ortalama/maksimum gecikme (ms), satır ve hata sayıları
+    """
+    if provider_names is None:
+        provider_names = list(PROVIDERS)
+
+    rows = []
+    for name in provider_names:
+        provider = get_data_provider(name)
+        latencies = []
+        total_rows = 0
+        errors = 0
+        for _ in range(repeats):
+            for symbol in symbols:
+                started = time.perf_counter()
+                try:
+                    total_rows += len(provider.get_history(symbol, start_date, end_date, interval))
+                except Exception as e:
+                    errors += 1
+                    logger.log_warning(f"{name} sağlayıcısı {symbol} için hata verdi: {e}")
+                latencies.append((time.perf_counter() - started) * 1000)
+        rows.append({
+            'provider': name,
+            'requests': len(latencies),
+            'mean_ms': float(np.mean(latencies)) if latencies else np.nan,
+            'max_ms': float(np.max(latencies)) if latencies else np.nan,
+            'rows': total_rows,
+            'errors': errors
+        })
+
+    report = pd.DataFrame(rows).set_index('provider')
+    logger.log_info(f"Sağlayıcı gecikme karşılaştırması:\n{report}")
+    return report
+
+
+if __name__ == "__main__":
+    """
+    Data Providers modülü test kodu
+    """
+    print("=== AI-FTB Data Providers Test ===")
+
+    synthetic = get_data_provider('synthetic')
+    data = synthetic.get_history('AAPL', '2023-01-01', '2023-12-31')
+    print(f"✅ Sentetik veri: {len(data)} satır, son kapanış {data['Close'].iloc[-1]:.2f}")
+
+    again = synthetic.get_history('AAPL', '2023-06-01', '2023-07-01')
+    print(f"📊 Deterministik: {np.allclose(again['Close'], data.loc['2023-06-01':'2023-06-30', 'Close'])}")
+
+    print(benchmark_providers(['AAPL', 'MSFT'], '2023-01-01', '2023-12-31', provider_names=['synthetic']))
+    print("\nData Providers test tamamlandı!")
@@ -0,0 +1,248 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Data Quality Module
+
+Bu modül, tüm sembol evreninin OHLCV verisini tek bir vektörel geçişte tarar.
+Semboller uç uca eklenmiş tek bir dizi olarak işlenir; sembol başına sayımlar
+segment sınırları üzerinden (np.add.reduceat vb.) tek seferde çıkarılır.
+
+Kontroller:
+- Eksik değerler (NaN)
+- Sıfır veya negatif fiyatlar
+- Tekrarlanan ve sırasız zaman damgaları
+- Sıfır hacim
+- Bayat veri (kapanışın art arda aynı kaldığı seriler)
+- Aykırı getiriler (sembol içi z-skoru)
+- İşlem takvimine (NYSE/BIST tatilleri dahil) göre eksik seanslar
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import data_store
+import trading_calendar
+
+
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+_NS_PER_DAY = 86_400 * 10 ** 9
+
+SUMMARY_COLUMNS = [
+    'rows', 'start', 'end', 'missing_values', 'non_positive_prices', 'duplicate_timestamps',
+    'unsorted_timestamps', 'zero_volume', 'stale_bars', 'max_stale_run', 'outlier_returns',
+    'missing_sessions', 'quality_score', 'status'
+]
+
+
+def scan_frames(frames, stale_run=None, return_zscore=None, min_score=None):
+    """
+    Birden fazla sembolün verisini tek vektörel geçişte kalite kontrolünden geçirir.
+
+    Args:
+        frames (dict): {symbol: pandas.DataFrame} - OHLCV verisi
+        stale_run (int): Bayat veri sayılacak en kısa aynı kapanış serisi
+        return_zscore (float): Aykırı getiri z-skoru eşiği
+        min_score (float): 'ok' durumu için en düşük kalite skoru
+
+    Returns:
+        pandas.DataFrame: Sembol başına bir satırlık özet tablo
+        None: Hata durumunda
+    """
+    try:
+        if stale_run is None:
+            stale_run = config.QUALITY_STALE_RUN
+        if return_zscore is None:
+            return_zscore = config.QUALITY_RETURN_ZSCORE
+        if min_score is None:
+            min_score = config.QUALITY_MIN_SCORE
+
+        started = time.perf_counter()
+        symbols = [s for s, frame in frames.items() if frame is not None and len(frame) > 0]
+        empty = [s for s in frames if s not in symbols]
+
+        summary = pd.DataFrame(index=pd.Index(symbols, name='symbol'))
+        if symbols:
+            summary = _scan_arrays(symbols, _concatenate(symbols, frames), stale_run, return_zscore)
+            issues = summary[['missing_values', 'non_positive_prices', 'duplicate_timestamps',
+                              'unsorted_timestamps', 'zero_volume', 'stale_bars', 'outlier_returns',
+                              'missing_sessions']].sum(axis=1)
+            summary['quality_score'] = np.maximum(0.0, 100 - issues / summary['rows'] * 100)
+            summary['status'] = np.where(summary['quality_score'] >= min_score, 'ok', 'fail')
+
+        summary = summary.reindex(index=pd.Index(list(frames), name='symbol'), columns=SUMMARY_COLUMNS)
+        count_columns = [c for c in SUMMARY_COLUMNS if c not in ('start', 'end', 'quality_score', 'status')]
+        summary[count_columns] = summary[count_columns].fillna(0).astype(np.int64)
+        summary['quality_score'] = summary['quality_score'].fillna(0.0).astype(np.float64)
+        summary['status'] = summary['status'].astype(object).fillna('empty')
+
+        elapsed = time.perf_counter() - started
+        problems = summary.index[summary['status'] != 'ok'].tolist()
+        logger.log_info(f"Veri kalitesi taraması: {len(summary)} sembol, {int(summary['rows'].sum())} satır, "
+                        f"{elapsed * 1000:.0f} ms, sorunlu: {len(problems)}")
+        if problems:
+            logger.log_warning(f"Kalite eşiğinin altındaki semboller: {problems}")
+        return summary
+
+    except Exception as e:
+        logger.log_error(f"Veri kalitesi taraması hatası: {e}", exc_info=True)
+        return None
+
+
+def scan_store(dataset='raw_data', symbols=None, timeframe=None, start_date=None, end_date=None, base_path=None):
+    """
+    NumPy deposunda kayıtlı sembolleri bellek eşlemeli okuyup toplu kalite taraması yapar.
+
+    Args:
+        dataset (str): Veri seti adı (save_data'daki dosya adı)
+        symbols (list): Taranacak semboller (None ise veri setindeki tüm semboller)
+        timeframe (str): Zaman dilimi
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+        base_path (str): Depo kök dizini
+
+    Returns:
+        pandas.DataFrame: Sembol başına özet tablo
+        None: Hata durumunda
+    """
+    if symbols is None:
+        symbols = data_store.list_symbols(dataset, timeframe, base_path=base_path)
+    columns = PRICE_COLUMNS + ['Volume']
+    frames = {}
+    for symbol in symbols:
+        meta = data_store.read_meta(dataset, symbol, timeframe, base_path=base_path)
+        if meta is None:
+            continue
+        available = [c for c in columns if c in meta['columns']]
+        frames[symbol] = data_store.read_frame(dataset, symbol, timeframe, available, start_date, end_date,
+                                               mmap=True, base_path=base_path)
+    return scan_frames(frames)
+
+
+def _concatenate(symbols, frames):
+    """
+    Sembol verilerini uç uca ekler.
+
+    Returns:
+        dict: 'offsets' (segment başlangıçları), 'lengths', 'time' (borsa yerel saati, ns),
+              'prices' (n x 4), 'volume' dizileri
+    """
+    times, prices, volumes, lengths = [], [], [], []
+    for symbol in symbols:
+        frame = frames[symbol]
+        index = frame.index
+        if isinstance(index, pd.DatetimeIndex) and index.tz is not None:
+            timezone = trading_calendar.get_symbol_calendar(symbol).timezone
+            index = index.tz_convert(timezone).tz_localize(None)
+        times.append(np.asarray(index.values, dtype='datetime64[ns]').view('int64'))
+        prices.append(frame.reindex(columns=PRICE_COLUMNS).to_numpy(dtype=np.float64, na_value=np.nan))
+        volume = frame['Volume'] if 'Volume' in frame.columns else pd.Series(np.nan, index=frame.index)
+        volumes.append(volume.to_numpy(dtype=np.float64, na_value=np.nan))
+        lengths.append(len(frame))
+
+    lengths = np.asarray(lengths, dtype=np.int64)
+    return {
+        'offsets': np.concatenate([[0], np.cumsum(lengths)[:-1]]),
+        'lengths': lengths,
+        'time': np.concatenate(times),
+        'prices': np.concatenate(prices),
+        'volume': np.concatenate(volumes)
+    }
+
+
+def _scan_arrays(symbols, arrays, stale_run, return_zscore):
+    """Uç uca eklenmiş dizilerde tüm kontrolleri hesaplar ve sembol başına toplar"""
+    offsets, lengths = arrays['offsets'], arrays['lengths']
+    times, prices, volume = arrays['time'], arrays['prices'], arrays['volume']
+    close = prices[:, 3]
+    n = len(times)
+
+    # Her satır için "önceki satır aynı sembole ait mi" maskesi
+    continues = np.ones(n, dtype=bool)
+    continues[offsets] = False
+
+    def per_symbol(values):
+        return np.add.reduceat(values.astype(np.int64), offsets)
+
+    time_diff = np.diff(times, prepend=times[0])
+    duplicates = continues & (time_diff == 0)
+    unsorted = continues & (time_diff < 0)
+
+    # Bayat veri: kapanışın önceki barla aynı olduğu ardışık seriler
+    same_close = continues & (close == np.roll(close, 1))
+    run_id = np.cumsum(~same_close) - 1
+    run_lengths = np.bincount(run_id)
+    row_run_length = run_lengths[run_id]
+    stale = row_run_length >= stale_run
+
+    # Aykırı getiriler: sembol içi logaritmik getiri z-skoru
+    previous_close = np.roll(close, 1)
+    valid_return = continues & (close > 0) & (previous_close > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.where(valid_return, np.log(close / np.where(valid_return, previous_close, 1.0)), 0.0)
+    returns = np.where(np.isfinite(returns), returns, 0.0)
+    valid_return &= np.isfinite(returns)
+    counts = np.maximum(per_symbol(valid_return), 1)
+    means = np.add.reduceat(returns, offsets) / counts
+    deviations = np.where(valid_return, returns - np.repeat(means, lengths), 0.0)
+    stds = np.sqrt(np.add.reduceat(deviations ** 2, offsets) / np.maximum(counts - 1, 1))
+    row_std = np.repeat(stds, lengths)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        outliers = valid_return & (row_std > 0) & (np.abs(deviations) / row_std > return_zscore)
+
+    # İşlem takvimine göre eksik seanslar (borsa takvimi üzerinde searchsorted aramaları)
+    days = times // _NS_PER_DAY
+    new_day = ~continues | (days != np.roll(days, 1))
+    first_day = np.minimum.reduceat(days, offsets)
+    last_day = np.maximum.reduceat(days, offsets)
+    exchanges = np.array([trading_calendar.get_exchange(symbol) for symbol in symbols])
+    row_exchanges = np.repeat(exchanges, lengths)
+    is_session = np.zeros(n, dtype=bool)
+    expected_sessions = np.zeros(len(symbols), dtype=np.int64)
+    for exchange in np.unique(exchanges):
+        calendar = trading_calendar.get_calendar(exchange)
+        rows = row_exchanges == exchange
+        segments = exchanges == exchange
+        is_session[rows] = calendar.is_session(days[rows])
+        expected_sessions[segments] = (np.searchsorted(calendar.session_days, last_day[segments] + 1) -
+                                       np.searchsorted(calendar.session_days, first_day[segments]))
+    observed_sessions = per_symbol(new_day & is_session)
+
+    summary = pd.DataFrame({
+        'rows': lengths,
+        'start': pd.to_datetime(np.minimum.reduceat(times, offsets)),
+        'end': pd.to_datetime(np.maximum.reduceat(times, offsets)),
+        'missing_values': per_symbol(np.isnan(prices).sum(axis=1) + np.isnan(volume)),
+        'non_positive_prices': per_symbol((prices <= 0).any(axis=1)),
+        'duplicate_timestamps': per_symbol(duplicates),
+        'unsorted_timestamps': per_symbol(unsorted),
+        'zero_volume': per_symbol(volume == 0),
+        'stale_bars': per_symbol(stale),
+        'max_stale_run': np.maximum.reduceat(row_run_length, offsets),
+        'outlier_returns': per_symbol(outliers),
+        'missing_sessions': np.maximum(expected_sessions - observed_sessions, 0)
+    }, index=pd.Index(symbols, name='symbol'))
+    return summary
+
+
+if __name__ == "__main__":
+    """
+    Data Quality modülü test kodu
+    """
+    print("=== AI-FTB Data Quality Test ===")
+
+    import data_providers
+
+    provider = data_providers.get_data_provider('synthetic')
+    universe = {f"SYM{i}": provider.get_history(f"SYM{i}", '2020-01-01', '2024-01-01') for i in range(500)}
+    universe['SYM0'].iloc[100:110, 3] = universe['SYM0'].iloc[99, 3]  # bayat seri
+    universe['SYM1'] = universe['SYM1'].drop(universe['SYM1'].index[200:230])  # eksik seanslar
+
+    started = time.perf_counter()
+    report = scan_frames(universe)
+    print(f"✅ {len(report)} sembol {time.perf_counter() - started:.3f} sn içinde tarandı")
+    print(report.sort_values('quality_score').head())
+
+    print("\nData Quality test tamamlandı!")
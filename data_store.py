@@ -0,0 +1,440 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Data Store Module
+
+Bu modül, OHLCV ve özellik verilerini kolon bazlı (columnar) bir NumPy deposunda
+saklar. Her veri seti sembol ve zaman dilimine göre bölümlenir; her kolon ayrı bir
+.npy dosyasıdır. Okuma sırasında sadece istenen kolonlar yüklenir (column projection)
+ve tarih aralığı filtresi dosya seviyesinde uygulanır (predicate pushdown).
+
+Dizin yapısı:
+    {DATA_STORE_PATH}/{dataset}/{timeframe}/{symbol}/
+        _meta.json   - kolon adları, tipler, zaman dilimi bilgisi
+        _index.npy   - int64 nanosaniye zaman damgaları (sıralı)
+        c0.npy, c1.npy, ... - kolon verileri
+"""
+
+import json
+import os
+import shutil
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+
+
+# Sembol verilmeden kaydedilen veri setleri için bölüm adı
+DEFAULT_PARTITION = '_'
+
+_META_FILE = '_meta.json'
+_INDEX_FILE = '_index.npy'
+
+
+def _partition_path(dataset, symbol=None, timeframe=None, base_path=None):
+    """
+    Bir veri setinin bölüm (partition) dizinini döndürür.
+
+    Args:
+        dataset (str): Veri seti adı (örn. 'raw_data', 'processed_data')
+        symbol (str): Sembol adı
+        timeframe (str): Zaman dilimi ('1d', '1h' vb.)
+        base_path (str): Depo kök dizini. None ise config'ten alınır.
+
+    Returns:
+        str: Bölüm dizininin yolu
+    """
+    if base_path is None:
+        base_path = config.DATA_STORE_PATH
+    if timeframe is None:
+        timeframe = config.PRICE_TIMEFRAME
+    if not symbol:
+        symbol = DEFAULT_PARTITION
+
+    # Dosya sistemi için güvenli olmayan karakterleri temizle
+    safe_symbol = str(symbol).replace('/', '_').replace('\\', '_')
+    return os.path.join(base_path, dataset, timeframe, safe_symbol)
+
+
+def _to_int64_ns(index):
+    """
+    DatetimeIndex'i UTC (veya naive) nanosaniye int64 dizisine çevirir.
+
+    Args:
+        index (pandas.DatetimeIndex): Çevrilecek indeks
+
+    Returns:
+        numpy.ndarray: int64 zaman damgaları
+    """
+    if index.tz is not None:
+        index = index.tz_convert('UTC').tz_localize(None)
+    return np.asarray(index.values, dtype='datetime64[ns]').view('int64')
+
+
+def _encode_column(series):
+    """
+    Bir pandas kolonunu diske yazılabilir NumPy dizisine ve tip bilgisine çevirir.
+
+    Args:
+        series (pandas.Series): Kodlanacak kolon
+
+    Returns:
+        tuple: (numpy.ndarray, dict) - veri dizisi ve kolon meta bilgisi
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = [str(c) for c in series.cat.categories]
+        codes = series.cat.codes.to_numpy()
+        return codes, {'kind': 'category', 'dtype': str(codes.dtype), 'categories': categories}
+
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        values = pd.DatetimeIndex(series)
+        tz = str(values.tz) if values.tz is not None else None
+        return _to_int64_ns(values), {'kind': 'datetime', 'dtype': 'int64', 'tz': tz}
+
+    if pd.api.types.is_bool_dtype(series.dtype) or pd.api.types.is_numeric_dtype(series.dtype):
+        values = series.to_numpy()
+        # Nullable tipler (Int64, Float64) NaN destekli float64'e çevrilir
+        if values.dtype == object:
+            values = series.to_numpy(dtype='float64', na_value=np.nan)
+        return values, {'kind': 'numeric', 'dtype': str(values.dtype)}
+
+    values = series.astype(str).to_numpy(dtype=str)
+    return values, {'kind': 'string', 'dtype': str(values.dtype)}
+
+
+def _decode_column(values, column_meta):
+    """
+    Diskten okunan diziyi kaydedildiği pandas tipine geri çevirir.
+
+    Args:
+        values (numpy.ndarray): Okunan veri
+        column_meta (dict): Kolon meta bilgisi
+
+    Returns:
+        numpy.ndarray or pandas array: Kolon değerleri
+    """
+    kind = column_meta.get('kind')
+    if kind == 'category':
+        return pd.Categorical.from_codes(values, categories=column_meta['categories'])
+    if kind == 'datetime':
+        decoded = pd.DatetimeIndex(np.asarray(values, dtype='datetime64[ns]'))
+        if column_meta.get('tz'):
+            decoded = decoded.tz_localize('UTC').tz_convert(column_meta['tz'])
+        return decoded
+    return values
+
+
+def _to_index_bound(value, tz):
+    """
+    Tarih sınırını depodaki int64 indeks değerine çevirir.
+
+    Args:
+        value (str or datetime): Tarih sınırı
+        tz (str): İndeksin zaman dilimi (None ise naive)
+
+    Returns:
+        int: Nanosaniye cinsinden UTC (veya naive) zaman damgası
+    """
+    ts = pd.Timestamp(value)
+    if tz is not None:
+        ts = ts.tz_localize(tz) if ts.tzinfo is None else ts.tz_convert(tz)
+        ts = ts.tz_convert('UTC').tz_localize(None)
+    elif ts.tzinfo is not None:
+        ts = ts.tz_localize(None)
+    return ts.value
+
+
+def write_frame(dataframe, dataset, symbol=None, timeframe=None, extra_meta=None, base_path=None):
+    """
+    DataFrame'i kolon bazlı depoya yazar. Mevcut bölüm atomik olarak değiştirilir.
+
+    Args:
+        dataframe (pandas.DataFrame): DatetimeIndex'li kaydedilecek veri
+        dataset (str): Veri seti adı
+        symbol (str): Sembol adı
+        timeframe (str): Zaman dilimi
+        extra_meta (dict): Meta dosyasına eklenecek ek bilgiler
+        base_path (str): Depo kök dizini
+
+    Returns:
+        bool: Başarı durumu
+    """
+    try:
+        path = _partition_path(dataset, symbol, timeframe, base_path)
+        parent = os.path.dirname(path)
+        os.makedirs(parent, exist_ok=True)
+
+        data = dataframe
+        if not isinstance(data.index, pd.DatetimeIndex):
+            data = data.copy()
+            data.index = pd.to_datetime(data.index)
+        if not data.index.is_monotonic_increasing:
+            data = data.sort_index()
+
+        # Geçici dizine yaz, sonra yer değiştir (yarım yazılmış bölüm kalmasın)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        if os.path.exists(tmp_path):
+            shutil.rmtree(tmp_path)
+        os.makedirs(tmp_path)
+
+        tz = str(data.index.tz) if data.index.tz is not None else None
+        np.save(os.path.join(tmp_path, _INDEX_FILE), _to_int64_ns(data.index))
+
+        columns_meta = []
+        for position, column in enumerate(data.columns):
+            values, column_meta = _encode_column(data[column])
+            file_name = f"c{position}.npy"
+            np.save(os.path.join(tmp_path, file_name), np.ascontiguousarray(values), allow_pickle=False)
+            column_meta.update({'name': str(column), 'file': file_name})
+            columns_meta.append(column_meta)
+
+        meta = {
+            'dataset': dataset,
+            'symbol': symbol,
+            'timeframe': timeframe or config.PRICE_TIMEFRAME,
+            'rows': int(len(data)),
+            'tz': tz,
+            'index_dtype': str(data.index.values.dtype),
+            'index_name': data.index.name,
+            'start': data.index.min().isoformat() if len(data) else None,
+            'end': data.index.max().isoformat() if len(data) else None,
+            'columns': columns_meta,
+            'written_at': datetime.now().isoformat()
+        }
+        if extra_meta:
+            meta.update(extra_meta)
+
+        with open(os.path.join(tmp_path, _META_FILE), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=2)
+
+        old_path = f"{path}.old{os.getpid()}"
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(tmp_path, path)
+        if os.path.exists(old_path):
+            shutil.rmtree(old_path, ignore_errors=True)
+
+        logger.log_debug(f"Veri depoya yazıldı: {path} ({len(data)} satır, {len(columns_meta)} kolon)")
+        return True
+
+    except Exception as e:
+        logger.log_error(f"Depoya yazarken hata ({dataset}/{symbol}): {e}", exc_info=True)
+        return False
+
+
+def read_meta(dataset, symbol=None, timeframe=None, base_path=None):
+    """
+    Bir bölümün meta bilgisini okur.
+
+    Args:
+        dataset (str): Veri seti adı
+        symbol (str): Sembol adı
+        timeframe (str): Zaman dilimi
+        base_path (str): Depo kök dizini
+
+    Returns:
+        dict: Meta bilgisi
+        None: Bölüm yoksa veya hata durumunda
+    """
+    try:
+        meta_path = os.path.join(_partition_path(dataset, symbol, timeframe, base_path), _META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.log_error(f"Depo meta bilgisi okunurken hata ({dataset}/{symbol}): {e}")
+        return None
+
+
+def has_frame(dataset, symbol=None, timeframe=None, base_path=None):
+    """
+    Bir bölümün depoda olup olmadığını kontrol eder.
+
+    Returns:
+        bool: Bölüm mevcut mu
+    """
+    meta_path = os.path.join(_partition_path(dataset, symbol, timeframe, base_path), _META_FILE)
+    return os.path.exists(meta_path)
+
+
+def read_frame(dataset, symbol=None, timeframe=None, columns=None, start_date=None, end_date=None,
+               mmap=False, base_path=None):
+    """
+    Depodan veri okur. Sadece istenen kolonlar ve tarih aralığındaki satırlar yüklenir.
+
+    Args:
+        dataset (str): Veri seti adı
+        symbol (str): Sembol adı
+        timeframe (str): Zaman dilimi
+        columns (list): Yüklenecek kolonlar (None ise tümü)
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç, yfinance ile aynı anlamda)
+        mmap (bool): True ise sayısal kolonlar kopyalanmadan bellek eşlemeli okunur
+        base_path (str): Depo kök dizini
+
+    Returns:
+        pandas.DataFrame: Okunan veri
+        None: Bölüm yoksa veya hata durumunda
+    """
+    try:
+        path = _partition_path(dataset, symbol, timeframe, base_path)
+        meta = read_meta(dataset, symbol, timeframe, base_path)
+        if meta is None:
+            return None
+
+        tz = meta.get('tz')
+        index_values = np.load(os.path.join(path, _INDEX_FILE), mmap_mode='r')
+
+        # Tarih filtresini sıralı indeks üzerinde ikili arama ile uygula
+        lo, hi = 0, len(index_values)
+        if start_date is not None:
+            lo = int(np.searchsorted(index_values, _to_index_bound(start_date, tz), side='left'))
+        if end_date is not None:
+            hi = int(np.searchsorted(index_values, _to_index_bound(end_date, tz), side='left'))
+        hi = max(hi, lo)
+
+        index = pd.DatetimeIndex(np.asarray(index_values[lo:hi], dtype='datetime64[ns]'),
+                                 name=meta.get('index_name'))
+        # Yazıldığı çözünürlüğe geri dön (pandas 2+ 'us'/'s' çözünürlükleri destekler)
+        index_dtype = meta.get('index_dtype', 'datetime64[ns]')
+        if index_dtype != 'datetime64[ns]':
+            index = index.astype(index_dtype)
+        if tz is not None:
+            index = index.tz_localize('UTC').tz_convert(tz)
+
+        columns_meta = meta['columns']
+        if columns is not None:
+            by_name = {c['name']: c for c in columns_meta}
+            missing = [c for c in columns if c not in by_name]
+            if missing:
+                logger.log_warning(f"Depoda olmayan kolonlar atlandı ({dataset}/{symbol}): {missing}")
+            columns_meta = [by_name[c] for c in columns if c in by_name]
+
+        data = {}
+        for column_meta in columns_meta:
+            values = np.load(os.path.join(path, column_meta['file']), mmap_mode='r')[lo:hi]
+            if not mmap or column_meta.get('kind') != 'numeric':
+                values = np.array(values)
+            data[column_meta['name']] = _decode_column(values, column_meta)
+
+        return pd.DataFrame(data, index=index, columns=[c['name'] for c in columns_meta])
+
+    except Exception as e:
+        logger.log_error(f"Depodan okurken hata ({dataset}/{symbol}): {e}", exc_info=True)
+        return None
+
+
+def read_many(symbols, dataset, timeframe=None, columns=None, start_date=None, end_date=None,
+              base_path=None):
+    """
+    Birden fazla sembolün verisini aynı projeksiyon ve filtre ile okur.
+
+    Args:
+        symbols (list): Sembol listesi
+        dataset (str): Veri seti adı
+        timeframe (str): Zaman dilimi
+        columns (list): Yüklenecek kolonlar
+        start_date (str): Başlangıç tarihi (dahil)
+        end_date (str): Bitiş tarihi (hariç)
+        base_path (str): Depo kök dizini
+
+    Returns:
+        dict: {symbol: pandas.DataFrame} - depoda bulunmayan semboller atlanır
+    """
+    frames = {}
+    for symbol in symbols:
+        frame = read_frame(dataset, symbol, timeframe, columns, start_date, end_date, base_path=base_path)
+        if frame is not None:
+            frames[symbol] = frame
+    return frames
+
+
+def list_symbols(dataset, timeframe=None, base_path=None):
+    """
+    Bir veri setinde kayıtlı sembolleri listeler.
+
+    Args:
+        dataset (str): Veri seti adı
+        timeframe (str): Zaman dilimi
+        base_path (str): Depo kök dizini
+
+    Returns:
+        list: Sıralı sembol listesi
+    """
+    if base_path is None:
+        base_path = config.DATA_STORE_PATH
+    if timeframe is None:
+        timeframe = config.PRICE_TIMEFRAME
+
+    root = os.path.join(base_path, dataset, timeframe)
+    if not os.path.isdir(root):
+        return []
+
+    symbols = []
+    for name in os.listdir(root):
+        if name == DEFAULT_PARTITION or '.tmp' in name or '.old' in name:
+            continue
+        if os.path.exists(os.path.join(root, name, _META_FILE)):
+            symbols.append(name)
+    return sorted(symbols)
+
+
+def delete_frame(dataset, symbol=None, timeframe=None, base_path=None):
+    """
+    Bir bölümü depodan siler.
+
+    Returns:
+        bool: Bölüm silindiyse True
+    """
+    try:
+        path = _partition_path(dataset, symbol, timeframe, base_path)
+        if not os.path.exists(path):
+            return False
+        shutil.rmtree(path)
+        logger.log_info(f"Depo bölümü silindi: {path}")
+        return True
+    except Exception as e:
+        logger.log_error(f"Depo bölümü silinirken hata ({dataset}/{symbol}): {e}")
+        return False
+
+
+if __name__ == "__main__":
+    """
+    Data Store modülü test kodu
+    """
+    import tempfile
+    import time
+
+    print("=== AI-FTB Data Store Test ===")
+
+    dates = pd.bdate_range('2015-01-01', periods=2520)
+    rng = np.random.default_rng(42)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, len(dates)))
+    sample = pd.DataFrame({
+        'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+        'Volume': rng.integers(1_000_000, 5_000_000, len(dates))
+    }, index=dates)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = os.path.join(tmp_dir, 'sample.csv')
+        sample.to_csv(csv_path)
+        write_frame(sample, 'raw_data', 'TEST', base_path=tmp_dir)
+
+        started = time.perf_counter()
+        pd.read_csv(csv_path, index_col=0, parse_dates=True)
+        csv_time = time.perf_counter() - started
+
+        started = time.perf_counter()
+        loaded = read_frame('raw_data', 'TEST', base_path=tmp_dir)
+        store_time = time.perf_counter() - started
+
+        print(f"CSV okuma: {csv_time * 1000:.1f} ms, Depo okuma: {store_time * 1000:.1f} ms")
+        print(f"✅ {len(loaded)} satır yüklendi, eşit: {loaded.equals(sample)}")
+
+        subset = read_frame('raw_data', 'TEST', columns=['Close'], start_date='2020-01-01',
+                            end_date='2021-01-01', base_path=tmp_dir)
+        print(f"📊 Projeksiyon + tarih filtresi: {subset.shape}")
+
+    print("\nData Store test tamamlandı!")
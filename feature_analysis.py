@@ -0,0 +1,219 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Feature Analysis Module
+
+Bu modül, özellik önemini ve özellikler arası fazlalığı analiz eder:
+- Özellik-hedef ve özellik-özellik korelasyon matrisleri tek NumPy geçişinde
+  (pandas DataFrame.corr ile aynı: her çift için ortak geçerli satırlar) hesaplanır
+- Karşılıklı bilgi (mutual information) özellik başına paralel hesaplanır
+- Birbirine çok yakın (ör. SMA_20 / BB_Middle / BB_Upper) özellik grupları işaretlenir;
+  her grupta hedefle en ilişkili özellik tutulur, diğerleri çıkarılmaya adaydır
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.feature_selection import mutual_info_classif
+
+import config
+import logger
+
+
+def correlation_matrix(values):
+    """
+    Sütunlar arası Pearson korelasyon matrisi. Her çift yalnızca ikisinin de NaN
+    olmadığı satırlarla hesaplanır; sabit sütunların korelasyonu NaN olur.
+
+    Args:
+        values (numpy.ndarray): (satır × sütun) değerler
+
+    Returns:
+        numpy.ndarray: (sütun × sütun) korelasyonlar
+    """
+    values = np.asarray(values, dtype=np.float64)
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Sütun ortalamasına göre merkezlemek büyük değerlerde hassasiyet kaybını önler
+        center = np.nanmean(np.where(present.any(axis=0), values, 0.0), axis=0)
+        centered = np.where(present, values - center, 0.0)
+
+        count = mask.T @ mask
+        sums = centered.T @ mask            # sums[i, j]: i'nin (i, j) ortak satırlarındaki toplamı
+        squares = (centered ** 2).T @ mask
+        products = centered.T @ centered
+
+        covariance = products - sums * sums.T / count
+        variance = squares - sums ** 2 / count
+        correlation = covariance / np.sqrt(variance * variance.T)
+
+    correlation[(count < 2) | (variance <= 0) | (variance.T <= 0)] = np.nan
+    return np.clip(correlation, -1.0, 1.0)
+
+
+def _feature_columns(dataframe, target_column):
+    """Analiz edilecek sayısal özellik sütunları (hedef ve '_scaled' kopyalar hariç)"""
+    numeric = dataframe.select_dtypes(include=[np.number]).columns
+    return [c for c in numeric if c != target_column and not c.endswith('_scaled')]
+
+
+def target_correlations(dataframe, features, target_column='Target'):
+    """
+    Özelliklerin hedefle korelasyonlarını tek matris geçişinde hesaplar.
+
+    Args:
+        dataframe (pandas.DataFrame): Özellikler ve hedef içeren veri
+        features (list): Özellik isimleri
+        target_column (str): Hedef sütun adı
+
+    Returns:
+        pandas.Series: {özellik: korelasyon} (hesaplanamayanlar NaN)
+    """
+    correlation = correlation_matrix(dataframe[list(features) + [target_column]].to_numpy(dtype=np.float64))
+    return pd.Series(correlation[:-1, -1], index=list(features))
+
+
+def _feature_mutual_info(values, target, random_state):
+    """Tek özellik için karşılıklı bilgi (yalnızca geçerli satırlar)"""
+    valid = ~(np.isnan(values) | np.isnan(target))
+    if valid.sum() < 4:
+        return np.nan
+    return mutual_info_classif(values[valid, None], target[valid].astype(int),
+                               random_state=random_state)[0]
+
+
+def mutual_information(dataframe, features, target_column='Target', n_jobs=None, random_state=42):
+    """
+    Özellik başına karşılıklı bilgiyi paralel hesaplar.
+
+    Args:
+        dataframe (pandas.DataFrame): Özellikler ve hedef içeren veri
+        features (list): Özellik isimleri
+        target_column (str): Hedef sütun adı (sınıf etiketi)
+        n_jobs (int): Paralel iş sayısı (None ise config.FEATURE_ANALYSIS_N_JOBS)
+        random_state (int): Tahminci gürültüsü için tohum
+
+    Returns:
+        pandas.Series: {özellik: karşılıklı bilgi}
+    """
+    n_jobs = config.FEATURE_ANALYSIS_N_JOBS if n_jobs is None else n_jobs
+    target = dataframe[target_column].to_numpy(dtype=np.float64)
+    columns = dataframe[list(features)].to_numpy(dtype=np.float64)
+
+    scores = Parallel(n_jobs=n_jobs, prefer='threads')(
+        delayed(_feature_mutual_info)(columns[:, i], target, random_state) for i in range(len(features))
+    )
+    return pd.Series(scores, index=list(features), dtype=np.float64)
+
+
+def collinear_features(correlation, importance, threshold=None):
+    """
+    Birbirine çok yakın özellik çiftlerini bulur ve çıkarılabilecekleri seçer.
+    Özellikler önem sırasıyla gezilir; daha önemli bir tutulan özellikle
+    |korelasyon| >= threshold olan özellik fazlalık sayılır.
+
+    Args:
+        correlation (pandas.DataFrame): Özellik-özellik korelasyon matrisi
+        importance (pandas.Series): Özellik önemi (büyük olan tutulur)
+        threshold (float): Eşik (None ise config.FEATURE_COLLINEARITY_THRESHOLD)
+
+    Returns:
+        tuple: (çiftler DataFrame'i [feature, other, correlation], fazlalık özellik listesi)
+    """
+    threshold = config.FEATURE_COLLINEARITY_THRESHOLD if threshold is None else threshold
+    names = list(correlation.columns)
+    strength = np.abs(correlation.to_numpy())
+
+    rows, columns = np.nonzero(np.triu(np.nan_to_num(strength) >= threshold, k=1))
+    pairs = pd.DataFrame({'feature': [names[i] for i in rows], 'other': [names[j] for j in columns],
+                          'correlation': correlation.to_numpy()[rows, columns]})
+
+    order = importance.reindex(names).fillna(-np.inf).sort_values(ascending=False, kind='stable').index
+    kept, redundant = [], []
+    for name in order:
+        position = names.index(name)
+        if any(strength[position, names.index(k)] >= threshold for k in kept):
+            redundant.append(name)
+        else:
+            kept.append(name)
+    return pairs, redundant
+
+
+def analyze_features(dataframe, features=None, target_column='Target', mutual_info=True, threshold=None,
+                     n_jobs=None):
+    """
+    Özellik önemi ve fazlalık analizini çalıştırır.
+
+    Args:
+        dataframe (pandas.DataFrame): Özellikler ve hedef içeren veri
+        features (list): Özellik isimleri (None ise hedef ve '_scaled' dışındaki sayısal sütunlar)
+        target_column (str): Hedef sütun adı
+        mutual_info (bool): Karşılıklı bilgi de hesaplansın mı
+        threshold (float): Eşdoğrusallık eşiği
+        n_jobs (int): Karşılıklı bilgi için paralel iş sayısı
+
+    Returns:
+        dict: {'ranking': DataFrame [feature, correlation, correlation_raw, mutual_info, redundant],
+               'correlation': özellik-özellik korelasyon DataFrame'i,
+               'collinear_pairs': DataFrame, 'redundant': list}
+        None: Hata durumunda
+    """
+    try:
+        if target_column not in dataframe.columns:
+            logger.log_warning(f"Hedef sütun bulunamadı: {target_column}")
+            return None
+        features = _feature_columns(dataframe, target_column) if features is None else list(features)
+        features = [f for f in features if f in dataframe.columns]
+        if not features:
+            logger.log_warning("Analiz edilecek özellik bulunamadı")
+            return None
+
+        matrix = correlation_matrix(dataframe[features + [target_column]].to_numpy(dtype=np.float64))
+        correlation = pd.DataFrame(matrix[:-1, :-1], index=features, columns=features)
+        ranking = pd.DataFrame({'feature': features, 'correlation': np.abs(matrix[:-1, -1]),
+                                'correlation_raw': matrix[:-1, -1]})
+        if mutual_info:
+            ranking['mutual_info'] = mutual_information(dataframe, features, target_column, n_jobs).to_numpy()
+
+        importance = ranking.set_index('feature')['mutual_info' if mutual_info else 'correlation']
+        pairs, redundant = collinear_features(correlation, importance, threshold)
+        ranking['redundant'] = ranking['feature'].isin(redundant)
+        ranking = ranking.sort_values(importance.name, ascending=False, kind='stable').reset_index(drop=True)
+
+        logger.log_info(f"Özellik analizi: {len(features)} özellik, {len(pairs)} yüksek korelasyonlu çift, "
+                        f"fazlalık adayları: {redundant}")
+        return {'ranking': ranking, 'correlation': correlation, 'collinear_pairs': pairs, 'redundant': redundant}
+
+    except Exception as e:
+        logger.log_error(f"Özellik analizi hatası: {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Feature Analysis modülü test kodu
+    """
+    print("=== AI-FTB Feature Analysis Test ===")
+
+    import time
+    import data_providers
+    import feature_engineer
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2012-01-01', '2024-01-01')
+    data = feature_engineer.create_target_variable(feature_engineer.add_technical_indicators(history))
+    features = _feature_columns(data, 'Target')
+
+    started = time.perf_counter()
+    matrix = correlation_matrix(data[features].to_numpy(dtype=np.float64))
+    vector_time = time.perf_counter() - started
+    started = time.perf_counter()
+    reference = data[features].corr().to_numpy()
+    print(f"✅ {len(features)}x{len(features)} korelasyon: NumPy {vector_time * 1000:.1f} ms, "
+          f"pandas {(time.perf_counter() - started) * 1000:.1f} ms, "
+          f"fark {np.nanmax(np.abs(matrix - reference)):.2e}")
+
+    analysis = analyze_features(data)
+    print(analysis['ranking'].head(8).to_string(index=False))
+    print(f"📊 Fazlalık adayları: {analysis['redundant']}")
+
+    print("\nFeature Analysis test tamamlandı!")
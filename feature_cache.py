@@ -0,0 +1,378 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Feature Cache Module
+
+Bu modül, hesaplanmış teknik gösterge özelliklerini disk üzerinde ve bellekte
+(LRU) önbelleğe alır. Anahtar; sembol, istenen özellikler ve config.TECHNICAL_INDICATORS
+parametreleridir; girdi verisinin içerik özeti girdiyle birlikte saklanır.
+
+Davranış:
+- Girdi verisi aynıysa özellikler yeniden hesaplanmadan döndürülür
+- Önceki veri değişmeden yeni barlar eklenmişse yalnızca yeni satırlar (geriye dönük
+  pencereyle birlikte) hesaplanıp önbelleğe eklenir
+- Geçmiş veri değişmişse (düzeltme, ayarlama) özellikler baştan hesaplanır
+- Çok sembollü istekte önbellekte bulunmayan semboller tek panel hesabıyla üretilir
+"""
+
+import math
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+import pandas as pd
+
+import config
+import logger
+import memory_utils
+import snapshots
+import feature_graph
+import panel_indicators
+
+
+def lookback_rows(features=None, params=None, tolerance=None):
+    """
+    Yeni satırların özelliklerini önbellekteki sonuçla aynı hesaplamak için gereken
+    geriye dönük satır sayısını döndürür. Kayan pencereler kesin sonuç verir; EMA
+    tabanlı özellikler (MACD) için eski değerlerin ağırlığı tolerance altına inene
+    kadar ısınma satırı eklenir.
+
+    Args:
+        features (list): Özellik isimleri (None ise config.ML_FEATURES)
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        tolerance (float): EMA ısınması için kabul edilen göreli hata
+
+    Returns:
+        int: Geriye dönük satır sayısı
+    """
+    params = config.TECHNICAL_INDICATORS if params is None else params
+    tolerance = config.FEATURE_CACHE_EMA_TOLERANCE if tolerance is None else tolerance
+    plan = feature_graph.FeatureGraph(params).plan(config.ML_FEATURES if features is None else features)
+
+    # En uzun pencere + fark/kaydırma işlemleri (pct_change, shift(10)) için bir satır
+    rows = max(params['SMA_SHORT_PERIOD'], params['SMA_LONG_PERIOD'], params['BB_PERIOD'],
+               params['VOLATILITY_PERIOD'], params['RSI_PERIOD'], 20, 10) + 1
+
+    if any(name.startswith('close_ema_') for name in plan):
+        def warm_up(span):
+            return int(math.ceil(math.log(tolerance) / math.log(1.0 - 2.0 / (span + 1.0))))
+        rows += warm_up(max(params['MACD_FAST'], params['MACD_SLOW']))
+        if 'MACD_Signal' in plan:
+            rows += warm_up(params['MACD_SIGNAL'])
+    return rows
+
+
+class FeatureCache:
+    """
+    Disk + bellek (LRU) özellik önbelleği. Girdiler {anahtar: entry} biçiminde tutulur;
+    entry = {'features', 'input_hash', 'rows', 'last_index'}.
+    """
+
+    def __init__(self, path=None, max_entries=None):
+        """
+        Args:
+            path (str): Disk önbelleği dizini (None ise config.FEATURE_CACHE_PATH)
+            max_entries (int): Bellekte tutulan en fazla girdi sayısı
+        """
+        self.path = path or config.FEATURE_CACHE_PATH
+        self.max_entries = config.FEATURE_CACHE_MAX_ENTRIES if max_entries is None else max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'appends': 0, 'misses': 0}
+
+    def _count(self, name):
+        """İstatistik sayacını kilit altında artırır"""
+        with self._lock:
+            self.stats[name] += 1
+
+    def _key(self, symbol, features, params):
+        """Sembol, özellikler ve gösterge parametrelerinden önbellek anahtarı"""
+        digest = snapshots.hash_params({'features': features, 'indicators': params})
+        return f"{symbol.replace('/', '_')}_{digest[:16]}"
+
+    def _file(self, key):
+        """Girdinin disk yolu"""
+        return os.path.join(self.path, f"{key}.joblib")
+
+    def _load(self, key):
+        """Girdiyi bellekten, yoksa diskten okur"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+        path = self._file(key)
+        if not os.path.exists(path):
+            return None
+        try:
+            entry = joblib.load(path)
+        except Exception as e:
+            logger.log_warning(f"Özellik önbelleği okunamadı ({path}): {e}")
+            return None
+        self._remember(key, entry)
+        return entry
+
+    def _remember(self, key, entry):
+        """Girdiyi bellekteki LRU'ya ekler, sınır aşılırsa en eskisini çıkarır"""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _store(self, key, entry):
+        """Girdiyi belleğe ve diske yazar"""
+        self._remember(key, entry)
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            path = self._file(key)
+            tmp_path = f"{path}.tmp{os.getpid()}"
+            joblib.dump(entry, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.log_error(f"Özellik önbelleği yazılamadı ({key}): {e}")
+
+    def _match(self, key, source):
+        """
+        Girdinin önbellek durumunu döndürür.
+
+        Returns:
+            tuple: ('hit' | 'append' | None, önbellek girdisi, girdi içerik özeti)
+        """
+        input_hash = snapshots.frame_hash(source)
+        entry = self._load(key)
+        if entry is None:
+            return None, None, input_hash
+        if entry['input_hash'] == input_hash:
+            return 'hit', entry, input_hash
+
+        rows = entry['rows']
+        appendable = (len(source) > rows and source.index[rows - 1] == entry['last_index']
+                      and snapshots.frame_hash(source.iloc[:rows]) == entry['input_hash'])
+        return ('append' if appendable else None), entry, input_hash
+
+    def _append(self, symbol, key, source, entry, input_hash, features, params):
+        """Önbellekteki özelliklere yalnızca yeni satırları (geriye dönük pencereyle) ekler"""
+        rows = entry['rows']
+        start = max(0, rows - lookback_rows(features, params))
+        tail = feature_graph.FeatureGraph(params).compute(source.iloc[start:], features)[features].iloc[rows - start:]
+        computed = pd.concat([entry['features'], tail])
+        self._count('appends')
+        logger.log_debug(f"{symbol} özellikleri {len(tail)} yeni satır için güncellendi")
+        self._update(key, source, input_hash, computed)
+        return computed
+
+    def _update(self, key, source, input_hash, computed):
+        """Hesaplanan özellikleri girdinin özetiyle birlikte önbelleğe yazar"""
+        self._store(key, {'features': computed, 'input_hash': input_hash,
+                          'rows': len(source), 'last_index': source.index[-1]})
+
+    def _source(self, dataframe):
+        """Özelliklerin hesaplandığı girdi sütunları"""
+        return dataframe[[c for c in feature_graph.SOURCE_COLUMNS if c in dataframe.columns]]
+
+    def get(self, symbol, dataframe, features=None, params=None):
+        """
+        Verinin özelliklerini önbellekten döndürür; gerekirse yalnızca yeni satırları
+        veya tüm veriyi hesaplar.
+
+        Args:
+            symbol (str): Sembol adı
+            dataframe (pandas.DataFrame): OHLCV verisi
+            features (list): Özellik isimleri (None ise config.ML_FEATURES)
+            params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+
+        Returns:
+            pandas.DataFrame: Girdi sütunları + özellikler (add_technical_indicators(features=...) ile aynı)
+        """
+        features = list(config.ML_FEATURES if features is None else features)
+        params = dict(config.TECHNICAL_INDICATORS if params is None else params)
+        key = self._key(symbol, features, params)
+        source = self._source(dataframe)
+
+        state, entry, input_hash = self._match(key, source)
+        if state == 'hit':
+            self._count('hits')
+            return self._result(dataframe, entry['features'])
+        if state == 'append':
+            return self._result(dataframe, self._append(symbol, key, source, entry, input_hash, features, params))
+
+        computed = feature_graph.FeatureGraph(params).compute(source, features)[features]
+        self._count('misses')
+        self._update(key, source, input_hash, computed)
+        return self._result(dataframe, computed)
+
+    def get_many(self, frames, features=None, params=None):
+        """
+        Birden fazla sembolün özelliklerini döndürür. Önbellekte girdisi olan semboller
+        get ile aynı şekilde (tam isabet veya yeni satır ekleme) karşılanır; kalan
+        semboller tek panel hesabıyla (panel_indicators) birlikte hesaplanıp önbelleğe
+        yazılır. Anahtarlar get ile aynıdır.
+
+        Args:
+            frames (dict): {sembol: OHLCV DataFrame}
+            features (list): Özellik isimleri (None ise config.ML_FEATURES)
+            params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+
+        Returns:
+            dict: {sembol: girdi sütunları + özellikler}
+        """
+        features = list(config.ML_FEATURES if features is None else features)
+        params = dict(config.TECHNICAL_INDICATORS if params is None else params)
+        if not set(features) <= set(panel_indicators.indicator_columns(params)):
+            return {symbol: self.get(symbol, frame, features, params) for symbol, frame in frames.items()}
+
+        results, misses = {}, {}
+        for symbol, dataframe in frames.items():
+            key = self._key(symbol, features, params)
+            source = self._source(dataframe)
+            state, entry, input_hash = self._match(key, source)
+            if state == 'hit':
+                self._count('hits')
+                results[symbol] = self._result(dataframe, entry['features'])
+            elif state == 'append':
+                computed = self._append(symbol, key, source, entry, input_hash, features, params)
+                results[symbol] = self._result(dataframe, computed)
+            else:
+                misses[symbol] = (key, source, input_hash)
+
+        if misses:
+            panel = panel_indicators.build_panel({s: frames[s] for s in misses}, align='bar')
+            indicators = panel_indicators.compute_panel_indicators(panel['Close'], panel['High'], panel['Low'],
+                                                                   panel['Volume'], params, columns=features)
+            for position, symbol in enumerate(panel['symbols']):
+                key, source, input_hash = misses[symbol]
+                rows = panel['rows'][symbol]
+                computed = pd.DataFrame({c: indicators[c][rows, position] for c in features}, index=source.index)
+                self._count('misses')
+                self._update(key, source, input_hash, computed)
+                results[symbol] = self._result(frames[symbol], computed)
+            logger.log_info(f"Panel özellikleri: {len(misses)} sembol hesaplandı, "
+                            f"{len(results) - len(misses)} sembol önbellekten")
+        return {symbol: results[symbol] for symbol in frames if symbol in results}
+
+    def _result(self, dataframe, computed):
+        """Girdi sütunlarına özellikleri ekler"""
+        data = dataframe.copy()
+        for column in computed.columns:
+            data[column] = computed[column].to_numpy()
+        return memory_utils.maybe_compact(data)
+
+    def invalidate(self, symbol=None):
+        """
+        Bellekteki girdileri siler (disk dosyaları korunur, içerik özeti tutarlılığı sağlar).
+
+        Args:
+            symbol (str): Sadece bu sembolün girdileri (None ise tümü)
+        """
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+                return
+            prefix = f"{symbol.replace('/', '_')}_"
+            for key in [k for k in self._entries if k.startswith(prefix)]:
+                del self._entries[key]
+
+
+_feature_cache = None
+_feature_cache_lock = threading.Lock()
+
+
+def get_feature_cache():
+    """
+    Süreç genelinde paylaşılan özellik önbelleğini döndürür.
+
+    Returns:
+        FeatureCache: Paylaşılan önbellek
+    """
+    global _feature_cache
+    with _feature_cache_lock:
+        if _feature_cache is None:
+            _feature_cache = FeatureCache()
+        return _feature_cache
+
+
+def reset_feature_cache():
+    """Paylaşılan önbelleği sıfırlar (ayarlar değiştiğinde veya testlerde)"""
+    global _feature_cache
+    with _feature_cache_lock:
+        _feature_cache = None
+
+
+def get_features(symbol, dataframe, features=None):
+    """
+    Sembolün özelliklerini döndürür; config.FEATURE_CACHE_ENABLED kapalıysa
+    önbellek kullanılmadan hesaplanır.
+
+    Args:
+        symbol (str): Sembol adı
+        dataframe (pandas.DataFrame): OHLCV verisi
+        features (list): Özellik isimleri (None ise config.ML_FEATURES)
+
+    Returns:
+        pandas.DataFrame: Girdi sütunları + özellikler
+        None: Hata durumunda
+    """
+    if not config.FEATURE_CACHE_ENABLED:
+        import feature_engineer
+        return feature_engineer.add_technical_indicators(
+            dataframe, features=config.ML_FEATURES if features is None else features)
+    try:
+        return get_feature_cache().get(symbol, dataframe, features)
+    except Exception as e:
+        logger.log_error(f"{symbol} özellikleri hesaplanırken hata: {e}", exc_info=True)
+        return None
+
+
+def get_features_many(frames, features=None):
+    """
+    Birden fazla sembolün özelliklerini tek panel hesabıyla döndürür; önbellekte
+    bulunan semboller yeniden hesaplanmaz. config.FEATURE_CACHE_ENABLED kapalıysa
+    tüm semboller önbelleksiz panel hesabından geçer.
+
+    Args:
+        frames (dict): {sembol: OHLCV DataFrame}
+        features (list): Özellik isimleri (None ise config.ML_FEATURES)
+
+    Returns:
+        dict: {sembol: girdi sütunları + özellikler}
+        None: Hata durumunda
+    """
+    features = list(config.ML_FEATURES if features is None else features)
+    if not config.FEATURE_CACHE_ENABLED:
+        # Önbellekli yol ile aynı sütun seçimi
+        if set(features) <= set(panel_indicators.indicator_columns()):
+            return panel_indicators.add_panel_indicators(frames, columns=features)
+        import feature_engineer
+        return {symbol: feature_engineer.add_technical_indicators(frame, features=features)
+                for symbol, frame in frames.items()}
+    try:
+        return get_feature_cache().get_many(frames, features)
+    except Exception as e:
+        logger.log_error(f"Panel özellikleri hesaplanırken hata: {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Feature Cache modülü test kodu
+    """
+    print("=== AI-FTB Feature Cache Test ===")
+
+    import tempfile
+    import time
+    import data_providers
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2012-01-01', '2024-01-01')
+    cache = FeatureCache(path=tempfile.mkdtemp())
+
+    for label, data in [('İlk hesap', history.iloc[:-5]), ('Önbellek', history.iloc[:-5]), ('5 yeni bar', history)]:
+        started = time.perf_counter()
+        result = cache.get('AAPL', data)
+        print(f"✅ {label}: {(time.perf_counter() - started) * 1000:.1f} ms ({len(result)} satır)")
+
+    full = feature_graph.FeatureGraph().compute(history)
+    difference = (result[config.ML_FEATURES] - full[config.ML_FEATURES]).abs().max().max()
+    print(f"📊 Baştan hesapla en büyük fark: {difference:.2e}, geriye dönük pencere: {lookback_rows()} satır")
+    print(f"📊 İstatistikler: {cache.stats}")
+
+    print("\nFeature Cache test tamamlandı!")
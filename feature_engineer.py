@@ -8,20 +8,29 @@ göstergelerini hesaplar ve ML için hazırlar.
 
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import StandardScaler, MinMaxScaler
 import os
 import joblib
 import config
 import logger
+import memory_utils
+import feature_graph
+import feature_scaler
+import feature_analysis
+import labeling
+import cross_sectional
 
 
-def add_technical_indicators(dataframe):
+def add_technical_indicators(dataframe, features=None):
     """
     DataFrame'e teknik analiz göstergelerini ekler. Basit Hareketli Ortalamalar (SMA), 
     Göreceli Güç Endeksi (RSI), MACD, Bollinger Bantları ve Volatilite hesaplar.
     
+    features verilirse yalnızca bu göstergeler ve gerektirdikleri ara sonuçlar
+    feature_graph üzerinden hesaplanır.
+    
     Args:
         dataframe (pandas.DataFrame): OHLCV verisi içeren DataFrame
+        features (list): Hesaplanacak gösterge isimleri (None ise tüm göstergeler)
     
     Returns:
         pandas.DataFrame: Teknik göstergeler eklenmiş DataFrame
@@ -32,6 +41,14 @@ def add_technical_indicators(dataframe):
     """
     try:
         logger.log_info("Teknik göstergeler hesaplanıyor...")
+        
+        if features is not None:
+            graph = feature_graph.FeatureGraph()
+            data = graph.compute(dataframe, features)
+            slowest = ', '.join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in graph.timing_report()[:3])
+            logger.log_info(f"{len(features)} gösterge {len(graph.timings)} düğümle hesaplandı ({slowest})")
+            return memory_utils.maybe_compact(data)
+        
         data = dataframe.copy()
         
         # Parametreleri config'ten al
@@ -105,7 +122,7 @@ def add_technical_indicators(dataframe):
         initial_nan_count = data.isnull().sum().sum()
         logger.log_info(f"Teknik göstergeler eklendi. İlk {max(sma_long, rsi_period, bb_period)} satır NaN içerebilir.")
         
-        return data
+        return memory_utils.maybe_compact(data)
         
     except Exception as e:
         logger.log_error(f"Teknik göstergeler hesaplanırken hata: {e}", exc_info=True)
@@ -220,20 +237,142 @@ def calculate_bollinger_bands(prices, period=20, std_dev=2):
         return pd.Series(index=prices.index, dtype=float), pd.Series(index=prices.index, dtype=float), pd.Series(index=prices.index, dtype=float)
 
 
-def normalize_features(dataframe, features_to_normalize=None, scaler_type=None, save_scaler=True, symbol=None):
+def resample_ohlcv(dataframe, timeframe):
+    """
+    OHLCV verisini daha yüksek zaman dilimine toplar (ör. günlükten haftalığa).
+    Her bar kendi takvim periyodundaki satırlardan oluşur: Open ilk, High en yüksek,
+    Low en düşük, Close son değer, Volume toplam.
+    
+    Args:
+        dataframe (pandas.DataFrame): DatetimeIndex'li OHLCV verisi
+        timeframe (str): pandas periyot kodu ('W', 'M', 'h' vb.)
+    
+    Returns:
+        pandas.DataFrame: PeriodIndex'li yüksek zaman dilimi barları
+    """
+    index = dataframe.index
+    if index.tz is not None:
+        index = index.tz_localize(None)  # periyotlar yerel takvime göre belirlenir
+    
+    aggregations = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+    columns = {column: how for column, how in aggregations.items() if column in dataframe.columns}
+    return dataframe[list(columns)].groupby(index.to_period(timeframe)).agg(columns)
+
+
+def _align_closed_bars(values, end_times, base_index):
+    """
+    Yüksek zaman dilimi değerlerini temel indekse as-of hizalar: her satır, periyodu
+    o satırın zamanında kapanmış (end_time <= zaman) son barın değerini alır.
+    """
+    if base_index.tz is not None:
+        base_index = base_index.tz_localize(None)
+    ends = end_times.to_numpy(dtype='datetime64[ns]')
+    positions = np.searchsorted(ends, base_index.to_numpy(dtype='datetime64[ns]'), side='right') - 1
+    
+    aligned = values[np.maximum(positions, 0)]
+    aligned[positions < 0] = np.nan
+    return aligned
+
+
+def model_features(timeframes=None, cross_sectional_features=None):
+    """
+    Modelin kullandığı özellik listesini döndürür: config.ML_FEATURES, ardından
+    add_multi_timeframe_features'ın ürettiği '{gösterge}_{periyot}' sütunları ve
+    kesitsel özellikler (cross_sectional). Ölçekleme, ML veri hazırlığı ve
+    walk-forward aynı listeyi kullanır; veride bulunmayan sütunlar atlanır.
+    
+    Args:
+        timeframes (dict): {periyot kodu: gösterge listesi} (None ise config.MULTI_TIMEFRAME_FEATURES)
+        cross_sectional_features (bool): Kesitsel özellikler eklensin mi
+            (None ise config.CROSS_SECTIONAL_FEATURES_ENABLED)
+    
+    Returns:
+        list: Özellik isimleri
+    """
+    timeframes = config.MULTI_TIMEFRAME_FEATURES if timeframes is None else timeframes
+    if cross_sectional_features is None:
+        cross_sectional_features = config.CROSS_SECTIONAL_FEATURES_ENABLED
+    multi_timeframe = [f'{feature}_{timeframe}' for timeframe, features in (timeframes or {}).items()
+                       for feature in features]
+    universe = list(cross_sectional.CROSS_SECTIONAL_SOURCES) if cross_sectional_features else []
+    return list(config.ML_FEATURES) + multi_timeframe + universe
+
+
+def usable_features(dataframe, features):
+    """
+    Veride bulunan ve en az bir geçerli değeri olan özellikleri döndürür. Tamamen boş
+    sütunlar (ör. sektöründe tek sembol kalan CS_Momentum_Sector) eksik sayılır;
+    aksi halde eksiksiz satır filtresi tüm veriyi atardı.
+    
+    Args:
+        dataframe (pandas.DataFrame): Veri
+        features (list): Özellik isimleri
+    
+    Returns:
+        list: Kullanılabilir özellikler (sırası korunur)
+    """
+    return [f for f in features if f in dataframe.columns and dataframe[f].notna().any()]
+
+
+def add_multi_timeframe_features(dataframe, timeframes=None, params=None):
+    """
+    Temel veriden haftalık/aylık (veya dakikalıktan saatlik) göstergeler türetip temel
+    indekse ekler. Her satır yalnızca o an kapanmış son yüksek zaman dilimi barını
+    görür; devam eden periyodun barı (ör. haftanın ortasında o haftanın kapanışı)
+    hiçbir satıra sızmaz. Sütunlar '{gösterge}_{zaman dilimi}' olarak adlandırılır.
+    
+    Args:
+        dataframe (pandas.DataFrame): DatetimeIndex'li OHLCV verisi
+        timeframes (dict): {periyot kodu: gösterge listesi} (None ise config.MULTI_TIMEFRAME_FEATURES)
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+    
+    Returns:
+        pandas.DataFrame: Çoklu zaman dilimi sütunları eklenmiş DataFrame
+        None: Hata durumunda
+    """
+    try:
+        timeframes = config.MULTI_TIMEFRAME_FEATURES if timeframes is None else timeframes
+        data = dataframe.copy()
+        
+        for timeframe, features in timeframes.items():
+            higher = resample_ohlcv(dataframe, timeframe)
+            indicators = feature_graph.FeatureGraph(params).compute(higher, features)
+            values = indicators[list(features)].to_numpy(dtype=np.float64)
+            aligned = _align_closed_bars(values, higher.index.end_time, dataframe.index)
+            
+            for column, feature in enumerate(features):
+                data[f'{feature}_{timeframe}'] = aligned[:, column]
+            logger.log_debug(f"{timeframe} zaman dilimi: {len(higher)} bar, {len(features)} gösterge")
+        
+        logger.log_info(f"Çoklu zaman dilimi özellikleri eklendi: {list(timeframes)}")
+        return memory_utils.maybe_compact(data)
+        
+    except Exception as e:
+        logger.log_error(f"Çoklu zaman dilimi özellikleri hesaplanırken hata: {e}", exc_info=True)
+        return None
+
+
+def normalize_features(dataframe, features_to_normalize=None, scaler_type=None, save_scaler=True, symbol=None,
+                       test_size=0.2):
     """
     Makine öğrenimi modeli için belirtilen özellikleri ölçeklendirir.
-    StandardScaler veya MinMaxScaler kullanır.
+    StandardScaler veya MinMaxScaler dönüşümü uygular.
+    
+    Ölçekleyici yalnızca eğitim penceresiyle (özellikleri eksiksiz satırların kronolojik
+    ilk 1 - test_size kısmı, prepare_data_for_ml'in eğitim satırları) fit edilir; test
+    dönemindeki istatistikler ölçeklemeye sızmaz. Fit edilmiş durum küçük diziler
+    olarak .npz dosyasına kaydedilir.
     
     Args:
         dataframe (pandas.DataFrame): Ölçeklendirilecek veriler
-        features_to_normalize (list): Ölçeklendirilecek özellik isimleri
+        features_to_normalize (list): Ölçeklendirilecek özellik isimleri (None ise model_features())
         scaler_type (str): 'StandardScaler' veya 'MinMaxScaler'
         save_scaler (bool): Scaler'ı dosyaya kaydet
         symbol (str): Sembol adı (scaler dosya adı için)
+        test_size (float): Fit penceresinin dışında bırakılan son satırların oranı
     
     Returns:
-        tuple: (normalized_dataframe, scaler_object)
+        tuple: (normalized_dataframe, feature_scaler.FeatureScaler)
         None: Hata durumunda
         
     Raises:
@@ -242,15 +381,15 @@ def normalize_features(dataframe, features_to_normalize=None, scaler_type=None,
     try:
         # Parametreleri config'ten al
         if features_to_normalize is None:
-            features_to_normalize = config.ML_FEATURES
+            features_to_normalize = model_features()
         if scaler_type is None:
             scaler_type = config.FEATURE_SCALING_METHOD
             
         data = dataframe.copy()
         
         # Ölçeklendirilecek özelliklerin mevcut olduğunu kontrol et
-        available_features = [f for f in features_to_normalize if f in data.columns]
-        missing_features = [f for f in features_to_normalize if f not in data.columns]
+        available_features = usable_features(data, features_to_normalize)
+        missing_features = [f for f in features_to_normalize if f not in available_features]
         
         if missing_features:
             logger.log_warning(f"Eksik özellikler: {missing_features}")
@@ -259,33 +398,33 @@ def normalize_features(dataframe, features_to_normalize=None, scaler_type=None,
             logger.log_error("Ölçeklendirilecek özellik bulunamadı")
             return None, None
             
-        logger.log_info(f"{scaler_type} ile {len(available_features)} özellik ölçeklendiriliyor...")
-        
-        # Scaler seç
-        if scaler_type == 'StandardScaler':
-            scaler = StandardScaler()
-        elif scaler_type == 'MinMaxScaler':
-            scaler = MinMaxScaler()
-        else:
+        if scaler_type not in feature_scaler.SCALER_METHODS:
             logger.log_error(f"Geçersiz scaler tipi: {scaler_type}")
             return None, None
             
-        # NaN değerleri geçici olarak 0 ile değiştir (scaler NaN'ı sevmez)
-        data_for_scaling = data[available_features].fillna(0)
+        # Scaler sadece eğitim penceresiyle fit edilir (ileriye bakma yok)
+        train_rows = feature_scaler.training_rows(data, available_features, test_size)
+        if len(train_rows) == 0:
+            logger.log_error("Scaler için eğitim satırı bulunamadı")
+            return None, None
+            
+        logger.log_info(f"{scaler_type} ile {len(available_features)} özellik ölçeklendiriliyor "
+                        f"(fit penceresi: {len(train_rows)} satır, son tarih {train_rows.index[-1]})...")
+        scaler = feature_scaler.FeatureScaler(scaler_type, available_features).fit(train_rows)
         
-        # Ölçeklendirme uygula
-        scaled_features = scaler.fit_transform(data_for_scaling)
+        # Ölçeklendirme uygula (NaN değerler NaN kalır)
+        scaled_features = scaler.transform(data)
         
         # Ölçeklendirilmiş verileri DataFrame'e geri koy
+        if config.COMPACT_DTYPES:
+            scaled_features = scaled_features.astype(np.float32)
         for i, feature in enumerate(available_features):
             data[f'{feature}_scaled'] = scaled_features[:, i]
             
         # Scaler'ı kaydet
         if save_scaler and symbol:
-            scaler_filename = f"{symbol}_{scaler_type.lower()}.joblib"
-            scaler_path = os.path.join(config.MODEL_SAVE_PATH, scaler_filename)
-            os.makedirs(os.path.dirname(scaler_path), exist_ok=True)
-            joblib.dump(scaler, scaler_path)
+            scaler_path = feature_scaler.scaler_path(symbol, scaler_type)
+            scaler.save(scaler_path)
             logger.log_info(f"Scaler kaydedildi: {scaler_path}")
             
         logger.log_info(f"Özellik ölçeklendirme tamamlandı: {len(available_features)} özellik")
@@ -299,20 +438,27 @@ def normalize_features(dataframe, features_to_normalize=None, scaler_type=None,
 
 def load_scaler(symbol, scaler_type=None):
     """
-    Kaydedilmiş scaler'ı yükler.
+    Kaydedilmiş scaler'ı yükler. Dizi tabanlı .npz durumu yoksa eski joblib
+    dosyası denenir.
     
     Args:
         symbol (str): Sembol adı
         scaler_type (str): Scaler tipi
     
     Returns:
-        sklearn scaler object: Yüklenen scaler
+        feature_scaler.FeatureScaler veya sklearn scaler: Yüklenen scaler
         None: Hata durumunda
     """
     try:
         if scaler_type is None:
             scaler_type = config.FEATURE_SCALING_METHOD
             
+        scaler_path = feature_scaler.scaler_path(symbol, scaler_type)
+        if os.path.exists(scaler_path):
+            scaler = feature_scaler.FeatureScaler.load(scaler_path)
+            logger.log_info(f"Scaler yüklendi: {scaler_path}")
+            return scaler
+            
         scaler_filename = f"{symbol}_{scaler_type.lower()}.joblib"
         scaler_path = os.path.join(config.MODEL_SAVE_PATH, scaler_filename)
         
@@ -347,15 +493,16 @@ def create_target_variable(dataframe, lookahead_days=None):
             
         data = dataframe.copy()
         
-        # Gelecekteki kapanış fiyatını al
-        future_close = data['Close'].shift(-lookahead_days)
-        
         # Hedef değişken: 1 = fiyat artacak, 0 = fiyat düşecek/sabit kalacak
-        data['Target'] = (future_close > data['Close']).astype(int)
+        # (çoklu ufuk ve üçlü bariyer için labeling.add_labels)
+        labels = labeling.horizon_labels(data['Close'].to_numpy(dtype=np.float64), [lookahead_days])[:, 0]
         
-        # Son lookahead_days satırda hedef bilinmeyeceği için NaN olur
-        valid_targets = data['Target'].notna().sum()
-        logger.log_info(f"Hedef değişken oluşturuldu: {valid_targets} geçerli hedef")
+        # Son lookahead_days satırın geleceği bilinmez: NaN kalır, eğitimdeki dropna bu satırları atar
+        data['Target'] = labels.astype(np.float32 if config.COMPACT_DTYPES else np.float64)
+        
+        valid_targets = int(data['Target'].notna().sum())
+        logger.log_info(f"Hedef değişken oluşturuldu: {valid_targets} geçerli hedef, "
+                        f"{len(data) - valid_targets} bilinmeyen")
         
         return data
         
@@ -367,6 +514,7 @@ def create_target_variable(dataframe, lookahead_days=None):
 def get_feature_importance_ranking(dataframe, target_column='Target'):
     """
     Özelliklerin hedef değişkenle korelasyonlarını hesaplar ve önem sırasını verir.
+    Karşılıklı bilgi ve fazlalık analizi için feature_analysis.analyze_features kullanılır.
     
     Args:
         dataframe (pandas.DataFrame): Özellikler ve hedef içeren DataFrame
@@ -388,22 +536,15 @@ def get_feature_importance_ranking(dataframe, target_column='Target'):
             logger.log_warning("Analiz edilecek özellik bulunamadı")
             return None
             
-        # Korelasyonları hesapla
-        correlations = []
-        for feature in feature_cols:
-            try:
-                corr = dataframe[feature].corr(dataframe[target_column])
-                if not np.isnan(corr):
-                    correlations.append({
-                        'feature': feature,
-                        'correlation': abs(corr),  # Mutlak değer
-                        'correlation_raw': corr
-                    })
-            except:
-                continue
-                
+        # Korelasyonlar tek matris geçişinde hesaplanır (hesaplanamayanlar NaN olup atlanır)
+        correlations = feature_analysis.target_correlations(dataframe, feature_cols, target_column).dropna()
+        
         # Sonuçları DataFrame'e çevir ve sırala
-        importance_df = pd.DataFrame(correlations)
+        importance_df = pd.DataFrame({
+            'feature': correlations.index,
+            'correlation': correlations.abs().to_numpy(),  # Mutlak değer
+            'correlation_raw': correlations.to_numpy()
+        })
         importance_df = importance_df.sort_values('correlation', ascending=False)
         
         logger.log_info(f"En önemli 5 özellik: {importance_df.head()['feature'].tolist()}")
@@ -0,0 +1,240 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Feature Graph Module
+
+Bu modül, teknik göstergeleri bağımlılıkları bildirilmiş düğümlerden oluşan bir
+grafik (DAG) olarak tanımlar. Bir özellik kümesi istendiğinde yalnızca gereken
+düğümler hesaplanır ve paylaşılan ara sonuçlar (ör. SMA_20 ile BB_Middle'ın aynı
+kayan ortalaması, periyotlar eşitse Bollinger ve Volatilite'nin aynı kayan std'si)
+bir kez üretilir. Her düğümün hesap süresi ölçülür.
+
+Düğümler add_technical_indicators ile aynı pandas işlemlerini kullanır; sonuçlar
+birebir aynıdır.
+"""
+
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+import config
+import logger
+
+
+# Kaynak düğümler doğrudan girdi DataFrame'inden okunur
+SOURCE_COLUMNS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+
+class _Node:
+    """Grafik düğümü: bağımlılıklar ve bağımlılık değerlerinden hesap fonksiyonu"""
+
+    def __init__(self, name, dependencies, compute):
+        self.name = name
+        self.dependencies = tuple(dependencies)
+        self.compute = compute
+
+
+class FeatureGraph:
+    """
+    Teknik gösterge düğümlerinin kaydı. Düğüm isimleri büyük harfle başlıyorsa
+    add_technical_indicators sütunlarıdır, küçük harfle başlayanlar ara sonuçlardır.
+    """
+
+    def __init__(self, params=None):
+        """
+        Args:
+            params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        """
+        self.params = dict(config.TECHNICAL_INDICATORS if params is None else params)
+        self.nodes = {}
+        self.timings = OrderedDict()
+        self._register_indicators()
+
+    def register(self, name, dependencies, compute):
+        """
+        Grafiğe bir düğüm ekler (aynı isimli düğüm varsa değiştirilir).
+
+        Args:
+            name (str): Düğüm ismi
+            dependencies (list): Bağımlı olunan düğüm isimleri
+            compute (callable): Bağımlılık değerlerini sırayla alıp sonucu döndüren fonksiyon
+        """
+        self.nodes[name] = _Node(name, dependencies, compute)
+
+    def _register_indicators(self):
+        """add_technical_indicators göstergelerini ve ara sonuçlarını kaydeder"""
+        p = self.params
+        sma_short, sma_long = p['SMA_SHORT_PERIOD'], p['SMA_LONG_PERIOD']
+        bb_period, vol_period, rsi_period = p['BB_PERIOD'], p['VOLATILITY_PERIOD'], p['RSI_PERIOD']
+        bb_std = p['BB_STD']
+
+        # Paylaşılan kayan pencere ara sonuçları
+        for period in {sma_short, sma_long, bb_period}:
+            self.register(f'close_mean_{period}', ['Close'], lambda c, n=period: c.rolling(window=n).mean())
+        for period in {bb_period, vol_period}:
+            self.register(f'close_std_{period}', ['Close'], lambda c, n=period: c.rolling(window=n).std())
+        for span in {p['MACD_FAST'], p['MACD_SLOW']}:
+            self.register(f'close_ema_{span}', ['Close'], lambda c, n=span: c.ewm(span=n).mean())
+
+        # Hareketli ortalamalar
+        self.register(f'SMA_{sma_short}', [f'close_mean_{sma_short}'], lambda m: m)
+        self.register(f'SMA_{sma_long}', [f'close_mean_{sma_long}'], lambda m: m)
+
+        # RSI
+        self.register('close_delta', ['Close'], lambda c: c.diff())
+        self.register('rsi_gain_mean', ['close_delta'],
+                      lambda d: d.where(d > 0, 0).rolling(window=rsi_period).mean())
+        self.register('rsi_loss_mean', ['close_delta'],
+                      lambda d: (-d.where(d < 0, 0)).rolling(window=rsi_period).mean())
+        self.register('RSI', ['rsi_gain_mean', 'rsi_loss_mean'], lambda g, l: 100 - (100 / (1 + g / l)))
+
+        # MACD
+        self.register('MACD', [f"close_ema_{p['MACD_FAST']}", f"close_ema_{p['MACD_SLOW']}"], lambda f, s: f - s)
+        self.register('MACD_Signal', ['MACD'], lambda m: m.ewm(span=p['MACD_SIGNAL']).mean())
+        self.register('MACD_Hist', ['MACD', 'MACD_Signal'], lambda m, s: m - s)
+
+        # Bollinger Bantları
+        self.register('BB_Middle', [f'close_mean_{bb_period}'], lambda m: m)
+        self.register('BB_Upper', [f'close_mean_{bb_period}', f'close_std_{bb_period}'], lambda m, s: m + (s * bb_std))
+        self.register('BB_Lower', [f'close_mean_{bb_period}', f'close_std_{bb_period}'], lambda m, s: m - (s * bb_std))
+        self.register('BB_Width', ['BB_Upper', 'BB_Lower', 'BB_Middle'], lambda u, l, m: (u - l) / m)
+        self.register('BB_Position', ['Close', 'BB_Upper', 'BB_Lower'], lambda c, u, l: (c - l) / (u - l))
+
+        # Volatilite
+        self.register('Volatility', [f'close_std_{vol_period}'], lambda s: s)
+
+        # Hacim
+        self.register('Volume_Change', ['Volume'], lambda v: v.pct_change())
+        self.register('Volume_SMA', ['Volume'], lambda v: v.rolling(window=20).mean())
+        self.register('Volume_Ratio', ['Volume', 'Volume_SMA'], lambda v, m: v / m)
+
+        # Fiyat değişimleri ve momentum
+        self.register('Price_Change', ['Close'], lambda c: c.pct_change())
+        self.register('Price_Change_5d', ['Close'], lambda c: c.pct_change(5))
+        self.register('High_Low_Ratio', ['High', 'Low', 'Close'], lambda h, l, c: (h - l) / c)
+        self.register('Momentum_10', ['Close'], lambda c: c / c.shift(10) - 1)
+        self.register('ROC_5', ['Close'], lambda c: ((c - c.shift(5)) / c.shift(5)) * 100)
+
+        # Destek/direnç
+        self.register('Recent_High', ['High'], lambda h: h.rolling(window=20).max())
+        self.register('Recent_Low', ['Low'], lambda l: l.rolling(window=20).min())
+        self.register('Position_in_Range', ['Close', 'Recent_High', 'Recent_Low'], lambda c, h, l: (c - l) / (h - l))
+
+    @property
+    def features(self):
+        """Kayıtlı özellik (sütun) düğümleri"""
+        return [name for name in self.nodes if name[0].isupper()]
+
+    def plan(self, features):
+        """
+        İstenen özellikler için hesaplanacak düğümleri bağımlılık sırasıyla döndürür.
+
+        Args:
+            features (list): Özellik isimleri
+
+        Returns:
+            list: Düğüm isimleri (kaynak sütunlar hariç, her biri bir kez)
+
+        Raises:
+            ValueError: Bilinmeyen özellik veya döngüsel bağımlılıkta
+        """
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done or name in SOURCE_COLUMNS:
+                return
+            if name not in self.nodes:
+                raise ValueError(f"Bilinmeyen özellik: {name}")
+            if name in visiting:
+                raise ValueError(f"Döngüsel bağımlılık: {name}")
+            visiting.add(name)
+            for dependency in self.nodes[name].dependencies:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for feature in features:
+            visit(feature)
+        return order
+
+    def compute(self, dataframe, features=None):
+        """
+        İstenen özellikleri hesaplar ve girdi sütunlarına ekler.
+
+        Args:
+            dataframe (pandas.DataFrame): OHLCV verisi
+            features (list): Özellik isimleri (None ise config.ML_FEATURES)
+
+        Returns:
+            pandas.DataFrame: Girdi sütunları + istenen özellikler (sonsuz değerler NaN)
+
+        Raises:
+            ValueError: Bilinmeyen özellikte
+        """
+        features = list(config.ML_FEATURES if features is None else features)
+        values = {column: dataframe[column] for column in SOURCE_COLUMNS if column in dataframe.columns}
+        self.timings = OrderedDict()
+
+        for name in self.plan(features):
+            node = self.nodes[name]
+            started = time.perf_counter()
+            values[name] = node.compute(*(values[d] for d in node.dependencies))
+            self.timings[name] = time.perf_counter() - started
+
+        data = dataframe.copy()
+        for feature in features:
+            if feature not in SOURCE_COLUMNS:
+                data[feature] = values[feature].replace([np.inf, -np.inf], np.nan)
+
+        logger.log_debug(f"Özellik grafiği: {len(self.timings)} düğüm, "
+                         f"{sum(self.timings.values()) * 1000:.1f} ms")
+        return data
+
+    def timing_report(self):
+        """
+        Son compute çağrısında düğüm başına süreleri döndürür (en yavaştan hızlıya).
+
+        Returns:
+            list: [(düğüm, saniye), ...]
+        """
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+
+
+def compute_features(dataframe, features=None, params=None):
+    """
+    İstenen özellikleri yalnızca gereken düğümlerle hesaplar.
+
+    Args:
+        dataframe (pandas.DataFrame): OHLCV verisi
+        features (list): Özellik isimleri (None ise config.ML_FEATURES)
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+
+    Returns:
+        tuple: (özellikleri eklenmiş DataFrame, {düğüm: saniye})
+    """
+    graph = FeatureGraph(params)
+    data = graph.compute(dataframe, features)
+    return data, dict(graph.timings)
+
+
+if __name__ == "__main__":
+    """
+    Feature Graph modülü test kodu
+    """
+    print("=== AI-FTB Feature Graph Test ===")
+
+    import data_providers
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2015-01-01', '2024-01-01')
+    graph = FeatureGraph()
+
+    print(f"📋 ML özellikleri için plan: {graph.plan(config.ML_FEATURES)}")
+    data = graph.compute(history)
+    print(f"✅ {len(config.ML_FEATURES)} özellik, {len(graph.timings)} düğüm hesaplandı")
+    for name, seconds in graph.timing_report()[:5]:
+        print(f"   {name}: {seconds * 1000:.2f} ms")
+
+    graph.compute(history, graph.features)
+    print(f"📊 Tüm {len(graph.features)} özellik: {len(graph.timings)} düğüm")
+
+    print("\nFeature Graph test tamamlandı!")
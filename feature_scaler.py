@@ -0,0 +1,298 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Feature Scaler Module
+
+Bu modül, özellik ölçeklendirmesini ileriye bakmadan (look-ahead olmadan) yapar.
+Ölçekleyici yalnızca eğitim penceresindeki satırlarla fit edilir ve yeni barlarla
+partial_fit üzerinden artımlı güncellenir (Chan birleştirme formülü).
+
+Fit edilmiş durum, sembol başına pickle edilmiş bir nesne yerine küçük diziler
+(sayaç, ortalama, kare sapma toplamı, min, max) olarak .npz dosyasında saklanır.
+StandardScaler ve MinMaxScaler ile aynı dönüşümleri üretir.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+
+
+SCALER_METHODS = ('StandardScaler', 'MinMaxScaler')
+
+
+class FeatureScaler:
+    """
+    Artımlı güncellenebilen StandardScaler/MinMaxScaler eşdeğeri.
+    NaN değerler istatistiklere katılmaz ve dönüşümde NaN kalır.
+    """
+
+    def __init__(self, method=None, features=None):
+        """
+        Args:
+            method (str): 'StandardScaler' veya 'MinMaxScaler' (None ise config.FEATURE_SCALING_METHOD)
+            features (list): Özellik isimleri (DataFrame girdilerinde sütun seçimi için)
+
+        Raises:
+            ValueError: Geçersiz yöntemde
+        """
+        method = config.FEATURE_SCALING_METHOD if method is None else method
+        if method not in SCALER_METHODS:
+            raise ValueError(f"Geçersiz scaler tipi: {method}")
+        self.method = method
+        self.features = list(features) if features is not None else None
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.minimum = None
+        self.maximum = None
+
+    def _values(self, X):
+        """Girdiyi (satır × özellik) float64 diziye çevirir"""
+        if isinstance(X, pd.DataFrame):
+            if self.features is None:
+                self.features = list(X.columns)
+            X = X[self.features]
+        return np.asarray(X, dtype=np.float64).reshape(len(X), -1)
+
+    @property
+    def fitted(self):
+        """Ölçekleyici en az bir kez fit edildi mi"""
+        return self.count is not None
+
+    def fit(self, X):
+        """
+        Durumu sıfırlayıp X ile fit eder.
+
+        Args:
+            X (pandas.DataFrame veya numpy.ndarray): Eğitim satırları
+
+        Returns:
+            FeatureScaler: self
+        """
+        self.count = None
+        return self.partial_fit(X)
+
+    def partial_fit(self, X):
+        """
+        Mevcut istatistikleri yeni satırlarla günceller.
+
+        Args:
+            X (pandas.DataFrame veya numpy.ndarray): Yeni satırlar
+
+        Returns:
+            FeatureScaler: self
+        """
+        values = self._values(X)
+        present = ~np.isnan(values)
+        count = present.sum(axis=0).astype(np.float64)
+        filled = np.where(present, values, 0.0)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            mean = np.where(count > 0, filled.sum(axis=0) / count, 0.0)
+        m2 = (np.where(present, values - mean, 0.0) ** 2).sum(axis=0)
+        minimum = np.where(present, values, np.inf).min(axis=0, initial=np.inf)
+        maximum = np.where(present, values, -np.inf).max(axis=0, initial=-np.inf)
+
+        if not self.fitted:
+            self.count, self.mean, self.m2 = count, mean, m2
+            self.minimum, self.maximum = minimum, maximum
+            return self
+
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0.0)
+            self.m2 = np.where(total > 0, self.m2 + m2 + delta ** 2 * self.count * count / total, 0.0)
+        self.count = total
+        self.minimum = np.minimum(self.minimum, minimum)
+        self.maximum = np.maximum(self.maximum, maximum)
+        return self
+
+    @property
+    def var(self):
+        """Popülasyon varyansı (ddof=0, sklearn StandardScaler ile aynı)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.count > 0, self.m2 / self.count, 0.0)
+
+    @property
+    def scale(self):
+        """Dönüşüm böleni; sıfır ölçekler 1 kabul edilir (sklearn ile aynı)"""
+        if self.method == 'StandardScaler':
+            scale = np.sqrt(self.var)
+        else:
+            scale = self.maximum - self.minimum
+        scale = np.where(np.isfinite(scale), scale, 1.0)
+        return np.where(scale < 10 * np.finfo(np.float64).eps, 1.0, scale)
+
+    @property
+    def offset(self):
+        """Dönüşümde çıkarılan değer (ortalama veya minimum)"""
+        offset = self.mean if self.method == 'StandardScaler' else self.minimum
+        return np.where(np.isfinite(offset), offset, 0.0)
+
+    def transform(self, X):
+        """
+        Fit edilmiş istatistiklerle ölçeklendirir.
+
+        Args:
+            X (pandas.DataFrame veya numpy.ndarray): Ölçeklenecek satırlar
+
+        Returns:
+            numpy.ndarray: (satır × özellik) ölçeklenmiş değerler
+
+        Raises:
+            RuntimeError: Ölçekleyici fit edilmemişse
+        """
+        if not self.fitted:
+            raise RuntimeError("Scaler henüz fit edilmedi")
+        return (self._values(X) - self.offset) / self.scale
+
+    def fit_transform(self, X):
+        """X ile fit edip dönüştürür"""
+        return self.fit(X).transform(X)
+
+    def to_arrays(self):
+        """
+        Durumu küçük diziler olarak döndürür.
+
+        Returns:
+            dict: {'method', 'features', 'count', 'mean', 'm2', 'minimum', 'maximum'}
+        """
+        return {'method': np.array(self.method), 'features': np.array(self.features or [], dtype=str),
+                'count': self.count, 'mean': self.mean, 'm2': self.m2,
+                'minimum': self.minimum, 'maximum': self.maximum}
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        """
+        to_arrays çıktısından ölçekleyici oluşturur.
+
+        Args:
+            arrays (dict veya numpy.lib.npyio.NpzFile): Durum dizileri
+
+        Returns:
+            FeatureScaler: Yüklenen ölçekleyici
+        """
+        scaler = cls(str(arrays['method']), [str(f) for f in arrays['features']] or None)
+        for name in ('count', 'mean', 'm2', 'minimum', 'maximum'):
+            setattr(scaler, name, np.asarray(arrays[name], dtype=np.float64))
+        return scaler
+
+    def save(self, path):
+        """
+        Durumu .npz dosyasına yazar.
+
+        Args:
+            path (str): Dosya yolu
+        """
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}.npz"
+        np.savez(tmp_path, **self.to_arrays())
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        .npz dosyasından ölçekleyici yükler.
+
+        Args:
+            path (str): Dosya yolu
+
+        Returns:
+            FeatureScaler: Yüklenen ölçekleyici
+        """
+        with np.load(path) as arrays:
+            return cls.from_arrays(arrays)
+
+
+def scaler_path(symbol, scaler_type=None):
+    """
+    Sembolün ölçekleyici durum dosyasının yolunu döndürür.
+
+    Args:
+        symbol (str): Sembol adı
+        scaler_type (str): Scaler tipi (None ise config.FEATURE_SCALING_METHOD)
+
+    Returns:
+        str: .npz dosya yolu
+    """
+    scaler_type = config.FEATURE_SCALING_METHOD if scaler_type is None else scaler_type
+    return os.path.join(config.MODEL_SAVE_PATH, f"{symbol}_{scaler_type.lower()}.npz")
+
+
+def training_rows(dataframe, features, test_size=0.2, target_column='Target'):
+    """
+    Ölçekleyicinin fit edileceği eğitim penceresini döndürür: özellikleri (ve varsa
+    hedefi) eksiksiz satırların kronolojik ilk (1 - test_size) kısmı. Bu pencere
+    ml_model.prepare_data_for_ml'in eğitim satırlarıyla aynıdır.
+
+    Args:
+        dataframe (pandas.DataFrame): Veri
+        features (list): Özellik isimleri
+        test_size (float): Test oranı
+        target_column (str): Hedef sütun adı
+
+    Returns:
+        pandas.DataFrame: Eğitim penceresindeki özellik satırları
+    """
+    columns = list(features) + ([target_column] if target_column in dataframe.columns else [])
+    clean = dataframe[columns].dropna()
+    n_train = len(clean) - int(np.ceil(len(clean) * test_size))
+    return clean.iloc[:n_train][list(features)]
+
+
+def update_scaler(symbol, new_rows, scaler_type=None):
+    """
+    Kayıtlı ölçekleyiciyi yeni barlarla artımlı günceller ve kaydeder.
+
+    Args:
+        symbol (str): Sembol adı
+        new_rows (pandas.DataFrame): Yeni satırlar (ölçekleyici özelliklerini içermeli)
+        scaler_type (str): Scaler tipi
+
+    Returns:
+        FeatureScaler: Güncellenmiş ölçekleyici
+        None: Kayıtlı ölçekleyici yoksa veya hata durumunda
+    """
+    try:
+        path = scaler_path(symbol, scaler_type)
+        if not os.path.exists(path):
+            logger.log_warning(f"Güncellenecek scaler bulunamadı: {path}")
+            return None
+        scaler = FeatureScaler.load(path).partial_fit(new_rows)
+        scaler.save(path)
+        return scaler
+    except Exception as e:
+        logger.log_error(f"{symbol} scaler güncellenirken hata: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Feature Scaler modülü test kodu
+    """
+    print("=== AI-FTB Feature Scaler Test ===")
+
+    import tempfile
+    import time
+    from sklearn.preprocessing import StandardScaler
+
+    rng = np.random.default_rng(0)
+    X = pd.DataFrame(rng.normal(50, 10, (2000, 8)), columns=[f"f{i}" for i in range(8)])
+
+    scaler = FeatureScaler('StandardScaler').fit(X.iloc[:1500])
+    for start in range(1500, 2000, 100):
+        scaler.partial_fit(X.iloc[start:start + 100])
+    difference = np.abs(scaler.transform(X) - StandardScaler().fit_transform(X)).max()
+    print(f"✅ Artımlı fit ile sklearn arasındaki en büyük fark: {difference:.2e}")
+
+    path = os.path.join(tempfile.mkdtemp(), 'demo_standardscaler.npz')
+    scaler.save(path)
+    started = time.perf_counter()
+    FeatureScaler.load(path).partial_fit(X.iloc[-1:]).save(path)
+    print(f"✅ Günlük güncelleme: {(time.perf_counter() - started) * 1000:.2f} ms, "
+          f"dosya {os.path.getsize(path)} bayt")
+
+    print("\nFeature Scaler test tamamlandı!")
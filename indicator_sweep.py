@@ -0,0 +1,279 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Indicator Sweep Module
+
+Bu modül, bir gösterge ailesini çok sayıda periyot için tek geçişte hesaplar
+(ör. 5-50 arası tüm periyotlar için RSI). TECHNICAL_INDICATORS parametre araması,
+her kombinasyon için add_technical_indicators'ı yeniden çalıştırmak yerine aile
+başına bir geçişe iner.
+
+Yöntem:
+- Kayan ortalamalar tek bir kümülatif toplamdan (zaman × periyot) indeks farklarıyla alınır
+- Standart sapma sayısal kararlılık için periyot başına kopyasız pencere görünümüyle hesaplanır
+- RSI kazanç/kayıpları ve fiyat farkları tüm periyotlarda paylaşılır
+- Sabit pencereler ve sıfır kazanç/kayıplı pencereler tamsayı sayaçlarla kesin tespit edilir
+- EMA, periyot ekseninde vektörel özyinelemeyle hesaplanır (panel_indicators.ewm_mean)
+
+Sonuçlar feature_engineer hesaplarıyla kayan nokta hassasiyetinde aynıdır.
+"""
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import panel_indicators
+
+
+SWEEP_FAMILIES = ['SMA', 'EMA', 'RSI', 'Volatility', 'BB_Upper', 'BB_Lower', 'BB_Width', 'BB_Position',
+                  'Momentum', 'ROC']
+
+
+def _periods(periods):
+    """Periyotları pozitif tamsayı dizisine çevirir"""
+    periods = np.asarray(list(periods), dtype=np.int64)
+    if periods.ndim != 1 or len(periods) == 0 or (periods < 1).any():
+        raise ValueError(f"Geçersiz periyot listesi: {periods}")
+    return periods
+
+
+def _window_sums(cumulative, periods):
+    """
+    Başına 0 eklenmiş kümülatif toplamdan her periyot için kayan pencere toplamları.
+    Pencere dolmayan satırlar NaN olur. Sonuç (zaman × periyot) boyutundadır.
+    """
+    length = len(cumulative) - 1
+    end = np.arange(1, length + 1)[:, None]
+    start = end - periods[None, :]
+    sums = cumulative[end] - cumulative[np.maximum(start, 0)]
+    sums = sums.astype(np.float64)
+    sums[start < 0] = np.nan
+    return sums
+
+
+def _cumulative(values):
+    """Başına 0 eklenmiş kümülatif toplam"""
+    return np.concatenate([np.zeros(1, dtype=values.dtype), np.cumsum(values)])
+
+
+def _rolling_means(values, periods):
+    """
+    Tüm periyotlar için kayan ortalama; ilk geçerli değere göre merkezlenmiş tek bir
+    kümülatif toplamdan alınır. Pencerede NaN varsa sonuç NaN, tüm değerleri aynı
+    pencerede değerin kendisi olur.
+    """
+    missing = np.isnan(values)
+    finite = values[~missing]
+    reference = finite[0] if len(finite) else 0.0
+    centered = np.where(missing, 0.0, values - reference)
+
+    sums = _window_sums(_cumulative(centered), periods)
+    nan_counts = _window_sums(_cumulative(missing.astype(np.int64)), periods)
+
+    # Pencere içindeki değer değişimi sayısı (ilk değer hariç p-1 fark)
+    changed = np.concatenate([[0], (values[1:] != values[:-1]).astype(np.int64)])[:len(values)]
+    flat = _window_sums(_cumulative(changed), periods - 1) == 0
+
+    mean = np.where(flat, values[:, None], sums / periods + reference)
+    mean[~(nan_counts == 0)] = np.nan
+    return mean
+
+
+def _rolling_stds(values, periods):
+    """
+    Tüm periyotlar için kayan örneklem standart sapması. Kareler toplamının kümülatif
+    farkı uzun serilerde hassasiyet kaybettirdiği için her periyot kopyasız pencere
+    görünümüyle iki geçişte hesaplanır.
+    """
+    std = np.full((len(values), len(periods)), np.nan)
+    for column, period in enumerate(periods):
+        if period > 1:
+            std[:, column] = panel_indicators.rolling_std(values[:, None], period)[:, 0]
+    return std
+
+
+def rolling_mean_sweep(values, periods):
+    """
+    Tüm periyotlar için kayan ortalama.
+
+    Args:
+        values (numpy.ndarray): 1 boyutlu zaman serisi
+        periods (list): Periyotlar
+
+    Returns:
+        numpy.ndarray: (zaman × periyot) kayan ortalamalar
+    """
+    return _rolling_means(np.asarray(values, dtype=np.float64), _periods(periods))
+
+
+def rolling_std_sweep(values, periods):
+    """
+    Tüm periyotlar için kayan örneklem standart sapması (ddof=1, tüm değerleri
+    aynı pencerede kesin 0).
+
+    Args:
+        values (numpy.ndarray): 1 boyutlu zaman serisi
+        periods (list): Periyotlar
+
+    Returns:
+        numpy.ndarray: (zaman × periyot) kayan standart sapmalar
+    """
+    return _rolling_stds(np.asarray(values, dtype=np.float64), _periods(periods))
+
+
+def rsi_sweep(values, periods):
+    """
+    Tüm periyotlar için RSI (feature_engineer.calculate_rsi tanımıyla).
+    Fiyat farkları, kazançlar ve kayıplar tüm periyotlarda paylaşılır.
+
+    Args:
+        values (numpy.ndarray): 1 boyutlu kapanış serisi
+        periods (list): Periyotlar
+
+    Returns:
+        numpy.ndarray: (zaman × periyot) RSI değerleri
+    """
+    periods = _periods(periods)
+    values = np.asarray(values, dtype=np.float64)
+    delta = np.concatenate([[np.nan], np.diff(values)])
+    gains = np.where(delta > 0, delta, 0.0)
+    losses = np.where(delta < 0, -delta, 0.0)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        average = {}
+        for name, series in (('gain', gains), ('loss', losses)):
+            means = _window_sums(_cumulative(series), periods) / periods
+            nonzero = _window_sums(_cumulative((series > 0).astype(np.int64)), periods)
+            average[name] = np.where(nonzero == 0, 0.0, means)  # sıfır pencereler kesin 0
+            average[name][np.isnan(means)] = np.nan
+        return 100 - (100 / (1 + average['gain'] / average['loss']))
+
+
+def ema_sweep(values, periods):
+    """
+    Tüm periyotlar için EMA (pandas ewm(span, adjust=True)).
+
+    Args:
+        values (numpy.ndarray): 1 boyutlu zaman serisi
+        periods (list): EMA periyotları
+
+    Returns:
+        numpy.ndarray: (zaman × periyot) EMA değerleri
+    """
+    periods = _periods(periods)
+    values = np.asarray(values, dtype=np.float64)
+    return panel_indicators.ewm_mean(np.repeat(values[:, None], len(periods), axis=1), periods)
+
+
+def _lagged(values, periods):
+    """Her periyot için shift(p) edilmiş seri (zaman × periyot)"""
+    rows = np.arange(len(values))[:, None] - periods[None, :]
+    lagged = values[np.maximum(rows, 0)]
+    lagged[rows < 0] = np.nan
+    return lagged
+
+
+def sweep_indicator(data, family, periods, bb_std=None):
+    """
+    Bir gösterge ailesini tüm periyotlar için tek geçişte hesaplar.
+
+    Args:
+        data (pandas.DataFrame veya pandas.Series): OHLCV verisi veya kapanış serisi
+        family (str): Gösterge ailesi (SWEEP_FAMILIES'ten biri)
+        periods (list): Periyotlar (ör. range(5, 51))
+        bb_std (float): Bollinger std çarpanı (None ise config.TECHNICAL_INDICATORS['BB_STD'])
+
+    Returns:
+        pandas.DataFrame: Sütunları '{family}_{periyot}' olan (zaman × periyot) sonuç
+
+    Raises:
+        ValueError: Bilinmeyen aile veya geçersiz periyotta
+    """
+    if family not in SWEEP_FAMILIES:
+        raise ValueError(f"Bilinmeyen gösterge ailesi: {family}")
+    periods = _periods(periods)
+    close = data['Close'] if isinstance(data, pd.DataFrame) else data
+    values = close.to_numpy(dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if family == 'SMA':
+            result = rolling_mean_sweep(values, periods)
+        elif family == 'EMA':
+            result = ema_sweep(values, periods)
+        elif family == 'RSI':
+            result = rsi_sweep(values, periods)
+        elif family == 'Volatility':
+            result = rolling_std_sweep(values, periods)
+        elif family in ('Momentum', 'ROC'):
+            lagged = _lagged(values, periods)
+            if family == 'Momentum':
+                result = values[:, None] / lagged - 1
+            else:
+                result = ((values[:, None] - lagged) / lagged) * 100
+        else:
+            bb_std = config.TECHNICAL_INDICATORS['BB_STD'] if bb_std is None else bb_std
+            mean = _rolling_means(values, periods)
+            band = _rolling_stds(values, periods) * bb_std
+            upper, lower = mean + band, mean - band
+            result = {
+                'BB_Upper': upper,
+                'BB_Lower': lower,
+                'BB_Width': (upper - lower) / mean,
+                'BB_Position': (values[:, None] - lower) / (upper - lower),
+            }[family]
+
+    result = np.where(np.isinf(result), np.nan, result)
+    return pd.DataFrame(result, index=close.index, columns=[f'{family}_{p}' for p in periods])
+
+
+def sweep_indicators(data, grid, bb_std=None):
+    """
+    Birden fazla aileyi (her biri tek geçişte) hesaplayıp birleştirir.
+
+    Args:
+        data (pandas.DataFrame): OHLCV verisi
+        grid (dict): {aile: periyotlar}, ör. {'RSI': range(5, 51), 'SMA': [10, 20, 50]}
+        bb_std (float): Bollinger std çarpanı
+
+    Returns:
+        pandas.DataFrame: Tüm ailelerin sütunları
+        None: Hata durumunda
+    """
+    try:
+        frames = [sweep_indicator(data, family, periods, bb_std) for family, periods in grid.items()]
+        total = sum(frame.shape[1] for frame in frames)
+        logger.log_info(f"Gösterge taraması: {len(grid)} aile, {total} sütun")
+        return pd.concat(frames, axis=1)
+    except Exception as e:
+        logger.log_error(f"Gösterge taraması hatası: {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Indicator Sweep modülü test kodu
+    """
+    print("=== AI-FTB Indicator Sweep Test ===")
+
+    import time
+    import data_providers
+    import feature_engineer
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2010-01-01', '2024-01-01')
+    periods = range(5, 51)
+
+    started = time.perf_counter()
+    rsi = sweep_indicator(history, 'RSI', periods)
+    sweep_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    reference = {p: feature_engineer.calculate_rsi(history['Close'], p) for p in periods}
+    loop_time = time.perf_counter() - started
+
+    difference = max((rsi[f'RSI_{p}'] - reference[p]).abs().max() for p in periods)
+    print(f"✅ RSI {len(periods)} periyot: tarama {sweep_time * 1000:.1f} ms, döngü {loop_time * 1000:.1f} ms")
+    print(f"📊 En büyük fark: {difference:.2e}")
+
+    grid = {'SMA': range(5, 101, 5), 'BB_Position': [10, 20, 30], 'EMA': [9, 12, 26]}
+    print(f"✅ Çoklu aile: {sweep_indicators(history, grid).shape}")
+
+    print("\nIndicator Sweep test tamamlandı!")
@@ -0,0 +1,374 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Inference Pipeline Module
+
+Bu modül, model tahmini için özellik matrisini pandas nesnesi oluşturmadan üretir.
+Girdi bitişik NumPy dizileridir (Close/High/Low/Volume); çıktı, modelin beklediği
+sütun sırasında, önceden ayrılmış float32 bir matristir.
+
+- Yalnızca modelin kullandığı göstergeler hesaplanır (panel_indicators, sütun seçimli)
+- Son N bar istendiğinde yalnızca son N bar + geriye dönük pencere işlenir
+- Üst zaman dilimi sütunları ('{gösterge}_{periyot}') tarih dizisinden kurulan barlardan,
+  add_multi_timeframe_features ile aynı kapanmış-bar as-of hizalamasıyla üretilir
+- Kesitsel sütunlar (CS_*) tek sembolün fiyatından türetilemez; hazır girdi olarak verilir
+- '_scaled' sütunları kayıtlı FeatureScaler durumundan (ofset/ölçek dizileri) üretilir
+
+Backtester, canlı döngü ve API aynı hattı kullanır.
+"""
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import panel_indicators
+import feature_cache
+import cross_sectional
+
+
+SCALED_SUFFIX = '_scaled'
+
+
+def frame_arrays(dataframe):
+    """
+    OHLCV DataFrame'inden hattın beklediği bitişik float64 dizileri çıkarır.
+
+    Args:
+        dataframe (pandas.DataFrame): OHLCV verisi
+
+    Returns:
+        tuple: (close, high, low, volume)
+    """
+    return tuple(np.ascontiguousarray(dataframe[c].to_numpy(dtype=np.float64))
+                 for c in ('Close', 'High', 'Low', 'Volume'))
+
+
+def frame_dates(dataframe):
+    """
+    DataFrame indeksini üst zaman dilimi barları için saat dilimsiz datetime64 dizisine çevirir.
+
+    Args:
+        dataframe (pandas.DataFrame): DatetimeIndex'li veri
+
+    Returns:
+        numpy.ndarray: datetime64[ns] tarih dizisi
+    """
+    index = dataframe.index
+    if index.tz is not None:
+        index = index.tz_localize(None)  # periyotlar yerel takvime göre belirlenir
+    return index.to_numpy(dtype='datetime64[ns]')
+
+
+def _base_name(name):
+    """'_scaled' sonekini atarak gösterge adını döndürür"""
+    return name[:-len(SCALED_SUFFIX)] if name.endswith(SCALED_SUFFIX) else name
+
+
+def _timeframe_columns(timeframes, params=None):
+    """'{gösterge}_{periyot}' sütun adı -> (periyot, gösterge); yalnızca panel göstergeleri"""
+    indicators = set(panel_indicators.indicator_columns(params))
+    return {f'{feature}_{timeframe}': (timeframe, feature) for timeframe, features in (timeframes or {}).items()
+            for feature in features if feature in indicators}
+
+
+def unsupported_features(feature_names, params=None, timeframes=None):
+    """
+    Tahmin hattının üretemediği özellikleri döndürür. Teknik göstergeler, üst zaman
+    dilimi göstergeleri ve (hazır girdi olarak) kesitsel özellikler desteklenir.
+
+    Args:
+        feature_names (list): Model sütunları ('_scaled' sonekli olabilir)
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        timeframes (dict): {periyot kodu: gösterge listesi} (None ise config.MULTI_TIMEFRAME_FEATURES)
+
+    Returns:
+        list: Desteklenmeyen gösterge isimleri (sırası korunur)
+    """
+    timeframes = config.MULTI_TIMEFRAME_FEATURES if timeframes is None else timeframes
+    supported = set(panel_indicators.indicator_columns(params)) | set(_timeframe_columns(timeframes, params)) \
+        | set(cross_sectional.CROSS_SECTIONAL_SOURCES)
+    return [b for b in dict.fromkeys(_base_name(name) for name in feature_names) if b not in supported]
+
+
+def _higher_timeframe_bars(dates, close, high, low, volume, timeframe):
+    """
+    Tarih sıralı günlük dizileri üst zaman dilimi barlarına toplar (resample_ohlcv ile aynı
+    kurallar: High en yüksek, Low en düşük, Close son değer, Volume toplam).
+
+    Returns:
+        tuple: ((close, high, low, volume) bar dizileri, bar kapanış zamanları datetime64[ns])
+    """
+    periods = pd.DatetimeIndex(dates).to_period(timeframe)
+    codes = periods.asi8
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    ends = np.r_[starts[1:], len(codes)] - 1
+    bars = (close[ends], np.maximum.reduceat(high, starts), np.minimum.reduceat(low, starts),
+            np.add.reduceat(volume, starts))
+    return bars, periods[starts].end_time.to_numpy(dtype='datetime64[ns]')
+
+
+class InferencePipeline:
+    """
+    Model sütun sırasında float32 özellik matrisi üreten, DataFrame kullanmayan hat.
+    Çıktı matrisi hat nesnesine aittir ve bir sonraki çağrıda üzerine yazılır.
+    """
+
+    def __init__(self, feature_names, scaler=None, params=None, timeframes=None):
+        """
+        Args:
+            feature_names (list): Modelin beklediği sütunlar (ör. ['RSI', ..., 'RSI_scaled', ...])
+            scaler (feature_scaler.FeatureScaler): '_scaled' sütunları için fit edilmiş ölçekleyici
+            params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+            timeframes (dict): {periyot kodu: gösterge listesi} (None ise config.MULTI_TIMEFRAME_FEATURES)
+
+        Raises:
+            ValueError: Desteklenmeyen özellikte veya '_scaled' sütunu için uygun ölçekleyici yoksa
+        """
+        self.feature_names = list(feature_names)
+        self.params = dict(config.TECHNICAL_INDICATORS if params is None else params)
+        timeframes = config.MULTI_TIMEFRAME_FEATURES if timeframes is None else timeframes
+
+        base_names = [_base_name(name) for name in self.feature_names]
+        self.base_features = list(dict.fromkeys(base_names))
+        unsupported = unsupported_features(self.base_features, self.params, timeframes)
+        if unsupported:
+            raise ValueError(f"Tahmin hattında desteklenmeyen özellikler: {unsupported}")
+
+        # Özellik grupları: fiyat göstergeleri, üst zaman dilimi göstergeleri, hazır (kesitsel) girdiler
+        timeframe_columns = _timeframe_columns(timeframes, self.params)
+        self.external_features = [b for b in self.base_features if b in cross_sectional.CROSS_SECTIONAL_SOURCES]
+        self.timeframe_features = {}
+        for name in self.base_features:
+            if name in timeframe_columns and name not in self.external_features:
+                timeframe, feature = timeframe_columns[name]
+                self.timeframe_features.setdefault(timeframe, {})[name] = feature
+        grouped = set(self.external_features).union(*self.timeframe_features.values())
+        self.indicator_features = [b for b in self.base_features if b not in grouped]
+        self.lookback = feature_cache.lookback_rows(self.indicator_features, self.params)
+
+        # Çıktı sütunu j = (gösterge[j] - offset[j]) / scale[j]
+        self._base_index = np.array([self.base_features.index(b) for b in base_names], dtype=np.intp)
+        self._offset = np.zeros(len(self.feature_names))
+        self._scale = np.ones(len(self.feature_names))
+        for column, (name, base) in enumerate(zip(self.feature_names, base_names)):
+            if name == base:
+                continue
+            if scaler is None or not hasattr(scaler, 'offset') or base not in (scaler.features or []):
+                raise ValueError(f"{name} için fit edilmiş FeatureScaler gerekli")
+            position = scaler.features.index(base)
+            self._offset[column] = scaler.offset[position]
+            self._scale[column] = scaler.scale[position]
+        self._buffer = None
+
+    def transform(self, close, high, low, volume, rows=None, dates=None, extra=None):
+        """
+        Özellik matrisini üretir.
+
+        Args:
+            close (numpy.ndarray): 1 boyutlu kapanış fiyatları (eskiden yeniye)
+            high (numpy.ndarray): 1 boyutlu en yüksek fiyatlar
+            low (numpy.ndarray): 1 boyutlu en düşük fiyatlar
+            volume (numpy.ndarray): 1 boyutlu hacimler
+            rows (int): Yalnızca son rows bar için üret (None ise tüm barlar)
+            dates (numpy.ndarray): Bar tarihleri (datetime64, bkz. frame_dates); üst zaman dilimi
+                sütunları için gerekli
+            extra (dict): {kesitsel özellik: fiyat dizileriyle aynı uzunlukta 1 boyutlu dizi}
+
+        Returns:
+            numpy.ndarray: (rows × özellik) float32 matris, model sütun sırasında
+
+        Raises:
+            ValueError: Üst zaman dilimi sütunları için tarih veya kesitsel sütun girdisi yoksa
+        """
+        length = len(close)
+        rows = length if rows is None else min(rows, length)
+        start = 0 if rows == length else max(0, length - rows - self.lookback)
+
+        values = {}
+        if self.indicator_features:
+            arrays = [np.asarray(a, dtype=np.float64)[start:, None] for a in (close, high, low, volume)]
+            indicators = panel_indicators.compute_panel_indicators(*arrays, params=self.params,
+                                                                   columns=self.indicator_features)
+            values.update((name, indicators[name][:, 0]) for name in self.indicator_features)
+
+        if self.timeframe_features:
+            if dates is None:
+                raise ValueError("Üst zaman dilimi özellikleri için bar tarihleri (dates) gerekli")
+            # Üst zaman dilimi göstergeleri az sayıda bar üzerinde tüm geçmişle hesaplanır
+            arrays = [np.asarray(a, dtype=np.float64) for a in (close, high, low, volume)]
+            dates = np.asarray(dates, dtype='datetime64[ns]')
+            for timeframe, columns in self.timeframe_features.items():
+                bars, end_times = _higher_timeframe_bars(dates, *arrays, timeframe)
+                indicators = panel_indicators.compute_panel_indicators(
+                    *(a[:, None] for a in bars), params=self.params, columns=list(dict.fromkeys(columns.values())))
+                # Her satır yalnızca o an kapanmış (end_time <= tarih) son barı görür
+                positions = np.searchsorted(end_times, dates[length - rows:], side='right') - 1
+                for name, feature in columns.items():
+                    aligned = indicators[feature][np.maximum(positions, 0), 0]
+                    aligned[positions < 0] = np.nan
+                    values[name] = aligned
+
+        missing = [name for name in self.external_features if name not in (extra or {})]
+        if missing:
+            raise ValueError(f"Kesitsel özellikler hazır girdi olarak verilmeli: {missing}")
+        for name in self.external_features:
+            values[name] = np.asarray(extra[name], dtype=np.float64)
+
+        if self._buffer is None or self._buffer.shape[0] != rows:
+            self._buffer = np.empty((rows, len(self.feature_names)), dtype=np.float32)
+        for column, base in enumerate(self._base_index):
+            source = values[self.base_features[base]]
+            self._buffer[:, column] = (source[len(source) - rows:] - self._offset[column]) / self._scale[column]
+        return self._buffer
+
+    def latest(self, close, high, low, volume, dates=None, extra=None):
+        """
+        Yalnızca son bar için (1 × özellik) matris üretir.
+
+        Returns:
+            numpy.ndarray: (1 × özellik) float32 matris
+        """
+        return self.transform(close, high, low, volume, rows=1, dates=dates, extra=extra)
+
+    def transform_frame(self, dataframe, rows=None):
+        """
+        OHLCV DataFrame'inden özellik matrisini üretir; kesitsel sütunlar veride varsa
+        hazır girdi olarak alınır.
+
+        Args:
+            dataframe (pandas.DataFrame): DatetimeIndex'li OHLCV verisi (CS_* sütunları olabilir)
+            rows (int): Yalnızca son rows bar için üret (None ise tüm barlar)
+
+        Returns:
+            numpy.ndarray: (rows × özellik) float32 matris, model sütun sırasında
+        """
+        extra = {name: dataframe[name].to_numpy(dtype=np.float64)
+                 for name in self.external_features if name in dataframe.columns}
+        return self.transform(*frame_arrays(dataframe), rows=rows, dates=frame_dates(dataframe), extra=extra)
+
+    @classmethod
+    def from_saved_model(cls, symbol, filename='trained_model'):
+        """
+        Kayıtlı modeli, metadata'daki sütun sırasını ve ölçekleyiciyi yükler.
+
+        Args:
+            symbol (str): Sembol adı
+            filename (str): Model dosya adı
+
+        Returns:
+            tuple: (InferencePipeline, model)
+            None: Model bulunamazsa, hat kurulamazsa veya hata durumunda
+        """
+        import ml_model
+        import feature_engineer
+
+        try:
+            loaded = ml_model.load_model(filename, symbol)
+            if loaded is None:
+                return None
+            model, metadata = loaded
+            feature_names = metadata.get('feature_names', config.ML_FEATURES)
+            scaler = None
+            if any(name.endswith(SCALED_SUFFIX) for name in feature_names):
+                scaler = feature_engineer.load_scaler(symbol)
+            return cls(feature_names, scaler), model
+        except ValueError as e:
+            # Fiyattan veya hazır girdiden üretilemeyen özellik ya da eksik ölçekleyici
+            logger.log_warning(f"{symbol}: Model tahmin hattında kullanılamıyor: {e}")
+            return None
+        except Exception as e:
+            logger.log_error(f"{symbol} tahmin hattı oluşturulamadı: {e}")
+            return None
+
+
+def model_signal(model, features):
+    """
+    Tek satırlık özellik matrisinden al/sat sinyali üretir.
+
+    Args:
+        model: Eğitilmiş sınıflandırıcı
+        features (pandas.DataFrame): (1 × özellik) model sütunlarıyla
+
+    Returns:
+        dict: {'signal': 'BUY'|'SELL', 'probability': float, 'confidence': 'HIGH'|'LOW'}
+    """
+    prediction = model.predict(features)[0]
+    if hasattr(model, 'predict_proba'):
+        probability = float(model.predict_proba(features)[0, 1])
+    else:
+        probability = float(prediction)
+    return {
+        'signal': 'BUY' if prediction == 1 else 'SELL',
+        'probability': probability,
+        'confidence': 'HIGH' if abs(probability - 0.5) > 0.3 else 'LOW'
+    }
+
+
+def predict_signal(symbol, history=None, filename='trained_model'):
+    """
+    Kayıtlı modelle son bar için sinyal üretir (analiz modu, canlı döngü ve API).
+    Son bar özellikleri ham fiyat dizilerinden, DataFrame oluşturmadan üretilir.
+
+    Args:
+        symbol (str): Sembol adı
+        history (pandas.DataFrame): OHLCV verisi (None ise data_handler ile çekilir;
+            kesitsel model için CS_* sütunları bulunmalı)
+        filename (str): Model dosya adı
+
+    Returns:
+        dict: model_signal çıktısı + {'price': son kapanış, 'features': {sütun: son değer}}
+        None: Model/hat yoksa, veri yoksa veya hata durumunda
+    """
+    import data_handler
+
+    try:
+        loaded = InferencePipeline.from_saved_model(symbol, filename)
+        if loaded is None:
+            return None
+        pipeline, model = loaded
+        if history is None:
+            history = data_handler.fetch_historical_data(symbol)
+        if history is None or len(history) == 0:
+            return None
+
+        # Model özellik isimleriyle eğitildiği için matris aynı sütunlarla verilir
+        latest = np.nan_to_num(pipeline.transform_frame(history, rows=1))
+        result = model_signal(model, pd.DataFrame(latest, columns=pipeline.feature_names))
+        result['price'] = float(history['Close'].iloc[-1])
+        result['features'] = dict(zip(pipeline.feature_names, latest[0].tolist()))
+        return result
+    except ValueError as e:
+        logger.log_warning(f"{symbol} tahmin hattı çalıştırılamadı: {e}")
+        return None
+    except Exception as e:
+        logger.log_error(f"{symbol} tahmini yapılamadı: {e}")
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Inference Pipeline modülü test kodu
+    """
+    print("=== AI-FTB Inference Pipeline Test ===")
+
+    import time
+    import data_providers
+    import feature_engineer
+    import feature_scaler
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2015-01-01', '2024-01-01')
+    features = config.ML_FEATURES
+    enhanced = feature_engineer.add_technical_indicators(history, features=features)
+    scaler = feature_scaler.FeatureScaler('StandardScaler', features).fit(enhanced[features].dropna())
+    pipeline = InferencePipeline(features + [f + SCALED_SUFFIX for f in features], scaler)
+
+    arrays = frame_arrays(history)
+    started = time.perf_counter()
+    for _ in range(100):
+        latest = pipeline.latest(*arrays)
+    per_call = (time.perf_counter() - started) / 100
+
+    expected = np.concatenate([enhanced[features].to_numpy()[-1], scaler.transform(enhanced[features])[-1]])
+    print(f"✅ Son bar özellikleri: {per_call * 1000:.2f} ms/çağrı, matris {latest.shape} {latest.dtype}")
+    print(f"📊 pandas hattıyla en büyük göreli fark: {np.max(np.abs(latest[0] - expected) / np.abs(expected)):.2e}")
+
+    print("\nInference Pipeline test tamamlandı!")
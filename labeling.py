@@ -0,0 +1,194 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Labeling Module
+
+Bu modül, model hedeflerini (etiketleri) vektörel olarak üretir:
+- Çoklu ufuk yön etiketleri: tüm ufuklar için tek indeksleme geçişiyle
+  (Close[t + h] > Close[t])
+- Üçlü bariyer (triple-barrier) etiketleri: take-profit (+1), stop-loss (-1) veya
+  süre dolumu (0); High/Low dizilerinin kopyasız kayan pencere görünümleriyle
+
+Geleceği bilinmeyen satırların etiketi 0 yerine NaN olur. Dakikalık veride geçici
+bellek parça parça işlenerek sınırlı tutulur.
+"""
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+import config
+import logger
+
+
+# Üçlü bariyer penceresinin parça başına en fazla eleman sayısı
+_CHUNK_ELEMENTS = 1 << 24
+
+
+def _horizons(horizons):
+    """Ufukları pozitif tamsayı dizisine çevirir"""
+    horizons = np.asarray(list(horizons), dtype=np.int64)
+    if horizons.ndim != 1 or len(horizons) == 0 or (horizons < 1).any():
+        raise ValueError(f"Geçersiz ufuk listesi: {horizons}")
+    return horizons
+
+
+def forward_returns(close, horizons):
+    """
+    Tüm ufuklar için ileri getiriler (Close[t + h] / Close[t] - 1).
+
+    Args:
+        close (numpy.ndarray): 1 boyutlu kapanış fiyatları
+        horizons (list): Ufuklar (bar sayısı)
+
+    Returns:
+        numpy.ndarray: (zaman × ufuk) getiriler; geleceği bilinmeyen satırlar NaN
+    """
+    close = np.asarray(close, dtype=np.float64)
+    horizons = _horizons(horizons)
+    rows = np.arange(len(close))[:, None] + horizons[None, :]
+    future = close[np.minimum(rows, len(close) - 1)]
+    future[rows >= len(close)] = np.nan
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return future / close[:, None] - 1
+
+
+def horizon_labels(close, horizons):
+    """
+    Tüm ufuklar için yön etiketleri (1 = fiyat artacak, 0 = düşecek/sabit kalacak).
+
+    Args:
+        close (numpy.ndarray): 1 boyutlu kapanış fiyatları
+        horizons (list): Ufuklar (bar sayısı)
+
+    Returns:
+        numpy.ndarray: (zaman × ufuk) etiketler; geleceği bilinmeyen satırlar NaN
+    """
+    returns = forward_returns(close, horizons)
+    return np.where(np.isnan(returns), np.nan, (returns > 0).astype(np.float64))
+
+
+def _first_hit(hits, horizon):
+    """Her satırda ilk True'nun konumu (yoksa horizon)"""
+    return np.where(hits.any(axis=1), hits.argmax(axis=1), horizon)
+
+
+def triple_barrier_labels(close, high=None, low=None, horizon=10, take_profit=None, stop_loss=None):
+    """
+    Üçlü bariyer etiketleri. Giriş t kapanışıdır; sonraki horizon bar içinde High
+    take-profit seviyesine ulaşırsa +1, Low stop-loss seviyesine inerse -1 olur.
+    Aynı barda ikisi birden görülürse (bar içi sıra bilinmediğinden) stop-loss
+    varsayılır. Hiçbiri görülmezse süre dolumunda 0 olur.
+
+    Args:
+        close (numpy.ndarray): 1 boyutlu kapanış fiyatları
+        high (numpy.ndarray): 1 boyutlu en yüksek fiyatlar (None ise close)
+        low (numpy.ndarray): 1 boyutlu en düşük fiyatlar (None ise close)
+        horizon (int): Dikey bariyer (bar sayısı)
+        take_profit (float): Kâr al oranı (None ise config.TAKE_PROFIT_PERCENT)
+        stop_loss (float): Zarar kes oranı (None ise config.STOP_LOSS_PERCENT)
+
+    Returns:
+        tuple: (etiketler, çıkış barı uzaklığı) float dizileri; sonuç bilinmeyen
+               (pencere dolmamış ve bariyere değmemiş) satırlar NaN
+
+    Raises:
+        ValueError: Geçersiz ufukta
+    """
+    horizon = int(_horizons([horizon])[0])
+    take_profit = config.TAKE_PROFIT_PERCENT if take_profit is None else take_profit
+    stop_loss = config.STOP_LOSS_PERCENT if stop_loss is None else stop_loss
+
+    close = np.asarray(close, dtype=np.float64)
+    high = close if high is None else np.asarray(high, dtype=np.float64)
+    low = close if low is None else np.asarray(low, dtype=np.float64)
+    length = len(close)
+    upper, lower = close * (1 + take_profit), close * (1 - stop_loss)
+
+    # Satır t'nin penceresi t+1 .. t+horizon barlarıdır; sonu NaN ile doldurulur (NaN karşılaştırması False)
+    padding = np.full(horizon, np.nan)
+    future_high = sliding_window_view(np.concatenate([high[1:], padding]), horizon)
+    future_low = sliding_window_view(np.concatenate([low[1:], padding]), horizon)
+
+    labels = np.empty(length)
+    exits = np.empty(length)
+    step = max(1, _CHUNK_ELEMENTS // horizon)
+    for start in range(0, length, step):
+        stop = min(start + step, length)
+        first_up = _first_hit(future_high[start:stop] >= upper[start:stop, None], horizon)
+        first_down = _first_hit(future_low[start:stop] <= lower[start:stop, None], horizon)
+
+        labels[start:stop] = np.where(first_down <= first_up, -1.0, 1.0)
+        exits[start:stop] = np.minimum(first_up, first_down) + 1.0
+
+    vertical = exits > horizon
+    labels[vertical] = 0.0
+    exits[vertical] = horizon
+    unknown = (vertical & (np.arange(length) + horizon >= length)) | np.isnan(close)
+    labels[unknown] = np.nan
+    exits[unknown] = np.nan
+    return labels, exits
+
+
+def add_labels(dataframe, horizons=None, barrier_horizon=None, take_profit=None, stop_loss=None):
+    """
+    DataFrame'e çoklu ufuk ve üçlü bariyer etiketlerini ekler: 'Target_{h}' sütunları,
+    'Barrier_Label' (-1/0/1) ve 'Barrier_Exit' (girişten çıkışa bar sayısı).
+
+    Args:
+        dataframe (pandas.DataFrame): OHLCV verisi
+        horizons (list): Yön etiketi ufukları (None ise config.LABEL_HORIZONS)
+        barrier_horizon (int): Üçlü bariyer süresi (None ise config.TRIPLE_BARRIER_HORIZON)
+        take_profit (float): Kâr al oranı (None ise config.TAKE_PROFIT_PERCENT)
+        stop_loss (float): Zarar kes oranı (None ise config.STOP_LOSS_PERCENT)
+
+    Returns:
+        pandas.DataFrame: Etiketler eklenmiş DataFrame
+        None: Hata durumunda
+    """
+    try:
+        horizons = _horizons(config.LABEL_HORIZONS if horizons is None else horizons)
+        barrier_horizon = config.TRIPLE_BARRIER_HORIZON if barrier_horizon is None else barrier_horizon
+        data = dataframe.copy()
+        close = data['Close'].to_numpy(dtype=np.float64)
+
+        labels = horizon_labels(close, horizons)
+        for column, horizon in enumerate(horizons):
+            data[f'Target_{horizon}'] = labels[:, column]
+
+        high = data['High'].to_numpy(dtype=np.float64) if 'High' in data.columns else None
+        low = data['Low'].to_numpy(dtype=np.float64) if 'Low' in data.columns else None
+        data['Barrier_Label'], data['Barrier_Exit'] = triple_barrier_labels(
+            close, high, low, barrier_horizon, take_profit, stop_loss)
+
+        counts = data['Barrier_Label'].value_counts().to_dict()
+        logger.log_info(f"Etiketler oluşturuldu: ufuklar {horizons.tolist()}, üçlü bariyer dağılımı {counts}")
+        return data
+
+    except Exception as e:
+        logger.log_error(f"Etiketler oluşturulurken hata: {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Labeling modülü test kodu
+    """
+    print("=== AI-FTB Labeling Test ===")
+
+    import time
+    import pandas as pd
+
+    rng = np.random.default_rng(0)
+    minutes = 1_000_000
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.0005, minutes)))
+    high = close * (1 + rng.uniform(0, 0.0005, minutes))
+    low = close * (1 - rng.uniform(0, 0.0005, minutes))
+
+    started = time.perf_counter()
+    labels = horizon_labels(close, [1, 5, 15, 30, 60, 120])
+    print(f"✅ {minutes} dakika × 6 ufuk yön etiketi: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    started = time.perf_counter()
+    barrier, exits = triple_barrier_labels(close, high, low, horizon=60, take_profit=0.004, stop_loss=0.002)
+    print(f"✅ Üçlü bariyer (60 bar): {(time.perf_counter() - started) * 1000:.0f} ms, "
+          f"dağılım {pd.Series(barrier).value_counts().to_dict()}")
+
+    print("\nLabeling test tamamlandı!")
@@ -16,22 +16,131 @@ import traceback
 import config
 import logger
 import data_handler
+import memory_utils
 import feature_engineer
 import news_sentiment_analyzer
 import ml_model
 import strategy_executor
 import backtester
+import trading_calendar
+import snapshots
+import feature_cache
+import inference_pipeline
+import feature_analysis
+import cross_sectional
+import walk_forward
+import feature_scaler
 
 
-def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
+def _add_multi_timeframe(enhanced_data, symbol):
+    """
+    config.MULTI_TIMEFRAME_FEATURES açıksa üst zaman dilimi göstergelerini ekler;
+    hesaplanamazsa veriyi değiştirmeden döndürür.
+    """
+    if not config.MULTI_TIMEFRAME_FEATURES:
+        return enhanced_data
+    multi_timeframe = feature_engineer.add_multi_timeframe_features(enhanced_data)
+    if multi_timeframe is None:
+        logger.log_warning(f"{symbol} için çoklu zaman dilimi özellikleri eklenemedi")
+        return enhanced_data
+    return multi_timeframe
+
+
+def _indicator_frames(raw_frames, memo):
+    """
+    Tüm semboller için panel göstergelerini (özellik önbelleği üzerinden) ve sembol
+    evrenine göre kesitsel özellikleri ilk çağrıda bir kez hesaplar; sonuç memo
+    sözlüğünde tutulur. Özellik aşaması tüm semboller için snapshot önbelleğinden
+    gelirse hiç çağrılmaz.
+    
+    Args:
+        raw_frames (dict): {sembol: ham OHLCV DataFrame}
+        memo (dict): Çalıştırma boyunca paylaşılan sonuç sözlüğü
+    
+    Returns:
+        dict: {sembol: göstergeli DataFrame} (panel kapalıysa boş)
+    """
+    if 'frames' in memo:
+        return memo['frames']
+        
+    frames = {}
+    if config.PANEL_INDICATORS_ENABLED and raw_frames:
+        usable = {s: f for s, f in raw_frames.items() if f is not None and len(f) >= 100}
+        frames = feature_cache.get_features_many(usable, config.ML_FEATURES) or {}
+        
+        # Sembol evrenine göre kesitsel özellikler (tarih başına tek sıralama)
+        if config.CROSS_SECTIONAL_FEATURES_ENABLED and len(frames) >= config.CROSS_SECTIONAL_MIN_SYMBOLS:
+            frames = cross_sectional.add_cross_sectional_features(frames) or frames
+    memo['frames'] = frames
+    return frames
+
+
+def _build_features(raw_data, symbol, memory_report, enhanced_data=None):
+    """
+    Ham veriden teknik göstergeleri, hedef değişkeni ve ölçeklendirilmiş özellikleri üretir.
+    
+    Args:
+        raw_data (pandas.DataFrame): Ham OHLCV verisi
+        symbol (str): Sembol adı
+        memory_report (list): Bellek raporu kayıtları
+        enhanced_data (pandas.DataFrame): Panel hesabından gelen göstergeli veri (None ise burada hesaplanır)
+    
+    Returns:
+        tuple: (ölçeklendirilmiş özellikleri içeren veri, fit edilmiş feature_scaler.FeatureScaler);
+               ölçekleyici çıktıyla birlikte önbelleğe alınır ve model ile birlikte kaydedilir
+        None: Hata durumunda
+    """
+    # 2. Teknik Göstergeler
+    logger.log_info(f"2. {symbol} için teknik göstergeler hesaplanıyor...")
+    if enhanced_data is None:
+        enhanced_data = feature_cache.get_features(symbol, raw_data, config.ML_FEATURES)
+    
+    if enhanced_data is None:
+        logger.log_error(f"{symbol} için teknik göstergeler hesaplanamadı")
+        return None
+        
+    enhanced_data = _add_multi_timeframe(enhanced_data, symbol)
+    logger.log_info(f"✅ Teknik göstergeler eklendi: {len(enhanced_data.columns)} sütun")
+    if config.MEMORY_REPORT_ENABLED:
+        memory_utils.record_memory_stage(memory_report, 'indicators', enhanced_data, symbol)
+    
+    # 3. Hedef Değişken
+    logger.log_info(f"3. {symbol} için hedef değişken oluşturuluyor...")
+    enhanced_data = feature_engineer.create_target_variable(enhanced_data)
+    
+    if 'Target' not in enhanced_data.columns:
+        logger.log_error(f"{symbol} için hedef değişken oluşturulamadı")
+        return None
+        
+    # 4. Özellik Ölçeklendirme
+    logger.log_info(f"4. {symbol} için özellik ölçeklendirme...")
+    normalized_data, scaler = feature_engineer.normalize_features(
+        enhanced_data, 
+        save_scaler=False, 
+        symbol=symbol
+    )
+    
+    if normalized_data is None:
+        logger.log_error(f"{symbol} için özellik ölçeklendirme başarısız")
+        return None
+        
+    logger.log_info(f"✅ Özellik ölçeklendirme tamamlandı")
+    return normalized_data, scaler
+
+
+def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None, snapshot_id=None):
     """
     Botun eğitim ve backtest sürecini yönetir. Sırasıyla veri çekme, özellik 
     mühendisliği, model eğitimi, backtest yapma adımlarını çalıştırır.
     
+    Çekilen veri içerik özetli bir snapshot'a dondurulur; özellik, model ve backtest
+    çıktıları bu snapshot'a bağlı önbellekten yeniden kullanılır.
+    
     Args:
         symbols (list): İşlem yapılacak semboller
         start_date (str): Veri başlangıç tarihi
         end_date (str): Veri bitiş tarihi
+        snapshot_id (str): Verilirse veri çekilmez, bu snapshot'ın verisi kullanılır
     
     Returns:
         dict: Süreç sonuçları
@@ -55,6 +164,45 @@ def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
         logger.log_info(f"Tarih aralığı: {start_date} - {end_date}")
         
         results = {}
+        memory_report = []
+        
+        # 1. Veri Çekme - tüm semboller sınırlı bir iş parçacığı havuzuyla eşzamanlı çekilir
+        if snapshot_id is not None:
+            logger.log_info(f"1. Veri snapshot {snapshot_id} üzerinden yükleniyor...")
+            raw_frames = snapshots.load_snapshot(snapshot_id, symbols)
+            if raw_frames is None:
+                return None
+            fetch_failures = {}
+        else:
+            logger.log_info("1. Tüm semboller için tarihsel veri çekiliyor...")
+            # Temizlenmemiş barlar çekme sırasında toplu kalite taramasından geçer (QUALITY_SCAN_ENABLED)
+            raw_frames, fetch_failures = data_handler.fetch_historical_data_many(symbols, start_date, end_date)
+            
+            # Girdileri değiştirilemez snapshot'a dondur (tekrar üretilebilirlik ve çıktı önbelleği için)
+            if config.SNAPSHOTS_ENABLED and raw_frames:
+                manifest = snapshots.create_snapshot(raw_frames, start_date, end_date)
+                snapshot_id = manifest['snapshot_id'] if manifest else None
+        logger.log_info(f"Veri snapshot: {snapshot_id or 'yok'}")
+        
+        # Çıktı önbelleği anahtarlarına giren parametreler
+        feature_params = {
+            'indicators': config.TECHNICAL_INDICATORS,
+            'ml_features': config.ML_FEATURES,
+            'scaling': config.FEATURE_SCALING_METHOD,
+            'scaler_fit': 'train_window',
+            'lookahead': config.TARGET_LOOKAHEAD_DAYS,
+            'compact': config.COMPACT_DTYPES,
+            'panel': config.PANEL_INDICATORS_ENABLED,
+            'multi_timeframe': config.MULTI_TIMEFRAME_FEATURES,
+            'cross_sectional': config.CROSS_SECTIONAL_FEATURES_ENABLED and sorted(symbols),
+            'output': 'data+scaler'
+        }
+        model_params = {'features': feature_params, 'type': config.ML_MODEL_TYPE, 'params': config.ML_MODEL_PARAMS}
+        backtest_params = {'model': model_params, 'capital': config.BACKTEST_INITIAL_CAPITAL,
+                           'commission': config.BACKTEST_COMMISSION, 'risk': config.RISK_MANAGEMENT}
+        
+        # Panel göstergeleri ve kesitsel özellikler ilk özellik önbelleği ıskalamasında bir kez hesaplanır
+        panel_memo = {}
         
         # Her sembol için işlem yap
         for symbol in symbols:
@@ -63,50 +211,34 @@ def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
             logger.log_info(f"{'='*50}")
             
             try:
-                # 1. Veri Çekme
-                logger.log_info(f"1. {symbol} için tarihsel veri çekiliyor...")
-                raw_data = data_handler.fetch_historical_data(symbol, start_date, end_date)
+                raw_data = raw_frames.get(symbol)
                 
                 if raw_data is None or len(raw_data) < 100:
-                    logger.log_warning(f"{symbol} için yetersiz veri, atlanıyor")
+                    reason = fetch_failures.get(symbol, 'yetersiz veri')
+                    logger.log_warning(f"{symbol} için veri kullanılamıyor ({reason}), atlanıyor")
                     continue
                     
                 logger.log_info(f"✅ Veri çekildi: {len(raw_data)} satır")
+                if config.MEMORY_REPORT_ENABLED:
+                    memory_utils.record_memory_stage(memory_report, 'fetch', raw_data, symbol)
                 
                 # Veriyi kaydet
                 data_handler.save_data(raw_data, 'raw_data', symbol)
                 
-                # 2. Teknik Göstergeler
-                logger.log_info(f"2. {symbol} için teknik göstergeler hesaplanıyor...")
-                enhanced_data = feature_engineer.add_technical_indicators(raw_data)
-                
-                if enhanced_data is None:
-                    logger.log_error(f"{symbol} için teknik göstergeler hesaplanamadı")
-                    continue
-                    
-                logger.log_info(f"✅ Teknik göstergeler eklendi: {len(enhanced_data.columns)} sütun")
-                
-                # 3. Hedef Değişken
-                logger.log_info(f"3. {symbol} için hedef değişken oluşturuluyor...")
-                enhanced_data = feature_engineer.create_target_variable(enhanced_data)
-                
-                if 'Target' not in enhanced_data.columns:
-                    logger.log_error(f"{symbol} için hedef değişken oluşturulamadı")
-                    continue
-                    
-                # 4. Özellik Ölçeklendirme
-                logger.log_info(f"4. {symbol} için özellik ölçeklendirme...")
-                normalized_data, scaler = feature_engineer.normalize_features(
-                    enhanced_data, 
-                    save_scaler=True, 
-                    symbol=symbol
+                # 2-4. Teknik göstergeler, hedef değişken ve ölçeklendirme
+                features_output, _ = snapshots.cached_output(
+                    snapshot_id, 'features',
+                    lambda: _build_features(raw_data, symbol, memory_report,
+                                            _indicator_frames(raw_frames, panel_memo).get(symbol)),
+                    symbol, feature_params
                 )
                 
-                if normalized_data is None:
-                    logger.log_error(f"{symbol} için özellik ölçeklendirme başarısız")
+                if features_output is None:
                     continue
+                normalized_data, scaler = features_output
                     
-                logger.log_info(f"✅ Özellik ölçeklendirme tamamlandı")
+                if config.MEMORY_REPORT_ENABLED:
+                    memory_utils.record_memory_stage(memory_report, 'normalize', normalized_data, symbol)
                 
                 # Ölçeklendirilmiş veriyi kaydet
                 data_handler.save_data(normalized_data, 'processed_data', symbol)
@@ -122,9 +254,18 @@ def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
                 X_train, X_test, y_train, y_test, feature_names = ml_data
                 logger.log_info(f"✅ ML verisi hazırlandı: Eğitim={len(X_train)}, Test={len(X_test)}")
                 
+                # Özellik önemi ve fazlalık analizi (yalnızca eğitim satırlarıyla)
+                feature_report = None
+                if config.FEATURE_ANALYSIS_ENABLED:
+                    feature_report = feature_analysis.analyze_features(X_train.assign(Target=y_train))
+                if config.MEMORY_REPORT_ENABLED:
+                    memory_utils.record_memory_stage(memory_report, 'ml_train', X_train, symbol)
+                
                 # 6. Model Eğitimi
                 logger.log_info(f"6. {symbol} için model eğitiliyor...")
-                model = ml_model.train_model(X_train, y_train)
+                model, _ = snapshots.cached_output(
+                    snapshot_id, 'model', lambda: ml_model.train_model(X_train, y_train), symbol, model_params
+                )
                 
                 if model is None:
                     logger.log_error(f"{symbol} için model eğitimi başarısız")
@@ -148,18 +289,34 @@ def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
                     'feature_names': feature_names,
                     'performance': performance,
                     'training_data_size': len(X_train),
+                    'redundant_features': feature_report['redundant'] if feature_report else [],
+                    'snapshot_id': snapshot_id,
                     'training_date': datetime.now().isoformat()
                 }
                 
                 ml_model.save_model(model, 'trained_model', symbol, model_metadata)
+                
+                # Ölçekleyici önbellekten gelse de model ile birlikte yazılır (çıkarım aynı istatistikleri kullanır)
+                scaler.save(feature_scaler.scaler_path(symbol, scaler.method))
                 logger.log_info(f"✅ Model kaydedildi")
                 
-                # 9. Backtest
+                # 9. Backtest - özellikler canlı döngü ve API ile aynı tahmin hattından, model sütun sırasında
                 logger.log_info(f"8. {symbol} için backtest çalıştırılıyor...")
-                backtest_result = backtester.run_backtest(
-                    normalized_data,
-                    model,
-                    initial_capital=config.BACKTEST_INITIAL_CAPITAL
+                try:
+                    pipeline = inference_pipeline.InferencePipeline(feature_names, scaler)
+                except ValueError as e:
+                    logger.log_warning(f"{symbol}: Backtest işlenmiş veri sütunlarıyla yapılacak ({e})")
+                    pipeline = None
+                backtest_result, _ = snapshots.cached_output(
+                    snapshot_id, 'backtest',
+                    lambda: backtester.run_backtest(
+                        normalized_data,
+                        model,
+                        initial_capital=config.BACKTEST_INITIAL_CAPITAL,
+                        snapshot_id=snapshot_id,
+                        pipeline=pipeline
+                    ),
+                    symbol, backtest_params
                 )
                 
                 if backtest_result is None:
@@ -184,6 +341,7 @@ def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
                 # Sonuçları kaydet
                 results[symbol] = {
                     'data_rows': len(raw_data),
+                    'snapshot_id': snapshot_id,
                     'model_accuracy': performance.get('accuracy', 0),
                     'backtest_return': backtest_result['total_return'],
                     'total_trades': backtest_result['total_trades'],
@@ -224,6 +382,9 @@ def run_bot_training_and_backtest(symbols=None, start_date=None, end_date=None):
             logger.log_info(f"Ortalama getiri: {avg_return:+.1f}%")
             logger.log_info(f"Ortalama model doğruluğu: {avg_accuracy:.3f}")
             
+        if config.MEMORY_REPORT_ENABLED:
+            memory_utils.summarize_memory_report(memory_report)
+            
         logger.log_info("=== Bot Eğitim ve Backtest Süreci Tamamlandı ===")
         
         return results
@@ -244,6 +405,20 @@ def run_live_trading():
     try:
         logger.log_info("=== AI-FTB Canlı Ticaret Modu ===")
         logger.log_warning("Canlı ticaret modu henüz geliştirilmemiştir")
+        
+        # Piyasa saatleri işlem takviminden okunur (tatiller ve yarım günler dahil)
+        for exchange in config.MARKET_SESSIONS:
+            calendar = trading_calendar.get_calendar(exchange)
+            state = 'açık' if calendar.is_open() else 'kapalı'
+            logger.log_info(f"{exchange} piyasası {state} - sonraki açılış: {calendar.next_open()}, "
+                            f"sonraki kapanış: {calendar.next_close()}")
+        
+        # Kaydedilmiş modellerle son bar sinyalleri (tahmin hattı; henüz emir gönderilmez)
+        for symbol in config.SYMBOLS:
+            prediction = inference_pipeline.predict_signal(symbol)
+            if prediction is not None:
+                logger.log_info(f"{symbol} anlık sinyal: {prediction['signal']} "
+                                f"(P={prediction['probability']:.3f}, fiyat={prediction['price']:.2f})")
         logger.log_info("Bu modda şunlar yapılacak:")
         logger.log_info("1. Gerçek zamanlı veri çekme")
         logger.log_info("2. Kaydedilmiş modelleri yükleme")
@@ -281,18 +456,21 @@ def run_analysis_mode(symbol, analysis_type='full'):
         logger.log_info(f"=== {symbol} Analiz Modu ({analysis_type}) ===")
         
         results = {}
+        history = None  # Teknik analiz ve tahmin aynı fiyat verisini kullanır
         
         if analysis_type in ['full', 'technical']:
             # Teknik analiz
             logger.log_info("Teknik analiz yapılıyor...")
-            data = data_handler.fetch_historical_data(symbol)
-            if data is not None:
-                enhanced_data = feature_engineer.add_technical_indicators(data)
+            history = data_handler.fetch_historical_data(symbol)
+            if history is not None:
+                sma_short = f"SMA_{config.TECHNICAL_INDICATORS['SMA_SHORT_PERIOD']}"
+                sma_long = f"SMA_{config.TECHNICAL_INDICATORS['SMA_LONG_PERIOD']}"
+                enhanced_data = feature_cache.get_features(symbol, history, ['RSI', 'MACD_Hist', sma_short, sma_long])
                 if enhanced_data is not None:
                     results['technical_analysis'] = {
                         'current_rsi': enhanced_data['RSI'].iloc[-1],
                         'current_macd': enhanced_data['MACD_Hist'].iloc[-1],
-                        'trend_sma': 'UP' if enhanced_data['SMA_20'].iloc[-1] > enhanced_data['SMA_50'].iloc[-1] else 'DOWN'
+                        'trend_sma': 'UP' if enhanced_data[sma_short].iloc[-1] > enhanced_data[sma_long].iloc[-1] else 'DOWN'
                     }
                     logger.log_info(f"Teknik analiz tamamlandı: RSI={results['technical_analysis']['current_rsi']:.1f}")
                     
@@ -309,27 +487,19 @@ def run_analysis_mode(symbol, analysis_type='full'):
             # Model tahmini
             logger.log_info("Model tahmini yapılıyor...")
             try:
-                model_result = ml_model.load_model('trained_model', symbol)
-                if model_result:
-                    model, metadata = model_result
-                    # Son veri ile tahmin yap
-                    data = data_handler.load_data('processed_data', symbol)
-                    if data is not None and len(data) > 0:
+                prediction = inference_pipeline.predict_signal(symbol, history)
+                if prediction is None:
+                    model_result = ml_model.load_model('trained_model', symbol)
+                    if model_result:
+                        model, metadata = model_result
+                        # Son veri ile tahmin yap (sadece model özellikleri okunur)
                         feature_names = metadata.get('feature_names', config.ML_FEATURES)
-                        last_features = data[feature_names].iloc[-1:].fillna(0)
-                        prediction = model.predict(last_features)[0]
-                        
-                        if hasattr(model, 'predict_proba'):
-                            probability = model.predict_proba(last_features)[0, 1]
-                        else:
-                            probability = float(prediction)
-                            
-                        results['prediction'] = {
-                            'signal': 'BUY' if prediction == 1 else 'SELL',
-                            'probability': probability,
-                            'confidence': 'HIGH' if abs(probability - 0.5) > 0.3 else 'LOW'
-                        }
-                        logger.log_info(f"Model tahmini: {results['prediction']['signal']} (P={probability:.3f})")
+                        data = data_handler.load_data('processed_data', symbol, columns=feature_names)
+                        if data is not None and len(data) > 0:
+                            prediction = inference_pipeline.model_signal(model, data[feature_names].iloc[-1:].fillna(0))
+                if prediction is not None:
+                    results['prediction'] = {key: prediction[key] for key in ('signal', 'probability', 'confidence')}
+                    logger.log_info(f"Model tahmini: {prediction['signal']} (P={prediction['probability']:.3f})")
             except Exception as e:
                 logger.log_warning(f"Model tahmini yapılamadı: {e}")
                 
@@ -340,6 +510,40 @@ def run_analysis_mode(symbol, analysis_type='full'):
         return {}
 
 
+def run_walk_forward_mode(symbol):
+    """
+    Sembol için walk-forward (ileriye yürüyen pencereli) eğitim ve örneklem dışı
+    değerlendirme yapar. Pencere modelleri ve metrikleri MODEL_SAVE_PATH/walk_forward/
+    altına kaydedilir.
+    
+    Args:
+        symbol (str): Sembol adı
+    
+    Returns:
+        dict: walk_forward.run_walk_forward sonucu
+        None: Hata durumunda
+    """
+    try:
+        logger.log_info(f"=== {symbol} Walk-Forward Modu ===")
+        data = data_handler.fetch_historical_data(symbol)
+        if data is None or len(data) == 0:
+            logger.log_error(f"{symbol} için veri çekilemedi")
+            return None
+            
+        enhanced_data = feature_cache.get_features(symbol, data, config.ML_FEATURES)
+        if enhanced_data is None:
+            return None
+        enhanced_data = _add_multi_timeframe(enhanced_data, symbol)
+        enhanced_data = feature_engineer.create_target_variable(enhanced_data)
+        
+        # Ham özellikler kullanılır: tüm veriyle fit edilmiş ölçekleyici erken pencerelere sızardı
+        return walk_forward.run_walk_forward(enhanced_data, symbol=symbol)
+        
+    except Exception as e:
+        logger.log_error(f"Walk-forward modu hatası: {e}", exc_info=True)
+        return None
+
+
 def main():
     """
     Ana program giriş noktası. Komut satırı argümanlarını işler ve 
@@ -380,6 +584,15 @@ def main():
             for key, value in results.items():
                 print(f"{key}: {value}")
                 
+        elif mode == 'walkforward':
+            # Walk-forward eğitim ve örneklem dışı değerlendirme
+            symbol = sys.argv[2] if len(sys.argv) > 2 else 'AAPL'
+            results = run_walk_forward_mode(symbol)
+            if results:
+                print(f"\n{symbol} walk-forward özeti:")
+                for key, value in results['summary'].items():
+                    print(f"{key}: {value}")
+                
         elif mode == 'test':
             # Test modu - tüm modülleri test et
             logger.log_info("Test modu çalıştırılıyor...")
@@ -387,10 +600,11 @@ def main():
             
         else:
             print("Kullanım:")
-            print("python main.py [training|live|analysis|test]")
+            print("python main.py [training|live|analysis|walkforward|test]")
             print("  training  - Model eğitimi ve backtest (varsayılan)")
             print("  live      - Canlı ticaret modu")
             print("  analysis  - Tekil sembol analizi")
+            print("  walkforward - Walk-forward eğitim ve örneklem dışı değerlendirme")
             print("  test      - Tüm modülleri test et")
             
     except KeyboardInterrupt:
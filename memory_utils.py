@@ -0,0 +1,202 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Memory Utils Module
+
+Bu modül, fiyat ve özellik DataFrame'lerinin bellek ayak izini küçültmek için
+kompakt veri tipi dönüşümleri ve aşama bazlı bellek raporu sağlar.
+
+Kompakt mod (config.COMPACT_DTYPES) açıkken:
+- Fiyat ve özellik kolonları float64 yerine float32 tutulur
+- Hacim kolonları aralığa sığıyorsa uint32/int32 tutulur
+- Sembol gibi tekrarlı metin kolonları kategorik tutulur
+
+Doğruluk gerektiren çıktılar (P&L, nakit, portföy değeri) bu modülden geçirilmez
+ve backtester tarafından float64 olarak hesaplanır.
+"""
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+
+
+# Hacim olarak ele alınan kolonlar (tam sayı tipine indirgenir)
+VOLUME_COLUMNS = ('Volume',)
+
+# Tekrar oranı bu eşiğin altındaki metin kolonları kategorik yapılır
+_CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+
+def compact_dtypes(dataframe, float_dtype=np.float32):
+    """
+    DataFrame kolonlarını daha küçük veri tiplerine dönüştürür.
+
+    - float64 kolonlar -> float32
+    - Tam sayı ve hacim kolonları -> uint32 (negatif değer yoksa) veya int32,
+      değerler aralığa sığmıyorsa veya eksik değer içeriyorsa olduğu gibi bırakılır
+    - Tekrarlı metin kolonları (ör. Symbol) -> category
+
+    Args:
+        dataframe (pandas.DataFrame): Dönüştürülecek veri
+        float_dtype (numpy.dtype): Ondalıklı kolonlar için hedef tip
+
+    Returns:
+        pandas.DataFrame: Kompakt veri tipli DataFrame (girdi değiştirilmez)
+    """
+    conversions = {}
+
+    for column in dataframe.columns:
+        series = dataframe[column]
+        dtype = series.dtype
+
+        if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+            continue
+
+        if pd.api.types.is_integer_dtype(dtype) or (column in VOLUME_COLUMNS and pd.api.types.is_float_dtype(dtype)):
+            integer_dtype = _smallest_integer_dtype(series.to_numpy())
+            if integer_dtype is not None:
+                conversions[column] = integer_dtype
+            elif pd.api.types.is_float_dtype(dtype) and dtype != float_dtype:
+                conversions[column] = float_dtype
+        elif pd.api.types.is_float_dtype(dtype):
+            if dtype != float_dtype:
+                conversions[column] = float_dtype
+        elif pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+            if len(series) and series.nunique(dropna=True) <= max(1, len(series) * _CATEGORY_MAX_UNIQUE_RATIO):
+                conversions[column] = 'category'
+
+    if not conversions:
+        return dataframe
+    return dataframe.astype(conversions)
+
+
+def _smallest_integer_dtype(values):
+    """Değerleri kayıpsız taşıyan 32 bit tam sayı tipini döndürür (yoksa None)"""
+    if len(values) == 0:
+        return None
+    if values.dtype.kind == 'f':
+        if not np.isfinite(values).all() or not np.array_equal(values, np.floor(values)):
+            return None
+    low, high = values.min(), values.max()
+    if low >= 0 and high <= np.iinfo(np.uint32).max:
+        return np.uint32
+    if low >= np.iinfo(np.int32).min and high <= np.iinfo(np.int32).max:
+        return np.int32
+    return None
+
+
+def maybe_compact(dataframe):
+    """
+    config.COMPACT_DTYPES açıksa DataFrame'i kompakt tiplere dönüştürür.
+
+    Args:
+        dataframe (pandas.DataFrame): Veri (None olabilir)
+
+    Returns:
+        pandas.DataFrame: Kompakt mod açıksa dönüştürülmüş, değilse aynı DataFrame
+    """
+    if dataframe is None or not config.COMPACT_DTYPES:
+        return dataframe
+    return compact_dtypes(dataframe)
+
+
+def frame_memory_usage(dataframe):
+    """
+    DataFrame'in bellek kullanımını (indeks dahil, derin) bayt olarak döndürür.
+
+    Args:
+        dataframe (pandas.DataFrame): Veri
+
+    Returns:
+        int: Bayt cinsinden bellek kullanımı
+    """
+    if dataframe is None:
+        return 0
+    return int(dataframe.memory_usage(index=True, deep=True).sum())
+
+
+def record_memory_stage(report, stage, dataframe, symbol=None):
+    """
+    Bir işlem aşamasının bellek kullanımını rapora ekler.
+
+    Args:
+        report (list): Aşama kayıtlarının biriktirildiği liste
+        stage (str): Aşama adı (ör. 'fetch', 'indicators')
+        dataframe (pandas.DataFrame): Aşamanın çıktısı
+        symbol (str): Sembol adı
+
+    Returns:
+        dict: Eklenen kayıt
+    """
+    memory_bytes = frame_memory_usage(dataframe)
+    rows = 0 if dataframe is None else len(dataframe)
+    dtypes = {} if dataframe is None else dataframe.dtypes.astype(str).value_counts().to_dict()
+
+    entry = {
+        'symbol': symbol,
+        'stage': stage,
+        'rows': rows,
+        'columns': 0 if dataframe is None else len(dataframe.columns),
+        'memory_mb': memory_bytes / 1024 ** 2,
+        'bytes_per_row': memory_bytes / rows if rows else 0.0,
+        'dtypes': ', '.join(f"{name}:{count}" for name, count in sorted(dtypes.items()))
+    }
+    report.append(entry)
+    logger.log_debug(f"Bellek [{symbol or '-'}] {stage}: {entry['memory_mb']:.2f} MB "
+                     f"({entry['rows']} satır, {entry['columns']} sütun)")
+    return entry
+
+
+def summarize_memory_report(report):
+    """
+    Aşama kayıtlarını tablo haline getirir ve aşama bazında toplamları loglar.
+
+    Args:
+        report (list): record_memory_stage ile biriktirilen kayıtlar
+
+    Returns:
+        pandas.DataFrame: Aşama başına toplam bellek tablosu
+    """
+    columns = ['stage', 'symbols', 'rows', 'memory_mb', 'bytes_per_row']
+    if not report:
+        return pd.DataFrame(columns=columns)
+
+    records = pd.DataFrame(report)
+    stage_order = list(dict.fromkeys(records['stage']))
+    summary = records.groupby('stage', sort=False).agg(
+        symbols=('symbol', 'nunique'),
+        rows=('rows', 'sum'),
+        memory_mb=('memory_mb', 'sum')
+    ).reindex(stage_order)
+    summary['bytes_per_row'] = np.where(summary['rows'] > 0,
+                                        summary['memory_mb'] * 1024 ** 2 / summary['rows'].clip(lower=1), 0.0)
+    summary = summary.reset_index()[columns]
+
+    mode = 'kompakt' if config.COMPACT_DTYPES else 'standart'
+    for row in summary.itertuples(index=False):
+        logger.log_info(f"Bellek raporu ({mode}) - {row.stage}: {row.memory_mb:.2f} MB, "
+                        f"{row.symbols} sembol, {row.bytes_per_row:.0f} bayt/satır")
+    return summary
+
+
+if __name__ == "__main__":
+    """
+    Memory Utils modülü test kodu
+    """
+    print("=== AI-FTB Memory Utils Test ===")
+
+    dates = pd.date_range('2023-01-02 09:30', periods=390 * 20, freq='min')
+    rng = np.random.default_rng(0)
+    close = 100 + rng.normal(0, 0.05, len(dates)).cumsum()
+    sample = pd.DataFrame({
+        'Open': close, 'High': close + 0.1, 'Low': close - 0.1, 'Close': close,
+        'Volume': rng.integers(100, 10000, len(dates)),
+        'Symbol': 'AAPL'
+    }, index=dates)
+
+    memory_report = []
+    record_memory_stage(memory_report, 'standart', sample, 'AAPL')
+    record_memory_stage(memory_report, 'kompakt', compact_dtypes(sample), 'AAPL')
+    print(pd.DataFrame(memory_report)[['stage', 'memory_mb', 'bytes_per_row', 'dtypes']])
+
+    print("\nMemory Utils test tamamlandı!")
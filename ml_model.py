@@ -18,18 +18,22 @@ import os
 from datetime import datetime
 import config
 import logger
+import purged_cv
+import feature_engineer
 
 
-def prepare_data_for_ml(dataframe, target_column_name='Target', test_size=0.2):
+def prepare_data_for_ml(dataframe, target_column_name='Target', test_size=0.2, features=None):
     """
     DataFrame'i makine öğrenimi için X (özellikler) ve y (hedef) olarak ayırır.
     Hedef olarak bir sonraki günün kapanış fiyatının artıp artmayacağını 
     (1 artış, 0 düşüş/sabit) binary sınıflandırma problemi olarak tanımlar.
+    Son test_size oranındaki satırlar test verisidir.
     
     Args:
         dataframe (pandas.DataFrame): Özellikler ve hedef içeren veri
         target_column_name (str): Hedef değişken sütun adı
         test_size (float): Test verisi oranı (0.0-1.0 arası)
+        features (list): Model özellikleri (None ise feature_engineer.model_features())
     
     Returns:
         tuple: (X_train, X_test, y_train, y_test, feature_names)
@@ -46,15 +50,15 @@ def prepare_data_for_ml(dataframe, target_column_name='Target', test_size=0.2):
             logger.log_error(f"Hedef sütun bulunamadı: {target_column_name}")
             return None
             
-        # ML özelliklerini config'ten al ve mevcut olanları filtrele
-        ml_features = config.ML_FEATURES.copy()
+        # Model özelliklerini (ML_FEATURES + çoklu zaman dilimi) al ve mevcut olanları filtrele
+        ml_features = feature_engineer.model_features() if features is None else list(features)
         
         # Ölçeklendirilmiş özellikleri de dahil et
         scaled_features = [f"{feature}_scaled" for feature in ml_features]
         all_possible_features = ml_features + scaled_features
         
         # Mevcut özellikleri bul
-        available_features = [f for f in all_possible_features if f in dataframe.columns]
+        available_features = feature_engineer.usable_features(dataframe, all_possible_features)
         
         if not available_features:
             logger.log_error("Kullanılabilir ML özelliği bulunamadı")
@@ -71,7 +75,7 @@ def prepare_data_for_ml(dataframe, target_column_name='Target', test_size=0.2):
             
         # X (özellikler) ve y (hedef) olarak ayır
         X = clean_data[available_features]
-        y = clean_data[target_column_name]
+        y = clean_data[target_column_name].astype(int)  # NaN hedefler dropna ile atıldı
         
         # Hedef değişkenin dağılımını kontrol et
         target_distribution = y.value_counts()
@@ -82,12 +86,12 @@ def prepare_data_for_ml(dataframe, target_column_name='Target', test_size=0.2):
         if min_class_ratio < 0.1:
             logger.log_warning(f"Dengesiz veri seti: En az sınıf oranı {min_class_ratio:.2%}")
             
-        # Eğitim-test ayrımı
+        # Eğitim-test ayrımı - kronolojik (test dönemi eğitimden sonra gelir, ölçekleyici
+        # de yalnızca bu eğitim satırlarıyla fit edilir)
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, 
             test_size=test_size, 
-            random_state=42, 
-            stratify=y  # Sınıf dağılımını korur
+            shuffle=False
         )
         
         logger.log_info(f"Veri bölümü: Eğitim={len(X_train)}, Test={len(X_test)}")
@@ -100,10 +104,34 @@ def prepare_data_for_ml(dataframe, target_column_name='Target', test_size=0.2):
         return None
 
 
+def create_model(model_type=None, params=None):
+    """
+    Model tipine göre eğitilmemiş sklearn tahmincisini oluşturur.
+    
+    Args:
+        model_type (str): Model tipi ('RandomForestClassifier', 'LogisticRegression')
+        params (dict): Model parametreleri
+    
+    Returns:
+        sklearn estimator: Eğitilmemiş model
+        None: Desteklenmeyen model tipinde
+    """
+    model_type = config.ML_MODEL_TYPE if model_type is None else model_type
+    params = config.ML_MODEL_PARAMS.copy() if params is None else params
+    
+    if model_type == 'RandomForestClassifier':
+        return RandomForestClassifier(**params)
+    if model_type == 'LogisticRegression':
+        return LogisticRegression(**params)
+    logger.log_error(f"Desteklenmeyen model tipi: {model_type}")
+    return None
+
+
 def train_model(X_train, y_train, model_type=None, params=None, use_grid_search=False):
     """
     Belirtilen model tipi ve parametrelerle makine öğrenimi modelini eğitir.
-    GridSearchCV ile hiperparametre optimizasyonu yapabilir.
+    GridSearchCV ile hiperparametre optimizasyonu yapabilir. Çapraz doğrulama,
+    örtüşen etiketler için purge edilmiş zaman serisi katlarıyla yapılır (purged_cv).
     
     Args:
         X_train (pandas.DataFrame): Eğitim özellikleri
@@ -130,13 +158,13 @@ def train_model(X_train, y_train, model_type=None, params=None, use_grid_search=
         logger.log_info(f"Model parametreleri: {params}")
         
         # Model seçimi
-        if model_type == 'RandomForestClassifier':
-            model = RandomForestClassifier(**params)
-        elif model_type == 'LogisticRegression':
-            model = LogisticRegression(**params)
-        else:
-            logger.log_error(f"Desteklenmeyen model tipi: {model_type}")
+        model = create_model(model_type, params)
+        if model is None:
             return None
+        
+        # Etiketler TARGET_LOOKAHEAD_DAYS ileriye baktığı için komşu örnekler örtüşür; katlar
+        # purge edilir ve aynı veri kümesinde grid search ile cross_val_score aynı katları kullanır
+        cv_splitter = purged_cv.get_cv_splitter()
             
         # Grid Search ile hiperparametre optimizasyonu
         if use_grid_search:
@@ -160,7 +188,7 @@ def train_model(X_train, y_train, model_type=None, params=None, use_grid_search=
             if param_grid:
                 grid_search = GridSearchCV(
                     model, param_grid, 
-                    cv=5, scoring='accuracy', 
+                    cv=cv_splitter, scoring='accuracy', 
                     n_jobs=-1, verbose=1
                 )
                 grid_search.fit(X_train, y_train)
@@ -173,8 +201,8 @@ def train_model(X_train, y_train, model_type=None, params=None, use_grid_search=
             # Normal eğitim
             model.fit(X_train, y_train)
             
-        # Cross-validation ile model performansını değerlendir
-        cv_scores = cross_val_score(model, X_train, y_train, cv=5, scoring='accuracy')
+        # Cross-validation ile model performansını değerlendir (purge + ambargolu zaman serisi katları)
+        cv_scores = cross_val_score(model, X_train, y_train, cv=cv_splitter, scoring='accuracy')
         logger.log_info(f"Cross-validation accuracy: {cv_scores.mean():.4f} (+/- {cv_scores.std() * 2:.4f})")
         
         # Özellik önemlerini logla (varsa)
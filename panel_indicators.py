@@ -0,0 +1,374 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Panel Indicators Module
+
+Bu modül, teknik göstergeleri çok sayıda sembol için aynı anda hesaplar. Girdi
+(zaman × sembol) biçiminde 2 boyutlu Close/High/Low/Volume dizileridir; her gösterge
+tüm semboller için tek bir NumPy geçişiyle üretilir ve sütunlu bir panel döner.
+Böylece binlerce sembolün özellikleri, sembol başına ayrı pandas hattı yerine
+birkaç dizi geçişiyle hesaplanır.
+
+Gösterge tanımları feature_engineer.add_technical_indicators ile aynıdır:
+- Kayan ortalama/std/max/min: zaman ekseninde kayan pencere görünümleri (kopyasız)
+- MACD: pandas ewm(adjust=True) özyinelemesi, sembol ekseninde vektörel
+- Değişim oranları ve momentum: kaydırılmış dizilerle eleman bazlı işlemler
+
+Paneldeki NaN değerler eksik bar olarak kabul edilir; pencere hesapları pandas gibi
+pencerede NaN varsa NaN üretir.
+"""
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+import config
+import logger
+import memory_utils
+
+
+PANEL_FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+
+# Geçici dizilerin üst sınırı (eleman sayısı); kayan std bu boyutta parçalara bölünür
+_CHUNK_ELEMENTS = 1 << 24
+
+# Bu sayıya kadar sütunda EMA sütun başına skaler döngüyle hesaplanır
+_SCALAR_EWM_COLUMNS = 4
+
+
+def indicator_columns(params=None):
+    """
+    Üretilen gösterge sütunlarını add_technical_indicators ile aynı sırada döndürür.
+
+    Args:
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+
+    Returns:
+        list: Sütun isimleri
+    """
+    params = config.TECHNICAL_INDICATORS if params is None else params
+    return [f"SMA_{params['SMA_SHORT_PERIOD']}", f"SMA_{params['SMA_LONG_PERIOD']}", 'RSI',
+            'MACD', 'MACD_Signal', 'MACD_Hist', 'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width',
+            'BB_Position', 'Volatility', 'Volume_Change', 'Volume_SMA', 'Volume_Ratio', 'Price_Change',
+            'Price_Change_5d', 'High_Low_Ratio', 'Momentum_10', 'ROC_5', 'Recent_High', 'Recent_Low',
+            'Position_in_Range']
+
+
+def _empty_like(values):
+    """Aynı boyutta NaN dolu dizi"""
+    return np.full(values.shape, np.nan)
+
+
+def _shift(values, periods):
+    """Zaman ekseninde kaydırma (pandas shift ile aynı, baştaki satırlar NaN)"""
+    out = _empty_like(values)
+    if periods < len(values):
+        out[periods:] = values[:len(values) - periods]
+    return out
+
+
+def _rolling(values, window, reducer):
+    """
+    Zaman ekseninde kayan pencere indirgemesi. Pencere tamamen dolmadan (veya
+    pencerede NaN varken) sonuç NaN olur, pandas rolling(window).<reducer>() gibi.
+    """
+    out = _empty_like(values)
+    if len(values) >= window:
+        out[window - 1:] = reducer(sliding_window_view(values, window, axis=0), axis=-1)
+    return out
+
+
+def rolling_mean(values, window):
+    """
+    Kayan ortalama.
+
+    Args:
+        values (numpy.ndarray): (zaman × sembol) dizi
+        window (int): Pencere uzunluğu
+
+    Returns:
+        numpy.ndarray: Aynı boyutta kayan ortalama
+    """
+    return _rolling(values, window, np.mean)
+
+
+def rolling_std(values, window):
+    """
+    Kayan örneklem standart sapması (ddof=1). Geçici bellek _CHUNK_ELEMENTS ile
+    sınırlı tutulur; tüm değerleri aynı olan pencerelerde sonuç tam olarak 0'dır.
+
+    Args:
+        values (numpy.ndarray): (zaman × sembol) dizi
+        window (int): Pencere uzunluğu
+
+    Returns:
+        numpy.ndarray: Aynı boyutta kayan standart sapma
+    """
+    out = _empty_like(values)
+    if len(values) < window:
+        return out
+
+    windows = sliding_window_view(values, window, axis=0)
+    width = int(np.prod(values.shape[1:], dtype=np.int64)) * window
+    step = max(1, _CHUNK_ELEMENTS // max(width, 1))
+    for start in range(0, len(windows), step):
+        block = windows[start:start + step]
+        std = block.std(axis=-1, ddof=1)
+        std[block.max(axis=-1) == block.min(axis=-1)] = 0.0
+        out[window - 1 + start:window - 1 + start + len(block)] = std
+    return out
+
+
+def _ewm_column(values, factor):
+    """Tek sütun için ewm(adjust=True) özyinelemesi (Python float'larıyla, aynı işlem sırası)"""
+    out = []
+    weighted = values[0]
+    old_wt = 1.0
+    for current in values:
+        if not out:
+            out.append(weighted)
+            continue
+        if weighted == weighted:
+            old_wt *= factor
+            if current == current:
+                if weighted != current:
+                    weighted = (old_wt * weighted + current) / (old_wt + 1.0)
+                old_wt += 1.0
+        elif current == current:
+            weighted = current
+        out.append(weighted)
+    return out
+
+
+def ewm_mean(values, span):
+    """
+    Üstel hareketli ortalama; pandas ewm(span=span, adjust=True).mean() özyinelemesi.
+    Zaman ekseninde bir döngü, sembol ekseninde vektörel çalışır.
+
+    Args:
+        values (numpy.ndarray): (zaman × sembol) dizi
+        span (int veya numpy.ndarray): EMA periyodu; dizi verilirse her sütun kendi periyoduyla hesaplanır
+
+    Returns:
+        numpy.ndarray: Aynı boyutta EMA
+    """
+    out = _empty_like(values)
+    if len(values) == 0:
+        return out
+
+    factor = 1.0 - 2.0 / (np.asarray(span, dtype=np.float64) + 1.0)
+    if values.ndim == 2 and values.shape[1] <= _SCALAR_EWM_COLUMNS:
+        # Az sütunda dizi işlemlerinin sabit maliyeti baskın olur; sütun başına skaler döngü
+        factors = np.broadcast_to(factor, values.shape[1:])
+        for column in range(values.shape[1]):
+            out[:, column] = _ewm_column(values[:, column].tolist(), float(factors[column]))
+        return out
+
+    weighted = np.array(values[0], dtype=np.float64)
+    old_wt = np.ones_like(weighted)
+    out[0] = weighted
+    for i in range(1, len(values)):
+        current = values[i]
+        observed = current == current
+        started = weighted == weighted
+
+        old_wt = np.where(started, old_wt * factor, old_wt)
+        blend = started & observed & (weighted != current)
+        weighted = np.where(blend, (old_wt * weighted + current) / (old_wt + 1.0), weighted)
+        old_wt = np.where(started & observed, old_wt + 1.0, old_wt)
+        weighted = np.where(~started & observed, current, weighted)
+        out[i] = weighted
+    return out
+
+
+def compute_panel_indicators(close, high, low, volume, params=None, columns=None):
+    """
+    Tüm semboller için teknik göstergeleri tek seferde hesaplar. columns verilirse
+    yalnızca bu göstergeler ve gerektirdikleri ara sonuçlar hesaplanır.
+
+    Args:
+        close (numpy.ndarray): (zaman × sembol) kapanış fiyatları
+        high (numpy.ndarray): (zaman × sembol) en yüksek fiyatlar
+        low (numpy.ndarray): (zaman × sembol) en düşük fiyatlar
+        volume (numpy.ndarray): (zaman × sembol) hacimler
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        columns (list): Hesaplanacak göstergeler (None ise tümü)
+
+    Returns:
+        dict: {sütun: (zaman × sembol) float64 dizi}, add_technical_indicators sırasıyla
+              (columns verilirse onun sırasıyla)
+
+    Raises:
+        KeyError: Bilinmeyen gösterge isminde
+    """
+    params = config.TECHNICAL_INDICATORS if params is None else params
+    close, high, low, volume = (np.asarray(a, dtype=np.float64) for a in (close, high, low, volume))
+    sma_short, sma_long = params['SMA_SHORT_PERIOD'], params['SMA_LONG_PERIOD']
+    bb_period, vol_period, rsi_period = params['BB_PERIOD'], params['VOLATILITY_PERIOD'], params['RSI_PERIOD']
+    columns = indicator_columns(params) if columns is None else list(columns)
+
+    # Her düğüm ilk istendiğinde bir kez hesaplanır (ör. SMA_20 ve BB_Middle aynı ortalamayı paylaşır)
+    memo = {}
+
+    def get(name):
+        if name not in memo:
+            memo[name] = nodes[name]()
+        return memo[name]
+
+    def rsi():
+        # NaN değişim (ilk bar) kazanç ve kayıpta 0 sayılır, eksik bar NaN kalır
+        delta = close - get('close_1')
+        missing = np.where(np.isnan(close), np.nan, 0.0)
+        gains = np.where(delta > 0, delta, missing)
+        losses = -np.where(delta < 0, delta, missing)
+        return 100 - (100 / (1 + rolling_mean(gains, rsi_period) / rolling_mean(losses, rsi_period)))
+
+    nodes = {
+        'close_1': lambda: _shift(close, 1),
+        'close_5': lambda: _shift(close, 5),
+        'close_10': lambda: _shift(close, 10),
+        f'mean_{sma_short}': lambda: rolling_mean(close, sma_short),
+        f'mean_{sma_long}': lambda: rolling_mean(close, sma_long),
+        f'mean_{bb_period}': lambda: rolling_mean(close, bb_period),
+        f'std_{bb_period}': lambda: rolling_std(close, bb_period),
+        f'std_{vol_period}': lambda: rolling_std(close, vol_period),
+        'band': lambda: get(f'std_{bb_period}') * params['BB_STD'],
+        f'SMA_{sma_short}': lambda: get(f'mean_{sma_short}'),
+        f'SMA_{sma_long}': lambda: get(f'mean_{sma_long}'),
+        'RSI': rsi,
+        'MACD': lambda: ewm_mean(close, params['MACD_FAST']) - ewm_mean(close, params['MACD_SLOW']),
+        'MACD_Signal': lambda: ewm_mean(get('MACD'), params['MACD_SIGNAL']),
+        'MACD_Hist': lambda: get('MACD') - get('MACD_Signal'),
+        'BB_Upper': lambda: get('BB_Middle') + get('band'),
+        'BB_Middle': lambda: get(f'mean_{bb_period}'),
+        'BB_Lower': lambda: get('BB_Middle') - get('band'),
+        'BB_Width': lambda: (get('BB_Upper') - get('BB_Lower')) / get('BB_Middle'),
+        'BB_Position': lambda: (close - get('BB_Lower')) / (get('BB_Upper') - get('BB_Lower')),
+        'Volatility': lambda: get(f'std_{vol_period}'),
+        'Volume_Change': lambda: volume / _shift(volume, 1) - 1,
+        'Volume_SMA': lambda: rolling_mean(volume, 20),
+        'Volume_Ratio': lambda: volume / get('Volume_SMA'),
+        'Price_Change': lambda: close / get('close_1') - 1,
+        'Price_Change_5d': lambda: close / get('close_5') - 1,
+        'High_Low_Ratio': lambda: (high - low) / close,
+        'Momentum_10': lambda: close / get('close_10') - 1,
+        'ROC_5': lambda: ((close - get('close_5')) / get('close_5')) * 100,
+        'Recent_High': lambda: _rolling(high, 20, np.max),
+        'Recent_Low': lambda: _rolling(low, 20, np.min),
+        'Position_in_Range': lambda: (close - get('Recent_Low')) / (get('Recent_High') - get('Recent_Low')),
+    }
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        panel = {column: get(column) for column in columns}
+
+    # Sonsuz değerler NaN yapılır (add_technical_indicators ile aynı)
+    for values in panel.values():
+        values[np.isinf(values)] = np.nan
+    return panel
+
+
+def build_panel(frames, align='date'):
+    """
+    Sembol DataFrame'lerini (zaman × sembol) dizilere dönüştürür.
+
+    align='date': satırlar tüm tarihlerin birleşimidir; sembolün işlem görmediği
+    tarihler NaN olur (kesitsel hesaplar için).
+    align='bar': her sütun sembolün kendi bar dizisidir, son satıra hizalanır ve başı
+    NaN ile doldurulur. Farklı takvimli veya farklı uzunluktaki semboller için
+    göstergeler sembol bazlı hesapla birebir aynı kalır.
+
+    Args:
+        frames (dict): {sembol: OHLCV DataFrame}
+        align (str): 'date' veya 'bar'
+
+    Returns:
+        dict: {'symbols': list, 'index': DatetimeIndex (yalnızca 'date'), 'rows': {sembol: satır
+              konumları}, 'Open'|'High'|'Low'|'Close'|'Volume': (zaman × sembol) float64 dizi}
+
+    Raises:
+        ValueError: Geçersiz align değerinde
+    """
+    if align not in ('date', 'bar'):
+        raise ValueError(f"Geçersiz panel hizalaması: {align}")
+
+    symbols = [s for s, frame in frames.items() if frame is not None and len(frame) > 0]
+    if align == 'date':
+        index = pd.DatetimeIndex([])
+        for symbol in symbols:
+            index = index.union(frames[symbol].index)
+        rows = {s: index.get_indexer(frames[s].index) for s in symbols}
+        length = len(index)
+    else:
+        index = None
+        length = max((len(frames[s]) for s in symbols), default=0)
+        rows = {s: np.arange(length - len(frames[s]), length) for s in symbols}
+
+    panel = {'symbols': symbols, 'index': index, 'rows': rows}
+    for field in PANEL_FIELDS:
+        values = np.full((length, len(symbols)), np.nan)
+        for column, symbol in enumerate(symbols):
+            values[rows[symbol], column] = frames[symbol][field].to_numpy(dtype=np.float64)
+        panel[field] = values
+    return panel
+
+
+def add_panel_indicators(frames, params=None, columns=None):
+    """
+    Sembol DataFrame'lerinin tümüne teknik göstergeleri tek panel hesabıyla ekler.
+    Her sembolün sonucu add_technical_indicators(frames[sembol]) ile aynıdır.
+
+    Args:
+        frames (dict): {sembol: OHLCV DataFrame}
+        params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        columns (list): Eklenecek göstergeler (None ise tümü)
+
+    Returns:
+        dict: {sembol: göstergeler eklenmiş DataFrame}
+        None: Hata durumunda
+    """
+    try:
+        panel = build_panel(frames, align='bar')
+        logger.log_info(f"Panel göstergeleri hesaplanıyor: {len(panel['symbols'])} sembol, "
+                        f"{panel['Close'].shape[0]} satır")
+        indicators = compute_panel_indicators(panel['Close'], panel['High'], panel['Low'],
+                                              panel['Volume'], params, columns)
+        columns = list(indicators)
+
+        results = {}
+        for position, symbol in enumerate(panel['symbols']):
+            rows = panel['rows'][symbol]
+            values = np.column_stack([indicators[c][rows, position] for c in columns])
+            frame = frames[symbol]
+            table = pd.DataFrame(values, index=frame.index, columns=columns)
+            results[symbol] = memory_utils.maybe_compact(pd.concat([frame, table], axis=1))
+        return results
+
+    except Exception as e:
+        logger.log_error(f"Panel göstergeleri hesaplanırken hata: {e}", exc_info=True)
+        return None
+
+
+if __name__ == "__main__":
+    """
+    Panel Indicators modülü test kodu
+    """
+    print("=== AI-FTB Panel Indicators Test ===")
+
+    import time
+    import data_providers
+    import feature_engineer
+
+    provider = data_providers.get_data_provider('synthetic')
+    base = provider.get_history('AAPL', '2014-01-01', '2024-01-01')
+    close = base['Close'].to_numpy()[:, None] * np.linspace(0.5, 2.0, 1000)
+    started = time.perf_counter()
+    panel = compute_panel_indicators(close, close * 1.01, close * 0.99,
+                                     np.repeat(base['Volume'].to_numpy(dtype=float)[:, None], 1000, axis=1))
+    print(f"✅ {close.shape[1]} sembol × {close.shape[0]} bar: {time.perf_counter() - started:.2f} sn")
+
+    frames = {s: provider.get_history(s, '2020-01-01', '2024-01-01') for s in ['AAPL', 'MSFT', 'THYAO.IS']}
+    enhanced = add_panel_indicators(frames)
+    for symbol, frame in frames.items():
+        batch = feature_engineer.add_technical_indicators(frame)
+        difference = (enhanced[symbol][indicator_columns()] - batch[indicator_columns()]).abs().max().max()
+        print(f"📊 {symbol}: sembol bazlı hesapla en büyük fark {difference:.2e}")
+
+    print("\nPanel Indicators test tamamlandı!")
@@ -0,0 +1,240 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Purged Cross-Validation Module
+
+Bu modül, etiketleri ileriye baktığı için birbiriyle örtüşen zaman serisi
+örnekleri için çapraz doğrulama bölücüleri sağlar:
+
+- PurgedKFold: ardışık test blokları; etiket aralığı test dönemiyle örtüşen eğitim
+  örnekleri çıkarılır (purge), test döneminin hemen ardından bir ambargo bırakılır
+- CombinatorialPurgedKFold: N gruptan k test grubunun tüm kombinasyonları (CPCV)
+
+Bölücüler sklearn'ün cv arayüzünü (split / get_n_splits) uygular; cross_val_score ve
+GridSearchCV'ye doğrudan verilebilir. Aynı veri kümesi için kat indeksleri bir kez
+hesaplanır ve sonraki tüm model değerlendirmelerinde önbellekten kullanılır.
+"""
+
+import hashlib
+from collections import OrderedDict
+from itertools import combinations
+
+import numpy as np
+
+import config
+import logger
+
+
+# (bölücü parametreleri, örnek sayısı, etiket bitişleri özeti) -> [(train, test), ...]
+_FOLD_CACHE = OrderedDict()
+_FOLD_CACHE_MAX_ENTRIES = 32
+
+
+def _label_ends(n_samples, label_horizon, label_ends):
+    """Her örneğin etiketinin bittiği konum (varsayılan i + label_horizon)"""
+    if label_ends is None:
+        return np.arange(n_samples) + label_horizon
+    label_ends = np.asarray(label_ends, dtype=np.int64)
+    if len(label_ends) != n_samples:
+        raise ValueError(f"label_ends uzunluğu ({len(label_ends)}) örnek sayısıyla ({n_samples}) uyuşmuyor")
+    return np.maximum(label_ends, np.arange(n_samples))
+
+
+def _purged_train(test_mask, starts, ends, embargo):
+    """
+    Test örnekleri dışındaki, etiket aralığı hiçbir test bloğuyla (ve sonrasındaki
+    ambargoyla) örtüşmeyen eğitim konumları.
+    """
+    train = ~test_mask
+    # Ardışık test blokları: her blok [ilk örnek, son etiket bitişi + ambargo] aralığını kapatır
+    positions = np.flatnonzero(test_mask)
+    breaks = np.flatnonzero(np.diff(positions) > 1)
+    block_starts = positions[np.concatenate([[0], breaks + 1])]
+    block_stops = positions[np.concatenate([breaks, [len(positions) - 1]])]
+    for first, last in zip(block_starts, block_stops):
+        closed_until = ends[first:last + 1].max() + embargo
+        train &= (ends < first) | (starts > closed_until)
+    return np.flatnonzero(train)
+
+
+class PurgedKFold:
+    """
+    Örtüşen etiketler için ambargolu, purge edilmiş k-katlı zaman serisi bölücüsü.
+    Örnekler zaman sırasında olmalıdır (karıştırma yapılmaz).
+    """
+
+    def __init__(self, n_splits=None, label_horizon=None, embargo_pct=None, label_ends=None):
+        """
+        Args:
+            n_splits (int): Kat sayısı (None ise config.CV_N_SPLITS)
+            label_horizon (int): Etiketin ileriye baktığı bar sayısı (None ise config.TARGET_LOOKAHEAD_DAYS)
+            embargo_pct (float): Test bloğundan sonra eğitimden çıkarılan örnek oranı
+                (None ise config.CV_EMBARGO_PCT)
+            label_ends (array): Örnek başına etiket bitiş konumu (ör. üçlü bariyer çıkışı);
+                verilirse label_horizon yerine kullanılır
+
+        Raises:
+            ValueError: Geçersiz kat sayısında
+        """
+        self.n_splits = config.CV_N_SPLITS if n_splits is None else n_splits
+        self.label_horizon = config.TARGET_LOOKAHEAD_DAYS if label_horizon is None else label_horizon
+        self.embargo_pct = config.CV_EMBARGO_PCT if embargo_pct is None else embargo_pct
+        self.label_ends = label_ends
+        if self.n_splits < 2:
+            raise ValueError(f"Geçersiz kat sayısı: {self.n_splits}")
+
+    def _test_groups(self, n_samples):
+        """Örnekleri zaman sırasıyla n_splits ardışık gruba böler"""
+        return np.array_split(np.arange(n_samples), self.n_splits)
+
+    def _test_sets(self, n_samples):
+        """Her katın test grupları (PurgedKFold'da tek grup)"""
+        return [(group,) for group in self._test_groups(n_samples)]
+
+    def _cache_key(self, n_samples):
+        """Bölücü parametreleri ve veri kümesi boyutuna göre önbellek anahtarı"""
+        ends = b'' if self.label_ends is None else np.asarray(self.label_ends, dtype=np.int64).tobytes()
+        return (type(self).__name__, self.n_splits, getattr(self, 'n_test_splits', 1), self.label_horizon,
+                self.embargo_pct, n_samples, hashlib.sha1(ends).hexdigest())
+
+    def folds(self, n_samples):
+        """
+        Kat indekslerini döndürür (aynı parametre ve boyut için önbellekten).
+
+        Args:
+            n_samples (int): Örnek sayısı
+
+        Returns:
+            list: [(train_indeksleri, test_indeksleri), ...] salt okunur diziler
+        """
+        key = self._cache_key(n_samples)
+        if key in _FOLD_CACHE:
+            _FOLD_CACHE.move_to_end(key)
+            return _FOLD_CACHE[key]
+
+        starts = np.arange(n_samples)
+        ends = _label_ends(n_samples, self.label_horizon, self.label_ends)
+        embargo = int(np.ceil(self.embargo_pct * n_samples))
+
+        folds = []
+        for groups in self._test_sets(n_samples):
+            test = np.sort(np.concatenate(groups))
+            test_mask = np.zeros(n_samples, dtype=bool)
+            test_mask[test] = True
+            train = _purged_train(test_mask, starts, ends, embargo)
+            for indices in (train, test):
+                indices.setflags(write=False)
+            folds.append((train, test))
+
+        _FOLD_CACHE[key] = folds
+        if len(_FOLD_CACHE) > _FOLD_CACHE_MAX_ENTRIES:
+            _FOLD_CACHE.popitem(last=False)
+        logger.log_debug(f"{type(self).__name__}: {len(folds)} kat hesaplandı ({n_samples} örnek, "
+                         f"ambargo {embargo})")
+        return folds
+
+    def split(self, X, y=None, groups=None):
+        """
+        sklearn cv arayüzü: (train, test) indekslerini üretir.
+
+        Args:
+            X (array-like): Özellikler (yalnızca uzunluk kullanılır)
+            y, groups: sklearn uyumluluğu için (kullanılmaz)
+
+        Yields:
+            tuple: (train_indeksleri, test_indeksleri)
+        """
+        yield from self.folds(len(X))
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        """Kat sayısı"""
+        return self.n_splits
+
+
+class CombinatorialPurgedKFold(PurgedKFold):
+    """
+    Kombinatoryal purge edilmiş çapraz doğrulama (CPCV): örnekler n_splits gruba
+    bölünür ve her n_test_splits'li grup kombinasyonu bir kez test edilir.
+    """
+
+    def __init__(self, n_splits=None, n_test_splits=None, label_horizon=None, embargo_pct=None, label_ends=None):
+        """
+        Args:
+            n_splits (int): Grup sayısı (None ise config.CV_N_SPLITS)
+            n_test_splits (int): Her katta test edilen grup sayısı (None ise config.CV_N_TEST_SPLITS)
+            label_horizon (int): Etiketin ileriye baktığı bar sayısı
+            embargo_pct (float): Her test bloğundan sonraki ambargo oranı
+            label_ends (array): Örnek başına etiket bitiş konumu
+
+        Raises:
+            ValueError: Geçersiz grup sayılarında
+        """
+        super().__init__(n_splits, label_horizon, embargo_pct, label_ends)
+        self.n_test_splits = config.CV_N_TEST_SPLITS if n_test_splits is None else n_test_splits
+        if not 1 <= self.n_test_splits < self.n_splits:
+            raise ValueError(f"Geçersiz test grubu sayısı: {self.n_test_splits}")
+
+    def _test_sets(self, n_samples):
+        """Tüm test grubu kombinasyonları"""
+        groups = self._test_groups(n_samples)
+        return [tuple(groups[i] for i in chosen) for chosen in combinations(range(self.n_splits), self.n_test_splits)]
+
+    def get_n_splits(self, X=None, y=None, groups=None):
+        """Kombinasyon sayısı C(n_splits, n_test_splits)"""
+        return len(list(combinations(range(self.n_splits), self.n_test_splits)))
+
+
+def get_cv_splitter(method=None, label_ends=None):
+    """
+    Ayarlara göre çapraz doğrulama bölücüsünü döndürür.
+
+    Args:
+        method (str): 'purged' veya 'combinatorial' (None ise config.CV_METHOD)
+        label_ends (array): Örnek başına etiket bitiş konumu (isteğe bağlı)
+
+    Returns:
+        PurgedKFold: Bölücü
+
+    Raises:
+        ValueError: Bilinmeyen yöntemde
+    """
+    method = config.CV_METHOD if method is None else method
+    if method == 'purged':
+        return PurgedKFold(label_ends=label_ends)
+    if method == 'combinatorial':
+        return CombinatorialPurgedKFold(label_ends=label_ends)
+    raise ValueError(f"Bilinmeyen çapraz doğrulama yöntemi: {method}")
+
+
+def clear_fold_cache():
+    """Önbelleğe alınmış kat indekslerini temizler"""
+    _FOLD_CACHE.clear()
+
+
+if __name__ == "__main__":
+    """
+    Purged CV modülü test kodu
+    """
+    print("=== AI-FTB Purged CV Test ===")
+
+    import time
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.model_selection import KFold, cross_val_score
+
+    # Hedef 5 bar ilerinin getirisi: komşu örnekler aynı gelecek barları paylaşır
+    rng = np.random.default_rng(0)
+    returns = rng.normal(0, 0.01, 3000)
+    close = 100 * np.exp(np.cumsum(returns))
+    future = np.concatenate([close[5:] / close[:-5] - 1, np.zeros(5)])
+    X = np.column_stack([future + rng.normal(0, 0.02, 3000), rng.normal(size=3000)])[:-5]
+    y = (future > 0).astype(int)[:-5]
+
+    model = RandomForestClassifier(n_estimators=50, max_depth=5, random_state=0)
+    splitter = PurgedKFold(n_splits=5, label_horizon=5, embargo_pct=0.01)
+    started = time.perf_counter()
+    purged = cross_val_score(model, X, y, cv=splitter)
+    print(f"✅ Purged 5 kat: {purged.mean():.4f} ({time.perf_counter() - started:.1f} sn)")
+    print(f"📊 Karıştırılmış KFold: {cross_val_score(model, X, y, cv=KFold(5, shuffle=True, random_state=0)).mean():.4f}")
+
+    cpcv = CombinatorialPurgedKFold(n_splits=6, n_test_splits=2, label_horizon=5)
+    print(f"✅ CPCV: {cpcv.get_n_splits()} kat, ortalama eğitim {np.mean([len(t) for t, _ in cpcv.folds(len(X))]):.0f} örnek")
+
+    print("\nPurged CV test tamamlandı!")
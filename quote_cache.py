@@ -0,0 +1,297 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Quote Cache Module
+
+Bu modül, güncel fiyat (quote) bilgileri için süreç genelinde paylaşılan,
+TTL (yaşam süresi) tabanlı bir önbellek sağlar.
+
+Özellikler:
+- TTL süresi dolmamış fiyatlar sağlayıcıya gitmeden döndürülür
+- Aynı sembol için eşzamanlı istekler tek bir indirmede birleştirilir (single-flight)
+- Toplu sorgularda sadece önbellekte olmayan semboller paralel çekilir
+- İsteğe bağlı arka plan yenilemesi ile izlenen semboller sürekli taze tutulur
+"""
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import config
+import logger
+import data_providers
+
+
+class QuoteCache:
+    """
+    TTL tabanlı, iş parçacığı güvenli güncel fiyat önbelleği.
+
+    Önbellek girdileri {symbol: (quote, fetched_at)} biçiminde tutulur. Bir sembol
+    için indirme sürerken gelen diğer istekler aynı Future nesnesini bekler.
+    """
+
+    def __init__(self, ttl=None, fetcher=None, max_workers=None):
+        """
+        Args:
+            ttl (float): Fiyatların geçerli sayıldığı süre (saniye)
+            fetcher (callable): symbol -> quote dict döndüren fonksiyon (varsayılan: sağlayıcıdan çeker)
+            max_workers (int): Toplu sorgularda eşzamanlı indirme sayısı üst sınırı
+        """
+        self.ttl = config.QUOTE_CACHE_TTL_SECONDS if ttl is None else ttl
+        self.max_workers = config.DATA_FETCH_MAX_WORKERS if max_workers is None else max_workers
+        self._fetcher = fetcher or fetch_quote
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._tracked = set()
+        self._refresh_thread = None
+        self._refresh_stop = threading.Event()
+        self.stats = {'hits': 0, 'misses': 0, 'fetches': 0, 'errors': 0}
+
+    def get(self, symbol, max_age=None):
+        """
+        Tek bir sembolün fiyatını döndürür; gerekirse sağlayıcıdan çeker.
+
+        Args:
+            symbol (str): İşlem sembolü
+            max_age (float): Kabul edilen en eski fiyat yaşı (saniye, None ise TTL)
+
+        Returns:
+            dict: {'price': float, 'change': float, 'change_percent': float}
+            None: Fiyat alınamazsa
+        """
+        return self.get_many([symbol], max_age=max_age).get(symbol)
+
+    def get_many(self, symbols, max_age=None):
+        """
+        Birden fazla sembolün fiyatını döndürür. Önbellekte taze olanlar doğrudan,
+        eksik olanlar tek bir paralel turda çekilir.
+
+        Args:
+            symbols (list): Sembol listesi
+            max_age (float): Kabul edilen en eski fiyat yaşı (saniye, None ise TTL)
+
+        Returns:
+            dict: {symbol: quote} - fiyatı alınamayan semboller dahil edilmez (giriş sırasıyla)
+        """
+        max_age = self.ttl if max_age is None else max_age
+        symbols = list(dict.fromkeys(symbols))
+        now = time.monotonic()
+        quotes = {}
+        waiting = {}
+        owned = {}
+
+        with self._lock:
+            self._tracked.update(symbols)
+            for symbol in symbols:
+                entry = self._entries.get(symbol)
+                if entry is not None and now - entry[1] <= max_age:
+                    quotes[symbol] = entry[0]
+                    self.stats['hits'] += 1
+                    continue
+                self.stats['misses'] += 1
+                future = self._inflight.get(symbol)
+                if future is None:
+                    future = Future()
+                    self._inflight[symbol] = future
+                    owned[symbol] = future
+                waiting[symbol] = future
+
+        if owned:
+            self._fetch_owned(owned)
+
+        for symbol, future in waiting.items():
+            quote = future.result()
+            if quote is not None:
+                quotes[symbol] = quote
+
+        return {symbol: dict(quotes[symbol]) for symbol in symbols if symbol in quotes}
+
+    def refresh(self, symbols=None):
+        """
+        Sembollerin fiyatlarını TTL'den bağımsız olarak yeniden çeker.
+
+        Args:
+            symbols (list): Yenilenecek semboller (None ise şimdiye kadar sorgulanan tüm semboller)
+
+        Returns:
+            dict: {symbol: quote}
+        """
+        if symbols is None:
+            with self._lock:
+                symbols = sorted(self._tracked)
+        return self.get_many(symbols, max_age=0)
+
+    def invalidate(self, symbol=None):
+        """
+        Önbellekten bir sembolü veya tüm girdileri siler.
+
+        Args:
+            symbol (str): Silinecek sembol (None ise tümü)
+        """
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(symbol, None)
+
+    def start_background_refresh(self, symbols=None, interval=None):
+        """
+        İzlenen sembolleri belirli aralıklarla yenileyen arka plan iş parçacığını başlatır.
+
+        Args:
+            symbols (list): İzleme listesine eklenecek semboller
+            interval (float): Yenileme aralığı (saniye, None ise config değeri)
+
+        Returns:
+            bool: İş parçacığı başlatıldıysa True, zaten çalışıyorsa False
+        """
+        if interval is None:
+            interval = config.QUOTE_REFRESH_INTERVAL_SECONDS
+        with self._lock:
+            if symbols:
+                self._tracked.update(symbols)
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return False
+            self._refresh_stop.clear()
+            self._refresh_thread = threading.Thread(target=self._refresh_loop, args=(interval,),
+                                                    name='quote-cache-refresh', daemon=True)
+            self._refresh_thread.start()
+        logger.log_info(f"Fiyat önbelleği arka plan yenilemesi başlatıldı ({interval} sn aralıkla)")
+        return True
+
+    def stop_background_refresh(self, timeout=None):
+        """
+        Arka plan yenilemesini durdurur.
+
+        Args:
+            timeout (float): İş parçacığının bitmesi için beklenecek süre (saniye)
+        """
+        self._refresh_stop.set()
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+        self._refresh_thread = None
+
+    def _refresh_loop(self, interval):
+        """Durdurulana kadar izlenen sembolleri yeniler"""
+        while not self._refresh_stop.wait(interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.log_error(f"Fiyat önbelleği yenileme hatası: {e}")
+
+    def _fetch_owned(self, owned):
+        """Bu çağrının sahip olduğu sembolleri çeker ve bekleyen Future'ları tamamlar"""
+        symbols = list(owned)
+        results = [None] * len(symbols)
+        try:
+            if len(symbols) == 1:
+                results = [self._fetch_one(symbols[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(symbols)))) as executor:
+                    results = list(executor.map(self._fetch_one, symbols))
+        finally:
+            # Bekleyen istekler hata durumunda da serbest bırakılmalı
+            fetched_at = time.monotonic()
+            with self._lock:
+                for symbol, quote in zip(symbols, results):
+                    if quote is not None:
+                        self._entries[symbol] = (quote, fetched_at)
+                    self._inflight.pop(symbol, None)
+            for symbol, quote in zip(symbols, results):
+                owned[symbol].set_result(quote)
+
+    def _fetch_one(self, symbol):
+        """Tek sembolü çeker; hatalar None olarak döner ve önbelleğe yazılmaz"""
+        with self._lock:
+            self.stats['fetches'] += 1
+        try:
+            quote = self._fetcher(symbol)
+        except Exception as e:
+            logger.log_error(f"Güncel fiyat alırken hata ({symbol}): {e}")
+            quote = None
+        if quote is None:
+            with self._lock:
+                self.stats['errors'] += 1
+        return quote
+
+
+def fetch_quote(symbol):
+    """
+    Sağlayıcıdan son iki kapanışı okuyarak fiyat bilgisini üretir.
+
+    Args:
+        symbol (str): İşlem sembolü
+
+    Returns:
+        dict: {'price': float, 'change': float, 'change_percent': float}
+        None: Veri yoksa
+    """
+    data = data_providers.get_data_provider().get_history(symbol, period="5d")
+    if data is None or data.empty:
+        return None
+
+    closes = data['Close'].to_numpy()[-2:]
+    current_price = float(closes[-1])
+    previous_price = float(closes[0])
+
+    change = current_price - previous_price
+    change_percent = (change / previous_price) * 100 if previous_price != 0 else 0.0
+
+    return {
+        'price': current_price,
+        'change': change,
+        'change_percent': float(change_percent)
+    }
+
+
+_quote_cache = None
+_quote_cache_lock = threading.Lock()
+
+
+def get_quote_cache():
+    """
+    Süreç genelinde paylaşılan fiyat önbelleğini döndürür.
+
+    Returns:
+        QuoteCache: Paylaşılan önbellek (config.QUOTE_BACKGROUND_REFRESH açıksa arka plan yenilemesi başlatılır)
+    """
+    global _quote_cache
+    with _quote_cache_lock:
+        if _quote_cache is None:
+            _quote_cache = QuoteCache()
+            if config.QUOTE_BACKGROUND_REFRESH:
+                _quote_cache.start_background_refresh()
+        return _quote_cache
+
+
+def reset_quote_cache():
+    """Paylaşılan önbelleği durdurur ve sıfırlar (sağlayıcı değiştiğinde veya testlerde)"""
+    global _quote_cache
+    with _quote_cache_lock:
+        if _quote_cache is not None:
+            _quote_cache.stop_background_refresh(timeout=1.0)
+        _quote_cache = None
+
+
+if __name__ == "__main__":
+    """
+    Quote Cache modülü test kodu
+    """
+    print("=== AI-FTB Quote Cache Test ===")
+
+    config.DATA_PROVIDER = 'synthetic'
+    symbols = [f"SYM{i}" for i in range(20)]
+    cache = QuoteCache(ttl=30)
+
+    started = time.perf_counter()
+    cache.get_many(symbols)
+    cold = time.perf_counter() - started
+
+    started = time.perf_counter()
+    quotes = cache.get_many(symbols)
+    warm = time.perf_counter() - started
+
+    print(f"✅ {len(quotes)} sembol: soğuk {cold * 1000:.1f} ms, önbellekten {warm * 1000:.3f} ms")
+    print(f"📊 İstatistikler: {cache.stats}")
+
+    print("\nQuote Cache test tamamlandı!")
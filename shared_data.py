@@ -0,0 +1,242 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Shared Data Module
+
+Bu modül, sembol başına OHLCV ve özellik kolonlarını bir kez bellek eşlemeli
+(.npy memmap) dosyalara yayınlar. Paralel backtest/eğitim işçileri bu dosyalara
+salt okunur NumPy görünümleri olarak bağlanır; böylece DataFrame'ler her işçiye
+pickle edilip kopyalanmaz ve tüm işçiler işletim sisteminin sayfa önbelleğindeki
+tek kopyayı paylaşır.
+
+Dosyalar varsayılan olarak /dev/shm (RAM tabanlı tmpfs) altında oluşturulur;
+yoksa sistemin geçici dizini kullanılır.
+
+Kullanım:
+    handle = shared_data.publish_frames({'AAPL': df_aapl, 'MSFT': df_msft})
+    # işçi sürecine sadece küçük 'handle' sözlüğü gönderilir
+    arrays = shared_data.attach_arrays(handle, 'AAPL', ['Close', 'RSI'])
+    ...
+    shared_data.release(handle)
+"""
+
+import os
+import shutil
+import tempfile
+import uuid
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+
+
+_MATRIX_FILE = 'values.npy'
+_INDEX_FILE = 'index.npy'
+
+# İşçi süreç içinde açılmış memmap'ler ((path, symbol) -> ndarray), tekrar açmayı önler
+_attached = {}
+
+
+def _default_base_path():
+    """Yayın dizininin kökünü döndürür (config, /dev/shm veya geçici dizin)"""
+    if config.SHARED_DATA_PATH:
+        return config.SHARED_DATA_PATH
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def publish_frames(frames, columns=None, dtype=np.float64, base_path=None):
+    """
+    Sembol DataFrame'lerini salt okunur paylaşım için bellek eşlemeli dosyalara yazar.
+
+    Her sembol için kolon-öncelikli (Fortran sıralı) tek bir matris oluşturulur; böylece
+    her kolon bellekte bitişiktir ve kopyasız bir görünüm olarak okunabilir.
+
+    Args:
+        frames (dict): {symbol: pandas.DataFrame}
+        columns (list): Yayınlanacak kolonlar (None ise tüm sayısal kolonlar)
+        dtype (numpy.dtype): Matris veri tipi
+        base_path (str): Yayın dizininin kökü (None ise varsayılan)
+
+    Returns:
+        dict: İşçilere gönderilecek küçük, pickle edilebilir tanımlayıcı (handle)
+        None: Hata durumunda
+    """
+    try:
+        if base_path is None:
+            base_path = _default_base_path()
+        path = os.path.join(base_path, f"aiftb_shared_{uuid.uuid4().hex[:12]}")
+        os.makedirs(path)
+
+        handle = {'path': path, 'symbols': {}}
+        total_bytes = 0
+
+        for position, (symbol, frame) in enumerate(frames.items()):
+            if columns is None:
+                symbol_columns = [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c].dtype)]
+            else:
+                symbol_columns = [c for c in columns if c in frame.columns]
+                missing = [c for c in columns if c not in frame.columns]
+                if missing:
+                    logger.log_warning(f"{symbol}: Yayınlanmayan eksik kolonlar: {missing}")
+
+            symbol_dir = os.path.join(path, str(position))
+            os.makedirs(symbol_dir)
+
+            matrix = np.lib.format.open_memmap(
+                os.path.join(symbol_dir, _MATRIX_FILE), mode='w+', dtype=dtype,
+                shape=(len(frame), len(symbol_columns)), fortran_order=True
+            )
+            for i, column in enumerate(symbol_columns):
+                matrix[:, i] = frame[column].to_numpy(dtype=dtype, na_value=np.nan)
+            matrix.flush()
+            total_bytes += matrix.nbytes
+            del matrix
+
+            index = frame.index
+            tz = None
+            if isinstance(index, pd.DatetimeIndex):
+                tz = str(index.tz) if index.tz is not None else None
+                if tz is not None:
+                    index = index.tz_convert('UTC').tz_localize(None)
+                np.save(os.path.join(symbol_dir, _INDEX_FILE),
+                        np.asarray(index.values, dtype='datetime64[ns]').view('int64'))
+
+            handle['symbols'][symbol] = {
+                'dir': str(position),
+                'columns': [str(c) for c in symbol_columns],
+                'rows': int(len(frame)),
+                'tz': tz,
+                'has_index': isinstance(frame.index, pd.DatetimeIndex)
+            }
+
+        logger.log_info(f"Paylaşımlı veri yayınlandı: {len(frames)} sembol, "
+                        f"{total_bytes / 1024 ** 2:.1f} MB ({path})")
+        return handle
+
+    except Exception as e:
+        logger.log_error(f"Paylaşımlı veri yayınlanırken hata: {e}", exc_info=True)
+        return None
+
+
+def _open_matrix(handle, symbol):
+    """Sembolün matrisini salt okunur memmap olarak açar (süreç içinde bir kez)"""
+    key = (handle['path'], symbol)
+    if key not in _attached:
+        entry = handle['symbols'][symbol]
+        _attached[key] = np.load(os.path.join(handle['path'], entry['dir'], _MATRIX_FILE), mmap_mode='r')
+    return _attached[key]
+
+
+def attach_arrays(handle, symbol, columns=None):
+    """
+    Yayınlanmış bir sembolün kolonlarına salt okunur NumPy görünümleri olarak bağlanır.
+
+    Args:
+        handle (dict): publish_frames'in döndürdüğü tanımlayıcı
+        symbol (str): Sembol adı
+        columns (list): İstenen kolonlar (None ise tümü)
+
+    Returns:
+        dict: {kolon: numpy.ndarray} - kopyasız, yazılamaz görünümler
+
+    Raises:
+        KeyError: Sembol veya kolon yayınlanmamışsa
+    """
+    entry = handle['symbols'][symbol]
+    matrix = _open_matrix(handle, symbol)
+    positions = {name: i for i, name in enumerate(entry['columns'])}
+    if columns is None:
+        columns = entry['columns']
+    return {column: matrix[:, positions[column]] for column in columns}
+
+
+def attach_index(handle, symbol):
+    """
+    Yayınlanmış bir sembolün zaman indeksini döndürür.
+
+    Returns:
+        pandas.DatetimeIndex: Zaman indeksi
+        None: Yayınlanan veri DatetimeIndex içermiyorsa
+    """
+    entry = handle['symbols'][symbol]
+    if not entry['has_index']:
+        return None
+    values = np.load(os.path.join(handle['path'], entry['dir'], _INDEX_FILE), mmap_mode='r')
+    index = pd.DatetimeIndex(np.asarray(values, dtype='datetime64[ns]'))
+    if entry['tz']:
+        index = index.tz_localize('UTC').tz_convert(entry['tz'])
+    return index
+
+
+def attach_frame(handle, symbol, columns=None):
+    """
+    Yayınlanmış bir sembolü DataFrame olarak döndürür. Değerler memmap üzerindeki
+    görünümlerden oluşturulur; yazma gerektiren işlemler için .copy() kullanılmalıdır.
+
+    Args:
+        handle (dict): publish_frames'in döndürdüğü tanımlayıcı
+        symbol (str): Sembol adı
+        columns (list): İstenen kolonlar (None ise tümü)
+
+    Returns:
+        pandas.DataFrame: Salt okunur veri
+    """
+    arrays = attach_arrays(handle, symbol, columns)
+    index = attach_index(handle, symbol)
+    return pd.DataFrame(arrays, index=index, copy=False)
+
+
+def detach(handle=None):
+    """
+    Bu süreçte açılmış memmap'leri kapatır.
+
+    Args:
+        handle (dict): Sadece bu yayına ait bağlantıları kapat (None ise tümü)
+    """
+    for key in list(_attached):
+        if handle is None or key[0] == handle['path']:
+            del _attached[key]
+
+
+def release(handle):
+    """
+    Yayını siler. Sadece yayını yapan süreç, tüm işçiler bittikten sonra çağırmalıdır.
+
+    Args:
+        handle (dict): publish_frames'in döndürdüğü tanımlayıcı
+
+    Returns:
+        bool: Başarı durumu
+    """
+    try:
+        detach(handle)
+        shutil.rmtree(handle['path'], ignore_errors=True)
+        logger.log_info(f"Paylaşımlı veri silindi: {handle['path']}")
+        return True
+    except Exception as e:
+        logger.log_error(f"Paylaşımlı veri silinirken hata: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    """
+    Shared Data modülü test kodu
+    """
+    print("=== AI-FTB Shared Data Test ===")
+
+    dates = pd.bdate_range('2015-01-01', periods=2500)
+    rng = np.random.default_rng(0)
+    frames = {
+        f"SYM{i}": pd.DataFrame({'Close': 100 + rng.normal(0, 1, len(dates)).cumsum(),
+                                 'Volume': rng.integers(1000, 5000, len(dates))}, index=dates)
+        for i in range(20)
+    }
+
+    handle = publish_frames(frames)
+    arrays = attach_arrays(handle, 'SYM0')
+    print(f"✅ Kolonlar: {list(arrays)}, yazılabilir: {arrays['Close'].flags.writeable}")
+    print(f"📊 İndeks: {attach_index(handle, 'SYM0')[:2].tolist()}")
+    release(handle)
+    print("\nShared Data test tamamlandı!")
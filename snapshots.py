@@ -0,0 +1,388 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Snapshots Module
+
+Bu modül, tekrar üretilebilir eğitim ve backtest için değiştirilemez (immutable)
+veri anlık görüntüleri (snapshot) oluşturur.
+
+Bir snapshot; sembol kümesi, tarih aralığı, zaman dilimi, fiyat ayarlama modu ve
+verinin kendisinin içerik özetinden (SHA-256) türetilen bir kimlikle adlandırılır.
+Aynı kimlik her zaman aynı veriyi ifade eder; veri değişirse yeni bir snapshot oluşur.
+
+Sonraki aşamalar (özellikler, modeller, backtestler) kullandıkları snapshot kimliğini
+kaydeder. Aynı snapshot ve aynı parametrelerle üretilmiş çıktılar önbellekten okunur.
+
+Dizin yapısı:
+    {SNAPSHOT_PATH}/{snapshot_id}/
+        manifest.json            - anahtar, semboller, sembol başına içerik özetleri
+        {timeframe}/{symbol}/    - data_store formatında değiştirilemez veri
+        outputs/{stage}/...      - aşama çıktıları önbelleği (joblib)
+    {SNAPSHOT_PATH}/_refs/{key_hash}.json - anahtar -> en güncel snapshot kimliği
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import joblib
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+import data_store
+
+
+_MANIFEST_FILE = 'manifest.json'
+_REFS_DIR = '_refs'
+_OUTPUTS_DIR = 'outputs'
+
+# Kimliğin kısaltılmış uzunluğu (hex karakter)
+SNAPSHOT_ID_LENGTH = 16
+
+
+def snapshot_key(symbols, start_date=None, end_date=None, timeframe=None, adjustment=None):
+    """
+    Snapshot'ı tanımlayan anahtar sözlüğünü üretir.
+
+    Args:
+        symbols (list): Sembol listesi
+        start_date (str): Başlangıç tarihi
+        end_date (str): Bitiş tarihi
+        timeframe (str): Zaman dilimi
+        adjustment (str): Fiyat ayarlama modu
+
+    Returns:
+        dict: Sıralı sembollerle normalize edilmiş anahtar
+    """
+    return {
+        'symbols': sorted(dict.fromkeys(symbols)),
+        'start_date': str(start_date or config.HISTORICAL_DATA_START_DATE),
+        'end_date': str(end_date or config.HISTORICAL_DATA_END_DATE),
+        'timeframe': timeframe or config.PRICE_TIMEFRAME,
+        'adjustment': adjustment or config.PRICE_ADJUSTMENT_MODE
+    }
+
+
+def hash_params(params):
+    """
+    JSON'a çevrilebilir parametrelerin kararlı SHA-256 özetini döndürür.
+
+    Args:
+        params: dict, list veya basit değerler
+
+    Returns:
+        str: Hex özet
+    """
+    encoded = json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def frame_hash(dataframe):
+    """
+    DataFrame'in içerik özetini hesaplar (indeks, kolon adları, tipler ve değerler).
+
+    Args:
+        dataframe (pandas.DataFrame): Özetlenecek veri
+
+    Returns:
+        str: Hex SHA-256 özeti
+    """
+    digest = hashlib.sha256()
+    index = dataframe.index
+    if isinstance(index, pd.DatetimeIndex):
+        if index.tz is not None:
+            index = index.tz_convert('UTC').tz_localize(None)
+        digest.update(np.ascontiguousarray(np.asarray(index.values, dtype='datetime64[ns]').view('int64')).tobytes())
+    else:
+        digest.update(pd.util.hash_pandas_object(index.to_series(), index=False).to_numpy().tobytes())
+
+    for column in dataframe.columns:
+        series = dataframe[column]
+        digest.update(f"{column}:{series.dtype}".encode('utf-8'))
+        if pd.api.types.is_numeric_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+            digest.update(np.ascontiguousarray(series.to_numpy()).tobytes())
+        else:
+            digest.update(pd.util.hash_pandas_object(series, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _snapshot_path(snapshot_id, base_path=None):
+    """Snapshot dizininin yolunu döndürür"""
+    return os.path.join(base_path or config.SNAPSHOT_PATH, snapshot_id)
+
+
+def _ref_path(key, base_path=None):
+    """Anahtarın en güncel snapshot'ını gösteren referans dosyasının yolu"""
+    return os.path.join(base_path or config.SNAPSHOT_PATH, _REFS_DIR, f"{hash_params(key)[:SNAPSHOT_ID_LENGTH]}.json")
+
+
+def create_snapshot(frames, start_date=None, end_date=None, timeframe=None, adjustment=None, base_path=None):
+    """
+    Verilen sembol verilerinden değiştirilemez bir snapshot oluşturur. Aynı içerikte
+    bir snapshot zaten varsa yeniden yazılmaz.
+
+    Args:
+        frames (dict): {symbol: pandas.DataFrame} - ham OHLCV verisi
+        start_date (str): İstenen başlangıç tarihi (anahtara girer)
+        end_date (str): İstenen bitiş tarihi (anahtara girer)
+        timeframe (str): Zaman dilimi
+        adjustment (str): Fiyat ayarlama modu
+        base_path (str): Snapshot kök dizini
+
+    Returns:
+        dict: Snapshot manifestosu ('snapshot_id' dahil)
+        None: Hata durumunda
+    """
+    try:
+        frames = {s: f for s, f in frames.items() if f is not None and len(f) > 0}
+        if not frames:
+            logger.log_warning("Snapshot için veri yok")
+            return None
+
+        key = snapshot_key(list(frames), start_date, end_date, timeframe, adjustment)
+        content = {symbol: frame_hash(frames[symbol]) for symbol in key['symbols']}
+        snapshot_id = hash_params({'key': key, 'content': content})[:SNAPSHOT_ID_LENGTH]
+
+        manifest = read_manifest(snapshot_id, base_path)
+        if manifest is not None:
+            logger.log_info(f"Snapshot zaten mevcut, yeniden kullanılıyor: {snapshot_id}")
+        else:
+            root = _snapshot_path(snapshot_id, base_path)
+            for symbol in key['symbols']:
+                if not data_store.write_frame(frames[symbol], snapshot_id, symbol, key['timeframe'],
+                                              extra_meta={'content_hash': content[symbol]},
+                                              base_path=os.path.dirname(root)):
+                    raise IOError(f"{symbol} snapshot'a yazılamadı")
+
+            manifest = {
+                'snapshot_id': snapshot_id,
+                'key': key,
+                'content': content,
+                'rows': {symbol: int(len(frames[symbol])) for symbol in key['symbols']},
+                'created_at': datetime.now().isoformat()
+            }
+            # Manifesto en son yazılır: manifestosu olmayan snapshot tamamlanmamış sayılır
+            tmp_path = os.path.join(root, f"{_MANIFEST_FILE}.tmp{os.getpid()}")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(tmp_path, os.path.join(root, _MANIFEST_FILE))
+            logger.log_info(f"Snapshot oluşturuldu: {snapshot_id} ({len(key['symbols'])} sembol, "
+                            f"{sum(manifest['rows'].values())} satır)")
+
+        ref_path = _ref_path(key, base_path)
+        os.makedirs(os.path.dirname(ref_path), exist_ok=True)
+        with open(ref_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': key, 'snapshot_id': snapshot_id, 'updated_at': datetime.now().isoformat()}, f, indent=2)
+
+        return manifest
+
+    except Exception as e:
+        logger.log_error(f"Snapshot oluşturma hatası: {e}", exc_info=True)
+        return None
+
+
+def find_snapshot(symbols, start_date=None, end_date=None, timeframe=None, adjustment=None, base_path=None):
+    """
+    Anahtar için en son oluşturulan snapshot'ı bulur (veri çekmeden).
+
+    Returns:
+        dict: Snapshot manifestosu
+        None: Bu anahtar için snapshot yoksa
+    """
+    key = snapshot_key(symbols, start_date, end_date, timeframe, adjustment)
+    ref_path = _ref_path(key, base_path)
+    if not os.path.exists(ref_path):
+        return None
+    try:
+        with open(ref_path, 'r', encoding='utf-8') as f:
+            ref = json.load(f)
+        return read_manifest(ref['snapshot_id'], base_path)
+    except Exception as e:
+        logger.log_error(f"Snapshot referansı okunamadı: {e}")
+        return None
+
+
+def read_manifest(snapshot_id, base_path=None):
+    """
+    Snapshot manifestosunu okur.
+
+    Args:
+        snapshot_id (str): Snapshot kimliği
+        base_path (str): Snapshot kök dizini
+
+    Returns:
+        dict: Manifesto
+        None: Snapshot yoksa veya tamamlanmamışsa
+    """
+    manifest_path = os.path.join(_snapshot_path(snapshot_id, base_path), _MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def list_snapshots(base_path=None):
+    """
+    Tamamlanmış snapshot'ları listeler.
+
+    Returns:
+        pandas.DataFrame: Snapshot başına kimlik, sembol sayısı, tarih aralığı ve oluşturulma zamanı
+    """
+    root = base_path or config.SNAPSHOT_PATH
+    rows = []
+    if os.path.isdir(root):
+        for name in sorted(os.listdir(root)):
+            if name == _REFS_DIR:
+                continue
+            manifest = read_manifest(name, base_path)
+            if manifest is None:
+                continue
+            key = manifest['key']
+            rows.append({
+                'snapshot_id': name,
+                'symbols': len(key['symbols']),
+                'start_date': key['start_date'],
+                'end_date': key['end_date'],
+                'timeframe': key['timeframe'],
+                'adjustment': key['adjustment'],
+                'created_at': manifest['created_at']
+            })
+    return pd.DataFrame(rows, columns=['snapshot_id', 'symbols', 'start_date', 'end_date', 'timeframe',
+                                       'adjustment', 'created_at'])
+
+
+def load_snapshot(snapshot_id, symbols=None, columns=None, mmap=False, base_path=None):
+    """
+    Snapshot verisini okur.
+
+    Args:
+        snapshot_id (str): Snapshot kimliği
+        symbols (list): Okunacak semboller (None ise tümü)
+        columns (list): Okunacak kolonlar (None ise tümü)
+        mmap (bool): True ise sayısal kolonlar bellek eşlemeli okunur
+        base_path (str): Snapshot kök dizini
+
+    Returns:
+        dict: {symbol: pandas.DataFrame}
+        None: Snapshot yoksa
+    """
+    manifest = read_manifest(snapshot_id, base_path)
+    if manifest is None:
+        logger.log_error(f"Snapshot bulunamadı: {snapshot_id}")
+        return None
+
+    store_path = os.path.dirname(_snapshot_path(snapshot_id, base_path))
+    timeframe = manifest['key']['timeframe']
+    frames = {}
+    for symbol in symbols or manifest['key']['symbols']:
+        if symbol not in manifest['content']:
+            logger.log_warning(f"{symbol} snapshot {snapshot_id} içinde yok")
+            continue
+        frame = data_store.read_frame(snapshot_id, symbol, timeframe, columns, mmap=mmap, base_path=store_path)
+        if frame is not None:
+            frames[symbol] = frame
+    return frames
+
+
+def _output_path(snapshot_id, stage, symbol, params, base_path=None):
+    """Aşama çıktısının önbellek dosya yolu"""
+    name = f"{symbol or '_'}_{hash_params(params)[:SNAPSHOT_ID_LENGTH]}.joblib"
+    return os.path.join(_snapshot_path(snapshot_id, base_path), _OUTPUTS_DIR, stage, name)
+
+
+def load_output(snapshot_id, stage, symbol=None, params=None, base_path=None):
+    """
+    Önbellekteki aşama çıktısını okur.
+
+    Args:
+        snapshot_id (str): Girdi snapshot kimliği
+        stage (str): Aşama adı ('features', 'model', 'backtest' vb.)
+        symbol (str): Sembol adı
+        params (dict): Çıktıyı etkileyen parametreler
+
+    Returns:
+        object: Kayıtlı çıktı
+        None: Önbellekte yoksa
+    """
+    path = _output_path(snapshot_id, stage, symbol, params, base_path)
+    if not os.path.exists(path):
+        return None
+    try:
+        return joblib.load(path)
+    except Exception as e:
+        logger.log_warning(f"Aşama önbelleği okunamadı ({path}): {e}")
+        return None
+
+
+def save_output(snapshot_id, stage, output, symbol=None, params=None, base_path=None):
+    """
+    Aşama çıktısını snapshot'a bağlı önbelleğe yazar.
+
+    Returns:
+        bool: Başarı durumu
+    """
+    try:
+        path = _output_path(snapshot_id, stage, symbol, params, base_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp{os.getpid()}"
+        joblib.dump(output, tmp_path)
+        os.replace(tmp_path, path)
+        return True
+    except Exception as e:
+        logger.log_error(f"Aşama önbelleği yazılamadı ({stage}/{symbol}): {e}")
+        return False
+
+
+def cached_output(snapshot_id, stage, compute, symbol=None, params=None, base_path=None):
+    """
+    Aşama çıktısını önbellekten döndürür; yoksa hesaplayıp kaydeder.
+    snapshot_id None ise önbellek kullanılmaz.
+
+    Args:
+        snapshot_id (str): Girdi snapshot kimliği
+        stage (str): Aşama adı
+        compute (callable): Parametresiz, çıktıyı üreten fonksiyon
+        symbol (str): Sembol adı
+        params (dict): Çıktıyı etkileyen parametreler
+
+    Returns:
+        tuple: (output, from_cache)
+    """
+    if snapshot_id is None or not config.SNAPSHOT_OUTPUT_CACHE:
+        return compute(), False
+
+    output = load_output(snapshot_id, stage, symbol, params, base_path)
+    if output is not None:
+        logger.log_info(f"{symbol or ''} {stage} çıktısı snapshot {snapshot_id} önbelleğinden okundu")
+        return output, True
+
+    output = compute()
+    if output is not None:
+        save_output(snapshot_id, stage, output, symbol, params, base_path)
+    return output, False
+
+
+if __name__ == "__main__":
+    """
+    Snapshots modülü test kodu
+    """
+    print("=== AI-FTB Snapshots Test ===")
+
+    import tempfile
+    import data_providers
+
+    provider = data_providers.get_data_provider('synthetic')
+    universe = {s: provider.get_history(s, '2022-01-01', '2023-01-01') for s in ['AAPL', 'MSFT']}
+    tmp_dir = tempfile.mkdtemp()
+
+    manifest = create_snapshot(universe, '2022-01-01', '2023-01-01', base_path=tmp_dir)
+    print(f"✅ Snapshot: {manifest['snapshot_id']}")
+    again = create_snapshot(universe, '2022-01-01', '2023-01-01', base_path=tmp_dir)
+    print(f"✅ Aynı içerik aynı kimlik: {again['snapshot_id'] == manifest['snapshot_id']}")
+
+    frames = load_snapshot(manifest['snapshot_id'], base_path=tmp_dir)
+    print(f"📊 Yüklenen semboller: {list(frames)}")
+    print(list_snapshots(tmp_dir))
+
+    print("\nSnapshots test tamamlandı!")
@@ -0,0 +1,431 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Streaming Indicators Module
+
+Bu modül, canlı modda yeni bir bar geldiğinde tüm teknik göstergeleri geçmişin
+uzunluğundan bağımsız olarak sabit zamanda (O(1)) günceller. Üretilen değerler
+feature_engineer.add_technical_indicators ile aynıdır.
+
+Kullanılan artımlı yöntemler:
+- Hareketli ortalamalar: Kahan telafili kayan toplamlar
+- Standart sapma (Bollinger, Volatilite): kayan pencerede Welford varyansı
+- MACD: pandas ewm(adjust=True) ile aynı EMA özyinelemesi
+- RSI: kazanç/kayıp kayan toplamları
+- Recent_High/Low: monoton deque ile kayan maksimum/minimum
+
+Pencere hesapları pandas'ın kayan pencere algoritmalarını izler (NaN atlama,
+sabit değerli pencerelerde kesin sonuç), böylece toplu hesapla aynı sonuç elde edilir.
+"""
+
+import math
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+import config
+import logger
+
+
+def _div(a, b):
+    """NumPy bölme kurallarıyla (inf/NaN) bölme"""
+    if b == 0.0 or b != b or a != a:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return float(np.float64(a) / np.float64(b))
+    return a / b
+
+
+def _finite(value):
+    """Sonsuz değerleri NaN yapar (toplu hesaptaki replace([inf, -inf], nan) ile aynı)"""
+    return value if math.isfinite(value) else math.nan
+
+
+class _RollingStats:
+    """
+    Sabit pencerede kayan ortalama ve örneklem varyansı (ddof=1).
+    NaN değerler atlanır; pencerede NaN varsa sonuç NaN olur (min_periods=window).
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque()
+        self.nobs = 0
+        self.neg_ct = 0
+        # Ortalama için Kahan telafili toplam (ekleme ve çıkarma telafileri ayrı tutulur)
+        self.sum_x = 0.0
+        self.sum_comp_add = 0.0
+        self.sum_comp_remove = 0.0
+        # Varyans için Welford momentleri
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+        self.var_comp_add = 0.0
+        self.var_comp_remove = 0.0
+        self.prev_value = math.nan
+        self.same_run = 0
+
+    def update(self, value):
+        """Yeni değeri ekler, pencereden çıkanı siler"""
+        self.values.append(value)
+        if len(self.values) > self.window:
+            self._remove(self.values.popleft())
+        self._add(value)
+
+    def _add(self, value):
+        if value != value:
+            return
+        self.nobs += 1
+        if value < 0:
+            self.neg_ct += 1
+        y = value - self.sum_comp_add
+        t = self.sum_x + y
+        self.sum_comp_add = t - self.sum_x - y
+        self.sum_x = t
+
+        prev_mean = self.mean_x - self.var_comp_add
+        y = value - self.var_comp_add
+        t = y - self.mean_x
+        self.var_comp_add = t + self.mean_x - y
+        self.mean_x += t / self.nobs
+        self.ssqdm_x += (value - prev_mean) * (value - self.mean_x)
+
+        if value == self.prev_value:
+            self.same_run += 1
+        else:
+            self.same_run = 1
+        self.prev_value = value
+        if self.same_run >= self.nobs:
+            # Pencerenin tamamı aynı değer: kayan nokta artıkları sıfırlanır
+            self.mean_x = value
+            self.ssqdm_x = 0.0
+
+    def _remove(self, value):
+        if value != value:
+            return
+        self.nobs -= 1
+        if value < 0:
+            self.neg_ct -= 1
+        y = -value - self.sum_comp_remove
+        t = self.sum_x + y
+        self.sum_comp_remove = t - self.sum_x - y
+        self.sum_x = t
+
+        if self.nobs:
+            prev_mean = self.mean_x - self.var_comp_remove
+            y = value - self.var_comp_remove
+            t = y - self.mean_x
+            self.var_comp_remove = t + self.mean_x - y
+            self.mean_x -= t / self.nobs
+            self.ssqdm_x -= (value - prev_mean) * (value - self.mean_x)
+        else:
+            self.mean_x = 0.0
+            self.ssqdm_x = 0.0
+
+    def mean(self):
+        """Pencere ortalaması (pencere dolmadıysa NaN)"""
+        if self.nobs < self.window:
+            return math.nan
+        if self.same_run >= self.nobs:
+            return self.prev_value
+        result = self.sum_x / self.nobs
+        if self.neg_ct == 0 and result < 0:
+            return 0.0
+        if self.neg_ct == self.nobs and result > 0:
+            return 0.0
+        return result
+
+    def std(self):
+        """Pencere standart sapması, ddof=1 (pencere dolmadıysa NaN)"""
+        if self.nobs < self.window or self.nobs <= 1:
+            return math.nan
+        if self.same_run >= self.nobs:
+            return 0.0
+        variance = self.ssqdm_x / (self.nobs - 1)
+        return math.sqrt(variance) if variance > 0 else 0.0
+
+
+class _RollingExtreme:
+    """Monoton deque ile sabit pencerede kayan maksimum veya minimum"""
+
+    def __init__(self, window, maximum=True):
+        self.window = window
+        self.maximum = maximum
+        self.candidates = deque()  # (konum, değer), değerler monoton
+        self.nan_positions = deque()
+        self.position = -1
+
+    def update(self, value):
+        """Yeni değeri ekler ve pencere ekstremumunu döndürür"""
+        self.position += 1
+        oldest = self.position - self.window + 1
+        while self.candidates and self.candidates[0][0] < oldest:
+            self.candidates.popleft()
+        while self.nan_positions and self.nan_positions[0] < oldest:
+            self.nan_positions.popleft()
+
+        if value != value:
+            self.nan_positions.append(self.position)
+        else:
+            if self.maximum:
+                while self.candidates and self.candidates[-1][1] <= value:
+                    self.candidates.pop()
+            else:
+                while self.candidates and self.candidates[-1][1] >= value:
+                    self.candidates.pop()
+            self.candidates.append((self.position, value))
+
+        if self.position + 1 < self.window or self.nan_positions or not self.candidates:
+            return math.nan
+        return self.candidates[0][1]
+
+
+class _EWMA:
+    """pandas ewm(span=..., adjust=True).mean() ile aynı özyinelemeli üstel ortalama"""
+
+    def __init__(self, span):
+        alpha = 2.0 / (span + 1.0)
+        self.old_wt_factor = 1.0 - alpha
+        self.weighted = math.nan
+        self.old_wt = 1.0
+
+    def update(self, value):
+        """Yeni değeri ekler ve güncel ortalamayı döndürür"""
+        observed = value == value
+        if self.weighted == self.weighted:
+            self.old_wt *= self.old_wt_factor
+            if observed:
+                if self.weighted != value:
+                    self.weighted = (self.old_wt * self.weighted + value) / (self.old_wt + 1.0)
+                self.old_wt += 1.0
+        elif observed:
+            self.weighted = value
+        return self.weighted
+
+
+class StreamingIndicators:
+    """
+    Tek bir sembol için artımlı teknik gösterge hesaplayıcısı. Her update çağrısı
+    add_technical_indicators'ın aynı bar için ürettiği satırı döndürür.
+    """
+
+    def __init__(self, params=None):
+        """
+        Args:
+            params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        """
+        params = dict(config.TECHNICAL_INDICATORS if params is None else params)
+        self.params = params
+        self.sma_short = params['SMA_SHORT_PERIOD']
+        self.sma_long = params['SMA_LONG_PERIOD']
+        self.rsi_period = params['RSI_PERIOD']
+        self.bb_period = params['BB_PERIOD']
+        self.bb_std = params['BB_STD']
+        self.vol_period = params['VOLATILITY_PERIOD']
+
+        # Aynı periyottaki kapanış pencereleri paylaşılır (ör. SMA_20 ve Bollinger orta bandı)
+        self._close_windows = {p: _RollingStats(p) for p in
+                               {self.sma_short, self.sma_long, self.bb_period, self.vol_period}}
+        self._gains = _RollingStats(self.rsi_period)
+        self._losses = _RollingStats(self.rsi_period)
+        self._ema_fast = _EWMA(params['MACD_FAST'])
+        self._ema_slow = _EWMA(params['MACD_SLOW'])
+        self._ema_signal = _EWMA(params['MACD_SIGNAL'])
+        self._volume_window = _RollingStats(20)
+        self._recent_high = _RollingExtreme(20, maximum=True)
+        self._recent_low = _RollingExtreme(20, maximum=False)
+        self._closes = deque(maxlen=11)  # shift(1), shift(5), shift(10) için
+        self._previous_volume = math.nan
+        self.bars = 0
+
+    @property
+    def columns(self):
+        """Üretilen gösterge sütunları (add_technical_indicators ile aynı sırada)"""
+        return [f'SMA_{self.sma_short}', f'SMA_{self.sma_long}', 'RSI', 'MACD', 'MACD_Signal', 'MACD_Hist',
+                'BB_Upper', 'BB_Middle', 'BB_Lower', 'BB_Width', 'BB_Position', 'Volatility',
+                'Volume_Change', 'Volume_SMA', 'Volume_Ratio', 'Price_Change', 'Price_Change_5d',
+                'High_Low_Ratio', 'Momentum_10', 'ROC_5', 'Recent_High', 'Recent_Low', 'Position_in_Range']
+
+    def update(self, open_price, high, low, close, volume):
+        """
+        Yeni bir tamamlanmış barı işler.
+
+        Args:
+            open_price (float): Açılış
+            high (float): En yüksek
+            low (float): En düşük
+            close (float): Kapanış
+            volume (float): Hacim
+
+        Returns:
+            dict: {sütun: değer} - bu bar için gösterge değerleri
+        """
+        high, low, close, volume = float(high), float(low), float(close), float(volume)
+        self.bars += 1
+        self._closes.append(close)
+
+        def lag(n):
+            return self._closes[-1 - n] if len(self._closes) > n else math.nan
+
+        for window in self._close_windows.values():
+            window.update(close)
+
+        # RSI: ilk barın farkı NaN'dır ve kazanç/kayıp olarak 0 sayılır (toplu hesapla aynı)
+        delta = close - lag(1)
+        self._gains.update(delta if delta > 0 else 0.0)
+        self._losses.update(-delta if delta < 0 else -0.0)
+        rs = _div(self._gains.mean(), self._losses.mean())
+        rsi = 100 - _div(100, 1 + rs)
+
+        macd = self._ema_fast.update(close) - self._ema_slow.update(close)
+        signal = self._ema_signal.update(macd)
+
+        bb_window = self._close_windows[self.bb_period]
+        bb_middle = bb_window.mean()
+        bb_deviation = bb_window.std() * self.bb_std
+        bb_upper = bb_middle + bb_deviation
+        bb_lower = bb_middle - bb_deviation
+
+        self._volume_window.update(volume)
+        volume_sma = self._volume_window.mean()
+        volume_change = _div(volume, self._previous_volume) - 1
+        self._previous_volume = volume
+
+        recent_high = self._recent_high.update(high)
+        recent_low = self._recent_low.update(low)
+
+        values = {
+            f'SMA_{self.sma_short}': self._close_windows[self.sma_short].mean(),
+            f'SMA_{self.sma_long}': self._close_windows[self.sma_long].mean(),
+            'RSI': rsi,
+            'MACD': macd,
+            'MACD_Signal': signal,
+            'MACD_Hist': macd - signal,
+            'BB_Upper': bb_upper,
+            'BB_Middle': bb_middle,
+            'BB_Lower': bb_lower,
+            'BB_Width': _div(bb_upper - bb_lower, bb_middle),
+            'BB_Position': _div(close - bb_lower, bb_upper - bb_lower),
+            'Volatility': self._close_windows[self.vol_period].std(),
+            'Volume_Change': volume_change,
+            'Volume_SMA': volume_sma,
+            'Volume_Ratio': _div(volume, volume_sma),
+            'Price_Change': _div(close, lag(1)) - 1,
+            'Price_Change_5d': _div(close, lag(5)) - 1,
+            'High_Low_Ratio': _div(high - low, close),
+            'Momentum_10': _div(close, lag(10)) - 1,
+            'ROC_5': _div(close - lag(5), lag(5)) * 100,
+            'Recent_High': recent_high,
+            'Recent_Low': recent_low,
+            'Position_in_Range': _div(close - recent_low, recent_high - recent_low)
+        }
+        return {column: _finite(value) for column, value in values.items()}
+
+    def warm_up(self, dataframe):
+        """
+        Geçmiş barları sırayla işleyerek durumu hazırlar (canlı moda geçişten önce bir kez).
+
+        Args:
+            dataframe (pandas.DataFrame): OHLCV verisi
+
+        Returns:
+            pandas.DataFrame: Girdi ve her bar için gösterge değerleri
+        """
+        columns = [dataframe[c].to_numpy(dtype=np.float64) for c in ['Open', 'High', 'Low', 'Close', 'Volume']]
+        rows = [self.update(*bar) for bar in zip(*columns)]
+        indicators = pd.DataFrame(rows, index=dataframe.index, columns=self.columns)
+        return pd.concat([dataframe, indicators], axis=1)
+
+
+class StreamingIndicatorEngine:
+    """
+    Çok sembollü canlı gösterge motoru. BarAggregator'ın yayınladığı bar kayıtlarını
+    doğrudan işler; her (sembol, zaman dilimi) için ayrı bir durum tutar.
+    """
+
+    def __init__(self, params=None):
+        """
+        Args:
+            params (dict): Gösterge parametreleri (None ise config.TECHNICAL_INDICATORS)
+        """
+        self.params = params
+        self._states = {}
+        self.latest = {}
+
+    def state(self, symbol, timeframe=None):
+        """Sembol ve zaman dilimi için hesaplayıcıyı döndürür (yoksa oluşturur)"""
+        key = (symbol, timeframe)
+        if key not in self._states:
+            self._states[key] = StreamingIndicators(self.params)
+        return self._states[key]
+
+    def warm_up(self, symbol, dataframe, timeframe=None):
+        """
+        Sembolün geçmiş verisiyle durumunu hazırlar.
+
+        Args:
+            symbol (str): İşlem sembolü
+            dataframe (pandas.DataFrame): OHLCV verisi
+            timeframe (str): Zaman dilimi
+
+        Returns:
+            pandas.DataFrame: Göstergeler eklenmiş geçmiş veri
+        """
+        self._states.pop((symbol, timeframe), None)
+        data = self.state(symbol, timeframe).warm_up(dataframe)
+        if len(data):
+            self.latest[(symbol, timeframe)] = data.iloc[-1].to_dict()
+        logger.log_info(f"{symbol}: Canlı gösterge durumu {len(dataframe)} barla hazırlandı")
+        return data
+
+    def on_bar(self, bar):
+        """
+        Tamamlanmış bir bar kaydını işler (bar_aggregator çıktısı biçiminde).
+
+        Args:
+            bar (dict): 'symbol', 'timeframe', 'timestamp', 'Open', 'High', 'Low', 'Close', 'Volume'
+
+        Returns:
+            dict: Bar alanları ve gösterge değerleri
+        """
+        symbol, timeframe = bar['symbol'], bar.get('timeframe')
+        values = self.state(symbol, timeframe).update(bar['Open'], bar['High'], bar['Low'],
+                                                      bar['Close'], bar['Volume'])
+        row = dict(bar)
+        row.update(values)
+        self.latest[(symbol, timeframe)] = row
+        return row
+
+    def on_bars(self, bars):
+        """
+        Birden fazla bar kaydını sırayla işler.
+
+        Returns:
+            list: Her bar için on_bar sonucu
+        """
+        return [self.on_bar(bar) for bar in bars]
+
+
+if __name__ == "__main__":
+    """
+    Streaming Indicators modülü test kodu
+    """
+    print("=== AI-FTB Streaming Indicators Test ===")
+
+    import time
+    import data_providers
+    import feature_engineer
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2015-01-01', '2024-01-01')
+    warm, live = history.iloc[:-250], history.iloc[-250:]
+
+    engine = StreamingIndicatorEngine()
+    engine.warm_up('AAPL', warm)
+
+    started = time.perf_counter()
+    rows = [engine.on_bar({'symbol': 'AAPL', 'timestamp': ts, **bar}) for ts, bar in live.to_dict('index').items()]
+    per_bar = (time.perf_counter() - started) / len(rows)
+
+    batch = feature_engineer.add_technical_indicators(history).iloc[-1]
+    difference = max(abs(rows[-1][c] - batch[c]) for c in engine.state('AAPL').columns if batch[c] == batch[c])
+    print(f"✅ Bar başına {per_bar * 1e6:.1f} µs ({len(history)} barlık geçmiş)")
+    print(f"📊 Toplu hesapla en büyük fark: {difference:.2e}")
+
+    print("\nStreaming Indicators test tamamlandı!")
@@ -0,0 +1,168 @@
+"""
+test_bar_aggregator.py - Bar Aggregator modülü için birim testler
+
+Bu dosya akış halindeki bar birleştirme motorunu test eder:
+- Akış ve vektörel birleştirmenin aynı barları üretmesi
+- Sadece tamamlanmış barların yayınlanması
+- Seans sınırları ve prepost filtresi
+- Tick verisi ve replay dosyası
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bar_aggregator
+import data_providers
+import data_handler
+
+
+def _minute_bars(start='2023-03-06', end='2023-03-08', symbol='AAPL'):
+    """Sentetik sağlayıcıdan 1 dakikalık barlar"""
+    return data_providers.SyntheticDataProvider(seed=5).get_history(symbol, start, end, '1m')
+
+
+def _stream(aggregator, symbol, bars):
+    """Barları sırayla aggregator'a verir ve yayınlananları toplar"""
+    emitted = []
+    for ts, row in bars.iterrows():
+        emitted.extend(aggregator.update_bar(symbol, ts, row['Open'], row['High'], row['Low'],
+                                             row['Close'], row['Volume']))
+    return emitted
+
+
+class TestBarAggregator(unittest.TestCase):
+    """Akış halinde bar birleştirme testleri"""
+
+    def test_streaming_matches_vectorized(self):
+        """Akış motoru ile vektörel birleştirme aynı barları üretmeli"""
+        bars = _minute_bars()
+        timeframes = ['5m', '15m', '1h', '1d']
+        frames = bar_aggregator.bars_to_frame(_stream(bar_aggregator.BarAggregator(timeframes), 'AAPL', bars))
+
+        for timeframe in timeframes:
+            expected = bar_aggregator.aggregate_bars(bars, timeframe, 'AAPL')
+            streamed = frames[timeframe][['Open', 'High', 'Low', 'Close', 'Volume']]
+            pd.testing.assert_frame_equal(streamed, expected, check_dtype=False, check_freq=False)
+
+        self.assertEqual(len(frames['5m']), 2 * 78)
+        self.assertEqual(len(frames['1d']), 2)
+        np.testing.assert_allclose(frames['1d']['Volume'].to_numpy(),
+                                   bars.groupby(bars.index.date)['Volume'].sum().to_numpy())
+
+    def test_emits_only_finished_bars(self):
+        """Yarım barlar yayınlanmamalı"""
+        bars = _minute_bars().iloc[:8]  # 09:30 - 09:37
+        aggregator = bar_aggregator.BarAggregator(['5m', '1h'])
+        emitted = _stream(aggregator, 'AAPL', bars)
+
+        self.assertEqual([(b['timeframe'], b['timestamp'].strftime('%H:%M')) for b in emitted], [('5m', '09:30')])
+
+        flushed = aggregator.flush()
+        self.assertEqual(sorted(b['timeframe'] for b in flushed), ['1h', '5m'])
+
+    def test_session_boundary(self):
+        """Son saatlik bar seans kapanışında kesilmeli"""
+        bars = _minute_bars(end='2023-03-07')
+        hourly = bar_aggregator.aggregate_bars(bars, '1h', 'AAPL')
+
+        self.assertEqual(hourly.index[-1].strftime('%H:%M'), '15:30')
+        self.assertEqual(hourly['Volume'].iloc[-1], bars.between_time('15:30', '15:59')['Volume'].sum())
+        self.assertEqual(hourly['Close'].iloc[-1], bars['Close'].iloc[-1])
+
+    def test_prepost_filter(self):
+        """Seans dışı barlar sadece prepost açıkken gün içi barlara girmeli"""
+        regular = _minute_bars(end='2023-03-07')
+        extended_index = pd.date_range('2023-03-06 16:00', '2023-03-06 16:59', freq='min', tz=regular.index.tz)
+        extended = pd.DataFrame({c: 100.0 for c in ['Open', 'High', 'Low', 'Close']}, index=extended_index)
+        extended['Volume'] = 10
+        bars = pd.concat([regular, extended])
+
+        without = bar_aggregator.aggregate_bars(bars, '15m', 'AAPL', prepost=False)
+        with_prepost = bar_aggregator.aggregate_bars(bars, '15m', 'AAPL', prepost=True)
+        daily = bar_aggregator.aggregate_bars(bars, '1d', 'AAPL', prepost=True)
+
+        self.assertEqual(len(without), 26)
+        self.assertEqual(len(with_prepost), 30)
+        self.assertEqual(daily['Volume'].iloc[0], regular['Volume'].sum())
+
+    def test_tick_stream_and_advance_time(self):
+        """Tick'ler zaman ilerleyince tamamlanmış bar üretmeli"""
+        aggregator = bar_aggregator.BarAggregator(['5m'])
+        ticks = [('2023-03-06 09:30:05', 10.0, 5), ('2023-03-06 09:33:00', 12.0, 1),
+                 ('2023-03-06 09:34:59', 9.0, 2)]
+        emitted = []
+        for ts, price, size in ticks:
+            emitted.extend(aggregator.update_tick('AAPL', ts, price, size))
+        self.assertEqual(emitted, [])
+
+        emitted = aggregator.update_tick('AAPL', '2023-03-06 09:35:01', 11.0, 1)
+        self.assertEqual(len(emitted), 1)
+        bar = emitted[0]
+        self.assertEqual((bar['Open'], bar['High'], bar['Low'], bar['Close'], bar['Volume']), (10.0, 12.0, 9.0, 9.0, 8))
+
+        emitted = aggregator.advance_time('2023-03-06 09:40:00')
+        self.assertEqual(emitted[0]['timestamp'], pd.Timestamp('2023-03-06 09:35'))
+
+    def test_bist_session_alignment(self):
+        """Borsa İstanbul sembolleri 10:00 açılışına hizalanmalı"""
+        index = pd.date_range('2023-03-06 10:00', '2023-03-06 17:59', freq='min', tz='Europe/Istanbul')
+        bars = pd.DataFrame({'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Volume': 1}, index=index)
+        hourly = bar_aggregator.aggregate_bars(bars.tz_convert('UTC'), '1h', 'THYAO.IS')
+
+        self.assertEqual(len(hourly), 8)
+        self.assertEqual(str(hourly.index.tz), 'Europe/Istanbul')
+        self.assertEqual(hourly.index[0].strftime('%H:%M'), '10:00')
+
+    def test_invalid_timeframe(self):
+        """Desteklenmeyen zaman dilimi hata vermeli"""
+        with self.assertRaises(ValueError):
+            bar_aggregator.parse_timeframe('1w')
+
+
+class TestReplayAndFetch(unittest.TestCase):
+    """Replay dosyası ve çoklu zaman dilimi çekme testleri"""
+
+    def setUp(self):
+        """Geçici dizin hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_replay_tick_file(self):
+        """Tick replay dosyasından tamamlanmış barlar üretilmeli"""
+        index = pd.date_range('2023-03-06 09:30', '2023-03-06 10:29:59', freq='10s')
+        ticks = pd.DataFrame({'Price': np.linspace(100, 110, len(index)), 'Size': 1}, index=index)
+        path = os.path.join(self.tmp_dir, 'ticks.csv')
+        ticks.to_csv(path)
+
+        frames = bar_aggregator.replay_file(path, 'AAPL', ['15m'])
+
+        self.assertEqual(len(frames['15m']), 3)  # son bar yeni tick gelmediği için yarım kalır
+        self.assertEqual(frames['15m']['Volume'].iloc[0], 90)
+
+    def test_fetch_historical_timeframes(self):
+        """Temel veri bir kez çekilip zaman dilimleri yerelde üretilmeli"""
+        bars = _minute_bars(end='2023-03-10')
+        with patch('config.DATA_CACHE_ENABLED', False), \
+             patch('data_handler._download_bars', return_value=bars) as download:
+            frames = data_handler.fetch_historical_timeframes('AAPL', ['1m', '15m', '1d'], '2023-03-06', '2023-03-10')
+
+        self.assertEqual(download.call_count, 1)
+        self.assertEqual(len(frames['1m']), len(bars))
+        self.assertEqual(len(frames['15m']), 4 * 26)
+        self.assertEqual(len(frames['1d']), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,152 @@
+"""
+test_corporate_actions.py - Corporate Actions modülü için birim testler
+
+Bu dosya ham barlar üzerinde yerel bölünme/temettü ayarlamasını test eder:
+- Bölünme sonrası fiyat sürekliliği ve hacim ayarlaması
+- Temettü faktörlerinin döngüsel referans hesapla aynı olması
+- Ayarlama modları ('raw', 'split', 'adjusted')
+- Kurumsal işlem tablosunun kaydı ve data_handler entegrasyonu
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import corporate_actions
+import data_providers
+import data_handler
+
+
+def _raw_bars():
+    """4:1 bölünmesi olan ham günlük barlar"""
+    dates = pd.bdate_range('2023-01-02', '2023-03-31')
+    close = np.linspace(100, 120, len(dates))
+    close[dates >= '2023-02-15'] /= 4
+    return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+                         'Volume': np.full(len(dates), 1000, dtype=np.int64)}, index=dates)
+
+
+def _reference_factors(index, close, actions):
+    """Döngüsel referans: her bar için kendisinden sonraki işlemlerin çarpımı"""
+    factors = np.ones(len(index))
+    for ex_date, row in actions.iterrows():
+        before = np.where(index < ex_date)[0]
+        if len(before) == 0:
+            continue
+        factor = 1.0
+        if row['Stock Splits'] > 0:
+            factor /= row['Stock Splits']
+        if row['Dividends'] > 0:
+            factor *= 1 - row['Dividends'] / close[before[-1]]
+        factors[before] *= factor
+    return factors
+
+
+class TestAdjustments(unittest.TestCase):
+    """Ayarlama faktörü testleri"""
+
+    def test_split_adjustment(self):
+        """Bölünme öncesi fiyatlar bölünmeli, hacim çarpılmalı"""
+        raw = _raw_bars()
+        actions = pd.DataFrame({'Dividends': [0.0], 'Stock Splits': [4.0]},
+                               index=pd.DatetimeIndex(['2023-02-15']))
+
+        adjusted = corporate_actions.apply_adjustments(raw, actions, 'split')
+
+        before = raw.index < '2023-02-15'
+        np.testing.assert_allclose(adjusted['Close'][before], raw['Close'][before] / 4)
+        np.testing.assert_allclose(adjusted['Close'][~before], raw['Close'][~before])
+        self.assertTrue((adjusted['Volume'][before] == 4000).all())
+        self.assertTrue((adjusted['Volume'][~before] == 1000).all())
+        # Bölünme günü fiyat sıçraması kalmamalı
+        self.assertLess(adjusted['Close'].pct_change().abs().max(), 0.01)
+        self.assertEqual(raw['Close'].iloc[0], 100.0)  # girdi değişmemeli
+
+    def test_matches_reference(self):
+        """Vektörel faktörler döngüsel referansla aynı olmalı"""
+        raw = _raw_bars()
+        actions = pd.DataFrame({'Dividends': [0.5, 0.0, 0.2, 1.0], 'Stock Splits': [0.0, 4.0, 0.0, 0.0]},
+                               index=pd.DatetimeIndex(['2023-01-20', '2023-02-15', '2023-03-10', '2022-06-01']))
+
+        adjusted = corporate_actions.apply_adjustments(raw, actions, 'adjusted')
+        expected = _reference_factors(raw.index, raw['Close'].to_numpy(),
+                                      corporate_actions.normalize_actions(actions))
+
+        np.testing.assert_allclose(adjusted['Close'].to_numpy(), raw['Close'].to_numpy() * expected)
+        np.testing.assert_allclose(adjusted['Open'].to_numpy(), raw['Open'].to_numpy() * expected)
+
+    def test_modes(self):
+        """'raw' ayarlama yapmamalı, 'split' temettüleri yok saymalı"""
+        raw = _raw_bars()
+        actions = pd.DataFrame({'Dividends': [0.5]}, index=pd.DatetimeIndex(['2023-01-20']))
+
+        pd.testing.assert_frame_equal(corporate_actions.apply_adjustments(raw, actions, 'raw'), raw)
+        pd.testing.assert_frame_equal(corporate_actions.apply_adjustments(raw, actions, 'split'), raw)
+        self.assertLess(corporate_actions.apply_adjustments(raw, actions, 'adjusted')['Close'].iloc[0], 100.0)
+        with self.assertRaises(ValueError):
+            corporate_actions.apply_adjustments(raw, actions, 'total_return')
+
+    def test_remove_split_adjustment_roundtrip(self):
+        """Bölünme ayarını kaldırmak ayarlamanın tersi olmalı"""
+        raw = _raw_bars()
+        splits = pd.Series([4.0], index=pd.DatetimeIndex(['2023-02-15']))
+        adjusted = corporate_actions.apply_adjustments(raw, pd.DataFrame({'Stock Splits': splits}), 'split')
+
+        restored = corporate_actions.remove_split_adjustment(adjusted, splits)
+
+        pd.testing.assert_frame_equal(restored, raw)
+
+
+class TestActionsTable(unittest.TestCase):
+    """Kurumsal işlem tablosu ve data_handler entegrasyonu testleri"""
+
+    def setUp(self):
+        """Geçici depo dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_record_and_load(self):
+        """Kaydedilen işlemler tabloda birleşmeli"""
+        corporate_actions.record_action('AAPL', '2020-08-31', split_ratio=4, base_path=self.tmp_dir)
+        corporate_actions.record_action('AAPL', '2023-02-10', dividend=0.23, base_path=self.tmp_dir)
+
+        actions = corporate_actions.get_actions('AAPL', refresh=False, base_path=self.tmp_dir)
+
+        self.assertEqual(len(actions), 2)
+        self.assertEqual(actions.loc['2020-08-31', 'Stock Splits'], 4.0)
+        self.assertAlmostEqual(actions.loc['2023-02-10', 'Dividends'], 0.23)
+
+    def test_fetch_applies_recorded_split(self):
+        """Yeni bir bölünme yeniden indirme olmadan okunan veriye yansımalı"""
+        with patch('config.DATA_STORE_PATH', self.tmp_dir), \
+             patch('config.DATA_PROVIDER', 'synthetic'), \
+             patch('config.LOCAL_PRICE_ADJUSTMENT', True), \
+             patch('config.PRICE_ADJUSTMENT_MODE', 'adjusted'):
+            before = data_handler.fetch_historical_data('AAPL', '2023-01-01', '2023-07-01', '1d')
+            corporate_actions.record_action('AAPL', '2023-04-03', split_ratio=2)
+            after = data_handler.fetch_historical_data('AAPL', '2023-01-01', '2023-07-01', '1d')
+
+        split = after.index < '2023-04-03'
+        np.testing.assert_allclose(after['Close'][split], before['Close'][split] / 2)
+        np.testing.assert_allclose(after['Close'][~split], before['Close'][~split])
+
+    def test_provider_actions_default_empty(self):
+        """Kurumsal işlem vermeyen sağlayıcı boş tablo döndürmeli"""
+        actions = data_providers.SyntheticDataProvider().get_actions('AAPL')
+        self.assertEqual(list(actions.columns), ['Dividends', 'Stock Splits'])
+        self.assertEqual(len(actions), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
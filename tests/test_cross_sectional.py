@@ -0,0 +1,97 @@
+"""
+test_cross_sectional.py - Cross-Sectional Features modülü için birim testler
+
+Bu dosya tarih başına evrene göre özellikleri test eder:
+- Sıra, z-skor ve sektör farklarının pandas groupby/rank referansıyla aynı olması
+- Farklı takvimli sembollerde yalnızca o tarihte işlem görenlerin kullanılması
+- Yetersiz evrenli tarihlerin NaN olması
+- Kesitsel sütunların model özelliklerine girmesi
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cross_sectional
+import feature_engineer
+import ml_model
+import data_providers
+
+
+SECTORS = {'AAPL': 'Tech', 'MSFT': 'Tech', 'GOOGL': 'Tech', 'AKBNK.IS': 'Bank', 'GARAN.IS': 'Bank'}
+
+
+def _frames():
+    """Farklı başlangıç tarihli sentetik semboller"""
+    provider = data_providers.SyntheticDataProvider(seed=2)
+    frames = {s: provider.get_history(s, '2020-01-01', '2021-06-01') for s in SECTORS}
+    frames['MSFT'] = frames['MSFT'].iloc[40:]
+    return frames
+
+
+def _long_table(result, columns):
+    """Sembol sonuçlarını (tarih, sembol) uzun tabloya çevirir"""
+    return pd.concat({s: frame[columns] for s, frame in result.items()}, names=['Symbol', 'Date']).reset_index()
+
+
+class TestCrossSectional(unittest.TestCase):
+    """Kesitsel özellik testleri"""
+
+    def test_matches_groupby_reference(self):
+        """Özellikler tarih bazlı pandas hesaplarıyla aynı olmalı"""
+        result = cross_sectional.add_cross_sectional_features(_frames(), SECTORS, min_symbols=3)
+        table = _long_table(result, ['Price_Change', 'Momentum_10', 'RSI'] + list(cross_sectional.CROSS_SECTIONAL_SOURCES))
+        table['Sector'] = table['Symbol'].map(SECTORS)
+
+        by_date = table.groupby('Date')['Price_Change']
+        rank = by_date.rank(pct=True)
+        rank[by_date.transform('count') < 3] = np.nan
+        zscore = (table['Price_Change'] - by_date.transform('mean')) / by_date.transform(lambda x: x.std(ddof=0))
+        zscore[by_date.transform('count') < 3] = np.nan
+        by_sector = table.groupby(['Date', 'Sector'])['Momentum_10']
+        sector = table['Momentum_10'] - by_sector.transform('mean')
+        sector[by_sector.transform('count') < 2] = np.nan
+
+        np.testing.assert_allclose(table['CS_Return_Rank'], rank, rtol=1e-12)
+        np.testing.assert_allclose(table['CS_Return_ZScore'], zscore, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(table['CS_Momentum_Sector'], sector, rtol=1e-9, atol=1e-12)
+        np.testing.assert_allclose(table['CS_RSI_Percentile'], table.groupby('Date')['RSI'].rank(pct=True),
+                                   rtol=1e-12)
+
+    def test_calendar_and_universe_size(self):
+        """İşlem görmeyen sembol sıraya katılmamalı; küçük evren NaN vermeli"""
+        frames = _frames()
+        result = cross_sectional.add_cross_sectional_features(frames, SECTORS, min_symbols=5)
+
+        self.assertEqual(len(result['MSFT']), len(frames['MSFT']))
+        early = result['AAPL']['CS_Return_Rank'].iloc[5:40]  # MSFT henüz yok -> 4 sembol
+        self.assertTrue(early.isna().all())
+        self.assertTrue(result['AAPL']['CS_Return_Rank'].iloc[60:].notna().all())
+        self.assertTrue(((result['AAPL']['CS_Return_Rank'].iloc[60:] * 5) % 1 == 0).all())
+
+    def test_features_reach_ml_data(self):
+        """Kesitsel sütunlar ölçeklenmeli ve model özelliklerine girmeli"""
+        names = list(cross_sectional.CROSS_SECTIONAL_SOURCES)
+        self.assertEqual(feature_engineer.model_features({}, cross_sectional_features=True)[-len(names):], names)
+        self.assertFalse(set(names) & set(feature_engineer.model_features({}, cross_sectional_features=False)))
+
+        result = cross_sectional.add_cross_sectional_features(_frames(), SECTORS, min_symbols=3)
+        with patch('config.MULTI_TIMEFRAME_FEATURES', {}), patch('config.CROSS_SECTIONAL_FEATURES_ENABLED', True):
+            data = feature_engineer.create_target_variable(
+                feature_engineer.add_technical_indicators(result['AAPL'], features=['RSI', 'SMA_20']))
+            normalized, _ = feature_engineer.normalize_features(data, save_scaler=False)
+            feature_names = ml_model.prepare_data_for_ml(normalized)[4]
+
+        for name in names:
+            self.assertIn(name, feature_names)
+            self.assertIn(f'{name}_scaled', feature_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
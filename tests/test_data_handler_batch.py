@@ -0,0 +1,153 @@
+"""
+test_data_handler_batch.py - data_handler toplu veri çekme için birim testler
+
+Bu dosya fetch_historical_data_many fonksiyonunu ağ kullanmadan, yerel bir
+sahte veri kaynağıyla test eder:
+- Eşzamanlı çekme ve sonuç sırası
+- Sembol başına yeniden deneme
+- Sembol başına hata raporlama
+- Sınırlı iş parçacığı havuzu ile verim
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import threading
+import time
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_handler
+
+
+def _bars(symbol, start_date, end_date, timeframe):
+    """Yerel sahte veri kaynağı - sembole göre deterministik OHLCV"""
+    dates = pd.bdate_range(start_date, end_date, inclusive='left')
+    base = 50 + (sum(map(ord, symbol)) % 100)
+    close = base + np.arange(len(dates), dtype=float)
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': np.full(len(dates), 1000)
+    }, index=dates)
+
+
+class TestFetchHistoricalDataMany(unittest.TestCase):
+    """fetch_historical_data_many testleri"""
+
+    def setUp(self):
+        """Önbelleği kapatır ve bekleme süresini sıfırlar"""
+        self.patches = [
+            patch('config.DATA_CACHE_ENABLED', False),
+            patch('config.DATA_OFFLINE_MODE', False),
+            patch('config.DATA_FETCH_RETRY_BACKOFF', 0.0),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        """Patch'leri kaldırır"""
+        for p in self.patches:
+            p.stop()
+
+    def test_returns_frames_in_input_order(self):
+        """Tüm semboller giriş sırasıyla dönmeli"""
+        symbols = ['MSFT', 'AAPL', 'GOOGL', 'AAPL']
+        with patch('data_handler._download_bars', side_effect=_bars):
+            data, failures = data_handler.fetch_historical_data_many(symbols, '2023-01-01', '2023-06-01')
+
+        self.assertEqual(list(data.keys()), ['MSFT', 'AAPL', 'GOOGL'])
+        self.assertEqual(failures, {})
+        self.assertEqual(data['AAPL']['Close'].iloc[0], _bars('AAPL', '2023-01-01', '2023-06-01', '1d')['Close'].iloc[0])
+
+    def test_transient_errors_are_retried(self):
+        """Geçici hatalar yeniden denenmeli"""
+        attempts = {'AAPL': 0}
+        lock = threading.Lock()
+
+        def flaky(symbol, start_date, end_date, timeframe):
+            with lock:
+                attempts[symbol] = attempts.get(symbol, 0) + 1
+                if symbol == 'AAPL' and attempts[symbol] < 3:
+                    raise ConnectionError('geçici hata')
+            return _bars(symbol, start_date, end_date, timeframe)
+
+        with patch('data_handler._download_bars', side_effect=flaky):
+            data, failures = data_handler.fetch_historical_data_many(['AAPL', 'MSFT'], '2023-01-01', '2023-06-01',
+                                                                     max_retries=3)
+
+        self.assertIn('AAPL', data)
+        self.assertEqual(attempts['AAPL'], 3)
+        self.assertEqual(failures, {})
+
+    def test_failures_reported_per_symbol(self):
+        """Kalıcı hatalar ve boş veri sembol bazında raporlanmalı"""
+        def source(symbol, start_date, end_date, timeframe):
+            if symbol == 'BAD':
+                raise ValueError('geçersiz sembol')
+            if symbol == 'EMPTY':
+                return pd.DataFrame()
+            return _bars(symbol, start_date, end_date, timeframe)
+
+        with patch('data_handler._download_bars', side_effect=source):
+            data, failures = data_handler.fetch_historical_data_many(['AAPL', 'BAD', 'EMPTY'], '2023-01-01',
+                                                                     '2023-06-01', max_retries=1)
+
+        self.assertEqual(list(data.keys()), ['AAPL'])
+        self.assertIn('geçersiz sembol', failures['BAD'])
+        self.assertIn('EMPTY', failures)
+
+    def test_quality_scan_sees_uncleaned_bars(self):
+        """Kalite taraması doldurulmadan önceki eksik ve sıfır fiyatları görmeli"""
+        def gappy(symbol, start_date, end_date, timeframe):
+            bars = _bars(symbol, start_date, end_date, timeframe)
+            if symbol == 'AAPL':
+                bars.iloc[10:13, bars.columns.get_loc('Close')] = np.nan
+                bars.iloc[20, bars.columns.get_loc('Low')] = 0.0
+            return bars
+
+        reports = []
+        scan_frames = data_handler.data_quality.scan_frames
+        with patch('data_handler._download_bars', side_effect=gappy), \
+                patch('data_quality.scan_frames', side_effect=lambda frames: reports.append(scan_frames(frames))):
+            data, _ = data_handler.fetch_historical_data_many(['AAPL', 'MSFT'], '2023-01-01', '2023-06-01',
+                                                              quality_scan=True)
+
+        self.assertFalse(data['AAPL']['Close'].isnull().any())
+        report = reports[0]
+        self.assertEqual(list(report.index), ['AAPL', 'MSFT'])
+        self.assertEqual(report.loc['AAPL', 'missing_values'], 3)
+        self.assertEqual(report.loc['AAPL', 'non_positive_prices'], 1)
+        self.assertEqual(report.loc['AAPL', 'stale_bars'], 0)
+
+    def test_bounded_pool_throughput(self):
+        """Gecikmeli kaynakta paralel çekme seri çekmeden hızlı olmalı ve sınırı aşmamalı"""
+        latency = 0.05
+        active = {'now': 0, 'max': 0}
+        lock = threading.Lock()
+
+        def slow_source(symbol, start_date, end_date, timeframe):
+            with lock:
+                active['now'] += 1
+                active['max'] = max(active['max'], active['now'])
+            time.sleep(latency)
+            with lock:
+                active['now'] -= 1
+            return _bars(symbol, start_date, end_date, timeframe)
+
+        symbols = [f"SYM{i}" for i in range(16)]
+        with patch('data_handler._download_bars', side_effect=slow_source):
+            started = time.perf_counter()
+            data, _ = data_handler.fetch_historical_data_many(symbols, '2023-01-01', '2023-06-01', max_workers=4)
+            elapsed = time.perf_counter() - started
+
+        self.assertEqual(len(data), 16)
+        self.assertLessEqual(active['max'], 4)
+        self.assertLess(elapsed, len(symbols) * latency)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+test_data_handler_cache.py - data_handler yerel bar önbelleği için birim testler
+
+Bu dosya önbellekli veri çekme akışını test eder:
+- Eksik tarih aralıklarının hesaplanması
+- Sadece eksik aralıkların indirilmesi
+- Offline (replay) modu
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_handler
+
+
+def _full_history():
+    """İndirme simülasyonu için tüm tarih aralığını kapsayan OHLCV verisi"""
+    dates = pd.bdate_range('2022-01-03', '2023-12-29', tz='America/New_York')
+    close = np.linspace(100, 200, len(dates))
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': np.full(len(dates), 1000, dtype=np.int64)
+    }, index=dates)
+
+
+class TestMissingRanges(unittest.TestCase):
+    """Kapsam/eksik aralık hesaplama testleri"""
+
+    def test_no_coverage_returns_full_range(self):
+        """Kapsam yoksa tüm aralık eksik olmalı"""
+        self.assertEqual(
+            data_handler._find_missing_ranges([], '2023-01-01', '2023-02-01'),
+            [('2023-01-01', '2023-02-01')]
+        )
+
+    def test_head_tail_and_inner_gaps(self):
+        """Baştaki, aradaki ve sondaki boşluklar bulunmalı"""
+        coverage = [['2023-01-10', '2023-01-20'], ['2023-02-01', '2023-02-10']]
+        missing = data_handler._find_missing_ranges(coverage, '2023-01-01', '2023-03-01')
+        self.assertEqual(missing, [
+            ('2023-01-01', '2023-01-10'),
+            ('2023-01-20', '2023-02-01'),
+            ('2023-02-10', '2023-03-01'),
+        ])
+
+    def test_fully_covered(self):
+        """Tamamen kapsanan aralık için eksik olmamalı"""
+        coverage = [['2022-01-01', '2023-01-15'], ['2023-01-15', '2024-01-01']]
+        self.assertEqual(data_handler._find_missing_ranges(coverage, '2023-01-01', '2023-06-01'), [])
+
+    def test_merge_ranges(self):
+        """Çakışan ve bitişik aralıklar birleşmeli"""
+        merged = data_handler._merge_ranges([['2023-02-01', '2023-03-01'], ['2023-01-01', '2023-02-01'],
+                                             ['2023-05-01', '2023-06-01']])
+        self.assertEqual(merged, [['2023-01-01', '2023-03-01'], ['2023-05-01', '2023-06-01']])
+
+
+class TestCachedFetch(unittest.TestCase):
+    """Önbellekli fetch_historical_data testleri"""
+
+    def setUp(self):
+        """Geçici depo ve sahte indirme fonksiyonu hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.history = _full_history()
+        self.calls = []
+
+        def fake_download(symbol, start_date, end_date, timeframe):
+            self.calls.append((start_date, end_date))
+            return data_handler._slice_by_date(self.history, start_date, end_date)
+
+        self.patches = [
+            patch('config.DATA_STORE_PATH', self.tmp_dir),
+            patch('data_handler._download_bars', side_effect=fake_download),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        """Patch'leri kaldırır ve geçici dizini siler"""
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_second_call_uses_cache(self):
+        """Aynı aralık ikinci kez indirilmemeli"""
+        first = data_handler.fetch_historical_data('AAPL', '2022-01-01', '2022-12-31', '1d', use_cache=True)
+        second = data_handler.fetch_historical_data('AAPL', '2022-01-01', '2022-12-31', '1d', use_cache=True)
+
+        self.assertEqual(len(self.calls), 1)
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    def test_extension_downloads_only_new_range(self):
+        """Aralık genişletildiğinde sadece yeni kısım indirilmeli"""
+        data_handler.fetch_historical_data('AAPL', '2022-01-01', '2022-12-31', '1d', use_cache=True)
+        extended = data_handler.fetch_historical_data('AAPL', '2022-01-01', '2023-06-30', '1d', use_cache=True)
+
+        self.assertEqual(self.calls[-1], ('2022-12-31', '2023-06-30'))
+        expected = data_handler._slice_by_date(self.history, '2022-01-01', '2023-06-30')
+        self.assertEqual(len(extended), len(expected))
+        self.assertFalse(extended.index.duplicated().any())
+
+    def test_offline_mode_never_downloads(self):
+        """Offline modda indirme yapılmamalı, önbellek kullanılmalı"""
+        data_handler.fetch_historical_data('AAPL', '2022-01-01', '2022-12-31', '1d', use_cache=True)
+        self.calls.clear()
+
+        replay = data_handler.fetch_historical_data('AAPL', '2022-03-01', '2023-06-30', '1d', offline=True)
+
+        self.assertEqual(self.calls, [])
+        self.assertEqual(replay.index.max().strftime('%Y-%m-%d'), '2022-12-30')
+
+    def test_offline_mode_without_cache_returns_none(self):
+        """Offline modda önbellek yoksa None dönmeli"""
+        self.assertIsNone(data_handler.fetch_historical_data('MSFT', '2022-01-01', '2022-12-31', '1d',
+                                                             offline=True))
+        self.assertEqual(self.calls, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
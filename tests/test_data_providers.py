@@ -0,0 +1,143 @@
+"""
+test_data_providers.py - Data Providers modülü için birim testler
+
+Bu dosya veri sağlayıcı arayüzünü ağ kullanmadan test eder:
+- Sentetik sağlayıcının deterministikliği
+- Yerel dosya sağlayıcısı (NumPy deposu ve CSV)
+- config.DATA_PROVIDER ile sağlayıcı seçimi
+- data_handler fonksiyonlarının sağlayıcı üzerinden çalışması
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_providers
+import data_store
+import data_handler
+
+
+class TestSyntheticProvider(unittest.TestCase):
+    """Sentetik veri sağlayıcısı testleri"""
+
+    def setUp(self):
+        """Sentetik sağlayıcıyı oluşturur"""
+        self.provider = data_providers.SyntheticDataProvider(seed=7)
+
+    def test_same_bars_for_overlapping_requests(self):
+        """Çakışan isteklerde aynı barlar dönmeli"""
+        long_range = self.provider.get_history('AAPL', '2022-01-01', '2023-01-01')
+        short_range = self.provider.get_history('AAPL', '2022-06-01', '2022-07-01')
+
+        pd.testing.assert_frame_equal(short_range, long_range.loc['2022-06-01':'2022-06-30'], check_freq=False)
+
+    def test_symbols_differ_and_prices_valid(self):
+        """Farklı semboller farklı, fiyatlar geçerli olmalı"""
+        aapl = self.provider.get_history('AAPL', '2022-01-01', '2022-03-01')
+        msft = self.provider.get_history('MSFT', '2022-01-01', '2022-03-01')
+
+        self.assertFalse(np.allclose(aapl['Close'], msft['Close']))
+        self.assertTrue((aapl['High'] >= aapl[['Open', 'Close']].max(axis=1)).all())
+        self.assertTrue((aapl['Low'] <= aapl[['Open', 'Close']].min(axis=1)).all())
+        self.assertEqual(list(aapl.columns), data_providers.OHLCV_COLUMNS)
+
+    def test_intraday_bars_within_session(self):
+        """Gün içi barlar seans saatleri içinde olmalı"""
+        bars = self.provider.get_history('AAPL', '2023-03-06', '2023-03-08', interval='5m')
+
+        self.assertEqual(len(bars), 2 * 78)
+        self.assertEqual(bars.index.min().strftime('%H:%M'), '09:30')
+        self.assertEqual(bars.index.max().strftime('%H:%M'), '15:55')
+
+    def test_period_argument(self):
+        """Göreli periyot ile son günler dönmeli"""
+        bars = self.provider.get_history('AAPL', period='10d')
+        self.assertGreater(len(bars), 0)
+        self.assertLessEqual(len(bars), 10)
+
+
+class TestLocalFileProvider(unittest.TestCase):
+    """Yerel dosya sağlayıcısı testleri"""
+
+    def setUp(self):
+        """Geçici veri dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.bars = data_providers.SyntheticDataProvider(seed=1).get_history('AAPL', '2022-01-01', '2023-01-01')
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_reads_numpy_store(self):
+        """NumPy deposundan tarih filtresiyle okunmalı"""
+        data_store.write_frame(self.bars, 'bars', 'AAPL', '1d', base_path=self.tmp_dir)
+        provider = data_providers.LocalFileDataProvider(base_path=self.tmp_dir, dataset='bars')
+
+        result = provider.get_history('AAPL', '2022-03-01', '2022-04-01')
+
+        pd.testing.assert_frame_equal(result, self.bars.loc['2022-03-01':'2022-03-31'], check_freq=False)
+
+    def test_reads_csv_file(self):
+        """CSV dosyasından okunmalı"""
+        self.bars.to_csv(os.path.join(self.tmp_dir, 'MSFT.csv'))
+        provider = data_providers.LocalFileDataProvider(base_path=self.tmp_dir, dataset='bars')
+
+        result = provider.get_history('MSFT', '2022-03-01', '2022-04-01')
+
+        self.assertEqual(len(result), len(self.bars.loc['2022-03-01':'2022-03-31']))
+        np.testing.assert_allclose(result['Close'].to_numpy(), self.bars.loc['2022-03-01':'2022-03-31', 'Close'])
+
+    def test_missing_symbol_returns_empty(self):
+        """Olmayan sembol için boş DataFrame dönmeli"""
+        provider = data_providers.LocalFileDataProvider(base_path=self.tmp_dir, dataset='bars')
+        self.assertTrue(provider.get_history('NOPE', '2022-01-01', '2022-02-01').empty)
+
+
+class TestProviderSelection(unittest.TestCase):
+    """config.DATA_PROVIDER ile sağlayıcı seçimi testleri"""
+
+    def tearDown(self):
+        """Sağlayıcı önbelleğini temizler"""
+        data_providers.reset_providers()
+
+    def test_get_data_provider_from_config(self):
+        """Config'teki sağlayıcı seçilmeli"""
+        with patch('config.DATA_PROVIDER', 'synthetic'):
+            provider = data_providers.get_data_provider()
+        self.assertIsInstance(provider, data_providers.SyntheticDataProvider)
+        self.assertIs(provider, data_providers.get_data_provider('synthetic'))
+
+    def test_unknown_provider_raises(self):
+        """Bilinmeyen sağlayıcı hata vermeli"""
+        with self.assertRaises(ValueError):
+            data_providers.get_data_provider('bloomberg')
+
+    def test_data_handler_runs_offline_with_synthetic(self):
+        """data_handler ağ olmadan sentetik sağlayıcıyla çalışmalı"""
+        with patch('config.DATA_PROVIDER', 'synthetic'):
+            data = data_handler.fetch_historical_data('AAPL', '2022-01-01', '2023-01-01', '1d')
+            price = data_handler.get_latest_price('AAPL')
+
+        self.assertGreater(len(data), 200)
+        self.assertIn('price', price)
+        self.assertGreater(price['price'], 0)
+
+    def test_benchmark_providers(self):
+        """Gecikme raporu sağlayıcı başına satır içermeli"""
+        report = data_providers.benchmark_providers(['AAPL', 'MSFT'], '2022-01-01', '2022-06-01',
+                                                    provider_names=['synthetic'])
+        self.assertEqual(list(report.index), ['synthetic'])
+        self.assertEqual(report.loc['synthetic', 'requests'], 2)
+        self.assertEqual(report.loc['synthetic', 'errors'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+test_data_quality.py - Data Quality modülü için birim testler
+
+Bu dosya sembol evreni genelindeki toplu kalite taramasını test eder:
+- Her kontrolün doğru sembole ve doğru sayıda işlenmesi
+- Boş verilerin raporlanması
+- NumPy deposundan toplu tarama
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_quality
+import data_providers
+import data_store
+
+
+def _universe():
+    """Temiz sentetik sembol evreni üretir"""
+    provider = data_providers.SyntheticDataProvider(seed=3)
+    return {s: provider.get_history(s, '2022-01-01', '2023-01-01') for s in ['AAPL', 'MSFT', 'GOOGL', 'TSLA']}
+
+
+class TestScanFrames(unittest.TestCase):
+    """scan_frames testleri"""
+
+    def test_clean_universe(self):
+        """Temiz veride sorun bulunmamalı"""
+        report = data_quality.scan_frames(_universe())
+
+        self.assertEqual(list(report.index), ['AAPL', 'MSFT', 'GOOGL', 'TSLA'])
+        self.assertTrue((report['status'] == 'ok').all())
+        self.assertTrue((report['missing_sessions'] == 0).all())
+        self.assertEqual(list(report.columns), data_quality.SUMMARY_COLUMNS)
+
+    def test_issues_are_attributed_to_symbols(self):
+        """Her sorun kendi sembolünde ve doğru sayıda raporlanmalı"""
+        frames = _universe()
+        aapl = frames['AAPL'].copy()
+        aapl.iloc[10:12, aapl.columns.get_loc('Open')] = np.nan
+        aapl.iloc[20, aapl.columns.get_loc('Low')] = -1.0
+        aapl.iloc[30:33, aapl.columns.get_loc('Volume')] = 0
+        frames['AAPL'] = aapl
+
+        msft = frames['MSFT'].copy()
+        msft.iloc[50:60, msft.columns.get_loc('Close')] = msft['Close'].iloc[49]
+        msft.iloc[100, msft.columns.get_loc('Close')] *= 3
+        frames['MSFT'] = msft
+
+        googl = frames['GOOGL']
+        frames['GOOGL'] = pd.concat([googl.iloc[:40], googl.iloc[39:40], googl.iloc[60:]])
+
+        report = data_quality.scan_frames(frames)
+
+        self.assertEqual(report.loc['AAPL', 'missing_values'], 2)
+        self.assertEqual(report.loc['AAPL', 'non_positive_prices'], 1)
+        self.assertEqual(report.loc['AAPL', 'zero_volume'], 3)
+        self.assertEqual(report.loc['MSFT', 'max_stale_run'], 11)
+        self.assertEqual(report.loc['MSFT', 'stale_bars'], 11)
+        self.assertGreaterEqual(report.loc['MSFT', 'outlier_returns'], 1)
+        self.assertEqual(report.loc['GOOGL', 'duplicate_timestamps'], 1)
+        self.assertEqual(report.loc['GOOGL', 'missing_sessions'], 20)
+        self.assertEqual(report.loc['TSLA', 'quality_score'], 100.0)
+        self.assertEqual(report.loc['AAPL', 'duplicate_timestamps'], 0)
+
+    def test_empty_frames_reported(self):
+        """Boş veya eksik veriler 'empty' olarak raporlanmalı"""
+        frames = _universe()
+        frames['NONE'] = None
+        report = data_quality.scan_frames(frames)
+
+        self.assertEqual(report.loc['NONE', 'status'], 'empty')
+        self.assertEqual(report.loc['NONE', 'rows'], 0)
+
+
+class TestScanStore(unittest.TestCase):
+    """NumPy deposundan tarama testleri"""
+
+    def setUp(self):
+        """Geçici depo dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_scan_store_all_symbols(self):
+        """Depodaki tüm semboller taranmalı"""
+        for symbol, frame in _universe().items():
+            data_store.write_frame(frame, 'raw_data', symbol, '1d', base_path=self.tmp_dir)
+
+        report = data_quality.scan_store('raw_data', timeframe='1d', base_path=self.tmp_dir)
+
+        self.assertEqual(sorted(report.index), ['AAPL', 'GOOGL', 'MSFT', 'TSLA'])
+        self.assertTrue((report['rows'] > 200).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+test_data_store.py - Data Store modülü için birim testler
+
+Bu dosya kolon bazlı veri deposunu test eder:
+- Yazma/okuma gidiş-dönüş testleri
+- Kolon projeksiyonu ve tarih filtresi testleri
+- data_handler.save_data / load_data entegrasyon testleri
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_store
+import data_handler
+
+
+def _make_ohlcv(periods=300, start='2023-01-02', tz=None):
+    """Test için OHLCV verisi üretir"""
+    dates = pd.bdate_range(start, periods=periods, tz=tz)
+    rng = np.random.default_rng(0)
+    close = 100 * np.cumprod(1 + rng.normal(0, 0.01, periods))
+    return pd.DataFrame({
+        'Open': close * 0.999,
+        'High': close * 1.01,
+        'Low': close * 0.99,
+        'Close': close,
+        'Volume': rng.integers(1000, 10000, periods)
+    }, index=dates)
+
+
+class TestDataStore(unittest.TestCase):
+    """Kolon bazlı depo fonksiyonları için test sınıfı"""
+
+    def setUp(self):
+        """Her test için geçici depo dizini oluşturur"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.data = _make_ohlcv()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_round_trip_preserves_values_and_dtypes(self):
+        """Yazılan veri aynı değer ve tiplerle okunmalı"""
+        self.assertTrue(data_store.write_frame(self.data, 'raw_data', 'AAPL', '1d', base_path=self.tmp_dir))
+
+        loaded = data_store.read_frame('raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        pd.testing.assert_frame_equal(loaded, self.data, check_freq=False)
+        self.assertEqual(loaded['Volume'].dtype, self.data['Volume'].dtype)
+
+    def test_round_trip_timezone_aware_index(self):
+        """Zaman dilimli indeks korunmalı"""
+        data = _make_ohlcv(tz='America/New_York')
+        data_store.write_frame(data, 'raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        loaded = data_store.read_frame('raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        self.assertEqual(str(loaded.index.tz), 'America/New_York')
+        self.assertTrue(loaded.index.equals(data.index))
+
+    def test_column_projection_and_date_filter(self):
+        """Sadece istenen kolonlar ve [start, end) aralığı okunmalı"""
+        data_store.write_frame(self.data, 'raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        loaded = data_store.read_frame(
+            'raw_data', 'AAPL', '1d', columns=['Close', 'Volume'],
+            start_date='2023-03-01', end_date='2023-04-01', base_path=self.tmp_dir
+        )
+
+        expected = self.data.loc['2023-03-01':'2023-03-31', ['Close', 'Volume']]
+        pd.testing.assert_frame_equal(loaded, expected, check_freq=False)
+
+    def test_category_and_string_columns(self):
+        """Kategorik ve metin kolonları korunmalı"""
+        data = self.data.head(5).copy()
+        data['Symbol'] = pd.Categorical(['AAPL'] * 5)
+        data['Note'] = ['a', 'b', 'c', 'd', 'e']
+        data_store.write_frame(data, 'misc', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        loaded = data_store.read_frame('misc', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        self.assertIsInstance(loaded['Symbol'].dtype, pd.CategoricalDtype)
+        self.assertEqual(loaded['Note'].tolist(), ['a', 'b', 'c', 'd', 'e'])
+
+    def test_missing_partition_returns_none(self):
+        """Olmayan bölüm için None dönmeli"""
+        self.assertIsNone(data_store.read_frame('raw_data', 'NOPE', '1d', base_path=self.tmp_dir))
+        self.assertFalse(data_store.has_frame('raw_data', 'NOPE', '1d', base_path=self.tmp_dir))
+
+    def test_list_symbols_and_read_many(self):
+        """Kayıtlı semboller listelenmeli ve toplu okunmalı"""
+        for symbol in ['MSFT', 'AAPL', 'THYAO.IS']:
+            data_store.write_frame(self.data, 'raw_data', symbol, '1d', base_path=self.tmp_dir)
+
+        symbols = data_store.list_symbols('raw_data', '1d', base_path=self.tmp_dir)
+        frames = data_store.read_many(['AAPL', 'NOPE'], 'raw_data', '1d', columns=['Close'],
+                                      base_path=self.tmp_dir)
+
+        self.assertEqual(symbols, ['AAPL', 'MSFT', 'THYAO.IS'])
+        self.assertEqual(list(frames.keys()), ['AAPL'])
+        self.assertEqual(list(frames['AAPL'].columns), ['Close'])
+
+    def test_overwrite_replaces_partition(self):
+        """Aynı bölüme yazma eski veriyi tamamen değiştirmeli"""
+        data_store.write_frame(self.data, 'raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+        data_store.write_frame(self.data.head(10), 'raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        loaded = data_store.read_frame('raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+        meta = data_store.read_meta('raw_data', 'AAPL', '1d', base_path=self.tmp_dir)
+
+        self.assertEqual(len(loaded), 10)
+        self.assertEqual(meta['rows'], 10)
+
+    def test_save_and_load_data_use_store(self):
+        """save_data/load_data npy formatında depoyu kullanmalı"""
+        with patch('config.DATA_STORE_PATH', self.tmp_dir), patch('config.DATA_STORE_FORMAT', 'npy'):
+            self.assertTrue(data_handler.save_data(self.data, 'raw_data', 'AAPL'))
+            loaded = data_handler.load_data('raw_data', 'AAPL', columns=['Close'], start_date='2023-06-01')
+
+        self.assertEqual(list(loaded.columns), ['Close'])
+        self.assertTrue((loaded.index >= pd.Timestamp('2023-06-01')).all())
+        self.assertFalse(any(name.endswith('.csv') for name in os.listdir(self.tmp_dir)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+test_feature_analysis.py - Feature Analysis modülü için birim testler
+
+Bu dosya özellik önemi ve fazlalık analizini test eder:
+- Korelasyon matrisinin pandas DataFrame.corr ile aynı olması (NaN ve sabit sütunlar dahil)
+- Karşılıklı bilginin seri ve paralel hesapta aynı olması
+- SMA_20 / BB_Middle gibi eşdoğrusal özelliklerin işaretlenmesi
+- get_feature_importance_ranking'in vektörel hesapla aynı sonucu vermesi
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feature_analysis
+import feature_engineer
+import data_providers
+
+
+def _dataset():
+    """Göstergeli ve hedefli sentetik veri"""
+    history = data_providers.SyntheticDataProvider(seed=4).get_history('AAPL', '2016-01-01', '2021-01-01')
+    return feature_engineer.create_target_variable(feature_engineer.add_technical_indicators(history))
+
+
+class TestFeatureAnalysis(unittest.TestCase):
+    """Özellik analizi testleri"""
+
+    def test_correlation_matches_pandas(self):
+        """Ortak geçerli satırlarla hesaplanan matris pandas ile aynı olmalı"""
+        data = _dataset()[['RSI', 'SMA_50', 'MACD_Hist', 'Volume', 'Target']].copy()
+        data['Constant'] = 3.0
+        data.iloc[100:130, 2] = np.nan
+
+        result = feature_analysis.correlation_matrix(data.to_numpy(dtype=np.float64))
+        np.testing.assert_allclose(result, data.corr().to_numpy(), rtol=1e-10, atol=1e-12)
+        self.assertTrue(np.isnan(result[-1]).all())
+
+    def test_mutual_information_parallel(self):
+        """Paralel ve seri karşılıklı bilgi aynı olmalı"""
+        data = _dataset()
+        features = ['RSI', 'MACD_Hist', 'Volatility']
+        serial = feature_analysis.mutual_information(data, features, n_jobs=1)
+        parallel = feature_analysis.mutual_information(data, features, n_jobs=3)
+
+        pd.testing.assert_series_equal(serial, parallel)
+        self.assertTrue((serial >= 0).all())
+
+    def test_flags_collinear_features(self):
+        """Aynı bilgiyi taşıyan özelliklerden yalnızca biri tutulmalı"""
+        data = _dataset()
+        analysis = feature_analysis.analyze_features(
+            data, ['SMA_20', 'BB_Middle', 'BB_Upper', 'RSI', 'MACD_Hist'], mutual_info=False)
+
+        self.assertEqual(set(analysis['collinear_pairs']['feature']) | set(analysis['collinear_pairs']['other']),
+                         {'SMA_20', 'BB_Middle', 'BB_Upper'})
+        self.assertEqual(len(analysis['redundant']), 2)
+        self.assertNotIn('RSI', analysis['redundant'])
+        self.assertEqual(analysis['ranking']['redundant'].sum(), 2)
+
+    def test_importance_ranking(self):
+        """get_feature_importance_ranking Series.corr ile aynı sıralamayı vermeli"""
+        data = _dataset()
+        ranking = feature_engineer.get_feature_importance_ranking(data)
+        expected = {c: data[c].corr(data['Target']) for c in ranking['feature']}
+
+        for _, row in ranking.iterrows():
+            self.assertAlmostEqual(row['correlation_raw'], expected[row['feature']], places=10)
+        self.assertTrue(ranking['correlation'].is_monotonic_decreasing)
+        self.assertIsNone(feature_engineer.get_feature_importance_ranking(data, 'Missing'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+test_feature_cache.py - Feature Cache modülü için birim testler
+
+Bu dosya disk + LRU özellik önbelleğini test eder:
+- Aynı girdide yeniden hesaplama yapılmaması
+- Yeni barlarda yalnızca yeni satırların hesaplanıp eklenmesi
+- Geçmiş veri veya parametre değiştiğinde yeniden hesaplama
+- Diskten okuma ve LRU sınırı
+- Çok sembollü panel hesabında yalnızca önbellekte olmayan sembollerin hesaplanması
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feature_cache
+import feature_graph
+import panel_indicators
+import config
+import data_providers
+
+
+def _history():
+    """Sentetik günlük veri"""
+    return data_providers.SyntheticDataProvider(seed=4).get_history('AAPL', '2016-01-01', '2022-01-01')
+
+
+class TestFeatureCache(unittest.TestCase):
+    """Özellik önbelleği testleri"""
+
+    def setUp(self):
+        """Geçici önbellek dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache = feature_cache.FeatureCache(path=self.tmp_dir)
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_hit_returns_same_features(self):
+        """Aynı girdi ikinci kez hesaplanmadan döndürülmeli"""
+        data = _history()
+        first = self.cache.get('AAPL', data)
+        second = self.cache.get('AAPL', data)
+
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(self.cache.stats, {'hits': 1, 'appends': 0, 'misses': 1})
+        self.assertEqual(list(first.columns), list(data.columns) + config.ML_FEATURES)
+
+    def test_append_new_bars(self):
+        """Yeni barlarda yalnızca kuyruk hesaplanmalı ve sonuç baştan hesapla aynı olmalı"""
+        data = _history()
+        self.cache.get('AAPL', data.iloc[:-10])
+
+        with patch.object(feature_graph.FeatureGraph, 'compute', autospec=True,
+                          side_effect=feature_graph.FeatureGraph.compute) as compute:
+            updated = self.cache.get('AAPL', data)
+        computed_rows = len(compute.call_args[0][1])
+
+        expected = feature_graph.FeatureGraph().compute(data)
+        self.assertEqual(self.cache.stats['appends'], 1)
+        self.assertEqual(computed_rows, feature_cache.lookback_rows() + 10)
+        for feature in config.ML_FEATURES:
+            np.testing.assert_allclose(updated[feature].to_numpy(), expected[feature].to_numpy(),
+                                       rtol=1e-9, atol=1e-9, err_msg=feature)
+
+    def test_revised_history_recomputes(self):
+        """Geçmiş veri değişirse baştan hesaplanmalı"""
+        data = _history()
+        self.cache.get('AAPL', data.iloc[:-10])
+
+        revised = data.copy()
+        revised.iloc[5, 3] *= 1.5
+        result = self.cache.get('AAPL', revised)
+
+        expected = feature_graph.FeatureGraph().compute(revised)
+        self.assertEqual(self.cache.stats['misses'], 2)
+        pd.testing.assert_series_equal(result['SMA_20'], expected['SMA_20'], check_freq=False)
+
+    def test_parameters_in_key(self):
+        """Farklı gösterge parametreleri ayrı girdi kullanmalı"""
+        data = _history()
+        default = self.cache.get('AAPL', data, ['RSI'])
+        params = dict(config.TECHNICAL_INDICATORS, RSI_PERIOD=7)
+        other = self.cache.get('AAPL', data, ['RSI'], params=params)
+
+        self.assertEqual(self.cache.stats['misses'], 2)
+        self.assertFalse(np.allclose(default['RSI'].dropna().iloc[-50:], other['RSI'].dropna().iloc[-50:]))
+
+    def test_disk_and_lru(self):
+        """Bellekten çıkarılan girdi diskten okunmalı"""
+        data = _history()
+        cache = feature_cache.FeatureCache(path=self.tmp_dir, max_entries=1)
+        cache.get('AAPL', data)
+        cache.get('MSFT', data)
+        self.assertEqual(len(cache._entries), 1)
+
+        fresh = feature_cache.FeatureCache(path=self.tmp_dir)
+        fresh.get('AAPL', data)
+        self.assertEqual(fresh.stats['hits'], 1)
+
+    def test_get_many_uses_panel_for_misses_only(self):
+        """Panel yalnızca önbellekte olmayan sembolleri hesaplamalı; sonuç get ile aynı olmalı"""
+        provider = data_providers.SyntheticDataProvider(seed=4)
+        frames = {s: provider.get_history(s, '2016-01-01', '2022-01-01') for s in ['AAPL', 'MSFT', 'THYAO.IS']}
+        frames['MSFT'] = frames['MSFT'].iloc[:-10]
+        self.cache.get('AAPL', frames['AAPL'])
+
+        with patch('panel_indicators.build_panel', wraps=panel_indicators.build_panel) as build:
+            results = self.cache.get_many(frames)
+        self.assertEqual(set(build.call_args[0][0]), {'MSFT', 'THYAO.IS'})
+        self.assertEqual(self.cache.stats, {'hits': 1, 'appends': 0, 'misses': 3})
+
+        reference = feature_cache.FeatureCache(path=os.path.join(self.tmp_dir, 'reference'))
+        for symbol, frame in frames.items():
+            expected = reference.get(symbol, frame)
+            self.assertEqual(list(results[symbol].columns), list(expected.columns))
+            np.testing.assert_allclose(results[symbol][config.ML_FEATURES].to_numpy(dtype=float),
+                                       expected[config.ML_FEATURES].to_numpy(dtype=float),
+                                       rtol=1e-9, atol=1e-9, err_msg=symbol)
+
+        # Sonraki çalıştırma: tam isabet ve yeni bar ekleme, panel hesabı yok
+        frames['MSFT'] = provider.get_history('MSFT', '2016-01-01', '2022-01-01')
+        with patch('panel_indicators.build_panel') as build:
+            self.cache.get_many(frames)
+        build.assert_not_called()
+        self.assertEqual(self.cache.stats['hits'], 3)
+        self.assertEqual(self.cache.stats['appends'], 1)
+
+    def test_get_features_many_columns_independent_of_cache_flag(self):
+        """Önbellek açık ya da kapalı, aynı sütunlar üretilmeli"""
+        provider = data_providers.SyntheticDataProvider(seed=4)
+        frames = {s: provider.get_history(s, '2018-01-01', '2021-01-01') for s in ['AAPL', 'MSFT']}
+        features = ['RSI', 'SMA_20']
+
+        with patch('config.FEATURE_CACHE_PATH', self.tmp_dir):
+            feature_cache.reset_feature_cache()
+            with patch('config.FEATURE_CACHE_ENABLED', True):
+                cached = feature_cache.get_features_many(frames, features)
+            with patch('config.FEATURE_CACHE_ENABLED', False):
+                direct = feature_cache.get_features_many(frames, features)
+            feature_cache.reset_feature_cache()
+
+        for symbol in frames:
+            self.assertEqual(list(cached[symbol].columns), list(direct[symbol].columns))
+            np.testing.assert_allclose(cached[symbol][features].to_numpy(dtype=float),
+                                       direct[symbol][features].to_numpy(dtype=float), rtol=1e-9)
+
+
+if __name__ == '__main__':
+    unittest.main()
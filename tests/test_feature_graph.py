@@ -0,0 +1,94 @@
+"""
+test_feature_graph.py - Feature Graph modülü için birim testler
+
+Bu dosya bağımlılık grafiğiyle özellik hesabını test eder:
+- Sonuçların add_technical_indicators ile birebir aynı olması
+- Yalnızca istenen özelliklerin ve bağımlılıklarının hesaplanması
+- Paylaşılan ara sonuçların bir kez hesaplanması
+- Bilinmeyen özellik ve döngüsel bağımlılık hataları
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feature_graph
+import feature_engineer
+import data_providers
+
+
+def _history():
+    """Sentetik günlük veri"""
+    return data_providers.SyntheticDataProvider(seed=2).get_history('AAPL', '2019-01-01', '2022-01-01')
+
+
+class TestFeatureGraph(unittest.TestCase):
+    """Özellik grafiği testleri"""
+
+    def test_matches_add_technical_indicators(self):
+        """Tüm özellikler toplu hesapla birebir aynı olmalı"""
+        data = _history()
+        graph = feature_graph.FeatureGraph()
+
+        computed = graph.compute(data, graph.features)
+        batch = feature_engineer.add_technical_indicators(data)
+
+        self.assertEqual(sorted(graph.features), sorted(c for c in batch.columns if c not in data.columns))
+        for feature in graph.features:
+            pd.testing.assert_series_equal(computed[feature], batch[feature], check_freq=False)
+
+    def test_computes_only_required_nodes(self):
+        """Yalnızca istenen özellik ve bağımlılıkları hesaplanmalı"""
+        data = _history()
+        graph = feature_graph.FeatureGraph()
+
+        computed = graph.compute(data, ['RSI'])
+
+        self.assertEqual(list(graph.timings), ['close_delta', 'rsi_gain_mean', 'rsi_loss_mean', 'RSI'])
+        self.assertEqual(list(computed.columns), list(data.columns) + ['RSI'])
+        self.assertTrue(all(seconds >= 0 for _, seconds in graph.timing_report()))
+
+    def test_shared_intermediates_computed_once(self):
+        """SMA_20/BB_Middle ortalaması ve eşit periyotlu std bir kez hesaplanmalı"""
+        params = dict(feature_graph.config.TECHNICAL_INDICATORS, VOLATILITY_PERIOD=20)
+        graph = feature_graph.FeatureGraph(params)
+        calls = []
+        original = graph.nodes['close_std_20'].compute
+        graph.nodes['close_std_20'].compute = lambda c: calls.append(1) or original(c)
+
+        computed = graph.compute(_history(), ['SMA_20', 'BB_Middle', 'BB_Upper', 'BB_Lower', 'Volatility'])
+
+        self.assertEqual(graph.plan(['SMA_20', 'BB_Middle']), ['close_mean_20', 'SMA_20', 'BB_Middle'])
+        self.assertEqual(len(calls), 1)
+        np.testing.assert_array_equal(computed['SMA_20'].to_numpy(), computed['BB_Middle'].to_numpy())
+
+    def test_errors(self):
+        """Bilinmeyen özellik ve döngüsel bağımlılık ValueError vermeli"""
+        graph = feature_graph.FeatureGraph()
+        with self.assertRaises(ValueError):
+            graph.plan(['NotAFeature'])
+
+        graph.register('loop_a', ['loop_b'], lambda b: b)
+        graph.register('loop_b', ['loop_a'], lambda a: a)
+        with self.assertRaises(ValueError):
+            graph.plan(['loop_a'])
+
+    def test_add_technical_indicators_features(self):
+        """add_technical_indicators features ile yalnızca istenenleri eklemeli"""
+        data = _history()
+        with patch('config.COMPACT_DTYPES', False):
+            subset = feature_engineer.add_technical_indicators(data, features=['MACD_Hist', 'Volatility'])
+        full = feature_engineer.add_technical_indicators(data)
+
+        self.assertEqual(list(subset.columns), list(data.columns) + ['MACD_Hist', 'Volatility'])
+        pd.testing.assert_series_equal(subset['MACD_Hist'], full['MACD_Hist'], check_freq=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
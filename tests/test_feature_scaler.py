@@ -0,0 +1,133 @@
+"""
+test_feature_scaler.py - Feature Scaler modülü için birim testler
+
+Bu dosya ileriye bakmayan, artımlı ölçekleyiciyi test eder:
+- sklearn StandardScaler/MinMaxScaler ile aynı dönüşümler
+- partial_fit ile parça parça fit'in tek seferde fit ile aynı olması
+- Durumun .npz dosyasına kaydedilip yüklenmesi
+- normalize_features'ın yalnızca eğitim penceresiyle fit etmesi
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+from sklearn.preprocessing import StandardScaler, MinMaxScaler
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feature_scaler
+import feature_engineer
+
+
+def _features(rows=500):
+    """Rastgele özellik tablosu"""
+    rng = np.random.default_rng(5)
+    data = pd.DataFrame(rng.normal(20, 4, (rows, 3)), columns=['RSI', 'MACD_Hist', 'Volatility'],
+                        index=pd.bdate_range('2020-01-01', periods=rows))
+    data['Constant'] = 7.0
+    return data
+
+
+class TestFeatureScaler(unittest.TestCase):
+    """Ölçekleyici testleri"""
+
+    def setUp(self):
+        """Geçici model dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_matches_sklearn(self):
+        """Dönüşümler sklearn ölçekleyicileriyle aynı olmalı (sabit sütun dahil)"""
+        X = _features()
+        for method, reference in (('StandardScaler', StandardScaler()), ('MinMaxScaler', MinMaxScaler())):
+            scaled = feature_scaler.FeatureScaler(method).fit_transform(X)
+            np.testing.assert_allclose(scaled, reference.fit_transform(X), atol=1e-12, err_msg=method)
+
+    def test_partial_fit_equals_full_fit(self):
+        """Parça parça güncelleme tek seferde fit ile aynı istatistikleri vermeli"""
+        X = _features()
+        full = feature_scaler.FeatureScaler('StandardScaler').fit(X)
+        incremental = feature_scaler.FeatureScaler('StandardScaler').fit(X.iloc[:300])
+        for start in range(300, 500, 37):
+            incremental.partial_fit(X.iloc[start:start + 37])
+
+        np.testing.assert_allclose(incremental.mean, full.mean, rtol=1e-12)
+        np.testing.assert_allclose(incremental.var, full.var, rtol=1e-10)
+        np.testing.assert_array_equal(incremental.maximum, full.maximum)
+
+    def test_nan_ignored(self):
+        """NaN değerler istatistiklere katılmamalı ve NaN kalmalı"""
+        X = _features()
+        X.iloc[:20, 0] = np.nan
+        scaler = feature_scaler.FeatureScaler('StandardScaler').fit(X)
+
+        self.assertAlmostEqual(scaler.mean[0], X['RSI'].mean())
+        self.assertTrue(np.isnan(scaler.transform(X)[:20, 0]).all())
+
+    def test_save_and_load(self):
+        """Durum küçük bir .npz dosyasından aynen yüklenmeli"""
+        X = _features()
+        scaler = feature_scaler.FeatureScaler('MinMaxScaler').fit(X)
+        path = os.path.join(self.tmp_dir, 'AAPL_minmaxscaler.npz')
+        scaler.save(path)
+
+        loaded = feature_scaler.FeatureScaler.load(path)
+        self.assertEqual(loaded.method, 'MinMaxScaler')
+        self.assertEqual(loaded.features, list(X.columns))
+        np.testing.assert_array_equal(loaded.transform(X), scaler.transform(X))
+        self.assertLess(os.path.getsize(path), 4096)
+
+    def test_update_scaler(self):
+        """Kayıtlı ölçekleyici yeni satırlarla güncellenmeli"""
+        X = _features()
+        with patch('config.MODEL_SAVE_PATH', self.tmp_dir):
+            feature_scaler.FeatureScaler('StandardScaler').fit(X.iloc[:400]).save(
+                feature_scaler.scaler_path('AAPL', 'StandardScaler'))
+            updated = feature_scaler.update_scaler('AAPL', X.iloc[400:], 'StandardScaler')
+            missing = feature_scaler.update_scaler('MSFT', X, 'StandardScaler')
+
+        np.testing.assert_allclose(updated.mean, X.mean().to_numpy(), rtol=1e-12)
+        self.assertIsNone(missing)
+
+
+class TestNormalizeFeatures(unittest.TestCase):
+    """normalize_features eğitim penceresi testleri"""
+
+    def setUp(self):
+        """Geçici model dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_no_look_ahead(self):
+        """Test dönemindeki değerler ölçeklemeyi etkilememeli"""
+        data = _features()
+        data['Target'] = (np.arange(len(data)) % 2).astype(float)
+        shocked = data.copy()
+        shocked.iloc[-100:, :3] *= 50
+
+        with patch('config.MODEL_SAVE_PATH', self.tmp_dir), patch('config.COMPACT_DTYPES', False):
+            features = ['RSI', 'MACD_Hist', 'Volatility']
+            normal, scaler = feature_engineer.normalize_features(data, features, 'StandardScaler', symbol='AAPL')
+            shocked_result, _ = feature_engineer.normalize_features(shocked, features, 'StandardScaler',
+                                                                    save_scaler=False)
+            loaded = feature_engineer.load_scaler('AAPL', 'StandardScaler')
+
+        pd.testing.assert_series_equal(normal['RSI_scaled'].iloc[:400], shocked_result['RSI_scaled'].iloc[:400])
+        self.assertEqual(scaler.count[0], 400)
+        np.testing.assert_array_equal(loaded.mean, scaler.mean)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+test_indicator_sweep.py - Indicator Sweep modülü için birim testler
+
+Bu dosya çok periyotlu gösterge taramasını test eder:
+- Her periyodun feature_engineer / pandas hesabıyla aynı olması
+- Sabit fiyatlı pencerelerde kesin sonuç (std = 0, RSI = 100 / NaN)
+- Çoklu aile birleştirme ve hatalı girdiler
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import indicator_sweep
+import feature_engineer
+import data_providers
+
+
+PERIODS = list(range(2, 61, 3))
+
+
+def _history():
+    """Sabit fiyatlı bölüm içeren sentetik günlük veri"""
+    data = data_providers.SyntheticDataProvider(seed=8).get_history('AAPL', '2015-01-01', '2022-01-01')
+    data.iloc[200:260, 3] = 75.3
+    return data
+
+
+class TestIndicatorSweep(unittest.TestCase):
+    """Gösterge taraması testleri"""
+
+    def _assert_close(self, result, family, expected):
+        """Her periyot sütunu beklenen seriyle aynı olmalı"""
+        for period in PERIODS:
+            np.testing.assert_allclose(result[f'{family}_{period}'].to_numpy(), expected(period).to_numpy(),
+                                       rtol=1e-9, atol=1e-9, err_msg=f'{family}_{period}')
+
+    def test_rolling_families(self):
+        """SMA ve Volatility pandas rolling ile aynı olmalı"""
+        close = _history()['Close']
+        self._assert_close(indicator_sweep.sweep_indicator(close, 'SMA', PERIODS), 'SMA',
+                           lambda p: close.rolling(p).mean())
+        volatility = indicator_sweep.sweep_indicator(close, 'Volatility', PERIODS)
+        self._assert_close(volatility, 'Volatility', lambda p: close.rolling(p).std())
+        self.assertTrue((volatility['Volatility_20'].iloc[230:260] == 0).all())
+
+    def test_rsi_matches_calculate_rsi(self):
+        """RSI her periyotta calculate_rsi ile aynı olmalı"""
+        close = _history()['Close']
+        result = indicator_sweep.sweep_indicator(close, 'RSI', PERIODS)
+
+        self._assert_close(result, 'RSI', lambda p: feature_engineer.calculate_rsi(close, p))
+        self.assertTrue(result['RSI_14'].iloc[220:260].isna().all())  # kazanç ve kayıp 0 -> 0/0
+
+    def test_ema_bollinger_momentum(self):
+        """EMA, Bollinger ve momentum aileleri tanımlarıyla aynı olmalı"""
+        data = _history()
+        close = data['Close']
+        self._assert_close(indicator_sweep.sweep_indicator(data, 'EMA', PERIODS), 'EMA',
+                           lambda p: close.ewm(span=p).mean())
+        self._assert_close(indicator_sweep.sweep_indicator(data, 'Momentum', PERIODS), 'Momentum',
+                           lambda p: close / close.shift(p) - 1)
+
+        def position(period):
+            upper, _, lower = feature_engineer.calculate_bollinger_bands(close, period, 2)
+            return ((close - lower) / (upper - lower)).replace([np.inf, -np.inf], np.nan)
+
+        self._assert_close(indicator_sweep.sweep_indicator(data, 'BB_Position', PERIODS, bb_std=2),
+                           'BB_Position', position)
+
+    def test_grid_and_errors(self):
+        """Çoklu aile birleşmeli, hatalı girdiler ValueError vermeli"""
+        data = _history()
+        result = indicator_sweep.sweep_indicators(data, {'RSI': range(5, 51), 'SMA': [10, 20]})
+
+        self.assertEqual(result.shape, (len(data), 48))
+        self.assertEqual(result.columns[0], 'RSI_5')
+        with self.assertRaises(ValueError):
+            indicator_sweep.sweep_indicator(data, 'ADX', [14])
+        with self.assertRaises(ValueError):
+            indicator_sweep.sweep_indicator(data, 'RSI', [0, 14])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,181 @@
+"""
+test_inference_pipeline.py - Inference Pipeline modülü için birim testler
+
+Bu dosya DataFrame kullanmayan tahmin hattını test eder:
+- Özelliklerin pandas hattı (add_technical_indicators + FeatureScaler) ile aynı olması
+- Model sütun sırası, float32 çıktı ve yalnızca son N bar üretimi
+- Üst zaman dilimi sütunlarının add_multi_timeframe_features ile aynı olması
+- Kesitsel sütunların hazır girdi olarak alınması
+- Ölçekleyici veya desteklenmeyen özellik hataları
+- Varsayılan ayarlarla eğitilen kayıtlı modelden hattın kurulması
+"""
+
+import unittest
+from unittest.mock import patch
+import tempfile
+import shutil
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+import inference_pipeline
+import feature_engineer
+import feature_scaler
+import cross_sectional
+import ml_model
+import data_providers
+
+
+FEATURES = ['RSI', 'MACD_Hist', 'SMA_20', 'SMA_50', 'Volume_Change', 'BB_Upper', 'BB_Lower', 'Volatility']
+
+
+def _history():
+    """Sentetik günlük veri"""
+    return data_providers.SyntheticDataProvider(seed=3).get_history('AAPL', '2016-01-01', '2022-01-01')
+
+
+class TestInferencePipeline(unittest.TestCase):
+    """Tahmin hattı testleri"""
+
+    def setUp(self):
+        """Referans pandas hattını hazırlar"""
+        self.history = _history()
+        self.enhanced = feature_engineer.add_technical_indicators(self.history, features=FEATURES)
+        self.scaler = feature_scaler.FeatureScaler('StandardScaler', FEATURES).fit(
+            self.enhanced[FEATURES].dropna())
+        self.arrays = inference_pipeline.frame_arrays(self.history)
+
+    def test_matches_pandas_path(self):
+        """Ham ve ölçeklenmiş sütunlar pandas hattıyla aynı olmalı (float32 hassasiyetinde)"""
+        names = ['Volatility_scaled', 'RSI'] + [f + '_scaled' for f in FEATURES[:3]] + FEATURES[1:]
+        pipeline = inference_pipeline.InferencePipeline(names, self.scaler)
+        result = pipeline.transform(*self.arrays)
+
+        scaled = self.scaler.transform(self.enhanced[FEATURES])
+        expected = np.column_stack([
+            scaled[:, FEATURES.index(name[:-7])] if name.endswith('_scaled') else self.enhanced[name].to_numpy()
+            for name in names])
+
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.shape, (len(self.history), len(names)))
+        np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+
+    def test_latest_uses_tail_only(self):
+        """Son N bar, tüm geçmişle hesaplanan son N satırla aynı olmalı"""
+        pipeline = inference_pipeline.InferencePipeline(FEATURES)
+        full = pipeline.transform(*self.arrays).copy()
+
+        np.testing.assert_allclose(pipeline.transform(*self.arrays, rows=5), full[-5:], rtol=1e-6)
+        latest = pipeline.latest(*self.arrays)
+        self.assertEqual(latest.shape, (1, len(FEATURES)))
+        np.testing.assert_allclose(latest[0], full[-1], rtol=1e-6)
+        self.assertIs(pipeline.latest(*self.arrays), latest)  # çıktı tamponu yeniden kullanılır
+
+    def test_invalid_features(self):
+        """Ölçekleyicisiz '_scaled' sütun veya bilinmeyen özellik ValueError vermeli"""
+        with self.assertRaises(ValueError):
+            inference_pipeline.InferencePipeline(['RSI_scaled'])
+        with self.assertRaises(ValueError):
+            inference_pipeline.InferencePipeline(['RSI', 'Sentiment_Score'])
+
+    def test_multi_timeframe_matches_pandas_path(self):
+        """Üst zaman dilimi sütunları add_multi_timeframe_features ile aynı, son N bar tutarlı olmalı"""
+        timeframes = {'W': ['RSI', 'MACD_Hist', 'Price_Change'], 'M': ['RSI', 'Volatility']}
+        names = ['RSI', 'RSI_W', 'MACD_Hist_W', 'Price_Change_W', 'RSI_M', 'Volatility_M']
+        expected = feature_engineer.add_multi_timeframe_features(self.enhanced, timeframes)[names].to_numpy()
+
+        pipeline = inference_pipeline.InferencePipeline(names, timeframes=timeframes)
+        result = pipeline.transform_frame(self.history).copy()
+
+        np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+        np.testing.assert_allclose(result, expected, rtol=1e-5, atol=1e-5)
+        np.testing.assert_allclose(pipeline.transform_frame(self.history, rows=3), result[-3:], rtol=1e-6)
+        with self.assertRaises(ValueError):
+            pipeline.transform(*self.arrays)  # tarihler olmadan üst zaman dilimi üretilemez
+
+    def test_cross_sectional_inputs(self):
+        """Kesitsel sütunlar hazır girdiden alınmalı; girdi yoksa ValueError vermeli"""
+        pipeline = inference_pipeline.InferencePipeline(['RSI', 'CS_Return_Rank'])
+        with self.assertRaises(ValueError):
+            pipeline.transform(*self.arrays)
+
+        ranks = np.linspace(0, 1, len(self.history))
+        result = pipeline.latest(*self.arrays, extra={'CS_Return_Rank': ranks})
+        self.assertAlmostEqual(float(result[0, 1]), 1.0)
+
+    def test_saved_model_with_unsupported_features(self):
+        """Fiyattan üretilemeyen özellikli model için hat kurulmamalı (None)"""
+        self.assertEqual(inference_pipeline.unsupported_features(['RSI_scaled', 'RSI_W', 'RSI_W_scaled',
+                                                                  'CS_Return_Rank', 'Sentiment_Score']),
+                         ['Sentiment_Score'])
+
+        metadata = {'feature_names': FEATURES + ['Sentiment_Score']}
+        with patch('ml_model.load_model', return_value=(object(), metadata)):
+            self.assertIsNone(inference_pipeline.InferencePipeline.from_saved_model('AAPL'))
+
+
+class TestSavedModelPipeline(unittest.TestCase):
+    """Varsayılan ayarlarla eğitilip kaydedilen modelin tahmin hattı testleri"""
+
+    def setUp(self):
+        """Geçici model klasörü"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici klasörü temizler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _train_and_load(self):
+        """Sentetik 3 sembollük evrende main ile aynı adımlarla model eğitir, kaydeder ve hattı yükler"""
+        provider = data_providers.SyntheticDataProvider(seed=5)
+        raw = {s: provider.get_history(s, '2016-01-01', '2022-01-01') for s in ('AAPL', 'MSFT', 'NVDA')}
+        frames = {s: feature_engineer.add_technical_indicators(f, features=config.ML_FEATURES)
+                  for s, f in raw.items()}
+        if config.CROSS_SECTIONAL_FEATURES_ENABLED:
+            frames = cross_sectional.add_cross_sectional_features(frames)
+        data = feature_engineer.create_target_variable(feature_engineer.add_multi_timeframe_features(frames['AAPL']))
+
+        normalized, scaler = feature_engineer.normalize_features(data, save_scaler=False, symbol='AAPL')
+        X_train, X_test, y_train, y_test, feature_names = ml_model.prepare_data_for_ml(normalized)
+        model = ml_model.train_model(X_train, y_train, model_type='LogisticRegression', params={'max_iter': 1000})
+        ml_model.save_model(model, 'trained_model', 'AAPL', {'feature_names': feature_names})
+        scaler.save(feature_scaler.scaler_path('AAPL'))
+
+        loaded = inference_pipeline.InferencePipeline.from_saved_model('AAPL')
+        self.assertIsNotNone(loaded)
+        pipeline, saved_model = loaded
+        self.assertTrue(hasattr(saved_model, 'predict_proba'))
+        self.assertEqual(pipeline.feature_names, feature_names)
+        self.assertTrue(any(name.endswith('_W') for name in feature_names))
+        return normalized, pipeline
+
+    def test_default_config_model(self):
+        """Varsayılan ayarlarla (üst zaman dilimi özellikli) eğitilen model ham fiyattan tahmin edilebilmeli"""
+        with patch('config.MODEL_SAVE_PATH', self.tmp_dir):
+            normalized, pipeline = self._train_and_load()
+            history = normalized[['Open', 'High', 'Low', 'Close', 'Volume']]
+
+            latest = pipeline.transform_frame(history, rows=1)
+            np.testing.assert_allclose(latest[0], normalized[pipeline.feature_names].to_numpy()[-1],
+                                       rtol=1e-4, atol=1e-4)
+            self.assertIn(inference_pipeline.predict_signal('AAPL', history)['signal'], ('BUY', 'SELL'))
+
+    def test_cross_sectional_model(self):
+        """Kesitsel özellikli model, CS_* sütunları veride hazır verildiğinde tahmin edilebilmeli"""
+        with patch('config.MODEL_SAVE_PATH', self.tmp_dir), patch('config.CROSS_SECTIONAL_FEATURES_ENABLED', True):
+            normalized, pipeline = self._train_and_load()
+            self.assertIn('CS_Return_Rank', pipeline.feature_names)
+
+            latest = pipeline.transform_frame(normalized, rows=1)
+            np.testing.assert_allclose(latest[0], normalized[pipeline.feature_names].to_numpy()[-1],
+                                       rtol=1e-4, atol=1e-4)
+            self.assertIsNone(inference_pipeline.predict_signal('AAPL', normalized[['Close', 'High', 'Low', 'Volume']]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+test_labeling.py - Labeling modülü için birim testler
+
+Bu dosya vektörel etiket üretimini test eder:
+- Çoklu ufuk yön etiketlerinin shift tabanlı tanımla aynı olması
+- Üçlü bariyer etiketlerinin döngüsel referans uygulamayla aynı olması
+- Geleceği bilinmeyen satırların NaN olması
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import labeling
+import feature_engineer
+import data_providers
+
+
+def _history():
+    """Sentetik günlük veri"""
+    return data_providers.SyntheticDataProvider(seed=9).get_history('AAPL', '2018-01-01', '2021-01-01')
+
+
+def _reference_barrier(close, high, low, horizon, take_profit, stop_loss):
+    """Bar bar ilerleyen referans üçlü bariyer etiketi"""
+    labels, exits = np.full(len(close), np.nan), np.full(len(close), np.nan)
+    for t in range(len(close)):
+        for offset in range(1, horizon + 1):
+            if t + offset >= len(close):
+                break
+            if low[t + offset] <= close[t] * (1 - stop_loss):
+                labels[t], exits[t] = -1, offset
+                break
+            if high[t + offset] >= close[t] * (1 + take_profit):
+                labels[t], exits[t] = 1, offset
+                break
+        else:
+            labels[t], exits[t] = 0, horizon
+    return labels, exits
+
+
+class TestLabeling(unittest.TestCase):
+    """Etiket üretimi testleri"""
+
+    def test_horizon_labels(self):
+        """Her ufuk Close.shift(-h) > Close tanımıyla aynı olmalı, son h satır NaN"""
+        close = _history()['Close']
+        horizons = [1, 3, 10]
+        labels = labeling.horizon_labels(close.to_numpy(), horizons)
+
+        for column, horizon in enumerate(horizons):
+            expected = (close.shift(-horizon) > close).astype(float).to_numpy().copy()
+            expected[-horizon:] = np.nan
+            np.testing.assert_array_equal(labels[:, column], expected)
+        with self.assertRaises(ValueError):
+            labeling.horizon_labels(close.to_numpy(), [0])
+
+    def test_triple_barrier_matches_reference(self):
+        """Üçlü bariyer etiketleri ve çıkış barları referans döngüyle aynı olmalı"""
+        data = _history()
+        close, high, low = (data[c].to_numpy() for c in ('Close', 'High', 'Low'))
+        with patch('labeling._CHUNK_ELEMENTS', 64):  # birden çok parça
+            labels, exits = labeling.triple_barrier_labels(close, high, low, 7, 0.03, 0.02)
+        expected_labels, expected_exits = _reference_barrier(close, high, low, 7, 0.03, 0.02)
+
+        np.testing.assert_array_equal(labels, expected_labels)
+        np.testing.assert_array_equal(exits, expected_exits)
+        self.assertEqual(set(np.unique(labels[~np.isnan(labels)])), {-1.0, 0.0, 1.0})
+
+    def test_add_labels_and_target(self):
+        """add_labels sütunları eklemeli, create_target_variable eski tanımı korumalı, bilinmeyen kuyruk NaN"""
+        data = _history()
+        labeled = labeling.add_labels(data, horizons=[1, 5], barrier_horizon=5)
+
+        for column in ('Target_1', 'Target_5', 'Barrier_Label', 'Barrier_Exit'):
+            self.assertIn(column, labeled.columns)
+        self.assertTrue(np.isnan(labeled['Target_5'].iloc[-5:]).all())
+
+        target = feature_engineer.create_target_variable(data, lookahead_days=2)['Target']
+        self.assertTrue(target.iloc[-2:].isna().all())
+        pd.testing.assert_series_equal(target.iloc[:-2].astype(int),
+                                       (data['Close'].shift(-2) > data['Close']).astype(int).iloc[:-2],
+                                       check_names=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
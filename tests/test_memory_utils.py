@@ -0,0 +1,133 @@
+"""
+test_memory_utils.py - Memory Utils modülü için birim testler
+
+Bu dosya kompakt veri tipi modunu ve bellek raporunu test eder:
+- float32 / uint32 / category dönüşümleri
+- Aralığa sığmayan değerlerin korunması
+- Kompakt modda gösterge ve backtest çıktıları
+- Aşama bazlı bellek raporu
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import memory_utils
+import feature_engineer
+import backtester
+
+
+def _sample_bars(rows=300):
+    """Örnek OHLCV verisi üretir"""
+    dates = pd.bdate_range('2022-01-03', periods=rows)
+    rng = np.random.default_rng(11)
+    close = 100 + rng.normal(0, 1, rows).cumsum()
+    return pd.DataFrame({
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': rng.integers(1_000, 5_000_000, rows),
+        'Symbol': 'AAPL'
+    }, index=dates)
+
+
+class TestCompactDtypes(unittest.TestCase):
+    """compact_dtypes testleri"""
+
+    def test_compact_dtypes_and_memory_saving(self):
+        """Fiyatlar float32, hacim uint32, sembol kategorik olmalı"""
+        bars = _sample_bars()
+        compact = memory_utils.compact_dtypes(bars)
+
+        self.assertEqual(compact['Close'].dtype, np.float32)
+        self.assertEqual(compact['Volume'].dtype, np.uint32)
+        self.assertIsInstance(compact['Symbol'].dtype, pd.CategoricalDtype)
+        self.assertLess(memory_utils.frame_memory_usage(compact), memory_utils.frame_memory_usage(bars) / 2)
+        np.testing.assert_allclose(compact['Close'], bars['Close'], rtol=1e-6)
+        self.assertEqual(bars['Close'].dtype, np.float64)  # girdi değişmemeli
+
+    def test_out_of_range_values_are_kept(self):
+        """32 bite sığmayan veya eksik hacim değerleri korunmalı"""
+        bars = pd.DataFrame({
+            'Volume': np.array([1, 2 ** 40], dtype=np.int64),
+            'Delta': np.array([-5, 3], dtype=np.int64),
+        })
+        compact = memory_utils.compact_dtypes(bars)
+        self.assertEqual(compact['Volume'].dtype, np.int64)
+        self.assertEqual(compact['Delta'].dtype, np.int32)
+
+        with_nan = memory_utils.compact_dtypes(pd.DataFrame({'Volume': [1.0, np.nan]}))
+        self.assertEqual(with_nan['Volume'].dtype, np.float32)
+
+    def test_maybe_compact_respects_config(self):
+        """Kompakt mod kapalıyken veri değişmemeli"""
+        bars = _sample_bars()
+        with patch('config.COMPACT_DTYPES', False):
+            self.assertIs(memory_utils.maybe_compact(bars), bars)
+        with patch('config.COMPACT_DTYPES', True):
+            self.assertEqual(memory_utils.maybe_compact(bars)['Close'].dtype, np.float32)
+
+
+class TestCompactPipeline(unittest.TestCase):
+    """Kompakt modda özellik ve backtest aşamaları testleri"""
+
+    def test_indicators_are_float32(self):
+        """Teknik göstergeler kompakt modda float32 olmalı ve standart sonuca yakın kalmalı"""
+        bars = _sample_bars().drop(columns='Symbol')
+        with patch('config.COMPACT_DTYPES', True):
+            compact = feature_engineer.add_technical_indicators(memory_utils.compact_dtypes(bars))
+        standard = feature_engineer.add_technical_indicators(bars)
+
+        self.assertEqual(compact['RSI'].dtype, np.float32)
+        self.assertEqual(compact['SMA_50'].dtype, np.float32)
+        np.testing.assert_allclose(compact['SMA_50'].dropna(), standard['SMA_50'].dropna(), rtol=1e-4)
+
+    def test_backtest_cash_stays_float64(self):
+        """Kompakt girdide nakit ve P&L float64 hesaplanmalı"""
+        bars = _sample_bars().drop(columns='Symbol')
+        with patch('config.COMPACT_DTYPES', True):
+            data = feature_engineer.add_technical_indicators(memory_utils.compact_dtypes(bars))
+
+        class _AlwaysBuy:
+            def predict(self, X):
+                return np.array([1])
+
+            def predict_proba(self, X):
+                return np.array([[0.1, 0.9]])
+
+        result = backtester.run_backtest(data, _AlwaysBuy(), initial_capital=100000)
+
+        self.assertIsNotNone(result)
+        self.assertIsInstance(result['final_portfolio_value'], float)
+        if not result['portfolio_history'].empty:
+            self.assertEqual(result['portfolio_history']['cash'].dtype, np.float64)
+
+
+class TestMemoryReport(unittest.TestCase):
+    """Aşama bazlı bellek raporu testleri"""
+
+    def test_report_per_stage(self):
+        """Rapor aşama başına toplam bellek içermeli"""
+        report = []
+        for symbol in ['AAPL', 'MSFT']:
+            bars = _sample_bars()
+            memory_utils.record_memory_stage(report, 'fetch', bars, symbol)
+            memory_utils.record_memory_stage(report, 'compact', memory_utils.compact_dtypes(bars), symbol)
+
+        summary = memory_utils.summarize_memory_report(report)
+
+        self.assertEqual(list(summary['stage']), ['fetch', 'compact'])
+        self.assertEqual(list(summary['symbols']), [2, 2])
+        self.assertLess(summary.loc[1, 'memory_mb'], summary.loc[0, 'memory_mb'])
+
+    def test_empty_report(self):
+        """Boş rapor boş tablo döndürmeli"""
+        self.assertTrue(memory_utils.summarize_memory_report([]).empty)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+"""
+test_multi_timeframe_features.py - Çoklu zaman dilimi özellikleri için birim testler
+
+Bu dosya feature_engineer'ın haftalık/aylık gösterge üretimini test eder:
+- OHLCV'nin üst zaman dilimine doğru toplanması
+- Her satırın yalnızca kapanmış son barı görmesi (ileriye bakma yok)
+- Gelecekteki verinin geçmiş satırları değiştirmemesi
+- Üretilen sütunların ölçekleme ve ML veri hazırlığına girmesi
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import feature_engineer
+import ml_model
+import config
+import data_providers
+
+
+TIMEFRAMES = {'W': ['RSI', 'Price_Change'], 'M': ['Price_Change']}
+
+
+def _history():
+    """Sentetik günlük veri"""
+    return data_providers.SyntheticDataProvider(seed=11).get_history('AAPL', '2017-01-01', '2021-06-16')
+
+
+class TestMultiTimeframeFeatures(unittest.TestCase):
+    """Çoklu zaman dilimi testleri"""
+
+    def test_resample_ohlcv(self):
+        """Haftalık barlar günlük satırlardan doğru toplanmalı"""
+        data = _history()
+        weekly = feature_engineer.resample_ohlcv(data, 'W')
+        week = data.loc['2019-03-04':'2019-03-10']
+        bar = weekly.loc[pd.Period('2019-03-04', 'W')]
+
+        self.assertEqual(bar['Open'], week['Open'].iloc[0])
+        self.assertEqual(bar['High'], week['High'].max())
+        self.assertEqual(bar['Low'], week['Low'].min())
+        self.assertEqual(bar['Close'], week['Close'].iloc[-1])
+        self.assertEqual(bar['Volume'], week['Volume'].sum())
+
+    def test_uses_last_closed_bar(self):
+        """Her satır, kendi tarihinden önce kapanmış son haftalık/aylık barın değerini almalı"""
+        data = _history()
+        result = feature_engineer.add_multi_timeframe_features(data, TIMEFRAMES)
+        weekly_close = feature_engineer.resample_ohlcv(data, 'W')['Close']
+        weekly_change = weekly_close.pct_change()
+
+        # Haftanın son günü (Cuma) hâlâ önceki haftayı, sonraki Pazartesi kapanan haftayı görür
+        friday, monday = pd.Timestamp('2019-03-08'), pd.Timestamp('2019-03-11')
+        self.assertAlmostEqual(result.loc[friday, 'Price_Change_W'], weekly_change[pd.Period('2019-02-25', 'W')])
+        self.assertAlmostEqual(result.loc[monday, 'Price_Change_W'], weekly_change[pd.Period('2019-03-04', 'W')])
+
+        # Veri ay ortasında bitiyor: son (kapanmamış) aylık bar hiçbir satırda kullanılmaz
+        monthly_change = feature_engineer.resample_ohlcv(data, 'M')['Close'].pct_change()
+        self.assertAlmostEqual(result['Price_Change_M'].iloc[-1], monthly_change.iloc[-2])
+        self.assertTrue(result[['RSI_W', 'Price_Change_W', 'Price_Change_M']].iloc[:5].isna().all().all())
+
+    def test_no_look_ahead(self):
+        """Kesim tarihinden sonraki fiyat değişiklikleri önceki satırları etkilememeli"""
+        data = _history()
+        cut = data.index[600]
+        shocked = data.copy()
+        shocked.loc[shocked.index > cut, ['Open', 'High', 'Low', 'Close']] *= 3
+
+        normal = feature_engineer.add_multi_timeframe_features(data, TIMEFRAMES)
+        changed = feature_engineer.add_multi_timeframe_features(shocked, TIMEFRAMES)
+        columns = ['RSI_W', 'Price_Change_W', 'Price_Change_M']
+
+        pd.testing.assert_frame_equal(normal.loc[:cut, columns], changed.loc[:cut, columns])
+        self.assertFalse(normal[columns].iloc[-1].equals(changed[columns].iloc[-1]))
+
+    def test_model_features_reach_ml_data(self):
+        """Çoklu zaman dilimi sütunları ölçeklenmeli ve model özelliklerine girmeli"""
+        self.assertEqual(feature_engineer.model_features(TIMEFRAMES, cross_sectional_features=False),
+                         config.ML_FEATURES + ['RSI_W', 'Price_Change_W', 'Price_Change_M'])
+        self.assertEqual(feature_engineer.model_features({}, cross_sectional_features=False), config.ML_FEATURES)
+
+        with patch('config.MULTI_TIMEFRAME_FEATURES', TIMEFRAMES):
+            data = feature_engineer.add_technical_indicators(_history(), features=config.ML_FEATURES)
+            data = feature_engineer.create_target_variable(feature_engineer.add_multi_timeframe_features(data))
+            normalized, _ = feature_engineer.normalize_features(data, save_scaler=False)
+            feature_names = ml_model.prepare_data_for_ml(normalized)[4]
+
+        for column in ['RSI_W', 'Price_Change_W', 'Price_Change_M']:
+            self.assertIn(column, feature_names)
+            self.assertIn(f'{column}_scaled', feature_names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""
+test_panel_indicators.py - Panel Indicators modülü için birim testler
+
+Bu dosya çok sembollü vektörel gösterge hesabını test eder:
+- Sembol bazlı add_technical_indicators ile aynı sonuçlar
+- Farklı uzunluk ve takvimli sembollerin 'bar' hizalaması
+- 'date' hizalamasında eksik tarihlerin NaN olması
+- EMA özyinelemesinin pandas ewm ile aynı olması
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import panel_indicators
+import feature_engineer
+import data_providers
+
+
+def _frames():
+    """Farklı başlangıç tarihli ve takvimli sentetik semboller"""
+    provider = data_providers.SyntheticDataProvider(seed=3)
+    frames = {
+        'AAPL': provider.get_history('AAPL', '2019-01-01', '2022-01-01'),
+        'MSFT': provider.get_history('MSFT', '2020-06-01', '2022-01-01'),
+        'THYAO.IS': provider.get_history('THYAO.IS', '2019-01-01', '2022-01-01'),
+    }
+    frames['AAPL'].iloc[100:130, :4] = 50.0  # sabit pencere (std = 0)
+    frames['MSFT'].iloc[50, frames['MSFT'].columns.get_loc('Volume')] = 0
+    return frames
+
+
+class TestPanelIndicators(unittest.TestCase):
+    """Panel gösterge hesabı testleri"""
+
+    def _assert_matches_batch(self, enhanced, frames):
+        """Her sembolün sonucu sembol bazlı hesapla aynı olmalı"""
+        for symbol, frame in frames.items():
+            batch = feature_engineer.add_technical_indicators(frame)
+            self.assertEqual(list(enhanced[symbol].columns), list(batch.columns))
+            for column in panel_indicators.indicator_columns():
+                np.testing.assert_allclose(enhanced[symbol][column].to_numpy(dtype=float),
+                                           batch[column].to_numpy(dtype=float),
+                                           rtol=1e-9, atol=1e-9, err_msg=f"{symbol} {column}")
+
+    def test_matches_per_symbol_indicators(self):
+        """Panel sonucu sembol bazlı add_technical_indicators ile aynı olmalı"""
+        frames = _frames()
+        self._assert_matches_batch(panel_indicators.add_panel_indicators(frames), frames)
+
+    def test_custom_parameters(self):
+        """Farklı parametrelerde de aynı sonuç üretilmeli"""
+        params = {'RSI_PERIOD': 7, 'MACD_FAST': 5, 'MACD_SLOW': 35, 'MACD_SIGNAL': 5, 'SMA_SHORT_PERIOD': 10,
+                  'SMA_LONG_PERIOD': 100, 'BB_PERIOD': 30, 'BB_STD': 2.5, 'VOLATILITY_PERIOD': 30}
+        frames = _frames()
+        with patch('config.TECHNICAL_INDICATORS', params):
+            enhanced = panel_indicators.add_panel_indicators(frames)
+            self._assert_matches_batch(enhanced, frames)
+        self.assertIn('SMA_100', enhanced['AAPL'].columns)
+
+    def test_ewm_matches_pandas(self):
+        """Baştaki ve aradaki NaN'larla EMA pandas ewm ile aynı olmalı"""
+        values = np.random.default_rng(1).normal(100, 5, (200, 3))
+        values[:30, 1] = np.nan
+        values[[60, 61, 90], 2] = np.nan
+        expected = pd.DataFrame(values).ewm(span=12).mean().to_numpy()
+
+        np.testing.assert_array_equal(panel_indicators.ewm_mean(values, 12), expected)
+
+
+class TestBuildPanel(unittest.TestCase):
+    """Panel oluşturma testleri"""
+
+    def test_date_alignment(self):
+        """'date' hizalaması tarih birleşimi kullanmalı, eksik tarihler NaN olmalı"""
+        frames = _frames()
+        panel = panel_indicators.build_panel(frames, align='date')
+
+        self.assertTrue(panel['index'].is_monotonic_increasing)
+        self.assertEqual(panel['Close'].shape, (len(panel['index']), 3))
+        msft = panel['symbols'].index('MSFT')
+        self.assertTrue(np.isnan(panel['Close'][0, msft]))
+        np.testing.assert_array_equal(panel['Close'][panel['rows']['MSFT'], msft], frames['MSFT']['Close'].to_numpy())
+
+    def test_bar_alignment(self):
+        """'bar' hizalaması her sembolü son satıra hizalamalı"""
+        frames = _frames()
+        panel = panel_indicators.build_panel(frames, align='bar')
+
+        self.assertIsNone(panel['index'])
+        self.assertEqual(panel['Close'].shape[0], max(len(f) for f in frames.values()))
+        msft = panel['symbols'].index('MSFT')
+        self.assertEqual(panel['Close'][-1, msft], frames['MSFT']['Close'].iloc[-1])
+        with self.assertRaises(ValueError):
+            panel_indicators.build_panel(frames, align='week')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+test_purged_cv.py - Purged CV modülü için birim testler
+
+Bu dosya örtüşen etiketler için çapraz doğrulama bölücülerini test eder:
+- Eğitim örneklerinin etiket aralığının test bloklarıyla örtüşmemesi (purge)
+- Test bloklarından sonra ambargo uygulanması
+- CPCV kombinasyonları
+- Kat indekslerinin önbellekten tekrar kullanılması ve sklearn ile uyum
+"""
+
+import unittest
+import numpy as np
+import sys
+import os
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import cross_val_score, GridSearchCV
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import purged_cv
+import ml_model
+
+
+def _reference_train(n_samples, test, ends, embargo):
+    """Örnek örnek kontrol eden referans purge"""
+    blocks = np.split(test, np.flatnonzero(np.diff(test) > 1) + 1)
+    train = []
+    for i in range(n_samples):
+        if i in set(test):
+            continue
+        if all(ends[i] < block[0] or i > ends[block].max() + embargo for block in blocks):
+            train.append(i)
+    return np.array(train)
+
+
+class TestPurgedCV(unittest.TestCase):
+    """Purge edilmiş bölücü testleri"""
+
+    def setUp(self):
+        """Kat önbelleğini temizler"""
+        purged_cv.clear_fold_cache()
+
+    def test_purged_kfold(self):
+        """Test blokları tüm örnekleri bir kez kapsamalı, eğitim purge ve ambargoya uymalı"""
+        splitter = purged_cv.PurgedKFold(n_splits=4, label_horizon=3, embargo_pct=0.05)
+        folds = list(splitter.split(np.zeros((200, 2))))
+
+        np.testing.assert_array_equal(np.sort(np.concatenate([test for _, test in folds])), np.arange(200))
+        train, test = folds[1]
+        self.assertEqual(train[train < test[0]].max(), test[0] - 4)      # etiketi teste uzananlar çıkarılır
+        self.assertEqual(train[train > test[-1]].min(), test[-1] + 3 + 10 + 1)  # etiket sonu + ambargo
+        self.assertEqual(splitter.get_n_splits(), 4)
+
+    def test_variable_label_ends(self):
+        """Örnek başına etiket bitişleriyle sonuç referans purge ile aynı olmalı"""
+        rng = np.random.default_rng(0)
+        ends = np.arange(150) + rng.integers(0, 8, 150)
+        splitter = purged_cv.CombinatorialPurgedKFold(n_splits=5, n_test_splits=2, embargo_pct=0.02, label_ends=ends)
+        folds = splitter.folds(150)
+
+        self.assertEqual(len(folds), splitter.get_n_splits())
+        self.assertEqual(len(folds), 10)
+        for train, test in folds:
+            np.testing.assert_array_equal(train, _reference_train(150, test, ends, 3))
+
+    def test_fold_cache_and_sklearn(self):
+        """Katlar bir kez hesaplanmalı; cross_val_score ve GridSearchCV ile çalışmalı"""
+        rng = np.random.default_rng(1)
+        X = rng.normal(size=(300, 3))
+        y = (X[:, 0] > 0).astype(int)
+        splitter = purged_cv.PurgedKFold(n_splits=5, label_horizon=2, embargo_pct=0.01)
+
+        scores = cross_val_score(LogisticRegression(), X, y, cv=splitter)
+        search = GridSearchCV(LogisticRegression(), {'C': [0.1, 1.0]}, cv=splitter).fit(X, y)
+
+        self.assertEqual(len(scores), 5)
+        self.assertIn(search.best_params_['C'], (0.1, 1.0))
+        self.assertEqual(len(purged_cv._FOLD_CACHE), 1)
+        self.assertIs(splitter.folds(300), purged_cv.PurgedKFold(5, 2, 0.01).folds(300))
+
+    def test_train_model_uses_purged_folds(self):
+        """train_model'in çapraz doğrulaması purge edilmiş katları kullanmalı"""
+        rng = np.random.default_rng(2)
+        X = rng.normal(size=(200, 2))
+        y = (X[:, 0] > 0).astype(int)
+
+        model = ml_model.train_model(X, y, 'LogisticRegression', {'max_iter': 200})
+
+        self.assertIsNotNone(model)
+        self.assertEqual(len(purged_cv._FOLD_CACHE), 1)
+        with self.assertRaises(ValueError):
+            purged_cv.get_cv_splitter('shuffled')
+
+
+if __name__ == '__main__':
+    unittest.main()
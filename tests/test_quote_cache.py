@@ -0,0 +1,143 @@
+"""
+test_quote_cache.py - Quote Cache modülü için birim testler
+
+Bu dosya güncel fiyat önbelleğini ağ kullanmadan test eder:
+- TTL süresince önbellekten okuma ve süre dolunca yeniden çekme
+- Eşzamanlı isteklerin tek indirmede birleştirilmesi
+- Toplu sorgu ve arka plan yenilemesi
+- data_handler fonksiyonlarının önbellek üzerinden çalışması
+"""
+
+import unittest
+from unittest.mock import patch
+import threading
+import time
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import quote_cache
+import data_handler
+
+
+class _CountingFetcher:
+    """Çağrı sayısını tutan sahte fiyat kaynağı"""
+
+    def __init__(self, delay=0.0, missing=()):
+        self.delay = delay
+        self.missing = set(missing)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, symbol):
+        with self.lock:
+            self.calls.append(symbol)
+            price = 100.0 + len(self.calls)
+        time.sleep(self.delay)
+        if symbol in self.missing:
+            return None
+        return {'price': price, 'change': 1.0, 'change_percent': 1.0}
+
+
+class TestQuoteCache(unittest.TestCase):
+    """QuoteCache testleri"""
+
+    def test_ttl_hit_and_expiry(self):
+        """TTL içinde önbellekten okunmalı, süre dolunca yeniden çekilmeli"""
+        fetcher = _CountingFetcher()
+        cache = quote_cache.QuoteCache(ttl=0.2, fetcher=fetcher)
+
+        first = cache.get('AAPL')
+        second = cache.get('AAPL')
+        self.assertEqual(first, second)
+        self.assertEqual(len(fetcher.calls), 1)
+
+        time.sleep(0.25)
+        third = cache.get('AAPL')
+        self.assertEqual(len(fetcher.calls), 2)
+        self.assertNotEqual(first['price'], third['price'])
+
+    def test_concurrent_requests_single_flight(self):
+        """Aynı sembol için eşzamanlı istekler tek indirmede birleşmeli"""
+        fetcher = _CountingFetcher(delay=0.2)
+        cache = quote_cache.QuoteCache(ttl=60, fetcher=fetcher)
+        results = []
+
+        threads = [threading.Thread(target=lambda: results.append(cache.get('MSFT'))) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(fetcher.calls, ['MSFT'])
+        self.assertEqual(len(results), 10)
+        self.assertTrue(all(r == results[0] for r in results))
+
+    def test_get_many_fetches_only_misses(self):
+        """Toplu sorguda sadece eksik semboller çekilmeli, sıra korunmalı"""
+        fetcher = _CountingFetcher(missing=['BAD'])
+        cache = quote_cache.QuoteCache(ttl=60, fetcher=fetcher)
+        cache.get('AAPL')
+
+        quotes = cache.get_many(['TSLA', 'AAPL', 'BAD', 'MSFT', 'TSLA'])
+
+        self.assertEqual(list(quotes), ['TSLA', 'AAPL', 'MSFT'])
+        self.assertEqual(sorted(fetcher.calls), ['AAPL', 'BAD', 'MSFT', 'TSLA'])
+        self.assertEqual(cache.stats['errors'], 1)
+
+        cache.get_many(['TSLA', 'AAPL', 'MSFT'])
+        self.assertEqual(len(fetcher.calls), 4)
+
+    def test_failures_are_not_cached(self):
+        """Hata veren semboller önbelleğe yazılmamalı"""
+        def failing(symbol):
+            raise ConnectionError("ağ yok")
+
+        cache = quote_cache.QuoteCache(ttl=60, fetcher=failing)
+        self.assertIsNone(cache.get('AAPL'))
+        self.assertEqual(cache.get_many(['AAPL']), {})
+        self.assertEqual(cache.stats['fetches'], 2)
+
+    def test_background_refresh(self):
+        """Arka plan yenilemesi izlenen sembolleri tazelemeli"""
+        fetcher = _CountingFetcher()
+        cache = quote_cache.QuoteCache(ttl=60, fetcher=fetcher)
+        self.assertTrue(cache.start_background_refresh(['AAPL', 'MSFT'], interval=0.05))
+        self.assertFalse(cache.start_background_refresh(interval=0.05))
+        try:
+            time.sleep(0.3)
+        finally:
+            cache.stop_background_refresh(timeout=1.0)
+
+        self.assertGreaterEqual(fetcher.calls.count('AAPL'), 2)
+        calls = len(fetcher.calls)
+        cache.get_many(['AAPL', 'MSFT'])
+        self.assertEqual(len(fetcher.calls), calls)
+
+
+class TestDataHandlerQuotes(unittest.TestCase):
+    """data_handler güncel fiyat fonksiyonları testleri"""
+
+    def setUp(self):
+        """Paylaşılan önbelleği sıfırlar"""
+        quote_cache.reset_quote_cache()
+
+    def tearDown(self):
+        """Paylaşılan önbelleği sıfırlar"""
+        quote_cache.reset_quote_cache()
+
+    def test_latest_prices_use_shared_cache(self):
+        """Tekil ve toplu fiyat sorguları aynı önbelleği kullanmalı"""
+        with patch('config.DATA_PROVIDER', 'synthetic'):
+            prices = data_handler.get_latest_prices(['AAPL', 'MSFT'])
+            price = data_handler.get_latest_price('AAPL')
+
+        self.assertEqual(list(prices), ['AAPL', 'MSFT'])
+        self.assertEqual(price, prices['AAPL'])
+        self.assertEqual(quote_cache.get_quote_cache().stats['fetches'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+test_shared_data.py - Shared Data modülü için birim testler
+
+Bu dosya bellek eşlemeli paylaşımlı veri katmanını test eder:
+- Yayınlama ve salt okunur bağlanma
+- Kopyasız kolon görünümleri
+- Süreç havuzundaki işçilerden erişim
+"""
+
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+import pickle
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import shared_data
+
+
+def _worker_close_sum(args):
+    """İşçi süreçte paylaşımlı kolonun toplamını hesaplar"""
+    handle, symbol = args
+    return float(shared_data.attach_arrays(handle, symbol, ['Close'])['Close'].sum())
+
+
+class TestSharedData(unittest.TestCase):
+    """Paylaşımlı veri katmanı testleri"""
+
+    def setUp(self):
+        """Geçici yayın dizini ve örnek veriler hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+        dates = pd.bdate_range('2022-01-03', periods=250, tz='America/New_York')
+        rng = np.random.default_rng(3)
+        self.frames = {
+            symbol: pd.DataFrame({
+                'Close': 100 + rng.normal(0, 1, len(dates)).cumsum(),
+                'Volume': rng.integers(1000, 5000, len(dates)),
+                'Label': ['x'] * len(dates)
+            }, index=dates)
+            for symbol in ['AAPL', 'MSFT', 'THYAO.IS']
+        }
+        self.handle = shared_data.publish_frames(self.frames, base_path=self.tmp_dir)
+
+    def tearDown(self):
+        """Yayını ve geçici dizini siler"""
+        shared_data.release(self.handle)
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_arrays_match_source_and_are_read_only(self):
+        """Kolonlar kaynakla aynı ve yazılamaz olmalı"""
+        arrays = shared_data.attach_arrays(self.handle, 'AAPL')
+
+        self.assertEqual(list(arrays), ['Close', 'Volume'])  # metin kolonu yayınlanmaz
+        np.testing.assert_array_equal(arrays['Close'], self.frames['AAPL']['Close'].to_numpy())
+        self.assertFalse(arrays['Close'].flags.writeable)
+        with self.assertRaises(ValueError):
+            arrays['Close'][0] = 0.0
+
+    def test_columns_are_contiguous_views(self):
+        """Kolonlar bitişik ve kopyasız görünümler olmalı"""
+        first = shared_data.attach_arrays(self.handle, 'MSFT', ['Close'])['Close']
+        second = shared_data.attach_arrays(self.handle, 'MSFT', ['Close'])['Close']
+
+        self.assertTrue(first.flags.c_contiguous)
+        self.assertTrue(np.shares_memory(first, second))
+
+    def test_attach_frame_restores_index(self):
+        """DataFrame olarak bağlanınca indeks ve zaman dilimi korunmalı"""
+        frame = shared_data.attach_frame(self.handle, 'THYAO.IS', ['Close'])
+
+        self.assertTrue(frame.index.equals(self.frames['THYAO.IS'].index))
+        np.testing.assert_allclose(frame['Close'], self.frames['THYAO.IS']['Close'])
+
+    def test_handle_is_small_and_picklable(self):
+        """İşçilere gönderilen tanımlayıcı küçük olmalı"""
+        self.assertLess(len(pickle.dumps(self.handle)), 2048)
+
+    def test_workers_read_shared_data(self):
+        """Süreç havuzundaki işçiler aynı veriyi okuyabilmeli"""
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            sums = list(executor.map(_worker_close_sum, [(self.handle, s) for s in self.frames]))
+
+        expected = [float(frame['Close'].sum()) for frame in self.frames.values()]
+        np.testing.assert_allclose(sums, expected)
+
+    def test_release_removes_files(self):
+        """release yayın dizinini silmeli"""
+        path = self.handle['path']
+        self.assertTrue(os.path.isdir(path))
+        shared_data.release(self.handle)
+        self.assertFalse(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+test_snapshots.py - Snapshots modülü için birim testler
+
+Bu dosya içerik özetli veri snapshot'larını test eder:
+- Aynı içeriğin aynı kimliği, farklı içeriğin yeni kimliği üretmesi
+- Snapshot verisinin birebir geri okunması
+- Anahtara göre en güncel snapshot'ın bulunması
+- Aşama çıktısı önbelleğinin yeniden kullanımı
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import snapshots
+import data_providers
+
+
+def _universe():
+    """Sentetik sembol evreni üretir"""
+    provider = data_providers.SyntheticDataProvider(seed=7)
+    return {s: provider.get_history(s, '2022-01-01', '2022-07-01') for s in ['MSFT', 'AAPL']}
+
+
+class TestSnapshots(unittest.TestCase):
+    """Snapshot oluşturma ve okuma testleri"""
+
+    def setUp(self):
+        """Geçici snapshot dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_identical_content_same_id(self):
+        """Aynı içerik ve anahtar aynı kimliği üretmeli, sembol sırası önemsiz olmalı"""
+        frames = _universe()
+        first = snapshots.create_snapshot(frames, '2022-01-01', '2022-07-01', base_path=self.tmp_dir)
+        reordered = {'AAPL': frames['AAPL'], 'MSFT': frames['MSFT']}
+        second = snapshots.create_snapshot(reordered, '2022-01-01', '2022-07-01', base_path=self.tmp_dir)
+
+        self.assertEqual(first['snapshot_id'], second['snapshot_id'])
+        self.assertEqual(first['key']['symbols'], ['AAPL', 'MSFT'])
+        self.assertEqual(len(snapshots.list_snapshots(self.tmp_dir)), 1)
+
+    def test_changed_content_or_key_new_id(self):
+        """Veri, tarih aralığı veya ayarlama modu değişirse yeni kimlik oluşmalı"""
+        frames = _universe()
+        base = snapshots.create_snapshot(frames, '2022-01-01', '2022-07-01', base_path=self.tmp_dir)
+
+        changed = dict(frames)
+        changed['AAPL'] = frames['AAPL'].copy()
+        changed['AAPL'].iloc[5, 3] += 0.01
+        revised = snapshots.create_snapshot(changed, '2022-01-01', '2022-07-01', base_path=self.tmp_dir)
+        other_range = snapshots.create_snapshot(frames, '2022-01-01', '2022-08-01', base_path=self.tmp_dir)
+        raw = snapshots.create_snapshot(frames, '2022-01-01', '2022-07-01', adjustment='raw', base_path=self.tmp_dir)
+
+        ids = {base['snapshot_id'], revised['snapshot_id'], other_range['snapshot_id'], raw['snapshot_id']}
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(base['content']['MSFT'], revised['content']['MSFT'])
+
+        # Eski snapshot değişmeden kalmalı, referans en güncele işaret etmeli
+        old = snapshots.load_snapshot(base['snapshot_id'], base_path=self.tmp_dir)
+        pd.testing.assert_frame_equal(old['AAPL'], frames['AAPL'], check_freq=False)
+        latest = snapshots.find_snapshot(['MSFT', 'AAPL'], '2022-01-01', '2022-07-01', base_path=self.tmp_dir)
+        self.assertEqual(latest['snapshot_id'], revised['snapshot_id'])
+
+    def test_load_roundtrip(self):
+        """Snapshot verisi birebir geri okunmalı"""
+        frames = _universe()
+        manifest = snapshots.create_snapshot(frames, '2022-01-01', '2022-07-01', base_path=self.tmp_dir)
+
+        loaded = snapshots.load_snapshot(manifest['snapshot_id'], ['AAPL'], ['Close'], base_path=self.tmp_dir)
+
+        self.assertEqual(list(loaded), ['AAPL'])
+        np.testing.assert_array_equal(loaded['AAPL']['Close'].to_numpy(), frames['AAPL']['Close'].to_numpy())
+        self.assertEqual(snapshots.frame_hash(frames['AAPL']), manifest['content']['AAPL'])
+        self.assertIsNone(snapshots.load_snapshot('missing', base_path=self.tmp_dir))
+
+
+class TestOutputCache(unittest.TestCase):
+    """Aşama çıktısı önbelleği testleri"""
+
+    def setUp(self):
+        """Geçici snapshot dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def test_cached_output_reused(self):
+        """Aynı snapshot ve parametrelerde çıktı yeniden hesaplanmamalı"""
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return pd.DataFrame({'x': [1.0, 2.0]})
+
+        first, hit_first = snapshots.cached_output('abc', 'features', compute, 'AAPL', {'p': 1}, base_path=self.tmp_dir)
+        second, hit_second = snapshots.cached_output('abc', 'features', compute, 'AAPL', {'p': 1}, base_path=self.tmp_dir)
+        snapshots.cached_output('abc', 'features', compute, 'AAPL', {'p': 2}, base_path=self.tmp_dir)
+        snapshots.cached_output(None, 'features', compute, 'AAPL', {'p': 1}, base_path=self.tmp_dir)
+
+        self.assertEqual((hit_first, hit_second), (False, True))
+        pd.testing.assert_frame_equal(first, second)
+        self.assertEqual(len(calls), 3)
+
+    def test_output_cache_can_be_disabled(self):
+        """Önbellek kapalıyken her seferinde hesaplanmalı"""
+        calls = []
+        with patch('config.SNAPSHOT_OUTPUT_CACHE', False):
+            for _ in range(2):
+                snapshots.cached_output('abc', 'model', lambda: calls.append(1) or 'm', base_path=self.tmp_dir)
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+test_streaming_indicators.py - Streaming Indicators modülü için birim testler
+
+Bu dosya artımlı (O(1)) gösterge motorunu test eder:
+- Toplu add_technical_indicators ile birebir aynı sonuçlar
+- Geçmişle hazırlanıp canlı barlarla devam etme
+- BarAggregator çıktısının doğrudan işlenmesi
+- Durumun geçmiş uzunluğundan bağımsız kalması
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streaming_indicators
+import feature_engineer
+import data_providers
+import bar_aggregator
+
+
+def _history(start='2018-01-01', end='2022-01-01'):
+    """Sabit fiyat ve sıfır hacim bölümleri içeren sentetik günlük veri"""
+    data = data_providers.SyntheticDataProvider(seed=11).get_history('AAPL', start, end)
+    data.iloc[100:130, :4] = 50.0           # sabit pencere (std = 0)
+    data.iloc[300:303, 3] = data['Close'].iloc[299]
+    data.iloc[400, data.columns.get_loc('Volume')] = 0
+    return data
+
+
+def _assert_same(test, streamed, batch, columns):
+    """Değerler ve NaN konumları birebir aynı olmalı"""
+    for column in columns:
+        np.testing.assert_array_equal(streamed[column].to_numpy(dtype=float), batch[column].to_numpy(dtype=float),
+                                      err_msg=column)
+
+
+class TestStreamingIndicators(unittest.TestCase):
+    """Tek sembol artımlı hesap testleri"""
+
+    def test_matches_batch_exactly(self):
+        """Tüm göstergeler toplu hesapla birebir aynı olmalı"""
+        data = _history()
+        indicators = streaming_indicators.StreamingIndicators()
+
+        streamed = indicators.warm_up(data)
+        batch = feature_engineer.add_technical_indicators(data)
+
+        self.assertEqual(list(streamed.columns), list(batch.columns))
+        _assert_same(self, streamed, batch, indicators.columns)
+
+    def test_custom_parameters(self):
+        """Farklı parametrelerle de toplu hesapla aynı olmalı"""
+        params = {'RSI_PERIOD': 7, 'MACD_FAST': 5, 'MACD_SLOW': 35, 'MACD_SIGNAL': 5, 'SMA_SHORT_PERIOD': 10,
+                  'SMA_LONG_PERIOD': 100, 'BB_PERIOD': 30, 'BB_STD': 2.5, 'VOLATILITY_PERIOD': 10}
+        data = _history()
+        with patch('config.TECHNICAL_INDICATORS', params):
+            batch = feature_engineer.add_technical_indicators(data)
+        indicators = streaming_indicators.StreamingIndicators(params)
+
+        _assert_same(self, indicators.warm_up(data), batch, indicators.columns)
+
+    def test_state_is_bounded(self):
+        """Durum boyutu geçmiş uzunluğundan bağımsız olmalı"""
+        indicators = streaming_indicators.StreamingIndicators()
+        indicators.warm_up(_history('2010-01-01', '2022-01-01'))
+
+        window_sizes = [len(w.values) for w in indicators._close_windows.values()]
+        self.assertLessEqual(max(window_sizes), indicators.sma_long)
+        self.assertLessEqual(len(indicators._recent_high.candidates), 20)
+        self.assertEqual(len(indicators._closes), 11)
+
+
+class TestStreamingEngine(unittest.TestCase):
+    """Çok sembollü motor testleri"""
+
+    def test_warm_up_then_live_bars(self):
+        """Geçmişle hazırlanıp canlı barlarla devam eden motor toplu hesapla aynı olmalı"""
+        data = _history()
+        live_bars = [{'symbol': 'AAPL', 'timeframe': '1d', 'timestamp': ts, **bar}
+                     for ts, bar in data.iloc[-60:].to_dict('index').items()]
+        engine = streaming_indicators.StreamingIndicatorEngine()
+        engine.warm_up('AAPL', data.iloc[:-60], timeframe='1d')
+
+        rows = engine.on_bars(live_bars)
+        batch = feature_engineer.add_technical_indicators(data).iloc[-60:]
+
+        _assert_same(self, pd.DataFrame(rows, index=batch.index), batch, engine.state('AAPL', '1d').columns)
+        self.assertEqual(engine.latest[('AAPL', '1d')]['timestamp'], data.index[-1])
+
+        # Her zaman dilimi ayrı durum tutar: hazırlanmamış bir durum pencereleri baştan doldurur
+        other = engine.on_bars([dict(bar, timeframe='1h') for bar in live_bars])
+        self.assertTrue(pd.DataFrame(other)['SMA_50'].iloc[:49].isna().all())
+
+    def test_aggregator_bars(self):
+        """BarAggregator'ın yayınladığı barlar doğrudan işlenmeli"""
+        minutes = data_providers.SyntheticDataProvider(seed=5).get_history('MSFT', '2023-03-06', '2023-03-10', '1m')
+        aggregator = bar_aggregator.BarAggregator(['15m'])
+        engine = streaming_indicators.StreamingIndicatorEngine()
+
+        rows = []
+        for ts, bar in minutes.iterrows():
+            emitted = aggregator.update_bar('MSFT', ts, bar['Open'], bar['High'], bar['Low'],
+                                            bar['Close'], bar['Volume'])
+            rows.extend(engine.on_bars(emitted))
+
+        streamed = pd.DataFrame(rows).set_index('timestamp')
+        expected = feature_engineer.add_technical_indicators(
+            bar_aggregator.aggregate_bars(minutes, '15m', 'MSFT').iloc[:len(streamed)])
+        _assert_same(self, streamed, expected, ['SMA_20', 'RSI', 'MACD_Hist', 'BB_Position', 'Recent_High'])
+
+
+if __name__ == '__main__':
+    unittest.main()
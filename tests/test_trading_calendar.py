@@ -0,0 +1,143 @@
+"""
+test_trading_calendar.py - Trading Calendar modülü için birim testler
+
+Bu dosya NYSE ve BIST işlem takvimlerini test eder:
+- Tatiller ve yarım günler
+- Beklenen bar sayıları ve eksik seans tespiti
+- Sembollerin ortak seans indeksine hizalanması
+- Zamanlama sorguları (açık mı, sonraki açılış/kapanış)
+"""
+
+import unittest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import trading_calendar
+import bar_aggregator
+import data_handler
+
+
+class TestNYSECalendar(unittest.TestCase):
+    """NYSE takvimi testleri"""
+
+    def setUp(self):
+        """NYSE takvimini alır"""
+        self.calendar = trading_calendar.get_calendar('NYSE')
+
+    def test_known_session_counts(self):
+        """Bilinen yıllık seans sayıları tutmalı"""
+        self.assertEqual(self.calendar.session_count('2023-01-01', '2024-01-01'), 250)
+        self.assertEqual(self.calendar.session_count('2024-01-01', '2025-01-01'), 252)
+
+    def test_holidays_and_half_days(self):
+        """Tatiller seans olmamalı, yarım günler erken kapanmalı"""
+        holidays = ['2024-01-01', '2024-03-29', '2024-06-19', '2024-07-04', '2024-11-28', '2024-12-25']
+        self.assertFalse(self.calendar.is_session(np.array(holidays, dtype='datetime64[D]')).any())
+        self.assertTrue(self.calendar.is_session(np.array(['2024-07-03'], dtype='datetime64[D]'))[0])
+
+        half_days = self.calendar.sessions[self.calendar.half_days]
+        for day in ['2024-07-03', '2024-11-29', '2024-12-24']:
+            self.assertIn(np.datetime64(day), half_days)
+        self.assertEqual(self.calendar.next_close('2024-11-29 10:00-05:00'),
+                         pd.Timestamp('2024-11-29 13:00', tz='America/New_York'))
+
+    def test_expected_bars(self):
+        """Gün içi beklenen bar sayısı yarım günleri hesaba katmalı"""
+        self.assertEqual(self.calendar.expected_bars('2024-11-25', '2024-11-30', '1d'), 4)
+        self.assertEqual(self.calendar.expected_bars('2024-11-29', '2024-11-30', '5m'), 42)
+        self.assertEqual(self.calendar.expected_bars('2024-11-26', '2024-11-27', '1h'), 7)
+
+    def test_missing_sessions(self):
+        """Veride olmayan seanslar bulunmalı, tatiller eksik sayılmamalı"""
+        sessions = self.calendar.sessions_in_range('2024-06-01', '2024-08-01')
+        index = pd.DatetimeIndex(np.delete(sessions, [3, 4]).astype('datetime64[ns]'))
+
+        missing = self.calendar.missing_sessions(index)
+
+        np.testing.assert_array_equal(missing, sessions[[3, 4]])
+
+    def test_scheduling(self):
+        """Açık/kapalı durumu ve sonraki açılış doğru olmalı"""
+        self.assertTrue(self.calendar.is_open('2024-07-03 12:00-04:00'))
+        self.assertFalse(self.calendar.is_open('2024-07-03 14:00-04:00'))
+        self.assertEqual(self.calendar.next_open('2024-07-03 14:00-04:00'),
+                         pd.Timestamp('2024-07-05 09:30', tz='America/New_York'))
+
+
+class TestBISTCalendar(unittest.TestCase):
+    """Borsa İstanbul takvimi testleri"""
+
+    def test_bist_holidays(self):
+        """Resmi ve dini bayramlar seans olmamalı"""
+        calendar = trading_calendar.get_symbol_calendar('THYAO.IS')
+        self.assertEqual(calendar.exchange, 'BIST')
+
+        holidays = ['2024-04-23', '2024-05-01', '2024-04-10', '2024-04-11', '2024-04-12',
+                    '2024-06-17', '2024-06-18', '2024-06-19', '2024-10-29']
+        self.assertFalse(calendar.is_session(np.array(holidays, dtype='datetime64[D]')).any())
+        self.assertIn(np.datetime64('2024-10-28'), calendar.sessions[calendar.half_days])
+        self.assertIn(np.datetime64('2024-04-09'), calendar.sessions[calendar.half_days])
+
+    def test_unknown_exchange(self):
+        """Bilinmeyen borsa hata vermeli"""
+        with self.assertRaises(ValueError):
+            trading_calendar.get_calendar('LSE')
+
+
+class TestAlignment(unittest.TestCase):
+    """Ortak indekse hizalama testleri"""
+
+    def test_align_frames(self):
+        """Semboller ortak seans indeksine hizalanmalı"""
+        calendar = trading_calendar.get_calendar('NYSE')
+        sessions = calendar.sessions_in_range('2024-01-01', '2024-02-01')
+        full = pd.DataFrame({'Close': np.arange(len(sessions), dtype=float)},
+                            index=pd.DatetimeIndex(sessions.astype('datetime64[ns]')))
+        partial = full.iloc[5:].drop(full.index[10])
+        holiday_row = pd.DataFrame({'Close': [99.0]}, index=pd.DatetimeIndex(['2024-01-15']))  # MLK günü
+
+        aligned = calendar.align({'A': full, 'B': pd.concat([partial, holiday_row]).sort_index()})
+
+        self.assertTrue(aligned['A'].index.equals(aligned['B'].index))
+        self.assertEqual(len(aligned['B']), len(sessions))
+        self.assertEqual(int(aligned['B']['Close'].isna().sum()), 6)
+        self.assertNotIn(pd.Timestamp('2024-01-15'), aligned['B'].index)
+
+    def test_half_day_bar_aggregation(self):
+        """Yarım günde saatlik barlar erken kapanışta kesilmeli"""
+        index = pd.date_range('2024-11-29 09:30', '2024-11-29 12:59', freq='min', tz='America/New_York')
+        bars = pd.DataFrame({'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Volume': 1}, index=index)
+
+        hourly = bar_aggregator.aggregate_bars(bars, '1h', 'AAPL')
+        daily = bar_aggregator.aggregate_bars(bars, '1d', 'AAPL')
+
+        self.assertEqual(len(hourly), 4)
+        self.assertEqual(hourly['Volume'].iloc[-1], 30)
+        self.assertEqual(len(daily), 1)  # 13:00 kapanışında tamamlanmış sayılır
+
+
+class TestDataHandlerGaps(unittest.TestCase):
+    """data_handler takvim kontrolü testleri"""
+
+    def test_empty_holiday_rows_are_dropped(self):
+        """Tatile düşen boş satırlar atılmalı, dolu satırlar korunmalı"""
+        index = pd.bdate_range('2024-01-01', '2024-01-31')
+        data = pd.DataFrame({'Open': 1.0, 'High': 1.0, 'Low': 1.0, 'Close': 1.0, 'Volume': 100}, index=index)
+        data.loc['2024-01-01', 'Volume'] = 0  # Yılbaşı - boş satır
+        data.loc['2024-01-10', 'Volume'] = 0  # İşlem günü - korunmalı
+
+        cleaned = data_handler._check_calendar_gaps(data, 'AAPL', '1d')
+
+        self.assertNotIn(pd.Timestamp('2024-01-01'), cleaned.index)
+        self.assertIn(pd.Timestamp('2024-01-10'), cleaned.index)
+        self.assertIn(pd.Timestamp('2024-01-15'), cleaned.index)  # dolu tatil satırı atılmaz
+        self.assertEqual(len(cleaned), len(data) - 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
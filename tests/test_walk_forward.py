@@ -0,0 +1,122 @@
+"""
+test_walk_forward.py - Walk-Forward modülü için birim testler
+
+Bu dosya ileriye yürüyen pencereli eğitimi test eder:
+- Genişleyen/kayan pencerelerin ve takvim periyotlu yeniden eğitimin doğru kurulması
+- Eğitim satırlarının test döneminden (ve etiket boşluğundan) önce bitmesi
+- Süreç havuzu ile tek süreçli çalışmanın aynı sonucu vermesi
+- Pencere modellerinin ve metriklerinin kaydedilmesi
+- Etiketi veri sonunu aşan satırların değerlendirmeye girmemesi
+"""
+
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+import tempfile
+import shutil
+import sys
+import os
+
+# Ana proje klasörünü Python path'ine ekle
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import walk_forward
+
+
+FEATURES = ['f1', 'f2', 'f3']
+PARAMS = {'C': 1.0, 'max_iter': 200}
+
+
+def _dataset(rows=700):
+    """Hedefi kısmen özelliklerden türeyen sentetik veri"""
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame(rng.normal(size=(rows, 3)), columns=FEATURES,
+                        index=pd.bdate_range('2019-01-01', periods=rows))
+    data['Target'] = (data['f1'] + rng.normal(scale=0.5, size=rows) > 0).astype(int)
+    return data
+
+
+class TestWalkForwardWindows(unittest.TestCase):
+    """Pencere kurulumu testleri"""
+
+    def test_monthly_expanding(self):
+        """Aylık pencerelerde test dönemleri ay başında başlamalı, eğitim boşlukla bitmeli"""
+        index = _dataset().index
+        windows = walk_forward.walk_forward_windows(index, 'M', 'expanding', min_train_bars=250, gap=2)
+
+        for window in windows:
+            self.assertEqual(window['train_start'], 0)
+            self.assertEqual(window['train_end'], window['test_start'] - 2)
+            self.assertGreaterEqual(window['train_end'], 250)
+            self.assertEqual(index[window['test_start']].month, index[window['test_end'] - 1].month)
+        self.assertEqual(windows[-1]['test_end'], len(index))
+        self.assertTrue(all(a['test_end'] == b['test_start'] for a, b in zip(windows, windows[1:])))
+
+    def test_rolling_bar_cadence(self):
+        """Bar sayılı sıklık ve kayan pencere sabit uzunlukta eğitim vermeli"""
+        windows = walk_forward.walk_forward_windows(pd.RangeIndex(500), 50, 'rolling', train_bars=120,
+                                                    min_train_bars=100, gap=1)
+
+        self.assertEqual(windows[0]['test_start'], 101)
+        self.assertTrue(all(w['train_end'] - w['train_start'] == 120 for w in windows[1:]))
+        with self.assertRaises(ValueError):
+            walk_forward.walk_forward_windows(pd.RangeIndex(500), 'M')
+        with self.assertRaises(ValueError):
+            walk_forward.walk_forward_windows(pd.RangeIndex(500), 50, 'sliding')
+
+
+class TestRunWalkForward(unittest.TestCase):
+    """Walk-forward çalıştırma testleri"""
+
+    def setUp(self):
+        """Geçici model dizini hazırlar"""
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Geçici dizini siler"""
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+    def _run(self, **kwargs):
+        """Küçük lojistik regresyonla walk-forward çalıştırır"""
+        with patch('config.MODEL_SAVE_PATH', self.tmp_dir), patch('config.SHARED_DATA_PATH', self.tmp_dir):
+            return walk_forward.run_walk_forward(_dataset(), FEATURES, symbol='TEST', retrain='M',
+                                                 min_train_bars=250, model_type='LogisticRegression',
+                                                 params=PARAMS, **kwargs)
+
+    def test_pool_matches_serial(self):
+        """Süreç havuzu tek süreçle aynı tahminleri üretmeli"""
+        serial = self._run(max_workers=1, save_models=False)
+        parallel = self._run(max_workers=2, save_models=False)
+
+        pd.testing.assert_frame_equal(serial['predictions'], parallel['predictions'])
+        self.assertEqual(serial['summary']['windows'], len(serial['windows']))
+        self.assertGreater(serial['summary']['accuracy'], 0.6)
+        self.assertTrue((serial['predictions'].index >= serial['windows']['test_start_date'].iloc[0]).all())
+
+    def test_saves_models_and_metrics(self):
+        """Her pencerenin modeli ve metrik dosyaları kaydedilmeli"""
+        result = self._run(max_workers=1)
+        saved = sorted(os.listdir(result['path']))
+
+        self.assertEqual(len([f for f in saved if f.endswith('.joblib')]), len(result['windows']))
+        self.assertIn('window_metrics.csv', saved)
+        self.assertIn('summary.json', saved)
+        self.assertEqual(len([d for d in os.listdir(self.tmp_dir) if d.startswith('aiftb_shared')]), 0)
+
+    def test_unknown_tail_labels_excluded(self):
+        """NaN hedefli son satırlar (geleceği bilinmeyen etiketler) ne eğitime ne teste girmeli"""
+        data = _dataset()
+        data['Target'] = data['Target'].astype(float)
+        data.iloc[-5:, data.columns.get_loc('Target')] = np.nan
+        with patch('config.MODEL_SAVE_PATH', self.tmp_dir), patch('config.SHARED_DATA_PATH', self.tmp_dir):
+            result = walk_forward.run_walk_forward(data, FEATURES, symbol='TEST', retrain='M', min_train_bars=250,
+                                                   model_type='LogisticRegression', params=PARAMS, max_workers=1,
+                                                   save_models=False, gap=5)
+
+        self.assertEqual(result['predictions'].index[-1], data.index[-6])
+        self.assertEqual(result['windows']['test_end'].iloc[-1], len(data) - 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,422 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Trading Calendar Module
+
+Bu modül, NYSE ve Borsa İstanbul (BIST) için işlem takvimini (seanslar, tatiller,
+yarım günler) bir kez hesaplar ve NumPy dizileri olarak önbellekte tutar.
+Boşluk tespiti, beklenen bar sayısı, sembollerin ortak indekse hizalanması ve
+zamanlama sorguları pandas tarih aritmetiği yerine bu diziler üzerinde
+searchsorted aramalarıyla yapılır.
+
+Tatil kuralları:
+- NYSE: Yılbaşı, Martin Luther King, Başkanlar Günü, Kutsal Cuma, Anma Günü,
+  Juneteenth (2022+), Bağımsızlık Günü, İşçi Bayramı, Şükran Günü, Noel ve
+  olağanüstü kapanışlar. Yarım gün: 3 Temmuz, Şükran Günü ertesi, Noel arifesi.
+- BIST: Yılbaşı, 23 Nisan, 1 Mayıs, 19 Mayıs, 15 Temmuz (2017+), 30 Ağustos,
+  29 Ekim, Ramazan (3 gün) ve Kurban (4 gün) Bayramları. Yarım gün: 28 Ekim ve
+  bayram arifeleri. Dini bayram tarihleri 2015-2030 için tanımlıdır.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar, Holiday, GoodFriday, USMartinLutherKingJr, USPresidentsDay,
+    USMemorialDay, USLaborDay, USThanksgivingDay, nearest_workday, sunday_to_monday
+)
+
+import config
+import logger
+
+
+_NS_PER_DAY = 86_400 * 10 ** 9
+
+# Hesaplanmış takvimler (borsa -> TradingCalendar), süreç başına bir kez oluşturulur
+_calendars = {}
+
+
+class _NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """NYSE tam gün tatil kuralları"""
+    rules = [
+        Holiday('NewYearsDay', month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday('Juneteenth', month=6, day=19, start_date='2022-01-01', observance=nearest_workday),
+        Holiday('IndependenceDay', month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday('Christmas', month=12, day=25, observance=nearest_workday),
+    ]
+
+
+# NYSE olağanüstü kapanışları
+_NYSE_SPECIAL_CLOSURES = [
+    '2001-09-11', '2001-09-12', '2001-09-13', '2001-09-14',  # 11 Eylül
+    '2004-06-11',                                            # Reagan cenazesi
+    '2007-01-02',                                            # Ford cenazesi
+    '2012-10-29', '2012-10-30',                              # Sandy kasırgası
+    '2018-12-05',                                            # George H. W. Bush cenazesi
+    '2025-01-09',                                            # Carter cenazesi
+]
+
+# BIST sabit tarihli tatiller (ay, gün, başlangıç yılı)
+_BIST_FIXED_HOLIDAYS = [(1, 1, 2000), (4, 23, 2000), (5, 1, 2009), (5, 19, 2000),
+                        (7, 15, 2017), (8, 30, 2000), (10, 29, 2000)]
+
+# Dini bayramların ilk günleri: (Ramazan Bayramı, Kurban Bayramı)
+_BIST_RELIGIOUS_HOLIDAYS = {
+    2015: ('2015-07-17', '2015-09-24'), 2016: ('2016-07-05', '2016-09-12'),
+    2017: ('2017-06-25', '2017-09-01'), 2018: ('2018-06-15', '2018-08-21'),
+    2019: ('2019-06-04', '2019-08-11'), 2020: ('2020-05-24', '2020-07-31'),
+    2021: ('2021-05-13', '2021-07-20'), 2022: ('2022-05-02', '2022-07-09'),
+    2023: ('2023-04-21', '2023-06-28'), 2024: ('2024-04-10', '2024-06-16'),
+    2025: ('2025-03-30', '2025-06-06'), 2026: ('2026-03-20', '2026-05-27'),
+    2027: ('2027-03-09', '2027-05-16'), 2028: ('2028-02-26', '2028-05-05'),
+    2029: ('2029-02-14', '2029-04-24'), 2030: ('2030-02-04', '2030-04-13'),
+}
+
+
+def get_exchange(symbol):
+    """
+    Sembolün işlem gördüğü borsayı döndürür.
+
+    Args:
+        symbol (str): İşlem sembolü
+
+    Returns:
+        str: config.MARKET_SESSIONS anahtarı ('.IS' uzantılı semboller için 'BIST')
+    """
+    if symbol and str(symbol).upper().endswith('.IS'):
+        return 'BIST'
+    return 'NYSE'
+
+
+def _time_offset(value):
+    """'HH:MM' saatini gece yarısından itibaren nanosaniyeye çevirir"""
+    return pd.Timedelta(value + ':00').value
+
+
+def _to_days(values):
+    """Tarih(ler)i 1970'ten itibaren gün sayısına (int64) çevirir"""
+    array = np.asarray(values)
+    if array.dtype.kind == 'M':
+        return array.astype('datetime64[D]').astype(np.int64)
+    if array.dtype.kind in 'iu':
+        return array.astype(np.int64)
+    return np.asarray(pd.to_datetime(np.atleast_1d(array)).values.astype('datetime64[D]').astype(np.int64)).reshape(array.shape)
+
+
+class TradingCalendar:
+    """
+    Bir borsanın önceden hesaplanmış işlem takvimi.
+
+    Tüm sorgular sıralı seans dizileri üzerinde searchsorted ile yapılır:
+        sessions       - seans günleri (datetime64[D])
+        opens, closes  - seans açılış/kapanış anları (UTC, int64 ns)
+        half_days      - yarım gün maskesi
+        holidays       - hafta içi tatil günleri (datetime64[D])
+    """
+
+    def __init__(self, exchange, holidays, half_days, start_date=None, end_date=None):
+        """
+        Args:
+            exchange (str): config.MARKET_SESSIONS anahtarı
+            holidays (array-like): Tam gün tatiller
+            half_days (array-like): Yarım günler
+            start_date (str): Takvim başlangıcı (None ise config.CALENDAR_START_DATE)
+            end_date (str): Takvim bitişi (None ise config.CALENDAR_END_DATE)
+        """
+        session = config.MARKET_SESSIONS[exchange]
+        self.exchange = exchange
+        self.timezone = session['timezone']
+        self.open_offset = _time_offset(session['open'])
+        self.close_offset = _time_offset(session['close'])
+        self.half_day_close_offset = _time_offset(session.get('half_day_close', session['close']))
+
+        start = np.datetime64(start_date or config.CALENDAR_START_DATE, 'D')
+        end = np.datetime64(end_date or config.CALENDAR_END_DATE, 'D')
+        holidays = np.unique(np.asarray(holidays, dtype='datetime64[D]'))
+        days = np.arange(start, end + 1, dtype='datetime64[D]')
+
+        self.holidays = holidays[np.is_busday(holidays) & (holidays >= start) & (holidays <= end)]
+        self.sessions = days[np.is_busday(days, holidays=holidays)]
+        self.session_days = self.sessions.astype(np.int64)
+        self.half_days = np.isin(self.sessions, np.asarray(half_days, dtype='datetime64[D]'))
+
+        self.close_offsets = np.where(self.half_days, self.half_day_close_offset, self.close_offset)
+        local_opens = self.session_days * _NS_PER_DAY + self.open_offset
+        local_closes = self.session_days * _NS_PER_DAY + self.close_offsets
+        self.opens = self._local_to_utc(local_opens)
+        self.closes = self._local_to_utc(local_closes)
+
+    def _local_to_utc(self, local_ns):
+        """Borsa yerel saatini (ns) UTC'ye çevirir (takvim kurulurken bir kez)"""
+        index = pd.DatetimeIndex(local_ns.astype('datetime64[ns]')).tz_localize(self.timezone)
+        return np.asarray(index.tz_convert('UTC').tz_localize(None).values, dtype='datetime64[ns]').view(np.int64)
+
+    def _local_days(self, values):
+        """Zaman damgalarını borsa yerel gününe (int64) çevirir"""
+        if isinstance(values, pd.DatetimeIndex) and values.tz is not None:
+            values = values.tz_convert(self.timezone).tz_localize(None)
+        elif isinstance(values, pd.Timestamp) and values.tzinfo is not None:
+            values = values.tz_convert(self.timezone).tz_localize(None)
+        if isinstance(values, (pd.DatetimeIndex, pd.Timestamp)):
+            values = np.asarray(values.to_numpy() if isinstance(values, pd.Timestamp) else values.values,
+                                dtype='datetime64[ns]')
+        return _to_days(values)
+
+    def _positions(self, days):
+        """Günlerin seans dizisindeki konumlarını ve seans olup olmadıklarını döndürür"""
+        positions = np.searchsorted(self.session_days, days)
+        clipped = np.minimum(positions, len(self.session_days) - 1)
+        return positions, self.session_days[clipped] == days
+
+    def is_session(self, dates):
+        """
+        Tarih(ler)in işlem günü olup olmadığını döndürür.
+
+        Args:
+            dates: Tek tarih veya tarih dizisi
+
+        Returns:
+            numpy.ndarray veya bool: İşlem günü maskesi
+        """
+        days = self._local_days(dates)
+        return self._positions(days)[1]
+
+    def sessions_in_range(self, start_date, end_date):
+        """
+        [start_date, end_date) aralığındaki seans günlerini döndürür.
+
+        Returns:
+            numpy.ndarray: datetime64[D] seans dizisi (takvim dizisinin görünümü)
+        """
+        lo, hi = np.searchsorted(self.session_days, [self._local_days(pd.Timestamp(start_date)),
+                                                     self._local_days(pd.Timestamp(end_date))])
+        return self.sessions[lo:hi]
+
+    def session_count(self, start_date, end_date):
+        """[start_date, end_date) aralığındaki seans sayısını döndürür"""
+        return len(self.sessions_in_range(start_date, end_date))
+
+    def expected_bars(self, start_date, end_date, timeframe='1d'):
+        """
+        Aralıkta beklenen bar sayısını döndürür (yarım günler dahil).
+
+        Args:
+            start_date (str): Başlangıç tarihi (dahil)
+            end_date (str): Bitiş tarihi (hariç)
+            timeframe (str): '1d' veya gün içi zaman dilimi ('1m', '5m', '1h', ...)
+
+        Returns:
+            int: Beklenen normal seans bar sayısı
+        """
+        lo, hi = np.searchsorted(self.session_days, [self._local_days(pd.Timestamp(start_date)),
+                                                     self._local_days(pd.Timestamp(end_date))])
+        if timeframe == '1d':
+            return int(hi - lo)
+        freq = pd.Timedelta(timeframe.replace('m', 'min') if timeframe.endswith('m') else timeframe).value
+        lengths = self.close_offsets[lo:hi] - self.open_offset
+        return int(((lengths + freq - 1) // freq).sum())
+
+    def missing_sessions(self, index):
+        """
+        Verinin ilk ve son günü arasında olup veride bulunmayan seansları döndürür.
+
+        Args:
+            index (pandas.DatetimeIndex): Veri indeksi
+
+        Returns:
+            numpy.ndarray: Eksik seans günleri (datetime64[D])
+        """
+        if len(index) == 0:
+            return np.array([], dtype='datetime64[D]')
+        days = np.unique(self._local_days(index))
+        lo, hi = np.searchsorted(self.session_days, [days[0], days[-1] + 1])
+        expected = self.session_days[lo:hi]
+        present = np.isin(expected, days, assume_unique=True)
+        return expected[~present].astype('datetime64[D]')
+
+    def session_close_offsets(self, days):
+        """
+        Günlerin seans kapanış saatini (gece yarısından itibaren ns) döndürür.
+        Yarım günlerde erken kapanış, seans dışı günlerde normal kapanış kullanılır.
+
+        Args:
+            days (numpy.ndarray): 1970'ten itibaren gün sayıları (int64)
+
+        Returns:
+            numpy.ndarray: Kapanış saatleri (int64 ns)
+        """
+        positions, is_session = self._positions(np.asarray(days, dtype=np.int64))
+        clipped = np.minimum(positions, len(self.session_days) - 1)
+        return np.where(is_session, self.close_offsets[clipped], self.close_offset)
+
+    def is_open(self, now=None):
+        """Verilen anda (None ise şimdi) piyasanın açık olup olmadığını döndürür"""
+        now_ns = _utc_ns(now)
+        position = np.searchsorted(self.opens, now_ns, side='right') - 1
+        return bool(position >= 0 and now_ns < self.closes[position])
+
+    def next_open(self, now=None):
+        """
+        Verilen andan (None ise şimdi) sonraki ilk seans açılışını döndürür.
+
+        Returns:
+            pandas.Timestamp: Borsa saat dilimli açılış zamanı (takvim sonrasında None)
+        """
+        position = np.searchsorted(self.opens, _utc_ns(now), side='right')
+        if position >= len(self.opens):
+            return None
+        return pd.Timestamp(int(self.opens[position]), tz='UTC').tz_convert(self.timezone)
+
+    def next_close(self, now=None):
+        """
+        Verilen andan (None ise şimdi) sonraki ilk seans kapanışını döndürür.
+
+        Returns:
+            pandas.Timestamp: Borsa saat dilimli kapanış zamanı (takvim sonrasında None)
+        """
+        position = np.searchsorted(self.closes, _utc_ns(now), side='right')
+        if position >= len(self.closes):
+            return None
+        return pd.Timestamp(int(self.closes[position]), tz='UTC').tz_convert(self.timezone)
+
+    def align(self, frames, start_date=None, end_date=None, columns=None):
+        """
+        Günlük verileri ortak seans indeksine hizalar. Eksik seanslar NaN olur,
+        seans dışı günlere ait satırlar atılır.
+
+        Args:
+            frames (dict): {symbol: pandas.DataFrame} - günlük veri
+            start_date (str): Ortak indeksin başlangıcı (None ise en erken veri)
+            end_date (str): Ortak indeksin bitişi, hariç (None ise en geç veri)
+            columns (list): Hizalanacak kolonlar (None ise tüm sayısal kolonlar)
+
+        Returns:
+            dict: {symbol: pandas.DataFrame} - aynı seans indeksli
+        """
+        day_arrays = {symbol: self._local_days(frame.index) for symbol, frame in frames.items() if len(frame)}
+        if not day_arrays:
+            return {}
+        first = self._local_days(pd.Timestamp(start_date)) if start_date else min(d.min() for d in day_arrays.values())
+        last = self._local_days(pd.Timestamp(end_date)) if end_date else max(d.max() for d in day_arrays.values()) + 1
+        lo, hi = np.searchsorted(self.session_days, [first, last])
+        shared_days = self.session_days[lo:hi]
+        shared_index = pd.DatetimeIndex(shared_days.astype('datetime64[D]').astype('datetime64[ns]'))
+
+        aligned = {}
+        for symbol, frame in frames.items():
+            symbol_columns = columns or [c for c in frame.columns if pd.api.types.is_numeric_dtype(frame[c].dtype)]
+            values = np.full((len(shared_days), len(symbol_columns)), np.nan)
+            days = day_arrays.get(symbol)
+            if days is not None:
+                positions = np.searchsorted(shared_days, days)
+                clipped = np.minimum(positions, max(len(shared_days) - 1, 0))
+                matched = (positions < len(shared_days)) & (shared_days[clipped] == days) if len(shared_days) else \
+                    np.zeros(len(days), dtype=bool)
+                values[positions[matched]] = frame[symbol_columns].to_numpy(dtype=np.float64, na_value=np.nan)[matched]
+            aligned[symbol] = pd.DataFrame(values, index=shared_index, columns=symbol_columns)
+        return aligned
+
+
+def _utc_ns(value):
+    """Zamanı UTC nanosaniyeye çevirir (saat dilimsiz değerler UTC kabul edilir)"""
+    ts = pd.Timestamp.now(tz='UTC') if value is None else pd.Timestamp(value)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize('UTC')
+    return ts.value
+
+
+def _nyse_days(start, end):
+    """NYSE tatil ve yarım günlerini döndürür"""
+    holidays = _NYSEHolidayCalendar().holidays(start, end)
+    holidays = holidays.append(pd.DatetimeIndex(_NYSE_SPECIAL_CLOSURES))
+
+    half_days = list(USThanksgivingDay.dates(start, end) + pd.Timedelta(days=1))  # Şükran Günü ertesi
+    for year in range(start.year, end.year + 1):
+        for day in (pd.Timestamp(year, 7, 3), pd.Timestamp(year, 12, 24)):
+            if day.dayofweek < 4:  # Pazartesi-Perşembe ise ertesi gün tatildir, bu gün yarım gün
+                half_days.append(day)
+
+    holiday_days = holidays.values.astype('datetime64[D]')
+    half_days = np.asarray(half_days, dtype='datetime64[D]')
+    return holiday_days, half_days[~np.isin(half_days, holiday_days)]
+
+
+def _bist_days(start, end):
+    """BIST tatil ve yarım günlerini döndürür"""
+    holidays, half_days = [], []
+    for year in range(start.year, end.year + 1):
+        for month, day, since in _BIST_FIXED_HOLIDAYS:
+            if year >= since:
+                holidays.append(pd.Timestamp(year, month, day))
+        half_days.append(pd.Timestamp(year, 10, 28))  # Cumhuriyet Bayramı arifesi
+
+        if year in _BIST_RELIGIOUS_HOLIDAYS:
+            ramadan, sacrifice = (pd.Timestamp(d) for d in _BIST_RELIGIOUS_HOLIDAYS[year])
+            holidays.extend(ramadan + pd.Timedelta(days=i) for i in range(3))
+            holidays.extend(sacrifice + pd.Timedelta(days=i) for i in range(4))
+            half_days.extend([ramadan - pd.Timedelta(days=1), sacrifice - pd.Timedelta(days=1)])
+
+    holiday_days = np.asarray(holidays, dtype='datetime64[D]')
+    half_days = np.asarray(half_days, dtype='datetime64[D]')
+    return holiday_days, half_days[~np.isin(half_days, holiday_days)]
+
+
+_HOLIDAY_BUILDERS = {'NYSE': _nyse_days, 'BIST': _bist_days}
+
+
+def get_calendar(exchange='NYSE'):
+    """
+    Borsanın önbelleğe alınmış işlem takvimini döndürür (ilk çağrıda hesaplanır).
+
+    Args:
+        exchange (str): 'NYSE' veya 'BIST'
+
+    Returns:
+        TradingCalendar: İşlem takvimi
+
+    Raises:
+        ValueError: Bilinmeyen borsa adında
+    """
+    if exchange not in _HOLIDAY_BUILDERS:
+        raise ValueError(f"Bilinmeyen borsa: {exchange} (geçerli: {list(_HOLIDAY_BUILDERS)})")
+    if exchange not in _calendars:
+        start = pd.Timestamp(config.CALENDAR_START_DATE)
+        end = pd.Timestamp(config.CALENDAR_END_DATE)
+        holidays, half_days = _HOLIDAY_BUILDERS[exchange](start, end)
+        extra = np.asarray(config.CALENDAR_EXTRA_HOLIDAYS.get(exchange, []), dtype='datetime64[D]')
+        _calendars[exchange] = TradingCalendar(exchange, np.concatenate([holidays, extra]), half_days)
+        calendar = _calendars[exchange]
+        logger.log_info(f"İşlem takvimi hazırlandı: {exchange}, {len(calendar.sessions)} seans, "
+                        f"{len(calendar.holidays)} tatil, {int(calendar.half_days.sum())} yarım gün")
+    return _calendars[exchange]
+
+
+def get_symbol_calendar(symbol):
+    """Sembolün borsasına ait işlem takvimini döndürür"""
+    return get_calendar(get_exchange(symbol))
+
+
+def reset_calendars():
+    """Önbelleğe alınmış takvimleri temizler (config değişikliği sonrası)"""
+    _calendars.clear()
+
+
+if __name__ == "__main__":
+    """
+    Trading Calendar modülü test kodu
+    """
+    print("=== AI-FTB Trading Calendar Test ===")
+
+    nyse = get_calendar('NYSE')
+    bist = get_calendar('BIST')
+    print(f"✅ NYSE 2024 seans sayısı: {nyse.session_count('2024-01-01', '2025-01-01')}")
+    print(f"✅ BIST 2024 seans sayısı: {bist.session_count('2024-01-01', '2025-01-01')}")
+    print(f"📊 NYSE 2024 yarım günler: {nyse.sessions[nyse.half_days & (nyse.sessions.astype('datetime64[Y]') == np.datetime64('2024', 'Y'))]}")
+    print(f"📊 NYSE 2024 beklenen 5m bar: {nyse.expected_bars('2024-01-01', '2025-01-01', '5m')}")
+    print(f"⏰ NYSE sonraki açılış: {nyse.next_open()}")
+    print(f"⏰ BIST sonraki açılış: {bist.next_open()}")
+
+    print("\nTrading Calendar test tamamlandı!")
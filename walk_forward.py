@@ -0,0 +1,262 @@
+"""
+AI-FTB (AI-Powered Financial Trading Bot) Walk-Forward Module
+
+Bu modül, modeli zaman sırasını bozmadan ileriye doğru yürüyen pencerelerle
+eğitir ve değerlendirir (walk-forward). Her yeniden eğitim tarihinde model yalnızca
+o tarihten önceki satırlarla (genişleyen veya sabit uzunlukta kayan pencere) eğitilir
+ve bir sonraki yeniden eğitime kadar olan dönemde örneklem dışı test edilir.
+
+- Özellikler bir kez hesaplanır ve shared_data ile bellek eşlemeli dosyalara yayınlanır;
+  işçi süreçler pencere satırlarını bu dosyalardan kopyasız okur
+- Pencere modelleri süreç havuzunda paralel eğitilir
+- Her pencerenin modeli ve metrikleri kaydedilir
+- Eğitim penceresinin son TARGET_LOOKAHEAD_DAYS satırı (etiketi test dönemine
+  uzanan satırlar) eğitimden çıkarılır
+- Verinin son TARGET_LOOKAHEAD_DAYS satırının hedefi (create_target_variable'da NaN)
+  bilinmez; bu satırlar dropna ile ne eğitime ne teste girer
+"""
+
+import os
+import json
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import joblib
+from sklearn.metrics import accuracy_score, precision_score, f1_score, roc_auc_score
+
+import config
+import logger
+import ml_model
+import shared_data
+import feature_engineer
+
+
+WINDOW_TYPES = ('expanding', 'rolling')
+
+
+def _period_starts(index, retrain):
+    """Her takvim periyodunun (ör. ay) ilk satırının konumları"""
+    if not isinstance(index, pd.DatetimeIndex):
+        raise ValueError("Takvim periyotlu yeniden eğitim için DatetimeIndex gerekli")
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    periods = index.to_period(retrain).asi8
+    return np.concatenate([[0], np.flatnonzero(periods[1:] != periods[:-1]) + 1])
+
+
+def walk_forward_windows(index, retrain=None, window=None, train_bars=None, min_train_bars=None, gap=None):
+    """
+    Walk-forward eğitim/test pencerelerini oluşturur.
+
+    Args:
+        index (pandas.Index): Satır indeksi (takvim periyotlu yeniden eğitimde DatetimeIndex)
+        retrain (str veya int): Yeniden eğitim sıklığı; pandas periyot kodu ('M', 'W', 'Q')
+            veya bar sayısı (None ise config.WALK_FORWARD_RETRAIN)
+        window (str): 'expanding' veya 'rolling' (None ise config.WALK_FORWARD_WINDOW)
+        train_bars (int): Kayan pencere uzunluğu (None ise config.WALK_FORWARD_TRAIN_BARS)
+        min_train_bars (int): En az eğitim satırı (None ise config.WALK_FORWARD_MIN_TRAIN_BARS)
+        gap (int): Eğitim sonu ile test başı arasında çıkarılan satır sayısı
+            (None ise config.TARGET_LOOKAHEAD_DAYS)
+
+    Returns:
+        list: [{'window', 'train_start', 'train_end', 'test_start', 'test_end'}] satır
+              konumları (bitişler hariç)
+
+    Raises:
+        ValueError: Geçersiz pencere tipi veya sıklıkta
+    """
+    retrain = config.WALK_FORWARD_RETRAIN if retrain is None else retrain
+    window = config.WALK_FORWARD_WINDOW if window is None else window
+    train_bars = config.WALK_FORWARD_TRAIN_BARS if train_bars is None else train_bars
+    min_train_bars = config.WALK_FORWARD_MIN_TRAIN_BARS if min_train_bars is None else min_train_bars
+    gap = config.TARGET_LOOKAHEAD_DAYS if gap is None else gap
+    if window not in WINDOW_TYPES:
+        raise ValueError(f"Geçersiz pencere tipi: {window}")
+
+    length = len(index)
+    if isinstance(retrain, (int, np.integer)):
+        if retrain < 1:
+            raise ValueError(f"Geçersiz yeniden eğitim sıklığı: {retrain}")
+        starts = np.arange(min_train_bars + gap, length, retrain)
+    else:
+        starts = _period_starts(index, retrain)
+    ends = np.append(starts[1:], length)
+
+    windows = []
+    for test_start, test_end in zip(starts, ends):
+        train_end = test_start - gap
+        train_start = 0 if window == 'expanding' else max(0, train_end - train_bars)
+        if train_end - train_start < min_train_bars or test_end <= test_start:
+            continue
+        windows.append({'window': len(windows), 'train_start': int(train_start), 'train_end': int(train_end),
+                        'test_start': int(test_start), 'test_end': int(test_end)})
+    return windows
+
+
+def _window_metrics(y_true, predictions, probabilities):
+    """Örneklem dışı metrikler (tek sınıflı dönemde ROC AUC NaN)"""
+    metrics = {
+        'accuracy': accuracy_score(y_true, predictions),
+        'precision': precision_score(y_true, predictions, average='weighted', zero_division=0),
+        'f1_score': f1_score(y_true, predictions, average='weighted', zero_division=0),
+        'roc_auc': np.nan,
+    }
+    if len(np.unique(y_true)) == 2 and len(np.unique(predictions)) <= 2:
+        metrics['roc_auc'] = roc_auc_score(y_true, probabilities)
+    return metrics
+
+
+def _fit_window(handle, symbol, features, target_column, window, model_type, params, model_path):
+    """
+    Tek pencerenin modelini eğitip test dönemini tahmin eder (işçi süreçte çalışır).
+
+    Returns:
+        tuple: (pencere metrikleri, tahminler, olasılıklar)
+    """
+    arrays = shared_data.attach_arrays(handle, symbol, features + [target_column])
+    train = slice(window['train_start'], window['train_end'])
+    test = slice(window['test_start'], window['test_end'])
+    X_train = np.column_stack([arrays[f][train] for f in features])
+    X_test = np.column_stack([arrays[f][test] for f in features])
+    y_train, y_test = arrays[target_column][train].astype(int), arrays[target_column][test].astype(int)
+
+    model = ml_model.create_model(model_type, params)
+    model.fit(X_train, y_train)
+    predictions = model.predict(X_test)
+    if hasattr(model, 'predict_proba') and len(model.classes_) == 2:
+        probabilities = model.predict_proba(X_test)[:, 1]
+    else:
+        probabilities = predictions.astype(np.float64)
+
+    if model_path:
+        joblib.dump(model, model_path)
+    metrics = dict(window, train_rows=len(y_train), test_rows=len(y_test),
+                   **_window_metrics(y_test, predictions, probabilities))
+    return metrics, predictions, probabilities
+
+
+def run_walk_forward(dataframe, features=None, target_column='Target', symbol='default', retrain=None,
+                     window=None, train_bars=None, min_train_bars=None, max_workers=None, model_type=None,
+                     params=None, save_models=None, gap=None):
+    """
+    Walk-forward eğitim ve örneklem dışı değerlendirmeyi çalıştırır.
+
+    Args:
+        dataframe (pandas.DataFrame): Özellikler ve hedef içeren veri (zaman sıralı)
+        features (list): Özellikler (None ise veride bulunan feature_engineer.model_features())
+        target_column (str): Hedef sütun adı
+        symbol (str): Sembol adı (kayıt dizini için)
+        retrain (str veya int): Yeniden eğitim sıklığı (bkz. walk_forward_windows)
+        window (str): 'expanding' veya 'rolling'
+        train_bars (int): Kayan pencere uzunluğu
+        min_train_bars (int): En az eğitim satırı
+        max_workers (int): Süreç sayısı (None ise config.WALK_FORWARD_MAX_WORKERS, o da None
+            ise CPU sayısı); 1 ise havuz kullanılmaz
+        model_type (str): Model tipi (None ise config.ML_MODEL_TYPE)
+        params (dict): Model parametreleri (None ise config.ML_MODEL_PARAMS)
+        save_models (bool): Pencere modelleri ve metrikler kaydedilsin mi
+            (None ise config.WALK_FORWARD_SAVE_MODELS)
+        gap (int): Etiket ufku; eğitim sonu ile test başı arasındaki boşluk
+            (None ise config.TARGET_LOOKAHEAD_DAYS)
+
+    Returns:
+        dict: {'windows': pencere metrikleri DataFrame'i, 'predictions': örneklem dışı tahminler
+               DataFrame'i, 'summary': tüm test dönemleri üzerinden metrikler, 'path': kayıt dizini}
+        None: Hata veya yetersiz veri durumunda
+    """
+    handle = None
+    try:
+        if features is None:
+            features = feature_engineer.usable_features(dataframe, feature_engineer.model_features())
+        features = list(features)
+        params = dict(config.ML_MODEL_PARAMS if params is None else params)
+        save_models = config.WALK_FORWARD_SAVE_MODELS if save_models is None else save_models
+        max_workers = config.WALK_FORWARD_MAX_WORKERS if max_workers is None else max_workers
+        gap = config.TARGET_LOOKAHEAD_DAYS if gap is None else gap
+
+        # Geleceği bilinmeyen (NaN hedefli) son satırlar burada atılır
+        clean = dataframe[features + [target_column]].dropna()
+        windows = walk_forward_windows(clean.index, retrain, window, train_bars, min_train_bars, gap)
+        if not windows:
+            logger.log_warning(f"{symbol}: Walk-forward için yeterli veri yok ({len(clean)} satır)")
+            return None
+
+        workers = min(max_workers or os.cpu_count() or 1, len(windows))
+        if workers > 1 and 'n_jobs' in ml_model.create_model(model_type, params).get_params():
+            params['n_jobs'] = 1  # paralellik pencereler arasında; süreç içi iş parçacıkları çakışmasın
+
+        path = os.path.join(config.MODEL_SAVE_PATH, 'walk_forward', symbol)
+        if save_models:
+            os.makedirs(path, exist_ok=True)
+        model_paths = [os.path.join(path, f"window_{w['window']:03d}.joblib") if save_models else None
+                       for w in windows]
+
+        # Özellikler bir kez yayınlanır; işçilere yalnızca küçük tanımlayıcı gider
+        handle = shared_data.publish_frames({symbol: clean})
+        tasks = [(handle, symbol, features, target_column, w, model_type, params, p)
+                 for w, p in zip(windows, model_paths)]
+        logger.log_info(f"{symbol}: {len(windows)} walk-forward penceresi, {workers} süreç")
+
+        if workers == 1:
+            results = [_fit_window(*task) for task in tasks]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(_fit_window, *zip(*tasks)))
+
+        metrics = pd.DataFrame([r[0] for r in results])
+        for column in ('train_start', 'test_start'):
+            metrics[f'{column}_date'] = clean.index[metrics[column]]
+        metrics['test_end_date'] = clean.index[metrics['test_end'] - 1]
+
+        rows = np.concatenate([np.arange(w['test_start'], w['test_end']) for w in windows])
+        predictions = pd.DataFrame({
+            'window': np.concatenate([np.full(w['test_end'] - w['test_start'], w['window']) for w in windows]),
+            'target': clean[target_column].to_numpy()[rows],
+            'prediction': np.concatenate([r[1] for r in results]),
+            'probability': np.concatenate([r[2] for r in results]),
+        }, index=clean.index[rows])
+
+        summary = _window_metrics(predictions['target'], predictions['prediction'], predictions['probability'])
+        summary.update({'windows': len(windows), 'test_rows': len(predictions)})
+        if save_models:
+            metrics.to_csv(os.path.join(path, 'window_metrics.csv'), index=False)
+            with open(os.path.join(path, 'summary.json'), 'w') as f:
+                json.dump({k: (None if pd.isna(v) else float(v)) for k, v in summary.items()}, f, indent=2)
+
+        logger.log_info(f"{symbol}: Walk-forward örneklem dışı accuracy={summary['accuracy']:.4f} "
+                        f"({summary['test_rows']} satır)")
+        return {'windows': metrics, 'predictions': predictions, 'summary': summary, 'path': path}
+
+    except Exception as e:
+        logger.log_error(f"{symbol}: Walk-forward hatası: {e}", exc_info=True)
+        return None
+
+    finally:
+        if handle is not None:
+            shared_data.release(handle)
+
+
+if __name__ == "__main__":
+    """
+    Walk-Forward modülü test kodu
+    """
+    print("=== AI-FTB Walk-Forward Test ===")
+
+    import time
+    import tempfile
+    import data_providers
+    import feature_engineer
+
+    history = data_providers.get_data_provider('synthetic').get_history('AAPL', '2014-01-01', '2024-01-01')
+    data = feature_engineer.create_target_variable(feature_engineer.add_technical_indicators(history))
+    config.MODEL_SAVE_PATH = tempfile.mkdtemp()
+
+    started = time.perf_counter()
+    result = run_walk_forward(data, symbol='AAPL', retrain='M', params={'n_estimators': 50, 'max_depth': 6,
+                                                                         'random_state': 42})
+    print(f"✅ {result['summary']['windows']} aylık pencere: {time.perf_counter() - started:.1f} sn")
+    print(f"📊 Örneklem dışı accuracy: {result['summary']['accuracy']:.4f}, "
+          f"pencere ortalaması: {result['windows']['accuracy'].mean():.4f}")
+
+    print("\nWalk-Forward test tamamlandı!")